@@ -1,4 +1,4 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, session
+from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, session, Response
 import threading
 import time
 import os
@@ -45,8 +45,17 @@ from utils import (
     get_all_active_keywords, fetch_ai_news_with_advanced_keywords,
     update_ai_keyword_category, get_ai_keywords_stats, analyze_tweet_quality,
     safe_log, get_trending_ai_hashtags, remove_emojis_from_text, enhance_hashtags_with_trending,
-    reset_rate_limit_status
+    reset_rate_limit_status, is_article_seen, get_article_seen_status, get_http_stats,
+    get_llm_cache_stats, get_content_cache_stats, get_render_pool_stats, get_run_traces, traced_run, trace_span,
+    get_run_profile, profiling, append_json_record, append_json_records,
+    add_pending_tweet, remove_pending_tweets, ensure_pending_ids, get_state_writer_stats,
+    get_state_cache_stats, rebuild_statistics, list_records, get_rejected_stats,
+    get_deleted_stats, search_articles, bulk_reject_pending, queue_pending_for_posting,
+    get_post_job, cancel_post_job, get_post_queue_stats, bulk_convert_rejected_articles,
+    bulk_remove_rejected_articles, bulk_delete_rejected_positions, bulk_archive_posted
 )
+from job_scheduler import get_job_scheduler, ScheduledJob
+from event_bus import get_event_bus, format_sse
 
 # GitHub modülü kaldırıldı
 
@@ -135,8 +144,11 @@ def inject_globals():
 # Global değişkenler ve sabitler
 HISTORY_FILE = "posted_articles.json"
 last_check_time = None
+AUTOMATION_JOB_ID = "check_and_post_articles"
 automation_running = False
 background_scheduler_running = False
+_automation_scheduler = None
+_automation_scheduler_lock = threading.Lock()
 
 # Global ilerleme durumu değişkenleri
 progress_status = {
@@ -150,6 +162,12 @@ progress_status = {
 }
 progress_lock = threading.Lock()
 
+def _publish_progress():
+    """İlerleme durumunu /api/events abonelerine gönder"""
+    with progress_lock:
+        snapshot = dict(progress_status)
+    get_event_bus().publish("progress", snapshot)
+
 def update_progress(step, message, step_number=None, total_steps=None):
     """İlerleme durumunu güncelle"""
     global progress_status
@@ -168,6 +186,7 @@ def update_progress(step, message, step_number=None, total_steps=None):
                 avg_time_per_step = elapsed / step_number
                 remaining_steps = total_steps - step_number
                 progress_status['estimated_time'] = avg_time_per_step * remaining_steps
+    _publish_progress()
 
 def start_progress():
     """İlerleme takibini başlat"""
@@ -180,6 +199,7 @@ def start_progress():
         progress_status['total_steps'] = 0
         progress_status['start_time'] = time.time()
         progress_status['estimated_time'] = 0
+    _publish_progress()
 
 def end_progress():
     """İlerleme takibini sonlandır"""
@@ -188,29 +208,35 @@ def end_progress():
         progress_status['is_running'] = False
         progress_status['current_step'] = 'Tamamlandı'
         progress_status['message'] = 'İşlem başarıyla tamamlandı'
+    _publish_progress()
 
 def ensure_tweet_ids(pending_tweets):
-    """Pending tweets'lerin ID'lerini güvenli şekilde kontrol et ve düzelt"""
+    """Pending tweets'lerin kalıcı ID'si olduğundan emin ol.
+    
+    ID'siz kayıt varsa ID'ler pending_tweets.json'a yazılır ve güncel liste döner
+    (sadece bellekte verilen ID'ler silme/paylaşımda başka kaydı gösterebilir)."""
     try:
-        for i, tweet in enumerate(pending_tweets):
-            if isinstance(tweet, dict):
-                if 'id' not in tweet or tweet['id'] is None:
-                    tweet['id'] = i + 1
-            else:
-                # Object ise dict'e çevir
-                try:
-                    tweet_dict = dict(tweet) if hasattr(tweet, '__dict__') else {}
-                    tweet_dict['id'] = i + 1
-                    pending_tweets[i] = tweet_dict
-                except:
-                    # Son çare: yeni dict oluştur
-                    pending_tweets[i] = {'id': i + 1, 'error': 'Tweet format hatası'}
-        
-        return pending_tweets
+        if all(isinstance(tweet, dict) and tweet.get('id') is not None for tweet in pending_tweets):
+            return pending_tweets
+        ensure_pending_ids()
+        return load_json("pending_tweets.json", [])
     except Exception as e:
         terminal_log(f"❌ Tweet ID düzeltme hatası: {e}", "error")
         return pending_tweets
 
+LISTING_FILTER_ARGS = ("status", "source_type", "fetch_method", "source", "date_from", "date_to", "q")
+
+def _listing_args(default_limit=None):
+    """Liste sayfaları/API'leri için sorgu parametreleri: (filtreler, sort, descending, cursor, limit)"""
+    filters = {key: request.args.get(key, '').strip() for key in LISTING_FILTER_ARGS}
+    sort = request.args.get('sort', 'date')
+    descending = request.args.get('order', 'desc').lower() != 'asc'
+    try:
+        limit = int(request.args.get('limit') or default_limit or os.getenv('LISTING_PAGE_SIZE', 50))
+    except ValueError:
+        limit = 50
+    return filters, sort, descending, request.args.get('cursor') or None, limit
+
 # Giriş kontrolü decorator'ı
 def login_required(f):
     @wraps(f)
@@ -490,48 +516,15 @@ def index():
     try:
         # Temel verileri yükle - performans için limit kullan
         all_articles = load_json("posted_articles.json", limit=100)  # Son 100 makale
-        pending_tweets = load_json("pending_tweets.json", limit=50)  # Son 50 pending tweet
-        rejected_articles = load_json("rejected_articles.json", [])  # Reddedilen makaleler
-        
-        # Reddedilen makalelerin tarih formatını düzelt
-        for article in rejected_articles:
-            if 'rejected_at' in article:
-                try:
-                    from datetime import datetime
-                    rejected_date = datetime.fromisoformat(article['rejected_at'].replace('Z', '+00:00'))
-                    article['rejected_at_formatted'] = rejected_date.strftime('%d.%m.%Y %H:%M')
-                except:
-                    article['rejected_at_formatted'] = article.get('rejected_at', 'Bilinmiyor')
-            else:
-                article['rejected_at_formatted'] = 'Bilinmiyor'
+        # Bekleyen ve reddedilenler sunucu tarafında sayfalanır - sadece gösterilecek kayıtlar yüklenir
+        pending_page = list_records("pending", limit=20)  # En yeni 20 pending tweet
+        rejected_page = list_records("rejected", limit=10)  # En yeni 10 reddedilen makale
+        pending_tweets = pending_page["items"]
+        rejected_articles = rejected_page["items"]
         
         # Aktif makaleleri filtrele
         articles = [article for article in all_articles if not article.get('deleted', False)]
         
-        # Tweet ID'lerini güvenli şekilde kontrol et
-        pending_tweets = ensure_tweet_ids(pending_tweets)
-        
-        # Tweet içeriklerini düzenle
-        for tweet in pending_tweets:
-            # Tweet metnini bul - farklı alan isimleri dene
-            tweet_text = ''
-            if 'tweet_data' in tweet and 'tweet' in tweet['tweet_data']:
-                tweet_text = tweet['tweet_data']['tweet']
-            elif 'content' in tweet:
-                tweet_text = tweet['content']
-            elif 'article' in tweet:
-                tweet_text = tweet['article'].get('title', 'İçerik bulunamadı')
-            
-            # Tweet content alanını ayarla
-            tweet['content'] = tweet_text
-            
-            # Başlık ve URL bilgilerini ekle
-            tweet['title'] = tweet['article'].get('title', 'Başlık bulunamadı') if 'article' in tweet else tweet.get('content', 'Başlık bulunamadı')
-            tweet['url'] = tweet['article'].get('url', '') if 'article' in tweet else ''
-        
-        # Tarihe göre sırala
-        pending_tweets.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-        
         # News count hesapla (haber kaynaklı tweet'ler)
         news_count = 0
         for tweet in pending_tweets:
@@ -588,8 +581,8 @@ def index():
         # İstatistikler
         stats = {
             'today_articles': len(articles),
-            'today_pending': len(pending_tweets),
-            'today_total_activity': len(articles) + len(pending_tweets)
+            'today_pending': pending_page["total"],
+            'today_total_activity': len(articles) + pending_page["total"]
         }
         
         # Otomasyon durumu
@@ -601,13 +594,13 @@ def index():
         }
         
         # Haber sayısı
-        news_count = len(pending_tweets)
+        news_count = pending_page["total"]
         
         return render_template('index.html', 
-                             pending_tweets=pending_tweets[:20],  # Maksimum 20 pending tweet
+                             pending_tweets=pending_tweets,
                              posted_count=len(articles),
-                             rejected_count=len(rejected_articles),
-                             rejected_articles=rejected_articles[:10],  # İlk 10 reddedilen makale
+                             rejected_count=rejected_page["total"],
+                             rejected_articles=rejected_articles,
                              api_check=api_check,
                              app_version=app_version,
                              app_release_date=app_release_date,
@@ -638,6 +631,68 @@ def get_progress():
     with progress_lock:
         return jsonify(progress_status)
 
+@app.route('/api/events')
+@login_required
+def api_events():
+    """Server-Sent Events akışı: 'progress' (update_progress adımları) ve
+    'dashboard' (pending/istatistik değişiklikleri). /api/progress ve
+    /api/dashboard_data eski şablonlar için aynen çalışmaya devam eder.
+    
+    Her akış bir sunucu thread'i tutar: akış SSE_MAX_STREAM_SECONDS sonra kapanır
+    (tarayıcı Last-Event-ID ile kaldığı yerden bağlanır). PythonAnywhere'de
+    (az sayıda WSGI worker) SSE kapalıdır - 204 yanıtı tarayıcıyı zamanlayıcılı
+    sorgulamaya döndürür."""
+    if os.environ.get('PYTHONANYWHERE_MODE', '').lower() == 'true':
+        return Response(status=204)
+    bus = get_event_bus()
+    heartbeat = max(5, int(os.getenv('SSE_HEARTBEAT_SECONDS', 15)))
+    max_stream = max(heartbeat, int(os.getenv('SSE_MAX_STREAM_SECONDS', 25)))
+    try:
+        last_id = int(request.headers.get('Last-Event-ID') or request.args.get('last_event_id') or -1)
+    except ValueError:
+        last_id = -1
+    
+    def snapshot():
+        # İlk bağlantıda ya da tampon kaçırıldıysa güncel durumun tamamı gönderilir.
+        # Sayaçlar önce yayınlanır; izleyicinin ilk kontrolü aynı veriyi tekrar göndermez
+        counts = _dashboard_counts()
+        bus.publish("dashboard", counts)
+        current_id = bus.last_id
+        with progress_lock:
+            progress = dict(progress_status)
+        yield format_sse({"id": current_id, "type": "progress", "data": progress})
+        yield format_sse({"id": current_id, "type": "dashboard", "data": counts})
+        return current_id
+    
+    def stream():
+        nonlocal last_id
+        bus.subscribe()
+        try:
+            yield "retry: 3000\n\n"
+            events = bus.events_after(last_id) if last_id >= 0 else None
+            deadline = time.monotonic() + max_stream
+            while True:
+                if events is None:
+                    last_id = yield from snapshot()
+                elif events:
+                    for event in events:
+                        yield format_sse(event)
+                    last_id = events[-1]["id"]
+                else:
+                    # Proxy'lerin bağlantıyı kapatmaması için yorum satırı
+                    yield ": keepalive\n\n"
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                events = bus.wait(last_id, min(heartbeat, remaining))
+        finally:
+            bus.unsubscribe()
+    
+    return Response(stream(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
 @app.route('/check_articles', methods=['GET', 'POST'])
 @login_required
 def check_articles():
@@ -680,11 +735,6 @@ def fetch_latest_ai_articles_with_mcp():
     try:
         import hashlib
         
-        # Önce mevcut yayınlanan makaleleri yükle
-        posted_articles = load_json("posted_articles.json")
-        posted_urls = [article.get('url', '') for article in posted_articles]
-        posted_hashes = [article.get('hash', '') for article in posted_articles]
-        
         safe_log("Özel haber kaynaklarından makale çekiliyor...", "INFO")
         
         # Önce özel kaynaklardan makale çek
@@ -705,7 +755,7 @@ def fetch_latest_ai_articles_with_mcp():
                     if title and url:
                         article_hash = hashlib.md5(title.encode()).hexdigest()
                         
-                        if url not in posted_urls and article_hash not in posted_hashes:
+                        if not is_article_seen(url=url, hash_value=article_hash, statuses=("posted",)):
                             article['hash'] = article_hash
                             filtered_articles.append(article)
                             terminal_log(f"🆕 Yeni makale: {title[:50]}...", "success")
@@ -760,7 +810,7 @@ def fetch_latest_ai_articles_with_mcp():
                 
                 article_urls = []
                 for url in found_urls:
-                    if (url not in posted_urls and 
+                    if (not is_article_seen(url=url, statuses=("posted",)) and 
                         "/2025/" in url and 
                         len(article_urls) < 4):  # Sadece son 4 makale
                         article_urls.append(url)
@@ -785,7 +835,7 @@ def fetch_latest_ai_articles_with_mcp():
                             article_hash = hashlib.md5(title.encode()).hexdigest()
                             
                             # Tekrar kontrolü
-                            if article_hash not in posted_hashes:
+                            if not is_article_seen(hash_value=article_hash, statuses=("posted",)):
                                 articles_data.append({
                                     "title": title,
                                     "url": url,
@@ -822,6 +872,7 @@ def fetch_latest_ai_articles_with_mcp():
         terminal_log("🔄 Fallback yönteme geçiliyor...", "info")
         return fetch_latest_ai_articles()
 
+@traced_run("check_and_post_articles")
 def check_and_post_articles():
     """Makale kontrol ve paylaşım fonksiyonu - MCP Firecrawl entegrasyonlu"""
     try:
@@ -865,12 +916,36 @@ def check_and_post_articles():
         min_score = settings.get('min_score_threshold', 5)
         auto_post = settings.get('auto_post_enabled', False)
         
-        # İşlenmiş makaleleri yükle (duplikat kontrolü için)
-        posted_articles = load_json("posted_articles.json")
-        pending_tweets = load_json("pending_tweets.json")
-        
         update_progress("Makaleler İşleniyor", f"{len(articles[:max_articles])} makale işleniyor...", 4, 8)
         
+        # Tweet'ler tüm aday makaleler için tek seferde paralel üretilir; döngü sadece sonuçları işler
+        theme = settings.get('tweet_theme', 'bilgilendirici')
+        pregenerated_tweets = {}
+        try:
+            from utils import is_article_content_valid
+            from openrouter_async import generate_tweets_batch
+            batch_candidates = []
+            for candidate in articles[:max_articles]:
+                candidate_title = candidate.get('title', '')
+                if not candidate_title or not candidate_title.strip() or not is_article_content_valid(candidate)[0]:
+                    continue
+                candidate_hash = candidate.get('hash') or hashlib.md5(candidate_title.encode()).hexdigest()
+                if get_article_seen_status(url=candidate.get('url', ''), hash_value=candidate_hash):
+                    continue
+                batch_candidates.append(candidate)
+            if len(batch_candidates) > 1:
+                update_progress("Tweet Oluşturuluyor", f"{len(batch_candidates)} makale için tweet'ler paralel oluşturuluyor...", 4, 8)
+                terminal_log(f"⚡ {len(batch_candidates)} makale için tweet'ler paralel oluşturuluyor (tema: {theme})", "info")
+                with trace_span("tweet_batch", candidates=len(batch_candidates)):
+                    batch_results = generate_tweets_batch(batch_candidates, api_key, theme)
+                for candidate, result in zip(batch_candidates, batch_results):
+                    if result.get('error'):
+                        terminal_log(f"⚠️ Paralel tweet üretim hatası: {result['error']}", "warning")
+                    pregenerated_tweets[id(candidate)] = result.get('tweet_data')
+        except Exception as batch_error:
+            terminal_log(f"⚠️ Paralel tweet üretimi kullanılamadı, sıralı üretime geçiliyor: {batch_error}", "warning")
+            pregenerated_tweets = {}
+        
         for i, article in enumerate(articles[:max_articles]):
             try:
                 # İlerleme güncelle - makale işleme aşaması
@@ -918,38 +993,14 @@ def check_and_post_articles():
                     terminal_log(f"⚠️ Boş başlık, atlanıyor: {article_url[:50]}...", "warning")
                     continue
                 
-                # Posted articles kontrolü
-                already_posted = False
-                for posted in posted_articles:
-                    posted_url = posted.get('url', '')
-                    posted_hash = posted.get('hash', '')
-                    
-                    # URL kontrolü
-                    if article_url and article_url == posted_url:
-                        already_posted = True
-                        break
-                    
-                    # Hash kontrolü
-                    if article_hash and article_hash == posted_hash:
-                        already_posted = True
-                        break
+                # Paylaşılmış / bekleyen kontrolü - görülme indeksi (O(1))
+                seen_status = get_article_seen_status(url=article_url, hash_value=article_hash)
+                already_posted = seen_status == "posted"
+                already_pending = seen_status == "pending"
                 
-                # Pending tweets kontrolü
-                already_pending = False
-                for pending in pending_tweets:
-                    pending_article = pending.get('article', {})
-                    pending_url = pending_article.get('url', '')
-                    pending_hash = pending_article.get('hash', '')
-                    
-                    # URL kontrolü
-                    if article_url and article_url == pending_url:
-                        already_pending = True
-                        break
-                    
-                    # Hash kontrolü
-                    if article_hash and article_hash == pending_hash:
-                        already_pending = True
-                        break
+                if seen_status == "rejected":
+                    terminal_log(f"⏭️ Makale daha önce reddedilmiş, atlanıyor: {article['title'][:50]}...", "info")
+                    continue
                 
                 if already_posted:
                     terminal_log(f"⏭️ Makale zaten paylaşılmış, atlanıyor: {article['title'][:50]}...", "info")
@@ -959,11 +1010,14 @@ def check_and_post_articles():
                     terminal_log(f"⏭️ Makale zaten onay bekliyor, atlanıyor: {article['title'][:50]}...", "info")
                     continue
                 
-                # Tweet oluştur - tema ile
-                update_progress("Tweet Oluşturuluyor", f"AI ile tweet oluşturuluyor: {article['title'][:50]}...", 4 + i, 4 + len(articles[:max_articles]))
-                theme = settings.get('tweet_theme', 'bilgilendirici')
-                terminal_log(f"🤖 Tweet oluşturuluyor (tema: {theme}): {article['title'][:50]}...", "info")
-                tweet_data = generate_ai_tweet_with_content(article, api_key, theme)
+                # Tweet oluştur - tema ile (paralel üretildiyse hazır sonucu kullan)
+                if id(article) in pregenerated_tweets:
+                    tweet_data = pregenerated_tweets[id(article)]
+                else:
+                    update_progress("Tweet Oluşturuluyor", f"AI ile tweet oluşturuluyor: {article['title'][:50]}...", 4 + i, 4 + len(articles[:max_articles]))
+                    terminal_log(f"🤖 Tweet oluşturuluyor (tema: {theme}): {article['title'][:50]}...", "info")
+                    with trace_span(article_title[:80], kind="article"):
+                        tweet_data = generate_ai_tweet_with_content(article, api_key, theme)
                 
                 if not tweet_data or not tweet_data.get('tweet'):
                     terminal_log(f"❌ Tweet oluşturulamadı: {article['title'][:50]}...", "error")
@@ -1010,7 +1064,9 @@ def check_and_post_articles():
                 if auto_post and not manual_approval:
                     # Direkt paylaş
                     update_progress("Tweet Paylaşılıyor", f"Tweet paylaşılıyor: {article['title'][:50]}...", 4 + i, 4 + len(articles[:max_articles]))
-                    tweet_result = post_tweet(tweet_data['tweet'], article['title'])
+                    with trace_span("post_tweet") as post_span:
+                        tweet_result = post_tweet(tweet_data['tweet'], article['title'])
+                        post_span.set(success=bool(tweet_result.get('success')))
                     
                     if tweet_result.get('success'):
                         mark_article_as_posted(article, tweet_result)
@@ -1042,8 +1098,6 @@ def check_and_post_articles():
                             save_automation_settings(settings)
                             
                             # Bu makaleyi de pending'e ekle ve döngüyü kır
-                            pending_tweets = load_json("pending_tweets.json")
-                            
                             new_tweet = {
                                 "article": article,
                                 "tweet_data": tweet_data,
@@ -1054,21 +1108,9 @@ def check_and_post_articles():
                                 "retry_count": 0
                             }
                             
-                            # Duplikat kontrolü
-                            article_url = article.get('url', '')
-                            article_hash = article.get('hash', '')
-                            
-                            is_duplicate = False
-                            for existing_tweet in pending_tweets:
-                                existing_article = existing_tweet.get('article', {})
-                                if (article_url and article_url == existing_article.get('url', '')) or \
-                                   (article_hash and article_hash == existing_article.get('hash', '')):
-                                    is_duplicate = True
-                                    break
-                            
-                            if not is_duplicate:
-                                pending_tweets.append(new_tweet)
-                                save_json("pending_tweets.json", pending_tweets)
+                            # Duplikat kontrolü ve ekleme tek kuyruk işleminde
+                            added, _ = add_pending_tweet(new_tweet)
+                            if added:
                                 pending_count += 1
                                 terminal_log(f"📝 Tweet pending listesine eklendi: {article['title'][:50]}...", "info")
                             
@@ -1077,8 +1119,6 @@ def check_and_post_articles():
                         
                         terminal_log(f"📝 Tweet pending listesine ekleniyor: {article['title'][:50]}...", "info")
                         
-                        pending_tweets = load_json("pending_tweets.json")
-                        
                         # Duplikat kontrolü yap
                         new_tweet = {
                             "article": article,
@@ -1101,35 +1141,16 @@ def check_and_post_articles():
                             article['hash'] = article_hash
                             new_tweet['article'] = article
                         
-                        is_duplicate = False
-                        for existing_tweet in pending_tweets:
-                            existing_article = existing_tweet.get('article', {})
-                            existing_url = existing_article.get('url', '')
-                            existing_hash = existing_article.get('hash', '')
-                            
-                            # URL kontrolü
-                            if article_url and article_url == existing_url:
-                                is_duplicate = True
-                                terminal_log(f"⚠️ Duplikat URL atlandı: {article['title'][:50]}...", "warning")
-                                break
-                            
-                            # Hash kontrolü
-                            if article_hash and article_hash == existing_hash:
-                                is_duplicate = True
-                                terminal_log(f"⚠️ Duplikat hash atlandı: {article['title'][:50]}...", "warning")
-                                break
-                        
-                        if not is_duplicate:
-                            pending_tweets.append(new_tweet)
-                            save_json("pending_tweets.json", pending_tweets)
+                        # Duplikat kontrolü ve ekleme tek kuyruk işleminde (URL/hash)
+                        added, _ = add_pending_tweet(new_tweet)
+                        if added:
                             pending_count += 1
                             terminal_log(f"✅ Tweet pending listesine eklendi: {article['title'][:50]}...", "success")
                         else:
-                            terminal_log(f"🔄 Duplikat tweet pending listesine eklenmedi", "info")
+                            terminal_log(f"⚠️ Duplikat tweet pending listesine eklenmedi: {article['title'][:50]}...", "warning")
                 else:
                     # Manuel onay gerekli - pending listesine ekle
                     terminal_log(f"📝 Manuel onay gerekli veya auto_post devre dışı - pending listesine ekleniyor", "info")
-                    pending_tweets = load_json("pending_tweets.json")
                     
                     # Duplikat kontrolü yap
                     new_tweet = {
@@ -1151,30 +1172,10 @@ def check_and_post_articles():
                         article['hash'] = article_hash
                         new_tweet['article'] = article
                     
-                    is_duplicate = False
-                    for existing_tweet in pending_tweets:
-                        existing_article = existing_tweet.get('article', {})
-                        existing_url = existing_article.get('url', '')
-                        existing_hash = existing_article.get('hash', '')
-                        
-                        # URL kontrolü
-                        if article_url and article_url == existing_url:
-                            is_duplicate = True
-                            terminal_log(f"⚠️ Duplikat URL atlandı: {article['title'][:50]}...", "warning")
-                            break
-                        
-                        # Hash kontrolü
-                        if article_hash and article_hash == existing_hash:
-                            is_duplicate = True
-                            terminal_log(f"⚠️ Duplikat hash atlandı: {article['title'][:50]}...", "warning")
-                            break
-                    
-                    if not is_duplicate:
-                        # ID ekle
-                        update_progress("Tweet Kaydediliyor", f"Tweet onay listesine ekleniyor: {article['title'][:50]}...", 4 + i, 4 + len(articles[:max_articles]))
-                        new_tweet['id'] = len(pending_tweets) + 1
-                        pending_tweets.append(new_tweet)
-                        save_json("pending_tweets.json", pending_tweets)
+                    # Duplikat kontrolü, ID ataması ve ekleme tek kuyruk işleminde (URL/hash)
+                    update_progress("Tweet Kaydediliyor", f"Tweet onay listesine ekleniyor: {article['title'][:50]}...", 4 + i, 4 + len(articles[:max_articles]))
+                    added, _ = add_pending_tweet(new_tweet)
+                    if added:
                         pending_count += 1
                         terminal_log(f"📝 Tweet onay bekliyor: {article['title'][:50]}... (ID: {new_tweet['id']})", "success")
                     else:
@@ -1323,14 +1324,11 @@ def post_tweet_route():
                 })
             
             # Posted articles'a ekle
-            posted_articles = load_json("posted_articles.json")
-            posted_articles.append(article_data)
-            save_json("posted_articles.json", posted_articles)
+            append_json_record("posted_articles.json", article_data)
             
-            # Pending listesinden kaldır
+            # Pending listesinden kaldır - paylaşım sürerken eklenen tweet'ler korunur
             if tweet_index is not None:
-                pending_tweets.pop(tweet_index)
-                save_json("pending_tweets.json", pending_tweets)
+                remove_pending_tweets([tweet_to_post.get('id', tweet_index + 1)])
             
             # Telegram bildirimi
             settings = load_automation_settings()
@@ -1469,16 +1467,13 @@ def delete_tweet_route():
                 })
             
             # Posted articles'a "silindi" olarak ekle
-            posted_articles = load_json("posted_articles.json")
-            posted_articles.append(article_data)
-            save_json("posted_articles.json", posted_articles)
+            append_json_record("posted_articles.json", article_data)
             
             terminal_log(f"📝 Tweet silindi olarak işaretlendi: {article_data.get('title', '')[:50]}...", "info")
         
-        # Pending listesinden kaldır
-        if tweet_index is not None:
-            pending_tweets.pop(tweet_index)
-            save_json("pending_tweets.json", pending_tweets)
+        # Pending listesinden kaldır (kalıcı ID ile - arada eklenen kayıtlar korunur)
+        if deleted_tweet is not None:
+            remove_pending_tweets([deleted_tweet['id']])
         
         return jsonify({
             "success": True, 
@@ -1599,8 +1594,6 @@ def manual_post_tweet_route():
                 mark_article_as_posted(tweet_to_post['article'], manual_tweet_result)
             else:
                 # GitHub repo tweet'i veya diğer türler
-                posted_articles = load_json('posted_articles.json')
-                
                 # Hash yoksa oluştur
                 hash_value = tweet_to_post.get('hash', '')
                 if not hash_value:
@@ -1639,8 +1632,7 @@ def manual_post_tweet_route():
                         "topics": tweet_to_post.get('topics', [])
                     })
                 
-                posted_articles.append(posted_article)
-                save_json('posted_articles.json', posted_articles)
+                append_json_record('posted_articles.json', posted_article)
             
             terminal_log(f"✅ Manuel paylaşım sonrası tweet kaydedildi: {tweet_to_post.get('title', '')[:50]}...", "success")
             
@@ -1649,9 +1641,8 @@ def manual_post_tweet_route():
         
         # Pending listesinden kaldır - hata olsa bile kaldır
         try:
-            if tweet_index is not None:
-                pending_tweets.pop(tweet_index)
-                save_json("pending_tweets.json", pending_tweets)
+            if tweet_to_post is not None:
+                remove_pending_tweets([tweet_to_post['id']])
                 terminal_log(f"✅ Tweet pending listesinden kaldırıldı: {tweet_to_post.get('title', '')[:50]}...", "success")
         except Exception as remove_error:
             terminal_log(f"❌ Tweet kaldırma hatası: {remove_error}", "error")
@@ -1677,7 +1668,10 @@ def manual_post_tweet_route():
 @app.route('/bulk_tweet_action', methods=['POST'])
 @login_required
 def bulk_tweet_action():
-    """Toplu tweet işlemleri - onaylama veya reddetme"""
+    """Toplu tweet işlemleri - onaylama veya reddetme.
+    
+    Reddetme tek geçişte yapılır; onaylanan tweet'ler arka plan paylaşım
+    kuyruğuna verilir ve dönen job_id ile /api/post_jobs/<job_id> sorgulanır."""
     try:
         data = request.get_json()
         tweet_ids = data.get('tweet_ids', [])
@@ -1689,233 +1683,33 @@ def bulk_tweet_action():
         if action not in ['approve', 'reject']:
             return jsonify({"success": False, "error": "Geçersiz işlem türü"})
         
-        # Pending tweets yükle
-        pending_tweets = load_json("pending_tweets.json", [])
-        pending_tweets = ensure_tweet_ids(pending_tweets)
-        
-        processed_count = 0
-        errors = []
-        
-        for tweet_id in tweet_ids:
-            try:
-                # Tweet'i bul
-                tweet_to_process = None
-                tweet_index = None
-                
-                for i, pending in enumerate(pending_tweets):
-                    try:
-                        pending_id = pending.get('id') if isinstance(pending, dict) else getattr(pending, 'id', None)
-                        if pending_id is None:
-                            pending_id = i + 1
-                            if isinstance(pending, dict):
-                                pending['id'] = pending_id
-                        
-                        if str(pending_id) == str(tweet_id):
-                            tweet_to_process = pending
-                            tweet_index = i
-                            break
-                    except (AttributeError, TypeError):
-                        if str(i + 1) == str(tweet_id):
-                            tweet_to_process = pending
-                            tweet_index = i
-                            break
-                
-                if not tweet_to_process:
-                    errors.append(f"Tweet ID {tweet_id} bulunamadı")
-                    continue
-                
-                if action == 'approve':
-                    # Tweet'i paylaş
-                    try:
-                        from utils import post_tweet, mark_article_as_posted
-                        
-                        # Hash kontrolü - tekrar paylaşımı önle
-                        hash_value = tweet_to_process.get('hash', '')
-                        if not hash_value:
-                            import hashlib
-                            title = tweet_to_process.get('title', '')
-                            if title:
-                                hash_value = hashlib.md5(title.encode()).hexdigest()
-                        
-                        # Posted articles kontrolü - hash ile tekrar paylaşımı önle
-                        posted_articles = load_json("posted_articles.json")
-                        already_posted = False
-                        for posted in posted_articles:
-                            posted_hash = posted.get('hash', '')
-                            if hash_value and hash_value == posted_hash:
-                                already_posted = True
-                                terminal_log(f"⚠️ Tweet zaten paylaşılmış (hash kontrolü): {tweet_to_process.get('title', '')[:50]}...", "warning")
-                                break
-                        
-                        if already_posted:
-                            errors.append(f"Tweet ID {tweet_id}: Bu tweet zaten paylaşılmış")
-                            continue
-                        
-                        # Tweet metnini bul - farklı alan isimleri dene
-                        tweet_text = ''
-                        if isinstance(tweet_to_process, dict):
-                            # Önce content alanına bak
-                            tweet_text = tweet_to_process.get('content', '')
-                            
-                            # Content boşsa tweet_data.tweet alanına bak
-                            if not tweet_text and 'tweet_data' in tweet_to_process:
-                                tweet_data = tweet_to_process['tweet_data']
-                                if isinstance(tweet_data, dict):
-                                    tweet_text = tweet_data.get('tweet', '')
-                            
-                            # Hala boşsa direk tweet alanına bak
-                            if not tweet_text:
-                                tweet_text = tweet_to_process.get('tweet', '')
-                        
-                        # Tweet metni hala boşsa hata ver
-                        if not tweet_text or not tweet_text.strip():
-                            errors.append(f"Tweet ID {tweet_id}: Tweet metni boş olamaz")
-                            continue
-                        
-                        # Twitter API ile paylaş
-                        tweet_result = post_tweet(tweet_text)
-                        
-                        if tweet_result.get('success'):
-                            # Hash yoksa oluştur
-                            hash_value = tweet_to_process.get('hash', '')
-                            if not hash_value:
-                                import hashlib
-                                title = tweet_to_process.get('title', '')
-                                if title:
-                                    hash_value = hashlib.md5(title.encode()).hexdigest()
-                            
-                            # Paylaşılan tweet'lere ekle
-                            mark_article_as_posted({
-                                'id': tweet_to_process.get('id'),
-                                'title': tweet_to_process.get('title', ''),
-                                'hash': hash_value,
-                                'content': tweet_to_process.get('content', ''),
-                                'url': tweet_to_process.get('url', ''),
-                                'source': tweet_to_process.get('source', ''),
-                                'category': tweet_to_process.get('category', 'ai_general'),
-                                'tags': tweet_to_process.get('tags', []),
-                                'score': tweet_to_process.get('score', 0),
-                                'posted_date': datetime.now().isoformat(),
-                                'tweet_text': tweet_text,  # Bulunan tweet metnini kullan
-                                'manual_approval': True,
-                                'bulk_operation': True
-                            }, tweet_result)
-                            
-                            # Pending'den kaldır - sadece başarılı işlem sonrası
-                            try:
-                                pending_tweets.pop(tweet_index)
-                                processed_count += 1
-                                terminal_log(f"✅ Bulk approve: Tweet {tweet_id} başarıyla paylaşıldı", "success")
-                            except IndexError:
-                                terminal_log(f"⚠️ Tweet {tweet_id} pending listesinden kaldırılamadı (index hatası)", "warning")
-                        else:
-                            # Detaylı hata bilgisi
-                            error_detail = tweet_result.get('error', 'API hatası')
-                            is_rate_limited = tweet_result.get('rate_limited', False)
-                            config_error = tweet_result.get('config_error', False)
-                            
-                            if config_error:
-                                errors.append(f"Tweet ID {tweet_id}: API yapılandırma hatası - {error_detail}")
-                            elif is_rate_limited:
-                                wait_minutes = tweet_result.get('wait_minutes', 15)
-                                errors.append(f"Tweet ID {tweet_id}: Rate limit ({wait_minutes}dk bekle) - {error_detail}")
-                            else:
-                                errors.append(f"Tweet ID {tweet_id}: {error_detail}")
-                            
-                            terminal_log(f"❌ Bulk approve başarısız: Tweet {tweet_id} - {error_detail}", "error")
-                            
-                    except Exception as e:
-                        errors.append(f"Tweet ID {tweet_id} paylaşım hatası: {str(e)}")
-                
-                elif action == 'reject':
-                    # Tweet'i sil ve posted_articles.json'a deleted:true ile kaydet
-                    try:
-                        # Hash kontrolü - tekrar reddetmeyi önle
-                        hash_value = tweet_to_process.get('hash', '')
-                        if not hash_value:
-                            import hashlib
-                            title = tweet_to_process.get('title', '')
-                            if title:
-                                hash_value = hashlib.md5(title.encode()).hexdigest()
-                        
-                        # Posted articles kontrolü - hash ile tekrar reddetmeyi önle
-                        posted_articles = load_json("posted_articles.json")
-                        already_rejected = False
-                        for posted in posted_articles:
-                            posted_hash = posted.get('hash', '')
-                            if hash_value and hash_value == posted_hash and posted.get('deleted', False):
-                                already_rejected = True
-                                terminal_log(f"⚠️ Tweet zaten reddedilmiş (hash kontrolü): {tweet_to_process.get('title', '')[:50]}...", "warning")
-                                break
-                        
-                        if already_rejected:
-                            errors.append(f"Tweet ID {tweet_id}: Bu tweet zaten reddedilmiş")
-                            continue
-                        
-                        # Tweet metnini bul - approve ile aynı mantık
-                        tweet_text = ''
-                        if isinstance(tweet_to_process, dict):
-                            tweet_text = tweet_to_process.get('content', '')
-                            if not tweet_text and 'tweet_data' in tweet_to_process:
-                                tweet_data = tweet_to_process['tweet_data']
-                                if isinstance(tweet_data, dict):
-                                    tweet_text = tweet_data.get('tweet', '')
-                            if not tweet_text:
-                                tweet_text = tweet_to_process.get('tweet', '')
-                        
-                        # Posted articles'a "silindi" olarak ekle
-                        
-                        deleted_article = {
-                            "title": tweet_to_process.get('title', ''),
-                            "url": tweet_to_process.get('url', ''),
-                            "hash": hash_value,
-                            "content": tweet_to_process.get('content', ''),
-                            "source": tweet_to_process.get('source', ''),
-                            "source_type": tweet_to_process.get('source_type', 'news'),
-                            "published_date": tweet_to_process.get('created_at', datetime.now().isoformat()),
-                            "posted_date": datetime.now().isoformat(),
-                            "tweet_text": tweet_text,  # Bulunan tweet metnini kullan
-                            "deleted": True,
-                            "deleted_date": datetime.now().isoformat(),
-                            "deletion_reason": 'Bulk rejection',
-                            "bulk_operation": True,
-                            "is_posted": False
-                        }
-                        
-                        # GitHub repo ise ek bilgileri ekle
-                        if tweet_to_process.get('source_type') == 'github':
-                            deleted_article.update({
-                                "type": "github_repo",
-                                "repo_data": tweet_to_process.get('repo_data', {}),
-                                "language": tweet_to_process.get('language', ''),
-                                "stars": tweet_to_process.get('stars', 0),
-                                "forks": tweet_to_process.get('forks', 0),
-                                "owner": tweet_to_process.get('owner', ''),
-                                "topics": tweet_to_process.get('topics', [])
-                            })
-                        
-                        posted_articles.append(deleted_article)
-                        save_json("posted_articles.json", posted_articles)
-                        
-                        # Pending'den kaldır
-                        pending_tweets.pop(tweet_index)
-                        processed_count += 1
-                        
-                        terminal_log(f"🗑️ Bulk reject: Tweet {tweet_id} silindi olarak işaretlendi", "info")
-                        
-                    except Exception as e:
-                        errors.append(f"Tweet ID {tweet_id} silme hatası: {str(e)}")
-                        
-            except Exception as e:
-                errors.append(f"Tweet ID {tweet_id} işlem hatası: {str(e)}")
+        if action == 'approve':
+            queued = queue_pending_for_posting(tweet_ids)
+            errors = queued["errors"]
+            if not queued["job_id"]:
+                return jsonify({
+                    "success": False,
+                    "error": f"Hiçbir tweet işlenemedi. Hatalar: {'; '.join(errors)}"
+                })
+            
+            message = f"{queued['queued_count']} tweet paylaşım kuyruğuna alındı"
+            if errors:
+                message += f". {len(errors)} hata oluştu."
+            terminal_log(f"📤 Bulk approve: {queued['queued_count']} tweet kuyrukta (iş {queued['job_id']}), {len(errors)} hata", "info")
+            
+            return jsonify({
+                "success": True,
+                "job_id": queued["job_id"],
+                "queued_count": queued["queued_count"],
+                "errors": errors,
+                "message": message
+            })
         
-        # Güncellenmiş pending tweets'i kaydet
-        save_json("pending_tweets.json", pending_tweets)
+        processed_count, errors = bulk_reject_pending(tweet_ids)
         
         # Sonucu döndür
         if processed_count > 0:
-            action_text = "onaylandı" if action == 'approve' else "reddedildi"
-            message = f"{processed_count} tweet başarıyla {action_text}"
+            message = f"{processed_count} tweet başarıyla reddedildi"
             if errors:
                 message += f". {len(errors)} hata oluştu."
             
@@ -1937,6 +1731,30 @@ def bulk_tweet_action():
         terminal_log(f"❌ Bulk operation hatası: {e}", "error")
         return jsonify({"success": False, "error": f"Toplu işlem hatası: {str(e)}"})
 
+@app.route('/api/post_jobs', methods=['GET'])
+@login_required
+def post_jobs_api():
+    """Paylaşım kuyruğunun durumu ve son işler"""
+    return jsonify({"success": True, **get_post_queue_stats()})
+
+@app.route('/api/post_jobs/<job_id>', methods=['GET'])
+@login_required
+def post_job_status_api(job_id):
+    """Toplu onay işinin ilerlemesi - arayüz bitene kadar sorgular"""
+    job = get_post_job(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": "İş bulunamadı"}), 404
+    return jsonify({"success": True, "job": job})
+
+@app.route('/api/post_jobs/<job_id>/cancel', methods=['POST'])
+@login_required
+def cancel_post_job_api(job_id):
+    """İşin henüz paylaşılmamış tweet'lerini iptal et"""
+    if not cancel_post_job(job_id):
+        return jsonify({"success": False, "error": "İş bulunamadı veya zaten bitti"}), 404
+    terminal_log(f"⏹️ Paylaşım işi iptal edildi: {job_id}", "info")
+    return jsonify({"success": True, "message": "İş iptal edildi"})
+
 @app.route('/bulk_delete_rejected', methods=['POST'])
 @login_required
 def bulk_delete_rejected():
@@ -1948,29 +1766,11 @@ def bulk_delete_rejected():
         if not article_ids:
             return jsonify({"success": False, "error": "Makale ID'leri gerekli"})
         
-        # Reddedilen makaleleri yükle
-        rejected_articles = load_json("rejected_articles.json", [])
-        
-        deleted_count = 0
-        errors = []
+        deleted_titles, errors = bulk_delete_rejected_positions(article_ids)
+        deleted_count = len(deleted_titles)
         
-        # ID'leri ters sırada işle (büyük indeksten küçüğe) - silme işlemi için
-        sorted_ids = sorted([int(id) for id in article_ids], reverse=True)
-        
-        for article_id in sorted_ids:
-            try:
-                if 0 <= article_id < len(rejected_articles):
-                    # Makaleyi sil
-                    deleted_article = rejected_articles.pop(article_id)
-                    deleted_count += 1
-                    terminal_log(f"🗑️ Reddedilen makale silindi: {deleted_article.get('title', '')[:50]}...", "info")
-                else:
-                    errors.append(f"Makale ID {article_id} geçersiz")
-            except Exception as e:
-                errors.append(f"Makale ID {article_id} silme hatası: {str(e)}")
-        
-        # Güncellenmiş listeyi kaydet
-        save_json("rejected_articles.json", rejected_articles)
+        for title in deleted_titles:
+            terminal_log(f"🗑️ Reddedilen makale silindi: {title[:50]}...", "info")
         
         if deleted_count > 0:
             message = f"{deleted_count} reddedilen makale başarıyla silindi"
@@ -2108,8 +1908,6 @@ def retry_rejected_article():
                 return jsonify({"success": False, "error": "Tweet oluşturulamadı"})
             
             # Pending listesine ekle
-            pending_tweets = load_json("pending_tweets.json")
-            
             new_tweet = {
                 "article": article_data,
                 "tweet_data": tweet_data,
@@ -2121,10 +1919,8 @@ def retry_rejected_article():
                 "retry_count": 1
             }
             
-            # ID ekle
-            new_tweet['id'] = len(pending_tweets) + 1
-            pending_tweets.append(new_tweet)
-            save_json("pending_tweets.json", pending_tweets)
+            # ID ataması ve ekleme tek kuyruk işleminde (len+1 mevcut ID ile çakışabiliyordu)
+            add_pending_tweet(new_tweet)
             
             # Reddedilen makaleyi listeden kaldır
             rejected_articles.pop(article_index)
@@ -2328,7 +2124,7 @@ def test_openrouter_models():
                 import time
                 start_time = time.time()
                 
-                response = openrouter_call(test_prompt, openrouter_key, max_tokens=100, model=model)
+                response = openrouter_call(test_prompt, openrouter_key, max_tokens=100, model=model, use_cache=False)
                 
                 end_time = time.time()
                 model_result["response_time"] = round(end_time - start_time, 2)
@@ -2430,6 +2226,11 @@ def system_status():
         
         status["health_score"] = f"{working_components}/{total_components}"
         
+        # Makale içerik önbelleği: boyut ve hit oranı
+        status["content_cache"] = get_content_cache_stats()
+        # Headless tarayıcı havuzu: sıcak tarayıcılar, açılış/render süreleri
+        status["render_pool"] = get_render_pool_stats()
+        
         return jsonify(status)
         
     except Exception as e:
@@ -2444,58 +2245,21 @@ def system_status():
 def rejected_articles():
     """Reddedilen makaleler sayfası"""
     try:
-        # Reddedilen makaleleri yükle
-        rejected_articles = load_json("rejected_articles.json", [])
-        
-        # Reddedilen makalelerin tarih formatını düzelt
-        for article in rejected_articles:
-            if 'rejected_at' in article:
-                try:
-                    from datetime import datetime
-                    rejected_date = datetime.fromisoformat(article['rejected_at'].replace('Z', '+00:00'))
-                    article['rejected_at_formatted'] = rejected_date.strftime('%d.%m.%Y %H:%M')
-                except:
-                    article['rejected_at_formatted'] = article.get('rejected_at', 'Bilinmiyor')
-            else:
-                article['rejected_at_formatted'] = 'Bilinmiyor'
-        
-        # İstatistikleri hesapla
-        stats = {
-            "total_rejected": len(rejected_articles),
-            "rejected_today": 0,
-            "rejected_this_week": 0,
-            "common_reasons": {}
-        }
-        
-        # Bugün ve bu hafta reddedilen sayılarını hesapla
-        today = datetime.now().date()
-        week_ago = today - timedelta(days=7)
-        
-        for article in rejected_articles:
-            try:
-                if 'rejected_at' in article:
-                    rejected_date = datetime.fromisoformat(article['rejected_at'].replace('Z', '+00:00')).date()
-                    
-                    if rejected_date == today:
-                        stats["rejected_today"] += 1
-                    
-                    if rejected_date >= week_ago:
-                        stats["rejected_this_week"] += 1
-            except:
-                pass
-            
-            # Red sebeplerini say
-            reason = article.get('reason', 'Bilinmeyen')
-            stats["common_reasons"][reason] = stats["common_reasons"].get(reason, 0) + 1
+        # Reddedilen makaleler sayfa sayfa, sunucu tarafında süzülerek yüklenir
+        listing_filters, sort, descending, cursor, limit = _listing_args()
+        page = list_records("rejected", listing_filters, sort, descending, cursor, limit)
+        rejected_articles = page["items"]
         
-        # En sık görülen sebepleri sırala
-        stats["common_reasons"] = dict(sorted(stats["common_reasons"].items(), key=lambda x: x[1], reverse=True)[:5])
+        # İstatistikler sayaçlardan gelir - tüm liste taranmaz
+        stats = get_rejected_stats()
         
-        terminal_log(f"📊 Reddedilen makaleler sayfası yüklendi: {len(rejected_articles)} makale", "info")
+        terminal_log(f"📊 Reddedilen makaleler sayfası yüklendi: {len(rejected_articles)}/{page['total']} makale", "info")
         
         return render_template('rejected_articles.html', 
                              rejected_articles=rejected_articles,
-                             stats=stats)
+                             stats=stats,
+                             total_count=page["total"],
+                             next_cursor=page["next_cursor"])
                              
     except Exception as e:
         safe_log(f"Reddedilen makaleler sayfası hatası: {str(e)}", "ERROR")
@@ -2710,8 +2474,6 @@ def confirm_manual_post():
             mark_article_as_posted(tweet_to_post['article'], manual_tweet_result)
         else:
             # GitHub repo tweet'i veya diğer türler
-            posted_articles = load_json('posted_articles.json')
-            
             # Hash yoksa oluştur
             hash_value = tweet_to_post.get('hash', '')
             if not hash_value:
@@ -2750,13 +2512,10 @@ def confirm_manual_post():
                     "topics": tweet_to_post.get('topics', [])
                 })
             
-            posted_articles.append(posted_article)
-            save_json('posted_articles.json', posted_articles)
+            append_json_record('posted_articles.json', posted_article)
         
-        # Pending listesinden kaldır
-        if tweet_index is not None:
-            pending_tweets.pop(tweet_index)  # Index'e göre direkt kaldır
-            save_json("pending_tweets.json", pending_tweets)
+        # Pending listesinden kaldır (kalıcı ID ile - arada eklenen kayıtlar korunur)
+        remove_pending_tweets([tweet_id])
         
         safe_log(f"Tweet başarıyla onaylandı ve kaldırıldı - ID: {tweet_id}", "INFO")
         
@@ -2993,7 +2752,7 @@ def test_api_connections():
             from utils import ai_call
             api_key = os.environ.get('OPENROUTER_API_KEY')
             if api_key:
-                test_result = ai_call("Test", api_key)
+                test_result = ai_call("Test", api_key, use_cache=False)
                 results["openrouter_api"] = {
                     "working": bool(test_result and test_result != "API hatası"),
                     "message": "✅ Çalışıyor" if test_result else "❌ Yanıt alınamadı"
@@ -3108,7 +2867,7 @@ def api_status():
             from utils import ai_call
             api_key = os.environ.get('OPENROUTER_API_KEY')
             if api_key:
-                test_result = ai_call("Test message", api_key)
+                test_result = ai_call("Test message", api_key, use_cache=False)
                 status["openrouter_api_test"] = "ÇALIŞIYOR" if (test_result and test_result != "API hatası") else "HATA"
             else:
                 status["openrouter_api_test"] = "API ANAHTARI EKSİK"
@@ -3124,6 +2883,20 @@ def api_status():
     except Exception as e:
         return jsonify({"error": str(e)})
 
+def _dashboard_counts():
+    """Panel sayaçları - /api/dashboard_data ve /api/events 'dashboard' olayı ortak kullanır"""
+    stats = get_data_statistics()
+    return {
+        "pending_tweets": len(load_json("pending_tweets.json", [])),
+        "today_articles": stats.get('today_articles', 0),
+        "total_articles": stats.get('total_articles', 0),
+        "today_pending": stats.get('today_pending', 0),
+        "average_score": stats.get('average_score', 0)
+    }
+
+# Başka süreçlerin (start_scheduler.py) yazımları da aboneler varken yakalanır
+get_event_bus().watch("dashboard", _dashboard_counts)
+
 @app.route('/api/dashboard_data')
 @login_required
 def api_dashboard_data():
@@ -3133,12 +2906,9 @@ def api_dashboard_data():
         last_check = session.get('last_dashboard_check', 0)
         current_time = time.time()
         
-        # İstatistikleri al
-        stats = get_data_statistics()
-        
-        # Pending tweets yükle
-        pending_tweets = load_json("pending_tweets.json", [])
-        current_pending_count = len(pending_tweets)
+        # İstatistikler ve pending sayısı
+        counts = _dashboard_counts()
+        current_pending_count = counts["pending_tweets"]
         
         # Önceki pending count ile karşılaştır
         previous_pending_count = session.get('previous_pending_count', 0)
@@ -3157,13 +2927,7 @@ def api_dashboard_data():
         
         return jsonify({
             "success": True,
-            "stats": {
-                "pending_tweets": current_pending_count,
-                "today_articles": stats.get('today_articles', 0),
-                "total_articles": stats.get('total_articles', 0),
-                "today_pending": stats.get('today_pending', 0),
-                "average_score": stats.get('average_score', 0)
-            },
+            "stats": counts,
             "automation": {
                 "auto_mode": automation_status.get('auto_mode', False),
                 "check_interval_hours": automation_status.get('check_interval_hours', 3),
@@ -3391,12 +3155,7 @@ def create_tweet():
             try:
                 if action == 'direct_post':
                     # Doğrudan pending tweets'e ekle
-                    from utils import save_json, load_json, get_next_tweet_id
-                    
-                    pending_tweets = load_json("pending_tweets.json", [])
-                    
                     new_tweet = {
-                        "id": get_next_tweet_id(pending_tweets),
                         "title": f"Manuel Tweet - {selected_theme.title()}",
                         "content": final_tweet_text,
                         "tweet_text": final_tweet_text,
@@ -3413,8 +3172,8 @@ def create_tweet():
                         "auto_approved": True
                     }
                     
-                    pending_tweets.append(new_tweet)
-                    save_json("pending_tweets.json", pending_tweets)
+                    # ID ataması ve ekleme tek kuyruk işleminde (aynı URL zaten bekliyorsa o kayıt döner)
+                    _, new_tweet = add_pending_tweet(new_tweet)
                     
                     terminal_log(f"🚀 Manuel tweet doğrudan pending'e eklendi - ID: {new_tweet['id']}", "success")
                     flash(f'✅ Tweet oluşturuldu ve paylaşım kuyruğuna eklendi! (ID: {new_tweet["id"]})', 'success')
@@ -3949,70 +3708,55 @@ def ocr_image():
         terminal_log(f"❌ AJAX OCR genel hatası: {e}", "error")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+def scheduled_check_and_post():
+    """Zamanlayıcı işi: makaleleri kontrol et ve paylaş"""
+    global last_check_time
+    
+    result = check_and_post_articles()
+    last_check_time = datetime.now()
+    terminal_log(f"✅ Otomatik kontrol tamamlandı: {result.get('message', 'Sonuç yok')}", "success")
+    return result
+
+def register_automation_jobs(scheduler=None):
+    """Otomatik haber kontrolünü ortak zamanlayıcıya ekle (app thread'i ve start_scheduler.py)"""
+    scheduler = scheduler or get_job_scheduler(load_automation_settings)
+    scheduler.register(ScheduledJob(
+        AUTOMATION_JOB_ID,
+        scheduled_check_and_post,
+        interval=lambda settings: float(settings.get('check_interval_hours', 3)) * 3600,
+        enabled=lambda settings: settings.get('auto_mode', False),
+        label="Otomatik haber kontrolü"
+    ))
+    return scheduler
+
+def get_automation_scheduler():
+    """İşleri kayıtlı süreç zamanlayıcısı - kayıt süreç başına bir kez yapılır.
+    
+    Her istekte tekrar kayıt reschedule() çalıştırdığından route'lar bunu kullanır."""
+    global _automation_scheduler
+    if _automation_scheduler is None:
+        with _automation_scheduler_lock:
+            if _automation_scheduler is None:
+                _automation_scheduler = register_automation_jobs()
+    return _automation_scheduler
+
 def background_scheduler():
-    """Arka plan zamanlayıcısı - Akıllı otomatik sistem"""
+    """Arka plan zamanlayıcısı - sonraki kontrol zamanına kadar uyur, ayar değişikliğinde uyanır"""
     global background_scheduler_running, last_check_time
     
     terminal_log("🚀 Akıllı otomatik zamanlayıcı başlatıldı", "success")
     background_scheduler_running = True
-    
-    # İlk çalıştırmayı hemen yap
-    terminal_log("🔄 İlk otomatik kontrol başlatılıyor...", "info")
     try:
-        settings = load_automation_settings()
-        if settings.get('auto_mode', False):
-            result = check_and_post_articles()
-            terminal_log(f"✅ İlk kontrol tamamlandı: {result.get('message', 'Sonuç yok')}", "success")
-            last_check_time = datetime.now()
-        else:
+        scheduler = get_automation_scheduler()
+        # Son kontrol zamanı kalıcı tablodan gelir; yeniden başlatmada sıfırlanmaz
+        last_check_time = scheduler.last_run_time(AUTOMATION_JOB_ID)
+        if not load_automation_settings().get('auto_mode', False):
             terminal_log("⏸️ Otomatik mod devre dışı, bekleme modunda", "warning")
+        scheduler.run_forever()
     except Exception as e:
-        terminal_log(f"❌ İlk kontrol hatası: {e}", "error")
-    
-    while background_scheduler_running:
-        try:
-            # Ayarları her döngüde yeniden yükle
-            settings = load_automation_settings()
-            
-            if settings.get('auto_mode', False):
-                current_time = datetime.now()
-                check_interval_hours = settings.get('check_interval_hours', 3)
-                
-                # Son kontrolden beri geçen süreyi hesapla
-                if last_check_time:
-                    time_passed = current_time - last_check_time
-                    time_passed_hours = time_passed.total_seconds() / 3600
-                    
-                    if time_passed_hours >= check_interval_hours:
-                        terminal_log(f"🔄 Otomatik kontrol zamanı geldi ({time_passed_hours:.1f} saat geçti)", "info")
-                        
-                        try:
-                            result = check_and_post_articles()
-                            terminal_log(f"✅ Otomatik kontrol tamamlandı: {result.get('message', 'Sonuç yok')}", "success")
-                            last_check_time = current_time
-                        except Exception as check_error:
-                            terminal_log(f"❌ Otomatik kontrol hatası: {check_error}", "error")
-                    else:
-                        remaining_hours = check_interval_hours - time_passed_hours
-                        terminal_log(f"⏰ Sonraki kontrol: {remaining_hours:.1f} saat sonra", "info")
-                else:
-                    # İlk çalıştırma
-                    terminal_log("🔄 İlk otomatik kontrol başlatılıyor...", "info")
-                    try:
-                        result = check_and_post_articles()
-                        terminal_log(f"✅ İlk kontrol tamamlandı: {result.get('message', 'Sonuç yok')}", "success")
-                        last_check_time = current_time
-                    except Exception as check_error:
-                        terminal_log(f"❌ İlk kontrol hatası: {check_error}", "error")
-            else:
-                terminal_log("⏸️ Otomatik mod devre dışı", "info")
-            
-            # Daha sık kontrol et (5 dakika)
-            time.sleep(300)  # 5 dakika = 300 saniye
-            
-        except Exception as e:
-            terminal_log(f"❌ Arka plan zamanlayıcı hatası: {e}", "error")
-            time.sleep(300)  # Hata durumunda da 5 dakika bekle
+        terminal_log(f"❌ Arka plan zamanlayıcı hatası: {e}", "error")
+    finally:
+        background_scheduler_running = False
 
 def start_background_scheduler():
     """Arka plan zamanlayıcısını thread olarak başlat"""
@@ -4022,7 +3766,7 @@ def start_background_scheduler():
         try:
             scheduler_thread = threading.Thread(target=background_scheduler, daemon=True)
             scheduler_thread.start()
-            terminal_log("🚀 Arka plan zamanlayıcısı başlatıldı (Her 5 dakikada kontrol eder)", "success")
+            terminal_log("🚀 Arka plan zamanlayıcısı başlatıldı (sonraki kontrol zamanına kadar uyur)", "success")
             terminal_log("🔄 Arka plan zamanlayıcı thread'i başlatıldı", "info")
             
             # Thread'in gerçekten başladığını kontrol et
@@ -4721,7 +4465,7 @@ def test_news_fetching_methods():
         # Özel kaynaklar test
         try:
             terminal_log("📰 Özel kaynaklar test ediliyor...", "info")
-            custom_articles = fetch_articles_from_custom_sources()
+            custom_articles = fetch_articles_from_custom_sources(respect_schedule=False)
             results['custom_sources'] = {
                 'success': True,
                 'count': len(custom_articles) if custom_articles else 0,
@@ -4795,7 +4539,7 @@ def debug_test_article_fetch():
         # Test 1: Özel haber kaynakları
         try:
             terminal_log("🧪 Test 1: Özel haber kaynaklarını test ediliyor...", "info")
-            custom_articles = fetch_articles_from_custom_sources()
+            custom_articles = fetch_articles_from_custom_sources(respect_schedule=False)
             test_results["tests"]["custom_sources"] = {
                 "success": True,
                 "article_count": len(custom_articles) if custom_articles else 0,
@@ -5412,51 +5156,22 @@ def highlight_selectors_in_html(html_content, selectors):
 def deleted_tweets():
     """Silinmiş tweetler sayfası"""
     try:
-        # Tüm makaleleri yükle
-        all_articles = load_json("posted_articles.json")
-        
-        # Sadece silinmiş olanları filtrele
-        deleted_articles = [article for article in all_articles if article.get('deleted', False)]
-        
-        # Tarihe göre sırala (en yeni önce)
-        deleted_articles.sort(key=lambda x: x.get('deleted_date', ''), reverse=True)
+        # Silinmiş tweetler silinme tarihine göre (en yeni önce) sayfa sayfa yüklenir
+        listing_filters, sort, descending, cursor, limit = _listing_args()
+        page = list_records("deleted", listing_filters, sort, descending, cursor, limit)
+        deleted_articles = page["items"]
         
-        # İstatistikler
-        stats = {
-            'total_deleted': len(deleted_articles),
-            'deleted_today': 0,
-            'deleted_this_week': 0,
-            'deleted_this_month': 0
-        }
-        
-        # Tarih bazlı istatistikler
-        from datetime import datetime, timedelta
-        today = datetime.now().date()
-        week_ago = today - timedelta(days=7)
-        month_ago = today - timedelta(days=30)
-        
-        for article in deleted_articles:
-            deleted_date_str = article.get('deleted_date', '')
-            if deleted_date_str:
-                try:
-                    deleted_date = datetime.fromisoformat(deleted_date_str.replace('Z', '+00:00')).date()
-                    
-                    if deleted_date == today:
-                        stats['deleted_today'] += 1
-                    if deleted_date >= week_ago:
-                        stats['deleted_this_week'] += 1
-                    if deleted_date >= month_ago:
-                        stats['deleted_this_month'] += 1
-                        
-                except Exception as e:
-                    continue
+        # İstatistikler sayaçlardan gelir
+        stats = get_deleted_stats()
         
         # Debug için log
-        safe_log(f"Silinmiş tweetler sayfası: {len(deleted_articles)} silinmiş tweet", "DEBUG")
+        safe_log(f"Silinmiş tweetler sayfası: {len(deleted_articles)}/{page['total']} silinmiş tweet", "DEBUG")
         
         return render_template('deleted_tweets.html', 
                              deleted_articles=deleted_articles,
-                             stats=stats)
+                             stats=stats,
+                             total_count=page["total"],
+                             next_cursor=page["next_cursor"])
                              
     except Exception as e:
         safe_log(f"Silinmiş tweetler sayfası hatası: {str(e)}", "ERROR")
@@ -5555,26 +5270,31 @@ def automation_debug():
     settings = load_automation_settings()
     current_time = datetime.now()
     
+    scheduler = get_automation_scheduler()
+    job_status = scheduler.status()
+    automation_job = job_status['jobs'].get(AUTOMATION_JOB_ID, {})
+    persisted_last_check = scheduler.last_run_time(AUTOMATION_JOB_ID) or last_check_time
+    
     debug_info = {
         'current_time': current_time.isoformat(),
         'background_scheduler_running': background_scheduler_running,
-        'last_check_time': last_check_time.isoformat() if last_check_time else None,
+        'last_check_time': persisted_last_check.isoformat() if persisted_last_check else None,
         'settings': settings,
         'auto_mode': settings.get('auto_mode', False),
-        'check_interval_hours': settings.get('check_interval_hours', 3)
+        'check_interval_hours': settings.get('check_interval_hours', 3),
+        'scheduler': job_status
     }
     
-    # Sonraki kontrol zamanını hesapla
-    if last_check_time:
-        next_check = last_check_time + timedelta(hours=settings.get('check_interval_hours', 3))
-        remaining_seconds = (next_check - current_time).total_seconds()
-        debug_info['next_check_time'] = next_check.isoformat()
+    # Sonraki kontrol zamanı zamanlayıcı tablosundan
+    if automation_job.get('next_run'):
+        remaining_seconds = automation_job['seconds_until_next']
+        debug_info['next_check_time'] = automation_job['next_run']
         debug_info['remaining_hours'] = remaining_seconds / 3600
         debug_info['should_run_now'] = remaining_seconds <= 0
     else:
-        debug_info['next_check_time'] = 'İlk çalışma - hemen çalışmalı'
-        debug_info['remaining_hours'] = 0
-        debug_info['should_run_now'] = True
+        debug_info['next_check_time'] = None
+        debug_info['remaining_hours'] = None
+        debug_info['should_run_now'] = False
     
     return jsonify(debug_info)
 
@@ -5593,22 +5313,40 @@ def force_automation_run():
                 'message': 'Otomatik mod kapalı. Önce ayarlardan açın.'
             })
         
-        terminal_log("🔄 Manuel otomatik kontrol başlatılıyor...", "info")
+        # profile=1 ile çalışma örneklemeli profiler altında yapılır
+        payload = request.get_json(silent=True) or {}
+        profile_flag = str(request.args.get('profile', payload.get('profile', ''))).strip().lower()
+        profile_run = profile_flag in ('1', 'true', 'yes', 'on')
         
-        # Otomatik sistemi çalıştır
-        result = check_and_post_articles()
+        terminal_log(f"🔄 Manuel otomatik kontrol başlatılıyor...{' (profiler açık)' if profile_run else ''}", "info")
+        
+        # Otomatik sistemi zamanlayıcı üzerinden çalıştır (kilit + kalıcı son çalışma zamanı)
+        with profiling(profile_run):
+            outcome = get_automation_scheduler().run_now(AUTOMATION_JOB_ID)
+        
+        if not outcome.get('ran'):
+            return jsonify({
+                'success': False,
+                'message': 'Otomatik kontrol şu anda başka bir süreçte çalışıyor, lütfen bekleyin.'
+            })
+        if outcome.get('status') == 'error':
+            raise RuntimeError(outcome.get('message') or 'Bilinmeyen hata')
+        result = outcome.get('result') or {}
         
         # Last check time'ı güncelle
         last_check_time = datetime.now()
         
         terminal_log(f"✅ Manuel otomatik kontrol tamamlandı: {result.get('message', 'Sonuç yok')}", "success")
         
-        return jsonify({
+        response = {
             'success': True,
             'message': 'Otomatik kontrol başarıyla çalıştırıldı',
             'result': result,
             'last_check_time': last_check_time.isoformat()
-        })
+        }
+        if profile_run and result.get('run_id'):
+            response['profile_url'] = url_for('api_run_profile', run_id=result['run_id'])
+        return jsonify(response)
         
     except Exception as e:
         terminal_log(f"❌ Manuel otomatik kontrol hatası: {e}", "error")
@@ -5729,7 +5467,7 @@ def test_openrouter_api():
         for model in free_models:
             try:
                 terminal_log(f"🔍 Model test ediliyor: {model}", "info")
-                result = openrouter_call(test_prompt, openrouter_key, max_tokens=100, model=model)
+                result = openrouter_call(test_prompt, openrouter_key, max_tokens=100, model=model, use_cache=False)
                 
                 if result and len(result.strip()) > 5:
                     test_results.append({
@@ -5924,14 +5662,14 @@ def debug_openrouter_key():
         # Basit HTTP test
         if openrouter_key:
             try:
-                import requests
+                from utils import http_get
                 headers = {
                     "Authorization": f"Bearer {openrouter_key}",
                     "Content-Type": "application/json"
                 }
                 
                 # Basit bir test isteği (models endpoint)
-                test_response = requests.get(
+                test_response = http_get(
                     "https://openrouter.ai/api/v1/models",
                     headers=headers,
                     timeout=10
@@ -6003,6 +5741,131 @@ def get_ai_keywords_config():
             "error": str(e)
         })
 
+@app.route('/api/http_stats')
+@login_required
+def api_http_stats():
+    """Ortak HTTP istemcisinin bağlantı havuzu ve yeniden kullanım sayaçları"""
+    try:
+        return jsonify({
+            "success": True,
+            "stats": get_http_stats()
+        })
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        })
+
+@app.route('/api/state_writer_stats')
+@login_required
+def api_state_writer_stats():
+    """pending/posted tek yazıcı kuyruğunun işlem ve yazım sayaçları"""
+    try:
+        return jsonify({
+            "success": True,
+            "stats": get_state_writer_stats()
+        })
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        })
+
+@app.route('/api/statistics/rebuild', methods=['POST'])
+@login_required
+def api_rebuild_statistics():
+    """İstatistik sayaçlarını geçmişten yeniden kur (verify_only=1 ise sadece karşılaştır)"""
+    try:
+        verify_only = str(request.args.get('verify_only', '')).lower() in ('1', 'true', 'yes')
+        report = rebuild_statistics(write=not verify_only)
+        return jsonify({
+            "success": True,
+            "report": report
+        })
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        })
+
+@app.route('/api/state_cache_stats')
+@login_required
+def api_state_cache_stats():
+    """Durum dosyası önbelleğinin isabet oranları (toplam ve dosya bazında)"""
+    try:
+        return jsonify({
+            "success": True,
+            "stats": get_state_cache_stats()
+        })
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        })
+
+@app.route('/api/llm_cache_stats')
+@login_required
+def api_llm_cache_stats():
+    """LLM yanıt önbelleği hit/miss sayaçları ve OpenRouter hız sınırlayıcı durumu"""
+    try:
+        try:
+            from openrouter_async import get_openrouter_limiter
+            limiter_stats = get_openrouter_limiter().stats()
+        except ImportError:
+            limiter_stats = {}
+        return jsonify({
+            "success": True,
+            "stats": get_llm_cache_stats(),
+            "rate_limiter": limiter_stats
+        })
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        })
+
+@app.route('/api/run_traces')
+@login_required
+def api_run_traces():
+    """check_and_post_articles çalışma izleri: son çalışmalar, aşama p50/p95 veya tek çalışmanın span ağacı"""
+    try:
+        limit = min(max(request.args.get('limit', 20, type=int), 1), 200)
+        run_id = request.args.get('run_id', '').strip() or None
+        traces = get_run_traces(limit=limit, run_id=run_id)
+        if run_id and traces.get("available") and traces.get("trace") is None:
+            return jsonify({"success": False, "error": "Çalışma izi bulunamadı"}), 404
+        return jsonify({
+            "success": True,
+            **traces
+        })
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        })
+
+@app.route('/api/run_traces/<run_id>/profile')
+@login_required
+def api_run_profile(run_id):
+    """Çalışma profilini indir: speedscope JSON (varsayılan) veya ?format=collapsed"""
+    try:
+        fmt = request.args.get('format', 'speedscope')
+        profile = get_run_profile(run_id, fmt)
+        if profile is None:
+            return jsonify({"success": False, "error": "Bu çalışma için profil bulunamadı"}), 404
+        if fmt == "collapsed":
+            return Response(profile, mimetype='text/plain; charset=utf-8', headers={
+                'Content-Disposition': f'attachment; filename=run_{run_id}.collapsed.txt'
+            })
+        return Response(json.dumps(profile, ensure_ascii=False), mimetype='application/json', headers={
+            'Content-Disposition': f'attachment; filename=run_{run_id}.speedscope.json'
+        })
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        })
+
 @app.route('/api/ai_keywords/stats')
 @login_required
 def get_ai_keywords_stats_api():
@@ -6236,13 +6099,12 @@ def toggle_ai_keyword():
 def shared_tweets():
     """Paylaşılan tweetler sayfası"""
     try:
-        # Paylaşılan makaleleri yükle
-        articles = load_json(HISTORY_FILE)
-        
-        # Sadece paylaşılan tweetleri filtrele (silinmemiş ve arşivlenmemiş olanlar)
-        shared_articles = [article for article in articles if not article.get('deleted', False) and not article.get('archived', False)]
+        # Sadece paylaşılan tweetler (silinmemiş ve arşivlenmemiş), en yeni önce ve sayfa sayfa
+        listing_filters, sort, descending, cursor, limit = _listing_args()
+        page = list_records("shared", listing_filters, sort, descending, cursor, limit)
         
-        return render_template('shared_tweets.html', articles=shared_articles)
+        return render_template('shared_tweets.html', articles=page["items"],
+                             total_count=page["total"], next_cursor=page["next_cursor"])
     except Exception as e:
         flash(f'Sayfa yükleme hatası: {str(e)}', 'danger')
         return redirect(url_for('index'))
@@ -6252,10 +6114,12 @@ def shared_tweets():
 def archived_tweets():
     """Arşivlenen tweetler sayfası"""
     try:
-        # Arşivlenen makaleleri yükle
-        archived_articles = load_json("archived_articles.json", [])
+        # Arşivlenen makaleler en yeni önce ve sayfa sayfa
+        listing_filters, sort, descending, cursor, limit = _listing_args()
+        page = list_records("archived", listing_filters, sort, descending, cursor, limit)
         
-        return render_template('archived_tweets.html', archived_articles=archived_articles)
+        return render_template('archived_tweets.html', archived_articles=page["items"],
+                             total_count=page["total"], next_cursor=page["next_cursor"])
     except Exception as e:
         flash(f'Sayfa yükleme hatası: {str(e)}', 'danger')
         return redirect(url_for('index'))
@@ -6536,10 +6400,7 @@ def share_rejected_tweet():
             return jsonify({"success": False, "error": "Makale bulunamadı"})
         
         # Pending tweets'e ekle
-        pending_tweets = load_json("pending_tweets.json", [])
-        
         new_tweet = {
-            'id': len(pending_tweets) + 1,
             'title': article_title,
             'url': article_url,
             'content': tweet_text,
@@ -6550,8 +6411,8 @@ def share_rejected_tweet():
             'recovered_from_rejected': True
         }
         
-        pending_tweets.append(new_tweet)
-        save_json("pending_tweets.json", pending_tweets)
+        # ID ataması ve ekleme tek kuyruk işleminde (len+1 mevcut ID ile çakışabiliyordu)
+        add_pending_tweet(new_tweet)
         
         # Makaleyi reddedilen listesinden kaldır
         rejected_articles = [a for a in rejected_articles if a.get('url') != article_url]
@@ -6616,48 +6477,11 @@ def bulk_convert_rejected():
         if not urls:
             return jsonify({"success": False, "error": "URL listesi gerekli"})
         
-        # Reddedilen makaleleri yükle
-        rejected_articles = load_json("rejected_articles.json", [])
-        pending_tweets = load_json("pending_tweets.json", [])
-        
-        converted_count = 0
-        errors = []
-        
-        for url in urls:
-            try:
-                # İlgili makaleyi bul
-                article = next((a for a in rejected_articles if a.get('url') == url), None)
-                
-                if article:
-                    # Tweet içeriği oluştur
-                    tweet_content = f"🤖 {article.get('title', 'Haber')}\n\n📰 Kaynak: {article.get('source', 'Bilinmeyen')}\n🔗 Detaylar: {url}\n\n#AI #Haber #Teknoloji"
-                    
-                    # Pending tweets'e ekle
-                    new_tweet = {
-                        'id': len(pending_tweets) + 1,
-                        'content': tweet_content,
-                        'article': article,
-                        'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'source_type': 'rejected_converted'
-                    }
-                    
-                    pending_tweets.append(new_tweet)
-                    converted_count += 1
-                    
-                    # Reddedilen listesinden kaldır
-                    rejected_articles = [a for a in rejected_articles if a.get('url') != url]
-                    
-                    terminal_log(f"🔄 Makale tweet'e çevrildi: {article.get('title', 'Bilinmeyen')[:50]}...", "success")
-                else:
-                    errors.append(f"Makale bulunamadı: {url}")
-                    
-            except Exception as e:
-                errors.append(f"Hata ({url}): {str(e)}")
-        
-        # Güncellenmiş listeleri kaydet
-        save_json("pending_tweets.json", pending_tweets)
-        save_json("rejected_articles.json", rejected_articles)
+        converted_titles, errors = bulk_convert_rejected_articles(urls)
+        converted_count = len(converted_titles)
         
+        for title in converted_titles:
+            terminal_log(f"🔄 Makale tweet'e çevrildi: {title[:50]}...", "success")
         terminal_log(f"✅ {converted_count} makale başarıyla tweet'e çevrildi", "success")
         
         return jsonify({
@@ -6682,31 +6506,11 @@ def bulk_remove_rejected():
         if not urls:
             return jsonify({"success": False, "error": "URL listesi gerekli"})
         
-        # Reddedilen makaleleri yükle
-        rejected_articles = load_json("rejected_articles.json", [])
-        
-        original_count = len(rejected_articles)
-        removed_count = 0
-        errors = []
-        
-        for url in urls:
-            try:
-                # İlgili makaleyi bul ve kaldır
-                article = next((a for a in rejected_articles if a.get('url') == url), None)
-                
-                if article:
-                    rejected_articles = [a for a in rejected_articles if a.get('url') != url]
-                    removed_count += 1
-                    terminal_log(f"🗑️ Makale kalıcı olarak silindi: {article.get('title', 'Bilinmeyen')[:50]}...", "info")
-                else:
-                    errors.append(f"Makale bulunamadı: {url}")
-                    
-            except Exception as e:
-                errors.append(f"Hata ({url}): {str(e)}")
-        
-        # Güncellenmiş listeyi kaydet
-        save_json("rejected_articles.json", rejected_articles)
+        removed_titles, errors = bulk_remove_rejected_articles(urls)
+        removed_count = len(removed_titles)
         
+        for title in removed_titles:
+            terminal_log(f"🗑️ Makale kalıcı olarak silindi: {title[:50]}...", "info")
         terminal_log(f"✅ {removed_count} makale başarıyla silindi", "success")
         
         return jsonify({
@@ -6723,9 +6527,11 @@ def bulk_remove_rejected():
 @app.route('/api/get_pending_tweets', methods=['GET'])
 @login_required
 def get_pending_tweets_api():
-    """Pending tweets'leri AJAX ile döndür"""
+    """Pending tweets'leri AJAX ile döndür - sayfalı (cursor/limit) ve süzülebilir"""
     try:
-        pending_tweets = load_json("pending_tweets.json")
+        listing_filters, sort, descending, cursor, limit = _listing_args()
+        page = list_records("pending", listing_filters, sort, descending, cursor, limit)
+        pending_tweets = page["items"]
         
         # HTML render et
         from flask import render_template_string
@@ -6778,13 +6584,50 @@ def get_pending_tweets_api():
         return jsonify({
             "success": True,
             "html": html_content,
-            "count": len(pending_tweets)
+            "count": page["total"],
+            "next_cursor": page["next_cursor"]
         })
         
     except Exception as e:
         terminal_log(f"❌ Pending tweets API hatası: {e}", "error")
         return jsonify({"success": False, "error": str(e)})
 
+@app.route('/api/listings/<kind>', methods=['GET'])
+@login_required
+def api_listings(kind):
+    """Sayfalı liste API'si: pending, rejected, archived, shared, deleted
+    
+    Parametreler: status, source_type, fetch_method, source, date_from, date_to, q,
+    sort (date|title|source), order (asc|desc), cursor, limit"""
+    try:
+        listing_filters, sort, descending, cursor, limit = _listing_args()
+        page = list_records(kind, listing_filters, sort, descending, cursor, limit)
+        return jsonify({"success": True, **page})
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    except Exception as e:
+        terminal_log(f"❌ Liste API hatası ({kind}): {e}", "error")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/search', methods=['GET'])
+@login_required
+def api_search():
+    """Tam metin arama: paylaşılan, bekleyen, reddedilen, silinen ve arşivlenen makaleler
+    
+    Parametreler: q, sets (virgülle: posted,pending,rejected,deleted,archived), cursor, limit"""
+    try:
+        query = request.args.get('q', '').strip()
+        sets = [s.strip() for s in request.args.get('sets', '').split(',') if s.strip()]
+        try:
+            limit = int(request.args.get('limit', 20))
+        except ValueError:
+            limit = 20
+        result = search_articles(query, sets, request.args.get('cursor') or None, limit)
+        return jsonify({"success": True, "query": query, **result})
+    except Exception as e:
+        terminal_log(f"❌ Arama hatası: {e}", "error")
+        return jsonify({"success": False, "error": str(e)}), 500
+
 @app.route('/api/rate_limit_status', methods=['GET'])
 @login_required
 def get_rate_limit_status_api():
@@ -6921,35 +6764,11 @@ def bulk_archive_tweets_api():
         if len(tweet_ids) > 1000:  # Güvenlik sınırı
             return jsonify({"success": False, "error": "Maksimum 1000 tweet arşivlenebilir"})
         
-        # Paylaşılan tweet'leri yükle
-        articles = load_json("posted_articles.json", [])
-        
-        # Arşivlenecek tweet'leri bul
-        tweets_to_archive = []
-        for article in articles:
-            if (str(article.get('hash', '')) in tweet_ids or 
-                str(article.get('id', '')) in tweet_ids or
-                str(article.get('tweet_id', '')) in tweet_ids):
-                tweets_to_archive.append(article)
+        tweets_to_archive = bulk_archive_posted(tweet_ids, archive_reason)
         
         if not tweets_to_archive:
             return jsonify({"success": False, "error": "Arşivlenecek tweet bulunamadı"})
         
-        # Arşivleme bilgilerini ekle
-        for tweet in tweets_to_archive:
-            tweet['archived'] = True
-            tweet['archived_at'] = datetime.now().isoformat()
-            tweet['archive_reason'] = archive_reason
-        
-        # Arşivlenen tweet'leri ayrı dosyaya kaydet
-        archived_articles = load_json("archived_articles.json", [])
-        archived_articles.extend(tweets_to_archive)
-        save_json("archived_articles.json", archived_articles)
-        
-        # Ana listeden kaldır
-        articles = [article for article in articles if article not in tweets_to_archive]
-        save_json("posted_articles.json", articles)
-        
         terminal_log(f"✅ {len(tweets_to_archive)} tweet toplu arşivlendi", "info")
         
         return jsonify({
@@ -7401,41 +7220,30 @@ def mark_tweets_as_posted():
         if not tweet_ids:
             return jsonify({"success": False, "error": "Tweet ID listesi gerekli"})
         
-        # Bekleyen tweet'leri yükle
-        pending_tweets = load_json("pending_tweets.json", [])
-        posted_articles = load_json("posted_articles.json", [])
-        
-        # İşaretlenecek tweet'leri bul ve taşı
+        # İşaretlenecek tweet'leri kalıcı ID ile pending listesinden al
+        # (tek kuyruk işlemi - arada eklenen tweet'ler silinmez)
         tweets_to_move = []
-        remaining_tweets = []
-        
-        for tweet in pending_tweets:
-            if str(tweet.get('id', '')) in tweet_ids:
-                # Manuel paylaşım bilgilerini ekle
-                tweet_data = {
-                    'id': tweet.get('id'),
-                    'hash': tweet.get('id'),  # ID'yi hash olarak kullan
-                    'content': tweet.get('content', ''),
-                    'article': tweet.get('article', {}),
-                    'created_at': tweet.get('created_at', datetime.now().isoformat()),
-                    'posted_at': datetime.now().isoformat(),
-                    'manual_post': True,
-                    'manual_post_timestamp': datetime.now().isoformat(),
-                    'tweet_id': f"manual_{tweet.get('id')}",
-                    'url': f"https://twitter.com/intent/tweet?text={tweet.get('content', '')[:50]}...",
-                    'source_type': tweet.get('source_type', 'news')
-                }
-                tweets_to_move.append(tweet_data)
-            else:
-                remaining_tweets.append(tweet)
+        for tweet in remove_pending_tweets([str(tweet_id) for tweet_id in tweet_ids]):
+            # Manuel paylaşım bilgilerini ekle
+            tweet_data = {
+                'id': tweet.get('id'),
+                'hash': tweet.get('id'),  # ID'yi hash olarak kullan
+                'content': tweet.get('content', ''),
+                'article': tweet.get('article', {}),
+                'created_at': tweet.get('created_at', datetime.now().isoformat()),
+                'posted_at': datetime.now().isoformat(),
+                'manual_post': True,
+                'manual_post_timestamp': datetime.now().isoformat(),
+                'tweet_id': f"manual_{tweet.get('id')}",
+                'url': f"https://twitter.com/intent/tweet?text={tweet.get('content', '')[:50]}...",
+                'source_type': tweet.get('source_type', 'news')
+            }
+            tweets_to_move.append(tweet_data)
         
         if not tweets_to_move:
             return jsonify({"success": False, "error": "İşaretlenecek tweet bulunamadı"})
         
-        # Dosyaları güncelle
-        save_json("pending_tweets.json", remaining_tweets)
-        posted_articles.extend(tweets_to_move)
-        save_json("posted_articles.json", posted_articles)
+        append_json_records("posted_articles.json", tweets_to_move)
         
         terminal_log(f"✅ {len(tweets_to_move)} tweet manuel paylaşım olarak işaretlendi", "info")
         
@@ -0,0 +1,700 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite Tabanlı Makale Deposu
+posted/pending/rejected/deleted/archived JSON dosyalarının yerine geçen,
+tek kayıt ekleme/güncelleme yapabilen indeksli depolama motoru.
+
+utils.load_json / utils.save_json bu dosya adları için otomatik olarak bu
+depoya yönlendirilir; mevcut JSON dosyaları ilk erişimde tek seferlik
+olarak içeri aktarılır ve yedek olarak yerinde bırakılır.
+"""
+
+import os
+import json
+import base64
+import difflib
+import sqlite3
+import threading
+from datetime import datetime
+
+ARTICLE_STORE_DB = os.environ.get('ARTICLE_STORE_DB', 'articles.db')
+
+# JSON dosya adı -> koleksiyon adı
+STORE_COLLECTIONS = {
+    "posted_articles.json": "posted",
+    "pending_tweets.json": "pending",
+    "rejected_articles.json": "rejected",
+    "deleted_articles.json": "deleted",
+    "archived_articles.json": "archived",
+}
+
+
+def is_store_enabled():
+    """Depo etkin mi? ARTICLE_STORE=json ile eski davranışa dönülebilir"""
+    return os.environ.get('ARTICLE_STORE', 'sqlite').lower() != 'json'
+
+
+def collection_for_path(path):
+    """Dosya yolunun bağlı olduğu koleksiyonu döndür (yoksa None)"""
+    if not path or not is_store_enabled():
+        return None
+    normalized = os.path.normpath(str(path))
+    if os.path.dirname(normalized) not in ('', '.'):
+        return None
+    return STORE_COLLECTIONS.get(os.path.basename(normalized))
+
+
+def _record_keys(record):
+    """İndekslenecek alanları kayıttan çıkar (pending kayıtlarında article altında)"""
+    if not isinstance(record, dict):
+        return "", "", "", 0
+    article = record.get('article') if isinstance(record.get('article'), dict) else {}
+    url = record.get('url') or article.get('url') or ""
+    hash_value = record.get('hash') or article.get('hash') or ""
+    posted_date = (record.get('posted_date') or record.get('created_at')
+                   or record.get('rejected_at') or record.get('archived_date') or "")
+    deleted = 1 if record.get('deleted') else 0
+    return str(url), str(hash_value), str(posted_date), deleted
+
+
+# Listeleme için önceden hesaplanan görüntü alanları (sürüm değişirse satırlar yeniden hesaplanır)
+DISPLAY_COLUMNS = ("title", "body", "source", "source_type", "fetch_method", "status", "sort_date", "search")
+DISPLAY_VERSION = "1"
+
+# Koleksiyon -> listeleme sıralamasında kullanılan tarih alanları (ilk dolu alan)
+SORT_DATE_FIELDS = {
+    "posted": ("posted_date", "created_at"),
+    "pending": ("created_at", "created_date"),
+    "rejected": ("rejected_at", "created_at"),
+    "deleted": ("deleted_date", "created_at"),
+    "archived": ("archived_at", "archived_date", "posted_date"),
+}
+
+# Sıralanabilir alanlar -> sütun
+SORT_COLUMNS = {"date": "sort_date", "title": "title", "source": "source"}
+
+_INSERT_SQL = (
+    "INSERT OR REPLACE INTO articles (collection, position, url, hash, posted_date, deleted, "
+    + ", ".join(DISPLAY_COLUMNS) + ", data) VALUES (" + ", ".join(["?"] * (7 + len(DISPLAY_COLUMNS))) + ")"
+)
+
+
+def display_fields(collection, record):
+    """Listeleme/arama için görüntü alanları - sayfa render edilirken kayıt parse edilmeden süzülür"""
+    if not isinstance(record, dict):
+        return dict.fromkeys(DISPLAY_COLUMNS, "")
+    article = record.get('article') if isinstance(record.get('article'), dict) else {}
+    tweet_data = record.get('tweet_data') if isinstance(record.get('tweet_data'), dict) else {}
+
+    title = record.get('title') or article.get('title') or ""
+    body = (tweet_data.get('tweet') or record.get('tweet_text') or record.get('tweet_content')
+            or record.get('content') or article.get('title') or "")
+    source = record.get('source') or article.get('source') or ""
+    source_type = record.get('source_type') or article.get('source_type') or ""
+    if not source_type and record.get('type') == 'github_repo':
+        source_type = "github"
+    fetch_method = (article.get('fetch_method') or record.get('fetch_method')
+                    or record.get('post_method') or "")
+
+    if collection == "posted":
+        status = "deleted" if record.get('deleted') else ("archived" if record.get('archived') else "posted")
+    elif collection == "pending":
+        status = record.get('status') or "pending"
+    else:
+        status = collection
+
+    date_fields = SORT_DATE_FIELDS.get(collection, ())
+    if collection == "posted" and status == "deleted":
+        date_fields = ("deleted_date",) + date_fields
+    sort_date = next((str(record[f]) for f in date_fields if record.get(f)), "")
+
+    url = record.get('url') or article.get('url') or ""
+    search = " ".join(str(v) for v in (title, body, source, url) if v).lower()
+    return {
+        "title": str(title), "body": str(body), "source": str(source), "source_type": str(source_type),
+        "fetch_method": str(fetch_method), "status": str(status), "sort_date": sort_date, "search": search,
+    }
+
+
+def _dump(record):
+    return json.dumps(record, ensure_ascii=False)
+
+
+def _row(collection, position, record, data=None):
+    """articles tablosu satırı: anahtarlar + görüntü alanları + JSON"""
+    display = display_fields(collection, record)
+    return (collection, position, *_record_keys(record),
+            *(display[c] for c in DISPLAY_COLUMNS), data if data is not None else _dump(record))
+
+
+def encode_cursor(values):
+    """Sayfa imleci (opak, URL güvenli)"""
+    return base64.urlsafe_b64encode(json.dumps(values, ensure_ascii=False).encode('utf-8')).decode('ascii').rstrip("=")
+
+
+def decode_cursor(cursor):
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+        return values if isinstance(values, list) and len(values) == 2 else None
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+class ArticleStore:
+    def __init__(self, db_path=None):
+        self.db_path = db_path or ARTICLE_STORE_DB
+        self._local = threading.local()
+        self._migration_lock = threading.RLock()
+        self._migrated = set()
+        self._listeners = []
+        self._change_hooks = []
+        self._version_conn = None
+        self._version_lock = threading.Lock()
+        self._collection_versions = {}
+        self._collection_versions_at = None
+        self.init_database()
+
+    def _log(self, message, level="info"):
+        """Logging sistemi"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        prefix = f"[{timestamp}] [ArticleStore]"
+
+        if level == "error":
+            print(f"❌ {prefix} {message}")
+        elif level == "warning":
+            print(f"⚠️ {prefix} {message}")
+        elif level == "success":
+            print(f"✅ {prefix} {message}")
+        else:
+            print(f"ℹ️ {prefix} {message}")
+
+    def add_listener(self, callback):
+        """Yazma sonrası çağrılacak fonksiyon ekle: callback(collection, added, removed).
+
+        removed, yazımda değişen ya da listeden düşen satırların eski halidir;
+        liste baştan numaralandığında yeri kayan kayıtlar hem added hem removed
+        içinde görünür."""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def add_change_hook(self, callback):
+        """Yazım transaction'ı içinde çağrılacak fonksiyon ekle:
+        callback(conn, collection, removed_records, added_records).
+
+        Hook aynı transaction'da çalıştığı için türetilmiş tablolar (ör. istatistik
+        sayaçları) kayıtlarla birlikte commit edilir ya da birlikte geri alınır."""
+        if callback not in self._change_hooks:
+            self._change_hooks.append(callback)
+
+    def _run_change_hooks(self, conn, collection, removed, added):
+        if not self._change_hooks or (not removed and not added):
+            return
+        for callback in list(self._change_hooks):
+            callback(conn, collection, removed, added)
+
+    def _notify(self, collection, records, removed=()):
+        """Değişen kayıtları dinleyicilere ilet (indeksler için)"""
+        if not records and not removed:
+            return
+        for callback in list(self._listeners):
+            try:
+                callback(collection, records, removed)
+            except Exception as e:
+                self._log(f"Dinleyici hatası ({collection}): {e}", "warning")
+
+    def _conn(self):
+        """Thread başına tek bağlantı"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA busy_timeout = 30000")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def data_version(self):
+        """Veritabanı değişiklik sayacı (önbellek doğrulaması için).
+
+        Hiç yazmayan ayrı bir bağlantıdan okunur; bu süreçteki diğer thread'lerin
+        ve diğer süreçlerin her commit'i değeri değiştirir."""
+        with self._version_lock:
+            if self._version_conn is None:
+                self._version_conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            return self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def collection_version(self, collection):
+        """Koleksiyon değişiklik sayacı - sadece bu koleksiyonun satırlarına yazım artırır.
+
+        data_version tüm veritabanında (görülme indeksi, istatistik sayaçları, iş
+        planı...) her commit'te değişir; önbellekler koleksiyon başına bunu kullanır.
+        Sayaçlar sadece data_version değiştiğinde yeniden okunur."""
+        with self._version_lock:
+            if self._version_conn is None:
+                self._version_conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            data_version = self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self._collection_versions_at:
+                self._collection_versions = dict(self._version_conn.execute(
+                    "SELECT key, value FROM store_meta WHERE key LIKE 'version:%'"
+                ).fetchall())
+                self._collection_versions_at = data_version
+            return self._collection_versions.get(f"version:{collection}", "0")
+
+    def _bump_version(self, conn, collection):
+        """Yazım transaction'ı içinde koleksiyon sayacını artır"""
+        key = f"version:{collection}"
+        conn.execute("INSERT OR IGNORE INTO store_meta (key, value) VALUES (?, '0')", (key,))
+        conn.execute("UPDATE store_meta SET value = CAST(value AS INTEGER) + 1 WHERE key = ?", (key,))
+
+    def init_database(self):
+        """Veritabanını başlat ve tabloları oluştur"""
+        conn = self._conn()
+        with conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS articles (
+                    collection TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    url TEXT,
+                    hash TEXT,
+                    posted_date TEXT,
+                    deleted INTEGER DEFAULT 0,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (collection, position)
+                )
+            ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_url ON articles(collection, url)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_hash ON articles(collection, hash)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_posted_date ON articles(collection, posted_date)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_deleted ON articles(collection, deleted)")
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS store_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            ''')
+        self._ensure_display_columns()
+
+    def _ensure_display_columns(self):
+        """Eski veritabanlarına görüntü sütunlarını ekle ve doldur"""
+        conn = self._conn()
+        with conn:
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(articles)")}
+            for column in DISPLAY_COLUMNS:
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE articles ADD COLUMN {column} TEXT DEFAULT ''")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_sort ON articles(collection, sort_date, position)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_status ON articles(collection, status, sort_date)")
+            row = conn.execute("SELECT value FROM store_meta WHERE key = 'display_version'").fetchone()
+            if row and row[0] == DISPLAY_VERSION:
+                return
+            rows = conn.execute("SELECT collection, position, data FROM articles").fetchall()
+            updates = []
+            for collection, position, data in rows:
+                display = display_fields(collection, json.loads(data))
+                updates.append((*(display[c] for c in DISPLAY_COLUMNS), collection, position))
+            conn.executemany(
+                "UPDATE articles SET " + ", ".join(f"{c} = ?" for c in DISPLAY_COLUMNS)
+                + " WHERE collection = ? AND position = ?",
+                updates
+            )
+            conn.execute("INSERT OR REPLACE INTO store_meta (key, value) VALUES ('display_version', ?)",
+                         (DISPLAY_VERSION,))
+        if rows:
+            self._log(f"{len(rows)} kaydın listeleme alanları hesaplandı", "success")
+
+    # ------------------------------------------------------------------
+    # Migrasyon
+    # ------------------------------------------------------------------
+    def ensure_migrated(self, collection):
+        """Koleksiyon daha önce aktarılmadıysa JSON dosyasından içeri al"""
+        if collection in self._migrated:
+            return
+        with self._migration_lock:
+            if collection in self._migrated:
+                return
+            conn = self._conn()
+            row = conn.execute("SELECT value FROM store_meta WHERE key = ?",
+                               (f"migrated:{collection}",)).fetchone()
+            if not row:
+                self.migrate_from_json(collection)
+            self._migrated.add(collection)
+
+    def migrate_from_json(self, collection, json_path=None):
+        """Tek seferlik JSON -> SQLite aktarımı"""
+        if json_path is None:
+            json_path = next((p for p, c in STORE_COLLECTIONS.items() if c == collection), None)
+
+        records = []
+        if json_path and os.path.exists(json_path):
+            try:
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if isinstance(data, list):
+                    records = data
+            except Exception as e:
+                self._log(f"{json_path} okunamadı, boş koleksiyon ile başlanıyor: {e}", "warning")
+
+        conn = self._conn()
+        with conn:
+            removed = []
+            if self._change_hooks or self._listeners:
+                removed = [json.loads(row[0]) for row in conn.execute(
+                    "SELECT data FROM articles WHERE collection = ?", (collection,)
+                ).fetchall()]
+            conn.execute("DELETE FROM articles WHERE collection = ?", (collection,))
+            conn.executemany(_INSERT_SQL, [_row(collection, i, r) for i, r in enumerate(records)])
+            conn.execute("INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)",
+                         (f"migrated:{collection}", datetime.now().isoformat()))
+            self._bump_version(conn, collection)
+            self._run_change_hooks(conn, collection, removed, records)
+
+        if records:
+            self._log(f"{json_path}: {len(records)} kayıt depoya aktarıldı", "success")
+        self._notify(collection, records, removed)
+        return len(records)
+
+    # ------------------------------------------------------------------
+    # Okuma
+    # ------------------------------------------------------------------
+    def load(self, collection, limit=None):
+        """Koleksiyonu sıralı liste olarak döndür - limit verilirse son N kayıt"""
+        self.ensure_migrated(collection)
+        conn = self._conn()
+        if limit:
+            rows = conn.execute(
+                "SELECT data FROM (SELECT position, data FROM articles WHERE collection = ? "
+                "ORDER BY position DESC LIMIT ?) ORDER BY position",
+                (collection, int(limit))
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT data FROM articles WHERE collection = ? ORDER BY position",
+                (collection,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self, collection, deleted=None):
+        """Kayıt sayısı - deleted filtresi opsiyonel"""
+        self.ensure_migrated(collection)
+        conn = self._conn()
+        if deleted is None:
+            row = conn.execute("SELECT COUNT(*) FROM articles WHERE collection = ?",
+                               (collection,)).fetchone()
+        else:
+            row = conn.execute("SELECT COUNT(*) FROM articles WHERE collection = ? AND deleted = ?",
+                               (collection, 1 if deleted else 0)).fetchone()
+        return row[0]
+
+    def exists(self, collection, url=None, hash_value=None):
+        """URL veya hash indeksinden varlık kontrolü"""
+        self.ensure_migrated(collection)
+        conn = self._conn()
+        if url:
+            if conn.execute("SELECT 1 FROM articles WHERE collection = ? AND url = ? LIMIT 1",
+                            (collection, url)).fetchone():
+                return True
+        if hash_value:
+            if conn.execute("SELECT 1 FROM articles WHERE collection = ? AND hash = ? LIMIT 1",
+                            (collection, hash_value)).fetchone():
+                return True
+        return False
+
+    def find(self, collection, url=None, hash_value=None):
+        """URL veya hash ile (position, kayıt) döndür"""
+        self.ensure_migrated(collection)
+        conn = self._conn()
+        for column, value in (("url", url), ("hash", hash_value)):
+            if not value:
+                continue
+            row = conn.execute(
+                f"SELECT position, data FROM articles WHERE collection = ? AND {column} = ? "
+                "ORDER BY position DESC LIMIT 1",
+                (collection, value)
+            ).fetchone()
+            if row:
+                return row[0], json.loads(row[1])
+        return None, None
+
+    def load_since(self, collection, since, limit=None):
+        """posted_date >= since olan kayıtlar (liste sırasıyla) - limit verilirse son N kayıt"""
+        self.ensure_migrated(collection)
+        conn = self._conn()
+        rows = conn.execute(
+            "SELECT data FROM (SELECT position, data FROM articles WHERE collection = ? AND posted_date >= ? "
+            "ORDER BY position DESC LIMIT ?) ORDER BY position",
+            (collection, since, int(limit) if limit else -1)
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def latest(self, collection):
+        """En yeni posted_date'e sahip kayıt (indeksten)"""
+        self.ensure_migrated(collection)
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT data FROM articles WHERE collection = ? AND posted_date != '' "
+            "ORDER BY posted_date DESC, position LIMIT 1",
+            (collection,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _filter_clause(self, collection, filters):
+        """Listeleme filtrelerini WHERE parçasına çevir"""
+        clauses = ["collection = ?"]
+        params = [collection]
+        filters = filters or {}
+        for column in ("status", "source_type", "fetch_method", "source"):
+            value = filters.get(column)
+            if value:
+                values = value if isinstance(value, (list, tuple, set)) else [value]
+                clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params.extend(str(v) for v in values)
+        if filters.get("date_from"):
+            clauses.append("sort_date >= ?")
+            params.append(str(filters["date_from"]))
+        if filters.get("date_to"):
+            # Gün olarak verilen üst sınır o günün tamamını kapsar
+            clauses.append("substr(sort_date, 1, 10) <= ?")
+            params.append(str(filters["date_to"])[:10])
+        if filters.get("q"):
+            for term in str(filters["q"]).lower().split():
+                clauses.append("search LIKE ? ESCAPE '\\'")
+                escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                params.append(f"%{escaped}%")
+        return " AND ".join(clauses), params
+
+    def list_page(self, collection, filters=None, sort="date", descending=True, cursor=None, limit=20):
+        """İmleçli (keyset) sayfa: ([(liste_indeksi, kayıt, görüntü_alanları)], sonraki_imleç).
+
+        Sadece istenen penceredeki satırların JSON'u okunur; filtre ve sıralama
+        önceden hesaplanmış görüntü sütunları üzerinden SQLite'ta yapılır."""
+        self.ensure_migrated(collection)
+        column = SORT_COLUMNS.get(sort, "sort_date")
+        where, params = self._filter_clause(collection, filters)
+        after = decode_cursor(cursor)
+        if after is not None:
+            op = "<" if descending else ">"
+            where += f" AND ({column} {op} ? OR ({column} = ? AND position {op} ?))"
+            params.extend([after[0], after[0], after[1]])
+        order = "DESC" if descending else "ASC"
+        limit = max(1, int(limit))
+        shown = [c for c in DISPLAY_COLUMNS if c != "search"]
+        conn = self._conn()
+        rows = conn.execute(
+            f"SELECT position, {column}, {', '.join(shown)}, data FROM articles WHERE {where} "
+            f"ORDER BY {column} {order}, position {order} LIMIT ?",
+            (*params, limit + 1)
+        ).fetchall()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor([rows[-1][1], rows[-1][0]])
+        # Pozisyonlar seyrek olabilir; çağırana listedeki sıra (indeks) verilir
+        index = {}
+        for row in rows:
+            index[row[0]] = conn.execute(
+                "SELECT COUNT(*) FROM articles WHERE collection = ? AND position < ?", (collection, row[0])
+            ).fetchone()[0]
+        return [(index[row[0]], json.loads(row[-1]), dict(zip(shown, row[2:-1]))) for row in rows], next_cursor
+
+    def count_matching(self, collection, filters=None):
+        """Filtreye uyan kayıt sayısı"""
+        self.ensure_migrated(collection)
+        where, params = self._filter_clause(collection, filters)
+        return self._conn().execute(f"SELECT COUNT(*) FROM articles WHERE {where}", params).fetchone()[0]
+
+    def keys(self, collection):
+        """Koleksiyondaki tüm (url, hash) çiftleri - JSON parse etmeden"""
+        self.ensure_migrated(collection)
+        conn = self._conn()
+        return conn.execute("SELECT url, hash FROM articles WHERE collection = ?",
+                            (collection,)).fetchall()
+
+    def existing_hashes(self, collection, hashes, deleted=None):
+        """Verilen hash'lerden koleksiyonda bulunanlar (toplu işlemler için tek sorgu turu)"""
+        self.ensure_migrated(collection)
+        conn = self._conn()
+        wanted = [h for h in {str(h) for h in hashes if h}]
+        found = set()
+        deleted_clause = "" if deleted is None else " AND deleted = ?"
+        deleted_params = () if deleted is None else (1 if deleted else 0,)
+        # SQLite parametre sınırının altında kalacak şekilde parçala
+        for start in range(0, len(wanted), 500):
+            chunk = wanted[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT DISTINCT hash FROM articles WHERE collection = ? AND hash IN ({placeholders}){deleted_clause}",
+                (collection, *chunk, *deleted_params)
+            ).fetchall()
+            found.update(row[0] for row in rows)
+        return found
+
+    # ------------------------------------------------------------------
+    # Yazma
+    # ------------------------------------------------------------------
+    def append(self, collection, record):
+        """Tek kayıt ekle - dosyanın tamamı yeniden yazılmaz"""
+        self.ensure_migrated(collection)
+        conn = self._conn()
+        with conn:
+            row = conn.execute("SELECT COALESCE(MAX(position), -1) FROM articles WHERE collection = ?",
+                               (collection,)).fetchone()
+            position = row[0] + 1
+            conn.execute(_INSERT_SQL, _row(collection, position, record))
+            self._bump_version(conn, collection)
+            self._run_change_hooks(conn, collection, [], [record])
+        self._notify(collection, [record])
+        return position
+
+    def append_many(self, collection, records):
+        """Birden çok kaydı tek transaction'da ekle"""
+        records = list(records)
+        if not records:
+            return
+        self.ensure_migrated(collection)
+        conn = self._conn()
+        with conn:
+            row = conn.execute("SELECT COALESCE(MAX(position), -1) FROM articles WHERE collection = ?",
+                               (collection,)).fetchone()
+            conn.executemany(_INSERT_SQL, [_row(collection, row[0] + 1 + i, record)
+                                           for i, record in enumerate(records)])
+            self._bump_version(conn, collection)
+            self._run_change_hooks(conn, collection, [], records)
+        self._notify(collection, records)
+
+    def update(self, collection, position, record):
+        """Belirli pozisyondaki kaydı güncelle"""
+        self.ensure_migrated(collection)
+        conn = self._conn()
+        with conn:
+            old = conn.execute("SELECT data FROM articles WHERE collection = ? AND position = ?",
+                               (collection, position)).fetchone()
+            removed = [json.loads(old[0])] if old else []
+            if old:
+                conn.execute(_INSERT_SQL, _row(collection, position, record))
+                self._bump_version(conn, collection)
+                self._run_change_hooks(conn, collection, removed, [record])
+        self._notify(collection, [record], removed)
+
+    def replace_all(self, collection, records):
+        """save_json uyumluluğu - listeyi sadece değişen satırları yazarak eşitle.
+
+        Yeni liste eski satırlarla içerik üzerinden eşleştirilir: aradan çıkan
+        kayıt sadece kendi satırını siler, sonraki satırlar yerinde kalır.
+        Pozisyon bir sıralama anahtarıdır, ardışık olması gerekmez."""
+        self.ensure_migrated(collection)
+        conn = self._conn()
+        new_rows = [_dump(r) for r in records]
+        with conn:
+            existing = conn.execute(
+                "SELECT position, data FROM articles WHERE collection = ? ORDER BY position", (collection,)
+            ).fetchall()
+            plan = self._diff_rows(existing, new_rows)
+            if plan is None:
+                # Araya sığmayan ekleme - liste baştan numaralanır
+                added, removed = self._rewrite_all(conn, collection, records, new_rows, dict(existing))
+            else:
+                dropped, inserted = plan
+                if dropped:
+                    conn.executemany("DELETE FROM articles WHERE collection = ? AND position = ?",
+                                     [(collection, existing[i][0]) for i in dropped])
+                if inserted:
+                    conn.executemany(_INSERT_SQL, [_row(collection, position, records[j], new_rows[j])
+                                                   for position, j in inserted])
+                if dropped or inserted:
+                    self._bump_version(conn, collection)
+
+                removed = []
+                added = [records[j] for _, j in inserted]
+                if self._change_hooks or self._listeners:
+                    removed = [json.loads(existing[i][1]) for i in dropped]
+                    self._run_change_hooks(conn, collection, removed, added)
+        self._notify(collection, added, removed)
+        return len(added)
+
+    @staticmethod
+    def _diff_rows(existing, new_rows):
+        """Eski (position, data) satırlarından yeni listeye geçiş planı.
+
+        (silinecek eski indeksler, [(pozisyon, yeni indeks)]) döndürür; eklenen
+        kayıtlar komşu satırların pozisyonları arasına sığmıyorsa None."""
+        positions = [row[0] for row in existing]
+        matcher = difflib.SequenceMatcher(None, [row[1] for row in existing], new_rows, autojunk=False)
+        dropped, inserted = [], []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                continue
+            dropped.extend(range(i1, i2))
+            if j1 == j2:
+                continue
+            if i1 == 0 and i2 < len(positions):
+                # Listenin başına ekleme ilk satırın önüne yazılır (negatif olabilir)
+                low = positions[i2] - (j2 - j1) - 1
+            else:
+                low = positions[i1 - 1] if i1 > 0 else -1
+            if i2 < len(positions) and positions[i2] - low - 1 < j2 - j1:
+                return None
+            inserted.extend((low + 1 + k, j1 + k) for k in range(j2 - j1))
+        return dropped, inserted
+
+    def _rewrite_all(self, conn, collection, records, new_rows, existing):
+        """Listeyi 0..n-1 pozisyonlarına yaz - sadece farklı olan satırlar değişir.
+
+        (eklenen kayıtlar, çıkarılan eski kayıtlar) döndürür; transaction'ı çağıran yönetir."""
+        changed = []
+        for position, data in enumerate(new_rows):
+            if existing.get(position) != data:
+                changed.append(_row(collection, position, records[position], data))
+        if changed:
+            conn.executemany(_INSERT_SQL, changed)
+        dropped = conn.execute("DELETE FROM articles WHERE collection = ? AND (position < 0 OR position >= ?)",
+                               (collection, len(new_rows))).rowcount
+        if changed or dropped:
+            self._bump_version(conn, collection)
+
+        removed = []
+        added = [records[row[1]] for row in changed]
+        if self._change_hooks or self._listeners:
+            # Değişen pozisyonların eski hali + listeden düşen satırlar çıkarılır
+            removed = [json.loads(existing[row[1]]) for row in changed if row[1] in existing]
+            removed.extend(json.loads(data) for position, data in existing.items()
+                           if not 0 <= position < len(new_rows))
+            self._run_change_hooks(conn, collection, removed, added)
+        return added, removed
+
+    def export_to_json(self, collection, json_path):
+        """Koleksiyonu JSON dosyasına yaz (yedekleme için)"""
+        records = self.load(collection)
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(records, f, ensure_ascii=False, indent=2)
+        return len(records)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_article_store():
+    """Süreç genelinde tek ArticleStore örneği"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ArticleStore()
+    return _store
+
+
+if __name__ == "__main__":
+    # Tek seferlik migrasyon: python article_store.py [--force]
+    import sys
+    store = get_article_store()
+    force = "--force" in sys.argv
+    for json_file, collection in STORE_COLLECTIONS.items():
+        if force:
+            store.migrate_from_json(collection, json_file)
+        else:
+            store.ensure_migrated(collection)
+        print(f"📦 {json_file} -> {collection}: {store.count(collection)} kayıt")
@@ -3,15 +3,18 @@
 """
 Otomatik Rate Limit Sıfırlama Sistemi
 Bu sistem, Twitter API rate limit'ini otomatik olarak sıfırlar.
+
+Zamanlama ortak job_scheduler üzerinden yapılır; JSON okuma/yazma utils
+ile aynıdır (atomic write).
 """
 
-import json
 import time
-import os
-import schedule
 from datetime import datetime, timedelta
 import logging
 
+from utils import load_json, save_json
+from job_scheduler import get_job_scheduler, ScheduledJob
+
 # Logging ayarları
 logging.basicConfig(
     level=logging.INFO,
@@ -28,27 +31,6 @@ logger = logging.getLogger(__name__)
 RATE_LIMIT_FILE = "rate_limit_status.json"
 RESET_LOG_FILE = "rate_limit_reset_history.json"
 
-def load_json(filename, default=None):
-    """JSON dosyasını yükle"""
-    try:
-        if os.path.exists(filename):
-            with open(filename, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return default if default is not None else {}
-    except Exception as e:
-        logger.error(f"❌ {filename} yükleme hatası: {e}")
-        return default if default is not None else {}
-
-def save_json(filename, data):
-    """JSON dosyasını kaydet"""
-    try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        return True
-    except Exception as e:
-        logger.error(f"❌ {filename} kaydetme hatası: {e}")
-        return False
-
 def check_rate_limit_status():
     """Rate limit durumunu kontrol et"""
     rate_limit_status = load_json(RATE_LIMIT_FILE, {})
@@ -202,41 +184,39 @@ def update_daily_usage(tweet_count=1):
     except Exception as e:
         logger.error(f"❌ Günlük kullanım güncelleme hatası: {e}")
 
-def schedule_rate_limit_reset():
-    """Rate limit sıfırlama zamanlaması"""
+def schedule_rate_limit_reset(scheduler=None):
+    """Rate limit sıfırlama işlerini ortak zamanlayıcıya ekle"""
+    scheduler = scheduler or get_job_scheduler()
     
     # Her 15 dakikada bir kontrol et
-    schedule.every(15).minutes.do(check_rate_limit_status)
+    scheduler.register(ScheduledJob("rate_limit_check", check_rate_limit_status,
+                                    interval=15 * 60, label="Rate limit kontrolü"))
     
     # Her gün saat 00:00'da günlük limit kontrolü
-    schedule.every().day.at("00:00").do(check_daily_limit)
-    
-    # Her saat başı kontrol et
-    schedule.every().hour.do(check_rate_limit_status)
+    scheduler.register(ScheduledJob("daily_limit_check", check_daily_limit,
+                                    daily_at="00:00", label="Günlük limit kontrolü"))
     
     logger.info("⏰ Rate limit sıfırlama zamanlaması başlatıldı")
     logger.info("   • Her 15 dakikada bir kontrol")
-    logger.info("   • Her saat başı kontrol")
     logger.info("   • Her gün 00:00'da günlük limit kontrolü")
+    return scheduler
 
 def run_scheduler():
     """Zamanlayıcıyı çalıştır"""
     logger.info("🚀 Otomatik Rate Limit Sıfırlama Sistemi Başlatılıyor...")
     
     # İlk kontrol
-    check_rate_limit_status()
     check_daily_limit()
     
-    # Zamanlamayı ayarla
-    schedule_rate_limit_reset()
+    # Zamanlamayı ayarla (rate limit kontrolü ilk döngüde hemen çalışır)
+    scheduler = schedule_rate_limit_reset()
     
     try:
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # 1 dakika bekle
+        scheduler.run_forever()
             
     except KeyboardInterrupt:
         logger.info("⏹️  Sistem durduruldu")
+        scheduler.stop()
     except Exception as e:
         logger.error(f"❌ Zamanlayıcı hatası: {e}")
 
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Duplikat Filtresi Benchmark'ı
+filter_duplicate_articles içindeki ikili check_content_similarity taraması ile
+MinHash/LSH yakın duplikat indeksini gerçek posted_articles.json üzerinde
+karşılaştırır. Her batch için süre ve kararların birebir aynı olup olmadığı
+raporlanır.
+
+Kullanım: python benchmark_duplicate_filter.py [batch_sayisi] [batch_boyutu]
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+
+from utils import check_content_similarity
+from near_duplicate import NearDuplicateIndex
+
+
+def load_list(path):
+    """JSON listesini doğrudan dosyadan oku (makale deposundan bağımsız)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, list) else []
+    except Exception:
+        return []
+
+
+def pairwise_verdicts(batch, existing, title_threshold, content_threshold):
+    """Eski yöntem: her makale için tüm geçmiş + batch içi ikili karşılaştırma"""
+    verdicts = []
+    accepted = []
+    for article in batch:
+        is_duplicate = False
+        for other in existing:
+            if check_content_similarity(article, other, title_threshold, content_threshold)[0]:
+                is_duplicate = True
+                break
+        if not is_duplicate:
+            for other in accepted:
+                if check_content_similarity(article, other, title_threshold, content_threshold)[0]:
+                    is_duplicate = True
+                    break
+        if not is_duplicate:
+            accepted.append(article)
+        verdicts.append(is_duplicate)
+    return verdicts
+
+
+def lsh_verdicts(index, batch, existing, title_threshold, content_threshold):
+    """Yeni yöntem: indeks senkronu + aday kovaları"""
+    index.sync(existing)
+    batch_index = NearDuplicateIndex(persist=False)
+    verdicts = []
+    for article in batch:
+        doc = index.get_doc(article)
+        is_duplicate = index.find_duplicate(article, title_threshold, content_threshold, doc=doc)[0]
+        if not is_duplicate:
+            is_duplicate = batch_index.find_duplicate(article, title_threshold, content_threshold, doc=doc)[0]
+        if not is_duplicate:
+            batch_index.add(article)
+        verdicts.append(is_duplicate)
+    return verdicts
+
+
+def main():
+    batch_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    try:
+        with open("automation_settings.json", 'r', encoding='utf-8') as f:
+            settings = json.load(f)
+    except Exception:
+        settings = {}
+    title_threshold = settings.get('title_similarity_threshold', 0.95)
+    content_threshold = settings.get('content_similarity_threshold', 0.9)
+
+    posted = load_list("posted_articles.json")
+    pending = [t.get('article', {}) for t in load_list("pending_tweets.json") if t.get('article')]
+    if len(posted) < batch_size * 2:
+        print("❌ Benchmark için yeterli geçmiş yok")
+        return
+
+    print(f"📊 Geçmiş: {len(posted)} paylaşılan + {len(pending)} bekleyen makale")
+    print(f"🎯 Eşikler: başlık {title_threshold:.0%}, içerik {content_threshold:.0%}")
+    print(f"📦 {batch_count} batch x {batch_size} makale\n")
+
+    db_path = os.path.join(tempfile.mkdtemp(), "benchmark_near_dup.db")
+    index = NearDuplicateIndex(db_path=db_path)
+
+    start = time.perf_counter()
+    index.sync(posted + pending)
+    cold_build = time.perf_counter() - start
+    print(f"🧱 İlk indeks oluşturma (tek seferlik, kalıcı): {cold_build:.2f}s\n")
+
+    # Batch'ler geçmişin sonuna doğru eşit aralıklarla seçilir; her batch kendinden önceki geçmişe karşı test edilir
+    step = max(batch_size, (len(posted) // 2) // batch_count)
+    starts = [len(posted) - batch_size - i * step for i in range(batch_count)]
+
+    total_old = total_new = 0.0
+    mismatches = 0
+    duplicates = 0
+    print(f"{'batch':>5} {'geçmiş':>7} {'ikili (s)':>10} {'LSH (s)':>9} {'hız':>7} {'duplikat':>9} {'aynı':>5}")
+    for n, batch_start in enumerate(sorted(s for s in starts if s > 0)):
+        batch = posted[batch_start:batch_start + batch_size]
+        existing = posted[:batch_start] + pending
+
+        t0 = time.perf_counter()
+        old = pairwise_verdicts(batch, existing, title_threshold, content_threshold)
+        t1 = time.perf_counter()
+        new = lsh_verdicts(index, batch, existing, title_threshold, content_threshold)
+        t2 = time.perf_counter()
+
+        same = old == new
+        mismatches += 0 if same else 1
+        duplicates += sum(old)
+        total_old += t1 - t0
+        total_new += t2 - t1
+        speedup = (t1 - t0) / max(t2 - t1, 1e-9)
+        print(f"{n + 1:>5} {len(existing):>7} {t1 - t0:>10.3f} {t2 - t1:>9.3f} {speedup:>6.1f}x {sum(old):>9} {'✅' if same else '❌':>5}")
+
+    print(f"\n⏱️ Toplam: ikili {total_old:.2f}s, LSH {total_new:.2f}s ({total_old / max(total_new, 1e-9):.1f}x)")
+    print(f"🔍 Duplikat karar sayısı: {duplicates}, uyuşmayan batch: {mismatches}")
+    print(f"📈 İndeks: {index.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
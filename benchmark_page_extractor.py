@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sayfa Çıkarıcı Benchmark'ı
+Eski yol (BeautifulSoup + 11 selector'lı extract_main_content + linkler için
+ikinci parse) ile page_extractor.extract_page'in tek geçişini kaydedilmiş
+HTML dosyaları üzerinde karşılaştırır. Her sayfa için süre, ana metnin
+(boşluklar yok sayılarak) aynı olup olmadığı, link sayıları ve yeni yolun
+bulduğu yayın tarihi / canonical URL raporlanır.
+
+Dosya adı bir URL'nin kaydıysa (--save ile indirilenler) göreli linkler o
+adrese göre çözülür; ilk satırdaki <!-- url: ... --> yorumu okunur.
+
+Kullanım: python benchmark_page_extractor.py [html_klasoru] [tekrar]
+          python benchmark_page_extractor.py --save html_klasoru URL [URL ...]
+"""
+
+import os
+import re
+import sys
+import time
+import hashlib
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from page_extractor import extract_page, LXML_AVAILABLE
+
+_URL_COMMENT = re.compile(r"^<!-- url: (\S+) -->")
+
+LEGACY_SELECTORS = [
+    'article', '[role="main"]', 'main', '.post-content', '.entry-content',
+    '.article-content', '.content', '.story-body', '.article-body',
+    '#content', '.main-content'
+]
+
+
+def legacy_extract(html, base_url):
+    """Eski yol: içerik için bir soup, linkler için ikinci bir soup"""
+    soup = BeautifulSoup(html, 'html.parser')
+    content_text = ""
+    for selector in LEGACY_SELECTORS:
+        elements = soup.select(selector)
+        if elements:
+            element = elements[0]
+            for unwanted in element(["script", "style", "nav", "footer", "header", "aside"]):
+                unwanted.decompose()
+            content_text = element.get_text(strip=True)
+            if len(content_text) > 200:
+                break
+    if not content_text or len(content_text) < 200:
+        body = soup.find('body')
+        if body:
+            for unwanted in body(["script", "style", "nav", "footer", "header", "aside"]):
+                unwanted.decompose()
+            content_text = body.get_text(strip=True)
+    content = ' '.join(content_text.split())
+
+    links = []
+    link_soup = BeautifulSoup(html, 'html.parser')
+    for link_elem in link_soup.find_all('a', href=True):
+        href = link_elem.get('href', '')
+        text = link_elem.get_text(strip=True)
+        if href and text and len(text) > 5:
+            if href.startswith('/'):
+                href = urljoin(base_url, href) if base_url else href
+            elif not href.startswith('http'):
+                continue
+            links.append({"text": text, "url": href})
+    return {"content": content, "links": links}
+
+
+def load_fixtures(folder):
+    """Klasördeki .html dosyaları -> (ad, html, url)"""
+    fixtures = []
+    for name in sorted(os.listdir(folder)):
+        if not name.lower().endswith(('.html', '.htm')):
+            continue
+        with open(os.path.join(folder, name), 'r', encoding='utf-8', errors='replace') as f:
+            html = f.read()
+        match = _URL_COMMENT.match(html)
+        fixtures.append((name, html, match.group(1) if match else None))
+    return fixtures
+
+
+def save_fixtures(folder, urls):
+    """URL'leri indirip ilk satıra adresini yazarak kaydet"""
+    from utils import http_get
+
+    os.makedirs(folder, exist_ok=True)
+    for url in urls:
+        try:
+            response = http_get(url, timeout=30)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"❌ {url}: {e}")
+            continue
+        name = hashlib.md5(url.encode('utf-8')).hexdigest()[:12] + ".html"
+        with open(os.path.join(folder, name), 'w', encoding='utf-8') as f:
+            f.write(f"<!-- url: {url} -->\n{response.text}")
+        print(f"💾 {url} -> {name} ({len(response.text)} karakter)")
+
+
+def compact(text):
+    return "".join(text.split())
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--save":
+        save_fixtures(sys.argv[2], sys.argv[3:])
+        return
+
+    folder = sys.argv[1] if len(sys.argv) > 1 else "html_fixtures"
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    if not os.path.isdir(folder):
+        print(f"❌ HTML klasörü bulunamadı: {folder}")
+        return
+
+    fixtures = load_fixtures(folder)
+    if not fixtures:
+        print(f"❌ {folder} içinde .html dosyası yok")
+        return
+
+    print(f"📄 {len(fixtures)} sayfa, her biri {repeat} tekrar")
+    print(f"🧩 Parser: {'lxml' if LXML_AVAILABLE else 'html.parser'}\n")
+
+    total_old = total_new = 0.0
+    same_content = 0
+    print(f"{'sayfa':<24} {'KB':>6} {'eski (ms)':>10} {'yeni (ms)':>10} {'hız':>7} {'metin':>6} {'link':>9} {'tarih':>6} {'canonical':>10}")
+    for name, html, url in fixtures:
+        old_time, old = timed(lambda: legacy_extract(html, url), repeat)
+        new_time, new = timed(lambda: extract_page(html, base_url=url), repeat)
+        total_old += old_time
+        total_new += new_time
+
+        same = compact(old["content"]) == compact(new["content"])
+        same_content += 1 if same else 0
+        speedup = old_time / max(new_time, 1e-9)
+        print(f"{name[:24]:<24} {len(html) / 1024:>6.0f} {old_time * 1000:>10.1f} {new_time * 1000:>10.1f} "
+              f"{speedup:>6.1f}x {'✅' if same else '≠':>6} {len(old['links']):>4}/{len(new['links']):<4} "
+              f"{'✅' if new['published_date'] else '-':>6} {'✅' if new['canonical_url'] else '-':>10}")
+
+    print(f"\n⏱️ Toplam: eski {total_old * 1000:.1f}ms, yeni {total_new * 1000:.1f}ms "
+          f"({total_old / max(total_new, 1e-9):.1f}x)")
+    print(f"🔍 Ana metni aynı olan sayfa: {same_content}/{len(fixtures)} "
+          f"(farklar reklam/menü/kenar çubuğu metninin atlanmasından gelir)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Headless Tarayıcı Havuzu
+advanced_web_scraper use_js ile çağrıldığında (TechCrunch, The Verge, Wired,
+Ars Technica, VentureBeat) her URL için yeni bir requests_html render'ı veya
+yeni bir Selenium Chrome örneği başlatıyordu; her sayfa tarayıcı açılış
+süresini yeniden ödüyordu.
+
+RenderPool N adet sıcak tarayıcıyı uzun ömürlü çalışan thread'lerde tutar.
+Scraper render isteğini kuyruğa bırakır, boştaki tarayıcı sayfayı yükler ve
+HTML'i döndürür; bir çalışmada birden çok JS sayfası render etmek sadece
+sayfa yükleme süresine mal olur.
+
+    - Her tarayıcı kendi thread'inde yaşar (pyppeteer'in event loop'u ve
+      Selenium sürücüsü thread'ler arasında paylaşılmaz)
+    - Tarayıcılar ilk istekte açılır; K sayfa sonra, bellek eşiği aşılınca
+      (psutil varsa) veya render hatasından sonra kapatılıp yenilenir
+    - Boşta kalan çalışanlar tarayıcılarını kapatıp çıkar; süreç kapanırken
+      tüm tarayıcılar kapatılır
+    - Zaman aşımına uğrayan render sayfa süresi + pay dolduğunda hâlâ
+      bitmediyse tarayıcı süreç ağacı öldürülür ve çalışanın yerine yenisi
+      başlatılır (takılan sürücü çalışanı ve tarayıcıyı sonsuza dek tutmaz)
+
+Ayarlar (.env):
+    RENDER_POOL_SIZE           - sıcak tarayıcı sayısı (varsayılan 2)
+    RENDER_POOL_MAX_PAGES      - yenilemeden önce render edilecek sayfa (varsayılan 50)
+    RENDER_POOL_MAX_MEMORY_MB  - tarayıcı süreç ağacı bellek eşiği (varsayılan 800)
+    RENDER_POOL_PAGE_TIMEOUT   - sayfa başına yükleme zaman aşımı, saniye (varsayılan 30)
+    RENDER_POOL_QUEUE_TIMEOUT  - kuyrukta en fazla bekleme, saniye (varsayılan 60)
+    RENDER_POOL_IDLE_SECONDS   - boşta kalan tarayıcının kapanma süresi (varsayılan 300)
+    RENDER_POOL_KILL_GRACE     - takılan render öldürülmeden önceki ek süre, saniye (varsayılan 10)
+"""
+
+import os
+import time
+import queue
+import atexit
+import signal
+import threading
+from datetime import datetime
+
+# Tarayıcı süreç ağacının bellek kullanımı (yoksa sadece sayfa sayısıyla yenilenir)
+try:
+    import psutil  # type: ignore
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None  # type: ignore
+    PSUTIL_AVAILABLE = False
+
+CHROME_ARGS = ['--headless', '--no-sandbox', '--disable-dev-shm-usage', '--disable-gpu',
+               '--window-size=1920,1080']
+
+
+def _env_number(name, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _process_tree_mb(pid):
+    """Sürecin ve alt süreçlerinin RSS toplamı (ölçülemezse None)"""
+    if not PSUTIL_AVAILABLE or not pid:
+        return None
+    try:
+        process = psutil.Process(pid)
+        total = process.memory_info().rss
+        for child in process.children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except psutil.Error:
+                pass
+        return total / (1024 * 1024)
+    except psutil.Error:
+        return None
+
+
+def _kill_process_tree(pid):
+    """Tarayıcı sürecini ve alt süreçlerini öldür (takılan render'ı serbest bırakır)"""
+    if not pid:
+        return
+    if PSUTIL_AVAILABLE:
+        try:
+            process = psutil.Process(pid)
+            processes = process.children(recursive=True) + [process]
+        except psutil.Error:
+            return
+        for proc in processes:
+            try:
+                proc.kill()
+            except psutil.Error:
+                pass
+        return
+    try:
+        os.kill(pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+    except OSError:
+        pass
+
+
+# ----------------------------------------------------------------------
+# Tarayıcı arka uçları
+# ----------------------------------------------------------------------
+class SeleniumRenderer:
+    """Tek bir headless Chrome sürücüsü"""
+
+    def __init__(self, user_agent=None):
+        from selenium import webdriver  # type: ignore
+        from selenium.webdriver.chrome.options import Options  # type: ignore
+
+        options = Options()
+        for arg in CHROME_ARGS:
+            options.add_argument(arg)
+        if user_agent:
+            options.add_argument(f'--user-agent={user_agent}')
+        self.driver = webdriver.Chrome(options=options)
+
+    def render(self, url, wait_time, timeout, headers=None):
+        from selenium.webdriver.common.by import By  # type: ignore
+        from selenium.webdriver.support.ui import WebDriverWait  # type: ignore
+        from selenium.webdriver.support import expected_conditions as EC  # type: ignore
+
+        self.driver.set_page_load_timeout(timeout)
+        self.driver.get(url)
+        WebDriverWait(self.driver, max(wait_time, 1)).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        # Dinamik içerik için biraz daha bekle
+        time.sleep(wait_time)
+        return self.driver.page_source
+
+    def pid(self):
+        try:
+            return self.driver.service.process.pid
+        except AttributeError:
+            return None
+
+    def close(self):
+        self.driver.quit()
+
+
+class RequestsHtmlRenderer:
+    """Tek bir requests_html oturumu ve ona bağlı pyppeteer Chromium'u"""
+
+    def __init__(self, user_agent=None):
+        import asyncio
+        import pyppeteer  # type: ignore
+        from requests_html import HTMLSession  # type: ignore
+
+        # Çalışan thread'in kendi event loop'u; tarayıcı sinyal işleyicisi
+        # kurmadan açılır (ana thread dışında signal kaydı hata verir)
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.session = HTMLSession()
+        if user_agent:
+            self.session.headers['User-Agent'] = user_agent
+        self.session.loop = self.loop
+        self.session._browser = self.loop.run_until_complete(pyppeteer.launch(
+            headless=True, args=CHROME_ARGS[1:],
+            handleSIGINT=False, handleSIGTERM=False, handleSIGHUP=False))
+
+    def render(self, url, wait_time, timeout, headers=None):
+        response = self.session.get(url, headers=headers, timeout=timeout)
+        response.html.render(wait=wait_time, timeout=timeout)
+        return response.html.html
+
+    def pid(self):
+        try:
+            return self.session._browser.process.pid
+        except AttributeError:
+            return None
+
+    def close(self):
+        try:
+            self.session.close()
+        finally:
+            self.loop.close()
+
+
+RENDERER_BACKENDS = {
+    "requests-html": RequestsHtmlRenderer,
+    "selenium": SeleniumRenderer,
+}
+
+
+class RenderTimeout(Exception):
+    """Render isteği kuyrukta veya sayfa yüklemesinde zaman aşımına uğradı"""
+
+
+class _RenderJob:
+    def __init__(self, url, wait_time, headers):
+        self.url = url
+        self.wait_time = wait_time
+        self.headers = headers
+        self.submitted_at = time.time()
+        self.abandoned = False
+        # Çalışan işi aldığında havuz kilidi altında doldurulur
+        self.started_at = None
+        self.worker = None
+        self.renderer = None
+        self.killed_renderer = None
+        self.html = None
+        self.error = None
+        self.done = threading.Event()
+
+
+# ----------------------------------------------------------------------
+# Havuz
+# ----------------------------------------------------------------------
+class RenderPool:
+    def __init__(self, backend="selenium", size=None, max_pages=None, max_memory_mb=None,
+                 page_timeout=None, queue_timeout=None, idle_seconds=None, user_agent=None,
+                 renderer_factory=None):
+        self.backend = backend
+        self.size = max(1, size or _env_number('RENDER_POOL_SIZE', 2))
+        self.max_pages = max(1, max_pages or _env_number('RENDER_POOL_MAX_PAGES', 50))
+        self.max_memory_mb = max_memory_mb or _env_number('RENDER_POOL_MAX_MEMORY_MB', 800, float)
+        self.page_timeout = page_timeout or _env_number('RENDER_POOL_PAGE_TIMEOUT', 30, float)
+        self.queue_timeout = queue_timeout or _env_number('RENDER_POOL_QUEUE_TIMEOUT', 60, float)
+        self.idle_seconds = idle_seconds or _env_number('RENDER_POOL_IDLE_SECONDS', 300, float)
+        self.kill_grace = _env_number('RENDER_POOL_KILL_GRACE', 10, float)
+        self.user_agent = user_agent
+        self.renderer_factory = renderer_factory or RENDERER_BACKENDS[backend]
+
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers = 0
+        self._threads = set()
+        # Takılan render'ı öldürülüp yerine yenisi başlatılan çalışanlar
+        self._orphaned = set()
+        self._warm = 0
+        self._busy = 0
+        self._closed = False
+        self._stats = {"renders": 0, "errors": 0, "timeouts": 0, "launches": 0, "launch_seconds": 0.0,
+                       "render_seconds": 0.0, "queue_wait_seconds": 0.0,
+                       "recycles": {"pages": 0, "memory": 0, "error": 0, "idle": 0, "hung": 0}}
+
+    def _log(self, message, level="info"):
+        """Tarayıcı havuzu logları"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        prefix = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"}.get(level, "ℹ️")
+        print(f"{prefix} [{timestamp}] [RenderPool:{self.backend}] {message}")
+
+    # ------------------------------------------------------------------
+    # Render isteği
+    # ------------------------------------------------------------------
+    def render(self, url, wait_time=3, headers=None):
+        """Sayfayı boştaki sıcak tarayıcıda render et ve HTML'i döndür
+
+        Kuyruk ve sayfa zaman aşımında RenderTimeout, tarayıcı hatasında
+        render hatası yükseltilir.
+        """
+        job = _RenderJob(url, wait_time, headers)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Tarayıcı havuzu kapatıldı")
+            self._queue.put(job)
+            self._spawn_worker_locked()
+
+        if not job.done.wait(self.queue_timeout + self.page_timeout + wait_time):
+            with self._lock:
+                job.abandoned = True
+                started_at = job.started_at
+                self._stats["timeouts"] += 1
+            if started_at is not None and not job.done.is_set():
+                # Tarayıcı kendi zaman aşımıyla dönmezse süreç ağacı öldürülür
+                delay = started_at + self.page_timeout + wait_time + self.kill_grace - time.time()
+                timer = threading.Timer(max(0.0, delay), self._kill_hung, args=(job,))
+                timer.daemon = True
+                timer.start()
+            raise RenderTimeout(f"Render zaman aşımı: {url}")
+        if job.error is not None:
+            raise job.error
+        return job.html
+
+    def _spawn_worker_locked(self):
+        """Kuyrukta bekleyen iş için gerekiyorsa çalışan başlat (self._lock tutulurken)"""
+        if self._closed:
+            return
+        if self._workers < self.size and self._workers - self._busy < self._queue.qsize():
+            self._workers += 1
+            thread = threading.Thread(target=self._run, name=f"RenderPool-{self.backend}", daemon=True)
+            self._threads.add(thread)
+            thread.start()
+
+    def _kill_hung(self, job):
+        """Hâlâ bitmemiş render'ın tarayıcısını öldür, çalışanı havuzdan düş ve yerine yenisini başlat"""
+        with self._lock:
+            if job.done.is_set() or job.worker is None or job.worker in self._orphaned:
+                return
+            self._orphaned.add(job.worker)
+            self._workers -= 1
+            self._busy -= 1
+            renderer = job.killed_renderer = job.renderer
+            if renderer is not None:
+                self._warm -= 1
+            self._stats["recycles"]["hung"] += 1
+            self._spawn_worker_locked()
+        pid = None
+        if renderer is not None:
+            try:
+                pid = renderer.pid()
+            except Exception:
+                pid = None
+        self._log(f"Takılan render sonlandırılıyor: {job.url} (pid {pid})", "warning")
+        _kill_process_tree(pid)
+
+    # ------------------------------------------------------------------
+    # Çalışan thread
+    # ------------------------------------------------------------------
+    def _next_job(self):
+        """Sıradaki iş; boşta kalma süresi dolduysa ve kuyruk boşsa None"""
+        while True:
+            try:
+                return self._queue.get(timeout=self.idle_seconds)
+            except queue.Empty:
+                with self._lock:
+                    # Çalışan sayısı kuyruk kontrolüyle aynı kilitte düşer;
+                    # aradaki render() çağrısı yeni çalışan başlatır
+                    if self._queue.empty():
+                        self._workers -= 1
+                        return None
+
+    def _run(self):
+        renderer = None
+        pages = 0
+        counted_out = False
+        try:
+            while True:
+                job = self._next_job()
+                if job is None:
+                    counted_out = True
+                    if renderer is not None:
+                        self._count_recycle("idle")
+                    return
+                if job.url is None:
+                    # shutdown() işareti
+                    return
+                with self._lock:
+                    # Vazgeçilme kontrolü ve başlangıç aynı kilitte (render() zaman aşımı ile yarışmasın)
+                    if job.abandoned:
+                        continue
+                    self._busy += 1
+                    self._stats["queue_wait_seconds"] += time.time() - job.submitted_at
+                    job.started_at = time.time()
+                    job.worker = threading.current_thread()
+                    job.renderer = renderer
+                failed = False
+                orphaned = False
+                try:
+                    if renderer is None:
+                        renderer = self._launch()
+                        with self._lock:
+                            job.renderer = renderer
+                    started = time.time()
+                    job.html = renderer.render(job.url, job.wait_time, self.page_timeout, job.headers)
+                    pages += 1
+                    with self._lock:
+                        self._stats["renders"] += 1
+                        self._stats["render_seconds"] += time.time() - started
+                except Exception as e:
+                    job.error = e
+                    failed = True
+                    with self._lock:
+                        self._stats["errors"] += 1
+                finally:
+                    with self._lock:
+                        orphaned = threading.current_thread() in self._orphaned
+                        if not orphaned:
+                            self._busy -= 1
+                        job.done.set()
+
+                if orphaned:
+                    # Tarayıcı _kill_hung ile öldürüldü ve yerine yeni çalışan başlatıldı
+                    # (açılışı takılan tarayıcı öldürülmediyse normal kapatılır)
+                    if renderer is not None and renderer is not job.killed_renderer:
+                        self._close_renderer(renderer, None)
+                    elif renderer is not None:
+                        try:
+                            renderer.close()
+                        except Exception:
+                            pass
+                    renderer = None
+                    return
+                if failed and renderer is not None:
+                    # Sürücü çökmüş veya sayfada takılı kalmış olabilir - tarayıcıyı yenile
+                    self._close_renderer(renderer, "error")
+                    renderer, pages = None, 0
+
+                reason = self._recycle_reason(renderer, pages)
+                if reason:
+                    self._close_renderer(renderer, reason)
+                    renderer, pages = None, 0
+                if self._closed:
+                    return
+        finally:
+            if renderer is not None:
+                self._close_renderer(renderer, None)
+            with self._lock:
+                current = threading.current_thread()
+                if not counted_out and current not in self._orphaned:
+                    self._workers -= 1
+                self._orphaned.discard(current)
+                self._threads.discard(current)
+
+    def _launch(self):
+        started = time.time()
+        renderer = self.renderer_factory(self.user_agent)
+        elapsed = time.time() - started
+        with self._lock:
+            self._warm += 1
+            self._stats["launches"] += 1
+            self._stats["launch_seconds"] += elapsed
+        self._log(f"Tarayıcı açıldı ({elapsed:.1f}s)")
+        return renderer
+
+    def _recycle_reason(self, renderer, pages):
+        if renderer is None:
+            return None
+        if pages >= self.max_pages:
+            return "pages"
+        memory_mb = _process_tree_mb(renderer.pid()) if self.max_memory_mb else None
+        if memory_mb is not None and memory_mb > self.max_memory_mb:
+            self._log(f"Tarayıcı bellek eşiğini aştı: {memory_mb:.0f} MB", "warning")
+            return "memory"
+        return None
+
+    def _count_recycle(self, reason):
+        with self._lock:
+            self._stats["recycles"][reason] += 1
+
+    def _close_renderer(self, renderer, reason):
+        try:
+            renderer.close()
+        except Exception as e:
+            self._log(f"Tarayıcı kapatma hatası: {e}", "warning")
+        with self._lock:
+            self._warm -= 1
+            if reason and reason != "idle":
+                self._stats["recycles"][reason] += 1
+
+    def shutdown(self, timeout=10):
+        """Yeni işleri reddet, tarayıcıları kapat ve çalışanların çıkmasını bekle"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            # Takılı kalan (öldürülmüş) çalışanlar kuyruğu okumaz, beklenmez
+            threads = [thread for thread in self._threads if thread not in self._orphaned]
+        if not threads:
+            return
+        self._log(f"Havuz kapatılıyor ({len(threads)} çalışan)")
+        for _ in threads:
+            self._queue.put(_RenderJob(None, 0, None))
+        deadline = time.time() + timeout
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.time()))
+
+    def stats(self):
+        """Render/açılış sayaçları, ortalama süreler ve havuz doluluğu"""
+        with self._lock:
+            stats = {**self._stats, "recycles": dict(self._stats["recycles"])}
+            stats.update(workers=self._workers, warm_browsers=self._warm, busy=self._busy)
+        renders = stats["renders"]
+        stats.update(
+            backend=self.backend,
+            size=self.size,
+            queued=self._queue.qsize(),
+            max_pages=self.max_pages,
+            max_memory_mb=self.max_memory_mb,
+            avg_launch_seconds=round(stats.pop("launch_seconds") / stats["launches"], 2) if stats["launches"] else 0.0,
+            avg_render_seconds=round(stats.pop("render_seconds") / renders, 2) if renders else 0.0,
+            avg_queue_wait_seconds=round(stats.pop("queue_wait_seconds") / renders, 3) if renders else 0.0,
+        )
+        return stats
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_render_pool(backend="selenium", user_agent=None):
+    """Arka uç başına süreç genelinde tek RenderPool örneği"""
+    pool = _pools.get(backend)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(backend)
+            if pool is None:
+                if not _pools:
+                    atexit.register(shutdown_render_pools)
+                pool = RenderPool(backend, user_agent=user_agent)
+                _pools[backend] = pool
+    return pool
+
+
+def get_render_pool_stats():
+    """Açılmış havuzların durumu (arka uç -> istatistik)"""
+    return {backend: pool.stats() for backend, pool in list(_pools.items())}
+
+
+def shutdown_render_pools():
+    """Süreç kapanırken açık tarayıcıları kapat (arkada Chrome süreci kalmasın)"""
+    for pool in list(_pools.values()):
+        try:
+            pool.shutdown()
+        except Exception:
+            pass
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Makale İçerik Önbelleği
+fetch_article_content_with_firecrawl, fetch_url_content_with_mcp ve fallback'leri
+bir makaleye her dokunulduğunda (akıllı çekim, /create_tweet, reddedilen makale
+denemeleri) tam sayfayı yeniden indirip yeniden çıkarıyordu.
+
+Çıkarılmış metin, başlık, meta veriler ve ETag/Last-Modified doğrulayıcıları
+canonical URL anahtarıyla diskte saklanır. Taze kayıt ağa hiç çıkmadan döner;
+bayatlayan kayıt koşullu GET ile doğrulanır (304 -> kayıt tazelenir).
+
+    - İstek URL'leri takma ad (alias) olarak canonical anahtara bağlanır;
+      utm_*, fbclid, gclid parametreleri ve #fragment anahtara girmez
+    - Toplam boyut, kayıt sayısı ve alan adı başına kayıt sınırı aşılınca en
+      uzun süredir kullanılmayan (LRU) kayıtlar silinir
+    - Uzun süre hiç kullanılmayan kayıtlar TTL sonunda atılır
+
+Ayarlar (.env):
+    CONTENT_CACHE_ENABLED        - "false" ile tamamen kapatılır (varsayılan true)
+    CONTENT_CACHE_DB             - veritabanı dosyası (varsayılan content_cache.db)
+    CONTENT_CACHE_FRESH_HOURS    - ağa çıkmadan kullanılacak süre (varsayılan 24)
+    CONTENT_CACHE_TTL_DAYS       - kullanılmayan kaydın ömrü (varsayılan 30)
+    CONTENT_CACHE_MAX_ENTRIES    - en fazla kayıt (varsayılan 5000)
+    CONTENT_CACHE_MAX_PER_DOMAIN - alan adı başına en fazla kayıt (varsayılan 500)
+    CONTENT_CACHE_MAX_MB         - en fazla toplam metin boyutu (varsayılan 50)
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from datetime import datetime
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+CONTENT_CACHE_DB = os.environ.get('CONTENT_CACHE_DB', 'content_cache.db')
+
+# Anahtara girmeyen izleme parametreleri
+_TRACKING_PARAMS = ("fbclid", "gclid", "mc_cid", "mc_eid", "ref_src")
+
+
+def _env_number(name, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def is_content_cache_enabled():
+    """CONTENT_CACHE_ENABLED=false ile önbellek devre dışı bırakılabilir"""
+    return os.getenv('CONTENT_CACHE_ENABLED', 'true').strip().lower() not in ('0', 'false', 'no', 'off')
+
+
+def normalize_url(url):
+    """Önbellek anahtarı: küçük harf şema/host, izleme parametresiz, fragment'sız, sonda / yok"""
+    try:
+        parts = urlsplit((url or "").strip())
+    except ValueError:
+        return (url or "").strip()
+    if not parts.scheme or not parts.netloc:
+        return (url or "").strip()
+    query = urlencode([(name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                       if not name.lower().startswith("utm_") and name.lower() not in _TRACKING_PARAMS])
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+def _domain(url):
+    host = urlsplit(url).netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class ContentCache:
+    def __init__(self, db_path=None, fresh_hours=None, ttl_days=None, max_entries=None,
+                 max_per_domain=None, max_mb=None):
+        self.db_path = db_path or CONTENT_CACHE_DB
+        self.fresh_seconds = (fresh_hours if fresh_hours is not None else _env_number('CONTENT_CACHE_FRESH_HOURS', 24, float)) * 3600
+        self.ttl_seconds = (ttl_days if ttl_days is not None else _env_number('CONTENT_CACHE_TTL_DAYS', 30, float)) * 86400
+        self.max_entries = max_entries or _env_number('CONTENT_CACHE_MAX_ENTRIES', 5000)
+        self.max_per_domain = max_per_domain or _env_number('CONTENT_CACHE_MAX_PER_DOMAIN', 500)
+        self.max_bytes = int((max_mb or _env_number('CONTENT_CACHE_MAX_MB', 50, float)) * 1024 * 1024)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "revalidated": 0, "refreshed": 0, "misses": 0,
+                          "stores": 0, "expired": 0, "evicted": 0}
+        self._init_db()
+
+    def _log(self, message, level="info"):
+        """İçerik önbelleği logları"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        prefix = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"}.get(level, "ℹ️")
+        print(f"{prefix} [{timestamp}] [ContentCache] {message}")
+
+    def _get_connection(self):
+        """Thread başına bir bağlantı"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA busy_timeout = 30000")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        conn = self._get_connection()
+        with conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS content_cache (
+                    key TEXT PRIMARY KEY,
+                    domain TEXT NOT NULL,
+                    title TEXT,
+                    content TEXT NOT NULL,
+                    metadata TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    size INTEGER NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    validated_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    hit_count INTEGER DEFAULT 0
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS content_cache_alias (
+                    alias TEXT PRIMARY KEY,
+                    key TEXT NOT NULL
+                )
+            ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_content_cache_last_access ON content_cache(last_access)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_content_cache_domain ON content_cache(domain, last_access)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_content_cache_alias_key ON content_cache_alias(key)")
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._counters[name] += amount
+
+    # ------------------------------------------------------------------
+    # Okuma / yazma
+    # ------------------------------------------------------------------
+    def get(self, url):
+        """URL'nin kaydı (sözlük) veya None - "fresh" alanı ağa çıkmadan kullanılabilir mi"""
+        alias = normalize_url(url)
+        try:
+            conn = self._get_connection()
+            row = conn.execute(
+                "SELECT c.key, c.title, c.content, c.metadata, c.etag, c.last_modified, c.fetched_at, c.validated_at "
+                "FROM content_cache c JOIN content_cache_alias a ON a.key = c.key WHERE a.alias = ?",
+                (alias,)).fetchone()
+        except Exception as e:
+            self._log(f"Önbellek okuma hatası: {e}", "warning")
+            return None
+        if row is None:
+            return None
+        key, title, content, metadata, etag, last_modified, fetched_at, validated_at = row
+        try:
+            metadata = json.loads(metadata) if metadata else {}
+        except ValueError:
+            metadata = {}
+        return {
+            "key": key,
+            "title": title or "",
+            "content": content,
+            "metadata": metadata,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": fetched_at,
+            "validated_at": validated_at,
+            "fresh": time.time() - validated_at < self.fresh_seconds,
+        }
+
+    def validators(self, entry):
+        """Koşullu GET başlıkları (doğrulayıcı yoksa boş)"""
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def note_hit(self, entry, revalidated=False):
+        """Kayıt kullanıldı; 304 ile doğrulandıysa tazelik süresi yeniden başlar"""
+        now = time.time()
+        try:
+            conn = self._get_connection()
+            with conn:
+                if revalidated:
+                    conn.execute("UPDATE content_cache SET last_access = ?, validated_at = ?, hit_count = hit_count + 1 "
+                                 "WHERE key = ?", (now, now, entry["key"]))
+                else:
+                    conn.execute("UPDATE content_cache SET last_access = ?, hit_count = hit_count + 1 WHERE key = ?",
+                                 (now, entry["key"]))
+        except Exception as e:
+            self._log(f"Önbellek güncelleme hatası: {e}", "warning")
+        self._count("revalidated" if revalidated else "hits")
+
+    def note_miss(self, refreshed=False):
+        """Kayıt yoktu (veya sayfa değişmişti) ve içerik yeniden çekildi"""
+        self._count("refreshed" if refreshed else "misses")
+
+    def put(self, url, title, content, metadata=None, etag=None, last_modified=None, canonical_url=None):
+        """Çıkarılmış içeriği canonical URL altında sakla; istek URL'si takma ad olur"""
+        if not content:
+            return
+        key = normalize_url(canonical_url or url)
+        now = time.time()
+        try:
+            conn = self._get_connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO content_cache (key, domain, title, content, metadata, etag, last_modified, "
+                    "size, fetched_at, validated_at, last_access, hit_count) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                    (key, _domain(key), title or "", content, json.dumps(metadata or {}, ensure_ascii=False),
+                     etag, last_modified, len(content.encode('utf-8', 'ignore')), now, now, now)
+                )
+                conn.executemany("INSERT OR REPLACE INTO content_cache_alias (alias, key) VALUES (?, ?)",
+                                 [(alias, key) for alias in {key, normalize_url(url)}])
+            self._count("stores")
+            self._evict(conn, _domain(key))
+        except Exception as e:
+            self._log(f"Önbellek yazma hatası: {e}", "warning")
+
+    def _evict(self, conn, domain):
+        """Süresi dolanları sil; alan adı / toplam sınır aşıldıysa LRU sırasıyla kayıt at"""
+        with conn:
+            expired = conn.execute("DELETE FROM content_cache WHERE last_access < ?",
+                                   (time.time() - self.ttl_seconds,)).rowcount
+            evicted = 0
+            overflow = conn.execute("SELECT COUNT(*) FROM content_cache WHERE domain = ?",
+                                    (domain,)).fetchone()[0] - self.max_per_domain
+            if overflow > 0:
+                evicted += conn.execute(
+                    "DELETE FROM content_cache WHERE key IN (SELECT key FROM content_cache WHERE domain = ? "
+                    "ORDER BY last_access ASC LIMIT ?)", (domain, overflow)).rowcount
+            count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM content_cache").fetchone()
+            if count > self.max_entries or total > self.max_bytes:
+                doomed = []
+                for key, size in conn.execute("SELECT key, size FROM content_cache ORDER BY last_access ASC").fetchall():
+                    if count <= self.max_entries and total <= self.max_bytes:
+                        break
+                    doomed.append((key,))
+                    count -= 1
+                    total -= size
+                conn.executemany("DELETE FROM content_cache WHERE key = ?", doomed)
+                evicted += len(doomed)
+            if expired or evicted:
+                conn.execute("DELETE FROM content_cache_alias WHERE key NOT IN (SELECT key FROM content_cache)")
+        if expired:
+            self._count("expired", expired)
+        if evicted:
+            self._count("evicted", evicted)
+
+    def clear(self):
+        """Tüm kayıtları sil"""
+        conn = self._get_connection()
+        with conn:
+            removed = conn.execute("DELETE FROM content_cache").rowcount
+            conn.execute("DELETE FROM content_cache_alias")
+        self._log(f"Önbellek temizlendi: {removed} kayıt", "success")
+        return removed
+
+    def stats(self, top_domains=10):
+        """Hit/doğrulama/miss sayaçları, disk kullanımı ve en çok yer kaplayan alan adları"""
+        with self._lock:
+            counters = dict(self._counters)
+        served = counters["hits"] + counters["revalidated"]
+        lookups = served + counters["misses"] + counters["refreshed"]
+        try:
+            conn = self._get_connection()
+            count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM content_cache").fetchone()
+            domains = [{"domain": domain, "entries": entries, "size_bytes": size}
+                       for domain, entries, size in conn.execute(
+                           "SELECT domain, COUNT(*), SUM(size) FROM content_cache GROUP BY domain "
+                           "ORDER BY SUM(size) DESC LIMIT ?", (top_domains,))]
+        except Exception:
+            count, total, domains = 0, 0, []
+        return {
+            **counters,
+            "hit_ratio": round(served / lookups, 3) if lookups else 0.0,
+            "entries": count,
+            "size_bytes": total,
+            "size_mb": round(total / (1024 * 1024), 2),
+            "max_entries": self.max_entries,
+            "max_per_domain": self.max_per_domain,
+            "max_bytes": self.max_bytes,
+            "fresh_hours": round(self.fresh_seconds / 3600, 1),
+            "ttl_days": round(self.ttl_seconds / 86400, 1),
+            "top_domains": domains,
+        }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_content_cache():
+    """Süreç genelinde tek ContentCache örneği"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ContentCache()
+    return _cache
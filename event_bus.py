@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Süreç İçi Olay Yayını (Server-Sent Events için)
+Panel /api/progress ve /api/dashboard_data uç noktalarını zamanlayıcıyla
+sorguluyordu; her sorgu kilit alıyor, pending_tweets.json'ı okuyor ve
+istatistikleri hesaplıyordu. Artık üreticiler (update_progress, durum
+değişiklikleri) olayları buraya yayınlar, /api/events bağlantıları bekleyip
+yalnızca yeni olay geldiğinde yazar.
+
+    - Her olaya artan bir id verilir; son olaylar halka tamponda tutulur ve
+      yeniden bağlanan istemci Last-Event-ID ile kaldığı yerden devam eder
+    - Aynı türde art arda gelen aynı veri tekrar yayınlanmaz
+    - Başka süreçlerin (start_scheduler.py) yazımları için izleyiciler
+      (watch) sadece en az bir abone varken çalışır; boşta maliyet yoktur
+
+Ayarlar (.env):
+    EVENT_BUS_BUFFER       - saklanan son olay sayısı (varsayılan 256)
+    EVENT_WATCH_SECONDS    - izleyici kontrol aralığı (varsayılan 2)
+"""
+
+import os
+import json
+import time
+import threading
+from collections import deque
+from datetime import datetime
+
+
+def _env_number(name, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class EventBus:
+    def __init__(self, buffer_size=None, watch_interval=None):
+        self.buffer_size = max(16, buffer_size or _env_number('EVENT_BUS_BUFFER', 256))
+        self.watch_interval = max(0.2, watch_interval or _env_number('EVENT_WATCH_SECONDS', 2, float))
+        self._events = deque(maxlen=self.buffer_size)
+        self._last_data = {}
+        self._next_id = 1
+        self._condition = threading.Condition()
+        self._subscribers = 0
+        self._watchers = {}
+        self._watch_wakeup = threading.Event()
+        self._watch_thread = None
+        self._stats = {"published": 0, "suppressed": 0, "watch_checks": 0, "connections": 0}
+
+    def _log(self, message, level="info"):
+        """Olay yayını logları"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        prefix = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"}.get(level, "ℹ️")
+        print(f"{prefix} [{timestamp}] [EventBus] {message}")
+
+    # ------------------------------------------------------------------
+    # Yayınlama
+    # ------------------------------------------------------------------
+    def publish(self, event_type, data, dedupe=True):
+        """Olayı yayınla - dedupe ise aynı türün son verisiyle aynıysa atlanır"""
+        with self._condition:
+            if dedupe and self._last_data.get(event_type) == data:
+                self._stats["suppressed"] += 1
+                return None
+            event = {"id": self._next_id, "type": event_type, "data": data, "time": time.time()}
+            self._next_id += 1
+            self._events.append(event)
+            self._last_data[event_type] = data
+            self._stats["published"] += 1
+            self._condition.notify_all()
+            return event["id"]
+
+    def last(self, event_type):
+        """Türün son yayınlanan verisi (ilk bağlantı anlık görüntüsü için)"""
+        with self._condition:
+            return self._last_data.get(event_type)
+
+    @property
+    def last_id(self):
+        with self._condition:
+            return self._next_id - 1
+
+    # ------------------------------------------------------------------
+    # Dinleme
+    # ------------------------------------------------------------------
+    def events_after(self, last_id):
+        """last_id'den sonraki olaylar; tampon o kadar geriye gitmiyorsa None"""
+        with self._condition:
+            return self._events_after(last_id)
+
+    def _events_after(self, last_id):
+        if self._events and last_id < self._events[0]["id"] - 1:
+            return None
+        return [event for event in self._events if event["id"] > last_id]
+
+    def wait(self, last_id, timeout):
+        """Yeni olay gelene ya da timeout dolana kadar bekle - olay listesi döner"""
+        deadline = time.time() + timeout
+        with self._condition:
+            while True:
+                events = self._events_after(last_id)
+                if events is None or events:
+                    return events
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return []
+                self._condition.wait(remaining)
+
+    def subscribe(self):
+        """Abone sayacını artır (izleyiciler aboneler varken çalışır)"""
+        with self._condition:
+            self._subscribers += 1
+            self._stats["connections"] += 1
+        self._ensure_watch_thread()
+        self._watch_wakeup.set()
+
+    def unsubscribe(self):
+        with self._condition:
+            self._subscribers = max(0, self._subscribers - 1)
+
+    # ------------------------------------------------------------------
+    # İzleyiciler
+    # ------------------------------------------------------------------
+    def watch(self, event_type, snapshot):
+        """snapshot() değeri değiştikçe event_type olayı yayınla (aboneler varken)"""
+        self._watchers[event_type] = snapshot
+
+    def poke(self):
+        """İzleyicileri hemen çalıştır (bu süreçte durum değişti)"""
+        self._watch_wakeup.set()
+
+    def check_watchers(self):
+        for event_type, snapshot in list(self._watchers.items()):
+            try:
+                self.publish(event_type, snapshot())
+            except Exception as e:
+                self._log(f"{event_type} izleyicisi hatası: {e}", "warning")
+        with self._condition:
+            self._stats["watch_checks"] += 1
+
+    def _ensure_watch_thread(self):
+        if self._watch_thread is not None and self._watch_thread.is_alive():
+            return
+        with self._condition:
+            if self._watch_thread is None or not self._watch_thread.is_alive():
+                self._watch_thread = threading.Thread(target=self._watch_loop, name="EventBusWatcher", daemon=True)
+                self._watch_thread.start()
+
+    def _watch_loop(self):
+        while True:
+            self._watch_wakeup.wait(self.watch_interval)
+            self._watch_wakeup.clear()
+            with self._condition:
+                active = self._subscribers > 0
+            if active:
+                self.check_watchers()
+            else:
+                # Abone yokken poke gelene kadar uyu
+                self._watch_wakeup.wait()
+
+    def stats(self):
+        with self._condition:
+            return {
+                **self._stats,
+                "subscribers": self._subscribers,
+                "last_id": self._next_id - 1,
+                "buffered": len(self._events),
+                "watchers": list(self._watchers),
+            }
+
+
+_bus = None
+_bus_lock = threading.Lock()
+
+
+def get_event_bus():
+    """Süreç genelinde tek EventBus örneği"""
+    global _bus
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                _bus = EventBus()
+    return _bus
+
+
+def format_sse(event):
+    """Olayı text/event-stream satırlarına çevir"""
+    payload = json.dumps(event["data"], ensure_ascii=False, default=str)
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {payload}\n\n"
@@ -13,7 +13,7 @@ load_dotenv()
 try:
     from utils import (
         terminal_log, load_json, save_json, gemini_call, 
-        mcp_firecrawl_scrape
+        mcp_firecrawl_scrape, http_get, add_pending_tweet
     )
     HISTORY_FILE = "posted_articles.json"
     print("✅ GitHub modülü utils import başarılı")
@@ -50,6 +50,15 @@ except ImportError as e:
     def mcp_firecrawl_scrape(params):
         return {"success": False, "error": "MCP not available"}
     
+    http_get = requests.get
+    
+    def add_pending_tweet(new_tweet):
+        pending_tweets = load_json('pending_tweets.json', [])
+        new_tweet['id'] = max([t.get('id') for t in pending_tweets if isinstance(t.get('id'), int)] + [len(pending_tweets)]) + 1
+        pending_tweets.append(new_tweet)
+        save_json('pending_tweets.json', pending_tweets)
+        return True, new_tweet
+    
     HISTORY_FILE = "posted_articles.json"
 
 def load_github_settings():
@@ -183,7 +192,7 @@ def search_github_repos_by_topics(topics=None, language="python", time_period="w
             terminal_log("⚠️ GitHub token bulunamadı, rate limit düşük olacak", "warning")
         
         terminal_log(f"📡 GitHub API'ye istek gönderiliyor...", "info")
-        response = requests.get(base_url, params=params, headers=headers, timeout=30)
+        response = http_get(base_url, params=params, headers=headers, timeout=30)
         
         # Rate limit kontrolü
         if response.status_code == 403:
@@ -223,7 +232,7 @@ def search_github_repos_by_topics(topics=None, language="python", time_period="w
                 "per_page": min(limit, 100)
             }
             
-            simple_response = requests.get(base_url, params=simple_params, headers=headers, timeout=30)
+            simple_response = http_get(base_url, params=simple_params, headers=headers, timeout=30)
             if simple_response.status_code == 200:
                 simple_data = simple_response.json()
                 total_count = simple_data.get("total_count", 0)
@@ -300,7 +309,7 @@ def fetch_trending_github_repos_from_web(time_period="daily", limit=10):
         }
         
         terminal_log(f"📡 GitHub trending sayfasına istek gönderiliyor: {base_url}", "info")
-        response = requests.get(base_url, params=params, headers=headers, timeout=30)
+        response = http_get(base_url, params=params, headers=headers, timeout=30)
         response.raise_for_status()
         
         soup = BeautifulSoup(response.text, 'html.parser')
@@ -511,7 +520,7 @@ def fetch_trending_github_repos(language="python", time_period="daily", limit=10
         if github_token:
             headers["Authorization"] = f"token {github_token}"
         
-        response = requests.get(base_url, params=params, headers=headers, timeout=30)
+        response = http_get(base_url, params=params, headers=headers, timeout=30)
         response.raise_for_status()
         
         data = response.json()
@@ -598,7 +607,7 @@ def fetch_github_repo_details_fallback(repo_url):
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
         }
         
-        response = requests.get(repo_url, headers=headers, timeout=30)
+        response = http_get(repo_url, headers=headers, timeout=30)
         response.raise_for_status()
         
         soup = BeautifulSoup(response.text, 'html.parser')
@@ -843,11 +852,8 @@ def fetch_github_articles_for_tweets():
                 tweet_result = generate_github_tweet(repo, api_key)
                 
                 if tweet_result.get("success"):
-                    # Benzersiz ID oluştur
-                    tweet_id = len(pending_tweets) + len(new_tweets) + 1
-                    
+                    # ID eklenirken atanır (add_pending_tweet)
                     tweet_data = {
-                        "id": tweet_id,
                         "title": f"GitHub: {repo['name']}",
                         "content": tweet_result["tweet"],
                         "url": repo["url"],
@@ -873,9 +879,9 @@ def fetch_github_articles_for_tweets():
                 continue
         
         if new_tweets:
-            # Yeni tweet'leri pending listesine ekle
-            pending_tweets.extend(new_tweets)
-            save_json('pending_tweets.json', pending_tweets)
+            # Yeni tweet'leri pending listesine ekle (ID ataması ve ekleme tek kuyruk işleminde)
+            for tweet in new_tweets:
+                add_pending_tweet(tweet)
             
             terminal_log(f"📊 {len(new_tweets)} GitHub tweet'i pending listesine eklendi", "success")
             
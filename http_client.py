@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ortak HTTP İstemcisi
+Tüm dış istekler (scraper'lar, RSS, OpenRouter, Telegram, GitHub) tek bir
+requests.Session üzerinden yapılır: host başına bağlantı havuzu, keep-alive,
+backoff'lu retry, gzip/brotli ve varsayılan timeout. Havuzlardan toplanan
+sayaçlarla bağlantı yeniden kullanımı izlenebilir.
+
+Ayarlar (.env):
+    HTTP_MAX_RETRIES      - bağlantı/5xx/429 için retry sayısı (varsayılan 2)
+    HTTP_BACKOFF_FACTOR   - retry bekleme katsayısı (varsayılan 0.5)
+    HTTP_POOL_CONNECTIONS - host havuzu sayısı (varsayılan 32)
+    HTTP_POOL_MAXSIZE     - host başına açık bağlantı (varsayılan 16)
+    HTTP_DEFAULT_TIMEOUT  - timeout verilmeyen istekler için saniye (varsayılan 30)
+"""
+
+import os
+import time
+import threading
+from datetime import datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# brotli varsa urllib3 'br' yanıtlarını otomatik açar
+try:
+    import brotli  # type: ignore  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # type: ignore  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+# İndirilen byte'lar aktif çalışma izine (run_tracer) yazılır
+try:
+    from run_tracer import record as trace_record
+except ImportError:
+    def trace_record(**counters):
+        pass
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+DEFAULT_USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                      '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+
+def _env_number(name, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class _TimeoutSession(requests.Session):
+    """timeout verilmeyen isteklere varsayılan timeout uygular"""
+
+    def __init__(self, default_timeout):
+        super().__init__()
+        self.default_timeout = default_timeout
+
+    def request(self, method, url, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.default_timeout
+        return super().request(method, url, **kwargs)
+
+
+class HttpClient:
+    def __init__(self, max_retries=None, backoff_factor=None, pool_connections=None,
+                 pool_maxsize=None, default_timeout=None):
+        self.max_retries = max_retries if max_retries is not None else _env_number('HTTP_MAX_RETRIES', 2)
+        self.backoff_factor = backoff_factor if backoff_factor is not None else _env_number('HTTP_BACKOFF_FACTOR', 0.5, float)
+        self.pool_connections = pool_connections or _env_number('HTTP_POOL_CONNECTIONS', 32)
+        self.pool_maxsize = pool_maxsize or _env_number('HTTP_POOL_MAXSIZE', 16)
+        self.default_timeout = default_timeout or _env_number('HTTP_DEFAULT_TIMEOUT', 30, float)
+
+        self._lock = threading.Lock()
+        self._counters = {"requests": 0, "errors": 0, "retried_requests": 0, "by_method": {}}
+        self._created_at = datetime.now().isoformat()
+        self.session = self._build_session()
+
+    def _build_session(self):
+        retry = Retry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=self.max_retries,
+            status=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "HEAD", "OPTIONS"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize,
+                              max_retries=retry)
+        session = _TimeoutSession(self.default_timeout)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            'User-Agent': DEFAULT_USER_AGENT,
+            'Accept-Encoding': 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate',
+            'Connection': 'keep-alive',
+        })
+        return session
+
+    # ------------------------------------------------------------------
+    # İstekler
+    # ------------------------------------------------------------------
+    def request(self, method, url, **kwargs):
+        """Ortak oturum üzerinden istek - sayaçlar güncellenir"""
+        method = method.upper()
+        with self._lock:
+            self._counters["requests"] += 1
+            self._counters["by_method"][method] = self._counters["by_method"].get(method, 0) + 1
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except Exception:
+            with self._lock:
+                self._counters["errors"] += 1
+            raise
+        if not kwargs.get('stream'):
+            trace_record(bytes=len(response.content or b""), http_requests=1)
+        history = getattr(getattr(response, 'raw', None), 'retries', None)
+        if history is not None and history.history:
+            with self._lock:
+                self._counters["retried_requests"] += 1
+        return response
+
+    def get(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', True)
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', False)
+        return self.request("HEAD", url, **kwargs)
+
+    # ------------------------------------------------------------------
+    # İstatistik
+    # ------------------------------------------------------------------
+    def stats(self):
+        """İstek, açılan bağlantı ve yeniden kullanım sayaçları (host bazında)"""
+        hosts = {}
+        total_connections = 0
+        total_pool_requests = 0
+        for adapter in set(self.session.adapters.values()):
+            pools = getattr(adapter.poolmanager, 'pools', None)
+            if pools is None:
+                continue
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                connections = getattr(pool, 'num_connections', 0)
+                pool_requests = getattr(pool, 'num_requests', 0)
+                total_connections += connections
+                total_pool_requests += pool_requests
+                hosts[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                    "connections_opened": connections,
+                    "requests": pool_requests,
+                    "reused": max(0, pool_requests - connections),
+                }
+
+        with self._lock:
+            counters = dict(self._counters, by_method=dict(self._counters["by_method"]))
+        reused = max(0, total_pool_requests - total_connections)
+        return {
+            **counters,
+            "connections_opened": total_connections,
+            "pool_requests": total_pool_requests,
+            "connections_reused": reused,
+            "reuse_ratio": round(reused / total_pool_requests, 3) if total_pool_requests else 0.0,
+            "hosts": hosts,
+            "brotli": BROTLI_AVAILABLE,
+            "max_retries": self.max_retries,
+            "pool_maxsize": self.pool_maxsize,
+            "since": self._created_at,
+        }
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_http_client():
+    """Süreç genelinde tek HttpClient örneği"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient()
+    return _client
+
+
+if __name__ == "__main__":
+    # Hızlı kontrol: python http_client.py https://example.com
+    import sys
+    client = get_http_client()
+    target = sys.argv[1] if len(sys.argv) > 1 else "https://example.com"
+    for _ in range(3):
+        start = time.time()
+        r = client.get(target, timeout=10)
+        print(f"{r.status_code} {time.time() - start:.3f}s")
+    print(client.stats())
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Olay Güdümlü İş Zamanlayıcı
+app.py arka plan thread'i, start_scheduler.py ve auto_rate_limit_reset.py için
+ortak zamanlayıcı. 5 dakikada bir uyanıp ayarları okumak yerine bir sonraki
+işin zamanına kadar uyur; ayarlar kaydedildiğinde (notify_settings_changed)
+hemen uyanıp zamanları yeniden hesaplar.
+
+Son/sonraki çalışma zamanları articles.db içindeki scheduled_jobs tablosunda
+saklanır; yeniden başlatmada "son kontrol" bilgisi kaybolmaz. Her iş
+scheduler_<iş>.lock dosyası üzerinde kilit alarak çalışır; Flask thread'i ile
+ayrı start_scheduler.py süreci aynı işi aynı anda çalıştıramaz.
+
+Ayarlar (.env):
+    SCHEDULER_MAX_SLEEP  - en uzun uyku (başka süreçlerin ayar değişikliklerini
+                           yakalamak için güvenlik sınırı, varsayılan 600 sn)
+    SCHEDULER_LOCK_DIR   - kilit dosyalarının klasörü (varsayılan çalışma dizini)
+"""
+
+import os
+import time
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+from article_store import ARTICLE_STORE_DB
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+try:
+    import msvcrt  # type: ignore
+    MSVCRT_AVAILABLE = True
+except ImportError:
+    MSVCRT_AVAILABLE = False
+
+JOB_SCHEDULER_DB = os.environ.get('JOB_SCHEDULER_DB', ARTICLE_STORE_DB)
+
+# Kilit başka süreçteyken tekrar deneme aralığı
+LOCK_RETRY_SECONDS = 60
+
+
+def _env_number(name, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class FileLock:
+    """Süreçler arası özel kilit (Unix: flock, Windows: msvcrt)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._fd = None
+
+    def _try_acquire(self):
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            elif MSVCRT_AVAILABLE:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()}\n".encode())
+        self._fd = fd
+        return True
+
+    def acquire(self, timeout=0):
+        """Kilidi almayı dene - timeout saniye boyunca tekrar dener, alınamazsa False"""
+        deadline = time.time() + timeout
+        while not self._try_acquire():
+            if time.time() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def __enter__(self):
+        if not self.acquire(timeout=30):
+            raise TimeoutError(f"Kilit alınamadı: {self.path}")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            elif MSVCRT_AVAILABLE:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+
+class ScheduledJob:
+    """Zamanlanmış iş tanımı.
+
+    interval: saniye veya settings -> saniye fonksiyonu
+    daily_at: "HH:MM" - her gün bu saatte (interval yerine)
+    enabled:  settings -> bool (kapalı işler planlanmaz)
+    """
+
+    def __init__(self, job_id, func, interval=None, daily_at=None, enabled=None, label=None):
+        if interval is None and daily_at is None:
+            raise ValueError("interval veya daily_at gerekli")
+        self.job_id = job_id
+        self.func = func
+        self.interval = interval
+        self.daily_at = daily_at
+        self.enabled = enabled
+        self.label = label or job_id
+
+    def is_enabled(self, settings):
+        return self.enabled is None or bool(self.enabled(settings))
+
+    def interval_seconds(self, settings):
+        value = self.interval(settings) if callable(self.interval) else self.interval
+        return max(60.0, float(value))
+
+    def next_run_after(self, last_run, settings, now):
+        """Son çalışmaya göre sonraki zaman (hiç çalışmadıysa hemen)"""
+        if self.daily_at:
+            hour, minute = (int(part) for part in self.daily_at.split(":"))
+            reference = max(last_run or 0, now)
+            target = datetime.fromtimestamp(reference).replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if target.timestamp() <= reference:
+                target += timedelta(days=1)
+            return target.timestamp()
+        if not last_run:
+            return now
+        return max(now, last_run + self.interval_seconds(settings))
+
+
+class JobScheduler:
+    def __init__(self, db_path=None, settings_loader=None, settings_path="automation_settings.json"):
+        self.db_path = db_path or JOB_SCHEDULER_DB
+        self.settings_loader = settings_loader or (lambda: {})
+        self.settings_path = settings_path
+        self.max_sleep = _env_number('SCHEDULER_MAX_SLEEP', 600, float)
+        self.lock_dir = os.environ.get('SCHEDULER_LOCK_DIR', '.')
+        self.jobs = {}
+        self._local = threading.local()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._running_jobs = set()
+        self._state_lock = threading.Lock()
+        self._settings_mtime = None
+        self._thread = None
+        self._init_db()
+
+    def _log(self, message, level="info"):
+        """Zamanlayıcı logları"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        prefix = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"}.get(level, "ℹ️")
+        print(f"{prefix} [{timestamp}] [JobScheduler] {message}")
+
+    def _get_connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA busy_timeout = 30000")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        conn = self._get_connection()
+        with conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS scheduled_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    last_run REAL,
+                    next_run REAL,
+                    last_status TEXT,
+                    last_message TEXT,
+                    last_duration REAL,
+                    run_count INTEGER DEFAULT 0,
+                    last_host TEXT
+                )
+            ''')
+
+    # ------------------------------------------------------------------
+    # İş kayıtları
+    # ------------------------------------------------------------------
+    def register(self, job):
+        """İşi ekle (aynı id ile tekrar kayıt tanımı günceller)"""
+        self.jobs[job.job_id] = job
+        self.reschedule()
+        return job
+
+    def _row(self, job_id):
+        row = self._get_connection().execute(
+            "SELECT last_run, next_run, last_status, last_message, last_duration, run_count "
+            "FROM scheduled_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        keys = ("last_run", "next_run", "last_status", "last_message", "last_duration", "run_count")
+        return dict(zip(keys, row))
+
+    def _load_settings(self):
+        try:
+            return self.settings_loader() or {}
+        except Exception as e:
+            self._log(f"Ayarlar okunamadı: {e}", "warning")
+            return {}
+
+    def reschedule(self):
+        """Ayarlara göre tüm işlerin sonraki çalışma zamanını yeniden hesapla.
+
+        Zamanı geçmiş (kesinti ya da ayar kaydı sırasında kaçırılmış) çalışma
+        korunur; döngü onu ilk fırsatta çalıştırır."""
+        settings = self._load_settings()
+        now = time.time()
+        conn = self._get_connection()
+        with conn:
+            for job in self.jobs.values():
+                row = self._row(job.job_id) or {}
+                next_run = job.next_run_after(row.get("last_run"), settings, now) if job.is_enabled(settings) else None
+                # Zamanı gelmiş ama henüz çalışmamış iş ertelenmez (daily_at ertesi güne kaymasın)
+                if next_run is not None and row.get("next_run") is not None and row["next_run"] <= now:
+                    next_run = min(next_run, row["next_run"])
+                conn.execute(
+                    "INSERT INTO scheduled_jobs (job_id, next_run) VALUES (?, ?) "
+                    "ON CONFLICT(job_id) DO UPDATE SET next_run = excluded.next_run",
+                    (job.job_id, next_run))
+        self._settings_mtime = self._current_settings_mtime()
+
+    def notify_settings_changed(self):
+        """Ayarlar kaydedildi - zamanları yeniden hesapla ve uyuyan döngüyü uyandır"""
+        if not self.jobs:
+            return
+        self.reschedule()
+        self._wake.set()
+
+    def _current_settings_mtime(self):
+        try:
+            return os.path.getmtime(self.settings_path)
+        except OSError:
+            return None
+
+    # ------------------------------------------------------------------
+    # Çalıştırma
+    # ------------------------------------------------------------------
+    def run_now(self, job_id, force=True):
+        """İşi çağıran thread'de çalıştır.
+
+        Dönüş: {"ran": bool, "result": ..., "reason": ...}
+        force=False ise iş henüz zamanı gelmemişse (başka süreç çalıştırdıysa) atlanır.
+        """
+        job = self.jobs.get(job_id)
+        if job is None:
+            return {"ran": False, "reason": "unknown_job"}
+
+        lock = FileLock(os.path.join(self.lock_dir, f"scheduler_{job_id}.lock"))
+        if not lock.acquire():
+            return {"ran": False, "reason": "locked"}
+        try:
+            row = self._row(job_id) or {}
+            if not force and row.get("next_run") and row["next_run"] > time.time():
+                # Kilidi beklerken başka bir süreç işi çalıştırmış
+                return {"ran": False, "reason": "not_due"}
+
+            with self._state_lock:
+                self._running_jobs.add(job_id)
+            started = time.time()
+            status, message, result = "ok", "", None
+            try:
+                result = job.func()
+                if isinstance(result, dict):
+                    message = str(result.get("message", ""))[:300]
+                    if result.get("success") is False:
+                        status = "failed"
+            except Exception as e:
+                status, message = "error", str(e)[:300]
+                self._log(f"{job.label} hatası: {e}", "error")
+            finally:
+                with self._state_lock:
+                    self._running_jobs.discard(job_id)
+
+            settings = self._load_settings()
+            finished = time.time()
+            next_run = job.next_run_after(started, settings, finished) if job.is_enabled(settings) else None
+            conn = self._get_connection()
+            with conn:
+                conn.execute(
+                    "INSERT INTO scheduled_jobs (job_id, last_run, next_run, last_status, last_message, last_duration, run_count, last_host) "
+                    "VALUES (?, ?, ?, ?, ?, ?, 1, ?) "
+                    "ON CONFLICT(job_id) DO UPDATE SET last_run = excluded.last_run, next_run = excluded.next_run, "
+                    "last_status = excluded.last_status, last_message = excluded.last_message, "
+                    "last_duration = excluded.last_duration, run_count = run_count + 1, last_host = excluded.last_host",
+                    (job_id, started, next_run, status, message, round(finished - started, 3), f"pid:{os.getpid()}"))
+            return {"ran": True, "status": status, "message": message, "result": result}
+        finally:
+            lock.release()
+
+    def _run_due_jobs(self):
+        """Zamanı gelen işleri çalıştır, bir sonraki uyanma zamanını döndür"""
+        now = time.time()
+        next_wake = now + self.max_sleep
+        for job_id in list(self.jobs):
+            row = self._row(job_id) or {}
+            next_run = row.get("next_run")
+            if next_run is None:
+                continue
+            if next_run <= now:
+                self._log(f"⏰ {self.jobs[job_id].label} zamanı geldi", "info")
+                outcome = self.run_now(job_id, force=False)
+                if outcome.get("reason") == "locked":
+                    self._log(f"🔒 {self.jobs[job_id].label} başka bir süreçte çalışıyor, "
+                              f"{LOCK_RETRY_SECONDS} sn sonra tekrar denenecek", "info")
+                    next_wake = min(next_wake, time.time() + LOCK_RETRY_SECONDS)
+                    continue
+                next_run = (self._row(job_id) or {}).get("next_run")
+                if next_run is None:
+                    continue
+            next_wake = min(next_wake, next_run)
+        return next_wake
+
+    def run_forever(self):
+        """Bloklayan döngü: sonraki işe kadar uyu, ayar değişikliğinde uyan"""
+        self._log(f"🚀 Zamanlayıcı başladı: {', '.join(job.label for job in self.jobs.values())}", "success")
+        self.reschedule()
+        while not self._stop.is_set():
+            try:
+                # Başka bir süreç ayar dosyasını değiştirdiyse yeniden planla
+                if self._current_settings_mtime() != self._settings_mtime:
+                    self.reschedule()
+                next_wake = self._run_due_jobs()
+                sleep_for = max(1.0, next_wake - time.time())
+                self._log(f"💤 Sonraki uyanma: {datetime.fromtimestamp(time.time() + sleep_for).strftime('%H:%M:%S')} "
+                          f"({sleep_for / 60:.1f} dk)", "info")
+            except Exception as e:
+                self._log(f"Zamanlayıcı döngü hatası: {e}", "error")
+                sleep_for = LOCK_RETRY_SECONDS
+            self._wake.wait(sleep_for)
+            self._wake.clear()
+        self._log("🛑 Zamanlayıcı durdu", "info")
+
+    def start(self):
+        """Döngüyü daemon thread'de başlat"""
+        if self._thread is not None and self._thread.is_alive():
+            return self._thread
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="JobScheduler", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    # ------------------------------------------------------------------
+    # Durum
+    # ------------------------------------------------------------------
+    def status(self):
+        """İş bazında son/sonraki çalışma bilgileri"""
+        def iso(ts):
+            return datetime.fromtimestamp(ts).isoformat() if ts else None
+
+        now = time.time()
+        jobs = {}
+        with self._state_lock:
+            running = set(self._running_jobs)
+        for job_id, job in self.jobs.items():
+            row = self._row(job_id) or {}
+            next_run = row.get("next_run")
+            jobs[job_id] = {
+                "label": job.label,
+                "last_run": iso(row.get("last_run")),
+                "next_run": iso(next_run),
+                "seconds_until_next": round(next_run - now, 1) if next_run else None,
+                "last_status": row.get("last_status"),
+                "last_message": row.get("last_message"),
+                "last_duration": row.get("last_duration"),
+                "run_count": row.get("run_count") or 0,
+                "running": job_id in running,
+            }
+        return {"thread_alive": self.is_running(), "jobs": jobs}
+
+    def last_run_time(self, job_id):
+        """İşin son çalışma zamanı (datetime veya None)"""
+        row = self._row(job_id) or {}
+        return datetime.fromtimestamp(row["last_run"]) if row.get("last_run") else None
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_job_scheduler(settings_loader=None):
+    """Süreç genelinde tek JobScheduler örneği"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = JobScheduler(settings_loader=settings_loader)
+    elif settings_loader is not None:
+        _scheduler.settings_loader = settings_loader
+    return _scheduler
+
+
+def notify_settings_changed():
+    """Ayar kaydedildiğinde çağrılır; zamanlayıcı henüz oluşturulmadıysa bir şey yapmaz"""
+    if _scheduler is not None:
+        _scheduler.notify_settings_changed()
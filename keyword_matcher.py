@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Çoklu Anahtar Kelime Eşleştirici
+generate_smart_hashtags, generate_comprehensive_analysis ve haber filtreleri
+her çağrıda onlarca `any(keyword in text ...)` alt dize taraması yapıyordu;
+üstelik "ar" "are" içinde, "ml" "html" içinde, "meta" "metadata" içinde,
+"art" "artificial" içinde eşleşiyordu.
+
+KeywordMatcher kategori -> anahtar kelime tablolarını bir kez trie'ye derler
+ve trie'yi tek bir düzenli ifadeye çevirir. Metin tek geçişte taranır; her
+konumda sadece trie'de devam eden dallar denenir (Aho-Corasick'in durum
+geçişleriyle aynı iş, ama döngü Python yerine C'deki regex motorunda döner -
+saf Python bir otomat karakter başına yorumlayıcı maliyeti öder ve kısa
+metinlerde `in` taramalarından bile yavaş kalır).
+
+    - Eşleşmeler kelime sınırlarına oturur; İngilizce çoğul/iyelik ekleri
+      ('s, s, es) aynı anahtar kelime sayılır
+    - Çok kelimeli anahtarlarda boşluk, tire ve alt çizgi eşdeğerdir
+      ("machine learning" = "machine-learning"); URL'lerde de çalışır
+    - Eşleşmeler çakışabilir: "quantum computing" bulunduğunda "quantum"
+      kategorisi de raporlanır
+"""
+
+import re
+import threading
+
+# Anahtar kelimenin sonuna gelebilecek ekler (uzundan kısaya)
+_SUFFIXES = ("'s", "es", "s")
+
+
+def normalize_keyword(keyword):
+    """Küçük harf, tek boşluk"""
+    return " ".join(str(keyword).lower().split())
+
+
+def _alias(text):
+    """Boşluk/tire/alt çizgi farkı gözetmeyen karşılaştırma anahtarı"""
+    return " ".join(re.split(r"[\s_-]+", text.lower()))
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == "_"
+
+
+def _trie_pattern(node):
+    """Trie düğümünü regex parçasına çevir - uzun devam önce denenir"""
+    branches = []
+    for char in sorted(key for key in node if key):
+        piece = r"[\s_-]+" if char == " " else re.escape(char)
+        branches.append(piece + _trie_pattern(node[char]))
+    if not branches:
+        return ""
+    if len(branches) == 1 and "" not in node:
+        return branches[0]
+    group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if "" in node else group
+
+
+class KeywordMatcher:
+    """{kategori: [anahtar kelimeler]} tablosundan derlenen tek geçişli eşleştirici"""
+
+    def __init__(self, categories):
+        # Trie ve aramalar ayırıcıdan bağımsız biçim (alias) üzerinden yapılır;
+        # sonuçlarda anahtarın tablodaki ilk yazımı döner
+        self._categories = {}
+        self._keywords = {}
+        self._category_order = list(categories)
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                normalized = normalize_keyword(keyword)
+                alias = _alias(normalized).strip()
+                if not alias:
+                    continue
+                self._keywords.setdefault(alias, normalized)
+                if category not in self._categories.setdefault(alias, []):
+                    self._categories[alias].append(category)
+
+        trie = {}
+        for alias in self._categories:
+            node = trie
+            for char in alias:
+                node = node.setdefault(char, {})
+            node[""] = True
+
+        # Aynı konumda başlayan kısa anahtarlar (regex en uzunu yakalar)
+        self._prefixes = {}
+        for alias in self._categories:
+            self._prefixes[alias] = [
+                alias[:i] for i in range(1, len(alias))
+                if alias[:i] in self._categories and not _is_word_char(alias[i])
+            ]
+
+        # Metin önceden küçük harfe çevrilir (IGNORECASE her karşılaştırmada katlama yapar)
+        self._pattern = None
+        if trie:
+            self._pattern = re.compile(r"\b(?=(" + _trie_pattern(trie) + r"(?:'s|es|s)?)(?!\w))")
+
+    def __len__(self):
+        return len(self._categories)
+
+    def _canonical(self, matched):
+        if matched in self._categories:
+            return matched
+        alias = _alias(matched)
+        if alias in self._categories:
+            return alias
+        for suffix in _SUFFIXES:
+            if alias.endswith(suffix) and alias[:-len(suffix)] in self._categories:
+                return alias[:-len(suffix)]
+        return None
+
+    def _iter_aliases(self, text):
+        if self._pattern is None or not text:
+            return
+        for match in self._pattern.finditer(text.lower()):
+            alias = self._canonical(match.group(1))
+            if alias is None:
+                continue
+            yield alias
+            yield from self._prefixes[alias]
+
+    def find(self, text):
+        """Metindeki anahtar kelimeler -> geçiş sayısı (ilk görülme sırasıyla)"""
+        counts = {}
+        for alias in self._iter_aliases(text):
+            keyword = self._keywords[alias]
+            counts[keyword] = counts.get(keyword, 0) + 1
+        return counts
+
+    def categories(self, text):
+        """Eşleşen kategoriler -> bulunan anahtar kelimeler (ilk görülme sırasıyla)"""
+        hits = {}
+        seen = set()
+        for alias in self._iter_aliases(text):
+            if alias in seen:
+                continue
+            seen.add(alias)
+            for category in self._categories[alias]:
+                hits.setdefault(category, []).append(self._keywords[alias])
+        return hits
+
+    def first_category(self, text):
+        """Tablo sırasına göre ilk eşleşen kategori (yoksa None)"""
+        hits = self.categories(text)
+        return next((category for category in self._category_order if category in hits), None)
+
+    def matches(self, text, category=None):
+        """En az bir eşleşme var mı - ilk uygun eşleşmede durur"""
+        for alias in self._iter_aliases(text):
+            if category is None or category in self._categories[alias]:
+                return True
+        return False
+
+
+_matchers = {}
+_matchers_lock = threading.Lock()
+
+
+def get_keyword_matcher(name, categories):
+    """Ada göre önbelleklenmiş eşleştirici - tablo değişirse yeniden derlenir"""
+    fingerprint = tuple((category, tuple(keywords)) for category, keywords in categories.items())
+    cached = _matchers.get(name)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    with _matchers_lock:
+        cached = _matchers.get(name)
+        if cached is None or cached[0] != fingerprint:
+            cached = (fingerprint, KeywordMatcher(categories))
+            _matchers[name] = cached
+    return cached[1]
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LLM Yanıt Önbelleği
+OpenRouter yanıtlarını (model, prompt hash, max_tokens, temperature) anahtarıyla
+diskte saklar. Aynı makale retry_rejected_article, convert_rejected_to_tweet,
+/test_tweet_generation veya ikinci bir zamanlayıcı çalışmasıyla tekrar işlendiğinde
+ücretsiz modelin rate limit'i harcanmaz.
+
+Sadece çağıranın doğruladığı yanıtlar saklanır (utils.openrouter_call validate);
+sonradan geçersiz sayılan kayıt invalidate ile silinir. Kayıtlar TTL sonunda geçersiz olur; kayıt sayısı veya toplam boyut sınırı aşılınca
+en uzun süredir kullanılmayan (LRU) kayıtlar silinir.
+
+Ayarlar (.env):
+    LLM_CACHE_ENABLED      - "false" ile tamamen kapatılır (varsayılan true)
+    LLM_CACHE_DB           - veritabanı dosyası (varsayılan llm_cache.db)
+    LLM_CACHE_TTL_HOURS    - kayıt ömrü (varsayılan 72)
+    LLM_CACHE_MAX_ENTRIES  - en fazla kayıt (varsayılan 2000)
+    LLM_CACHE_MAX_MB       - en fazla toplam yanıt boyutu (varsayılan 20)
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from datetime import datetime
+
+LLM_CACHE_DB = os.environ.get('LLM_CACHE_DB', 'llm_cache.db')
+
+
+def _env_number(name, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def is_llm_cache_enabled():
+    """LLM_CACHE_ENABLED=false ile önbellek devre dışı bırakılabilir"""
+    return os.getenv('LLM_CACHE_ENABLED', 'true').strip().lower() not in ('0', 'false', 'no', 'off')
+
+
+def make_cache_key(model, prompt, max_tokens, temperature):
+    """İçerik adresli anahtar: model + prompt hash + max_tokens + temperature"""
+    prompt_hash = hashlib.sha256((prompt or "").encode('utf-8', 'ignore')).hexdigest()
+    raw = f"{model}\x00{prompt_hash}\x00{int(max_tokens)}\x00{float(temperature):.3f}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class LLMCache:
+    def __init__(self, db_path=None, ttl_hours=None, max_entries=None, max_mb=None):
+        self.db_path = db_path or LLM_CACHE_DB
+        self.ttl_seconds = (ttl_hours if ttl_hours is not None else _env_number('LLM_CACHE_TTL_HOURS', 72, float)) * 3600
+        self.max_entries = max_entries or _env_number('LLM_CACHE_MAX_ENTRIES', 2000)
+        self.max_bytes = int((max_mb or _env_number('LLM_CACHE_MAX_MB', 20, float)) * 1024 * 1024)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "stores": 0, "expired": 0, "evicted": 0, "bypassed": 0,
+                          "rejected": 0}
+        self._init_db()
+
+    def _log(self, message, level="info"):
+        """Önbellek logları"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        prefix = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"}.get(level, "ℹ️")
+        print(f"{prefix} [{timestamp}] [LLMCache] {message}")
+
+    def _get_connection(self):
+        """Thread başına bir bağlantı"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA busy_timeout = 30000")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        conn = self._get_connection()
+        with conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    model TEXT,
+                    max_tokens INTEGER,
+                    temperature REAL,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    hit_count INTEGER DEFAULT 0
+                )
+            ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache(last_access)")
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._counters[name] += amount
+
+    # ------------------------------------------------------------------
+    # Okuma / yazma
+    # ------------------------------------------------------------------
+    def get(self, model, prompt, max_tokens, temperature):
+        """Geçerli kayıt varsa yanıtı döndür, yoksa None"""
+        key = make_cache_key(model, prompt, max_tokens, temperature)
+        try:
+            conn = self._get_connection()
+            row = conn.execute("SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._count("misses")
+                return None
+            response, created_at = row
+            now = time.time()
+            if now - created_at > self.ttl_seconds:
+                with conn:
+                    conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._count("expired")
+                self._count("misses")
+                return None
+            with conn:
+                conn.execute("UPDATE llm_cache SET last_access = ?, hit_count = hit_count + 1 WHERE key = ?", (now, key))
+            self._count("hits")
+            return response
+        except Exception as e:
+            self._log(f"Önbellek okuma hatası: {e}", "warning")
+            self._count("misses")
+            return None
+
+    def put(self, model, prompt, max_tokens, temperature, response):
+        """Başarılı yanıtı sakla ve sınırları uygula"""
+        if not response:
+            return
+        key = make_cache_key(model, prompt, max_tokens, temperature)
+        now = time.time()
+        try:
+            conn = self._get_connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, model, max_tokens, temperature, response, size, created_at, last_access, hit_count) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                    (key, model, int(max_tokens), float(temperature), response,
+                     len(response.encode('utf-8', 'ignore')), now, now)
+                )
+            self._count("stores")
+            self._evict(conn)
+        except Exception as e:
+            self._log(f"Önbellek yazma hatası: {e}", "warning")
+
+    def invalidate(self, model, prompt, max_tokens, temperature):
+        """Çağıranın reddettiği kaydı sil (ör. ayrıştırılamayan yanıt) - sonraki çağrı taze yanıt alır"""
+        key = make_cache_key(model, prompt, max_tokens, temperature)
+        try:
+            conn = self._get_connection()
+            with conn:
+                removed = conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,)).rowcount
+            if removed:
+                self._count("rejected")
+            return removed
+        except Exception as e:
+            self._log(f"Önbellek silme hatası: {e}", "warning")
+            return 0
+
+    def _evict(self, conn):
+        """Süresi dolanları sil, sınır aşıldıysa LRU sırasıyla kayıt at"""
+        with conn:
+            expired = conn.execute("DELETE FROM llm_cache WHERE created_at < ?",
+                                   (time.time() - self.ttl_seconds,)).rowcount
+            count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache").fetchone()
+            evicted = 0
+            if count > self.max_entries or total > self.max_bytes:
+                rows = conn.execute("SELECT key, size FROM llm_cache ORDER BY last_access ASC").fetchall()
+                doomed = []
+                for key, size in rows:
+                    if count <= self.max_entries and total <= self.max_bytes:
+                        break
+                    doomed.append((key,))
+                    count -= 1
+                    total -= size
+                conn.executemany("DELETE FROM llm_cache WHERE key = ?", doomed)
+                evicted = len(doomed)
+        if expired:
+            self._count("expired", expired)
+        if evicted:
+            self._count("evicted", evicted)
+
+    def note_bypass(self):
+        """Önbelleği atlayan (taze yanıt isteyen) çağrıyı say"""
+        self._count("bypassed")
+
+    def clear(self):
+        """Tüm kayıtları sil"""
+        conn = self._get_connection()
+        with conn:
+            removed = conn.execute("DELETE FROM llm_cache").rowcount
+        self._log(f"Önbellek temizlendi: {removed} kayıt", "success")
+        return removed
+
+    def stats(self):
+        """Hit/miss sayaçları ve disk kullanımı"""
+        with self._lock:
+            counters = dict(self._counters)
+        lookups = counters["hits"] + counters["misses"]
+        try:
+            count, total = self._get_connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache").fetchone()
+        except Exception:
+            count, total = 0, 0
+        return {
+            **counters,
+            "hit_ratio": round(counters["hits"] / lookups, 3) if lookups else 0.0,
+            "entries": count,
+            "size_bytes": total,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_hours": round(self.ttl_seconds / 3600, 1),
+        }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache():
+    """Süreç genelinde tek LLMCache örneği"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMCache()
+    return _cache
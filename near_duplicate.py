@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MinHash / LSH Yakın Duplikat İndeksi
+filter_duplicate_articles için her makalenin karşılaştırma özelliklerini
+(normalize başlık, içerik özellikleri, kısa içerik metni) bir kez hesaplar,
+MinHash imzalarını LSH kovalarına yerleştirir ve yeni bir makaleyi sadece
+aynı kovaya düşen adaylarla karşılaştırır.
+
+Nihai karar check_content_similarity ile birebir aynı kurallarla verilir;
+LSH sadece aday kümesini daraltır. İmzalar articles.db içinde saklanır;
+FEATURE_VERSION'dan farklı sürümle kaydedilmiş satırlar yüklenirken silinir ve
+tablo en fazla NEAR_DUPLICATE_MAX_DOCS belgeyle sınırlanır (en eskiler düşer).
+"""
+
+import os
+import json
+import time
+import zlib
+import random
+import sqlite3
+import hashlib
+import threading
+from array import array
+from difflib import SequenceMatcher
+
+from article_store import ARTICLE_STORE_DB
+
+NEAR_DUPLICATE_DB = os.environ.get('NEAR_DUPLICATE_DB', ARTICLE_STORE_DB)
+
+# normalize_title_for_comparison / extract_key_content_features değiştiğinde artırın;
+# eski sürümle kaydedilmiş özellikler yeni makalelerle karşılaştırılmaz
+FEATURE_VERSION = "3"
+
+try:
+    MAX_DOCS = max(100, int(os.environ.get('NEAR_DUPLICATE_MAX_DOCS', 20000)))
+except ValueError:
+    MAX_DOCS = 20000
+
+# 16 bant x 2 satır: Jaccard 0.5 için yakalama olasılığı ~%99, 0.75 için ~%100
+LSH_BANDS = 16
+LSH_ROWS = 2
+NUM_PERM = LSH_BANDS * LSH_ROWS
+SHINGLE_SIZE = 3
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1337)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERM)]
+
+# İmza türleri: başlık 3-gram, içerik özellikleri, kısa içerik 3-gram
+SIGNATURE_KINDS = ("title", "features", "content")
+
+
+def _shingles(text, size=SHINGLE_SIZE):
+    """Karakter n-gram kümesi"""
+    if not text:
+        return set()
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def minhash_signature(tokens):
+    """Token kümesinden MinHash imzası (süreçler arası kararlı crc32 ile)"""
+    if not tokens:
+        return None
+    hashes = [zlib.crc32(token.encode('utf-8')) for token in tokens]
+    return array('Q', [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS])
+
+
+def _band_keys(kind, signature):
+    """İmzayı LSH kova anahtarlarına böl"""
+    if signature is None:
+        return []
+    keys = []
+    for band in range(LSH_BANDS):
+        start = band * LSH_ROWS
+        keys.append((kind, band) + tuple(signature[start:start + LSH_ROWS]))
+    return keys
+
+
+def article_doc_key(article):
+    """Başlık + içerik parmak izi - özellikler bu ikisine bağlıdır"""
+    title = article.get('title', '') or ''
+    content = article.get('content', '') or ''
+    return hashlib.md5(f"{title}\x00{content}".encode('utf-8', 'ignore')).hexdigest()
+
+
+class _Doc:
+    """Bir makalenin önceden hesaplanmış karşılaştırma özellikleri"""
+    __slots__ = ("key", "title_cmp", "features", "content_cmp", "content_short", "signatures")
+
+    def __init__(self, key, title_cmp, features, content_cmp, content_short, signatures):
+        self.key = key
+        self.title_cmp = title_cmp
+        self.features = features
+        self.content_cmp = content_cmp
+        self.content_short = content_short
+        self.signatures = signatures
+
+
+def build_doc(article, key=None):
+    """Makale için özellikleri bir kez hesapla (check_content_similarity ile aynı normalizasyon)"""
+    from utils import normalize_title_for_comparison, extract_key_content_features
+
+    title = article.get('title', '') or ''
+    content = article.get('content', '') or ''
+    title_cmp = normalize_title_for_comparison(title).lower().strip()
+    features = frozenset(extract_key_content_features(content))
+    content_short = len(content) < 1000
+    content_cmp = ""
+    if content_short:
+        # Sadece boşluktan oluşan içerik, calculate_text_similarity'de olduğu gibi boş metinden ayrı tutulur
+        content_cmp = content[:500].lower().strip() or (" " if content[:500] else "")
+
+    signatures = {
+        "title": minhash_signature(_shingles(title_cmp)),
+        "features": minhash_signature(features),
+        "content": minhash_signature(_shingles(content_cmp)) if content_short else None,
+    }
+    return _Doc(key or article_doc_key(article), title_cmp, features, content_cmp, content_short, signatures)
+
+
+def _ratio_at_least(text1, text2, threshold):
+    """calculate_text_similarity >= eşik mi? real_quick_ratio/quick_ratio üst sınır olarak önce denenir"""
+    if not text1 or not text2:
+        return False, 0.0
+    if len(text1) < 10 or len(text2) < 10:
+        similarity = 1.0 if text1 == text2 else 0.0
+        return similarity >= threshold, similarity
+    matcher = SequenceMatcher(None, text1, text2)
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return False, 0.0
+    similarity = matcher.ratio()
+    return similarity >= threshold, similarity
+
+
+def compare_docs(new_doc, existing_doc, title_threshold, content_threshold):
+    """check_content_similarity(new, existing) kararının önceden hesaplanmış özelliklerle aynısı"""
+    matched, similarity = _ratio_at_least(new_doc.title_cmp, existing_doc.title_cmp, title_threshold)
+    if matched:
+        return True, similarity, "title"
+
+    if new_doc.features and existing_doc.features:
+        union = len(new_doc.features | existing_doc.features)
+        feature_similarity = len(new_doc.features & existing_doc.features) / union if union > 0 else 0.0
+        if feature_similarity >= content_threshold:
+            return True, feature_similarity, "content_features"
+
+    if new_doc.content_short and existing_doc.content_short:
+        matched, similarity = _ratio_at_least(new_doc.content_cmp, existing_doc.content_cmp, content_threshold)
+        if matched:
+            return True, similarity, "content_text"
+
+    return False, 0.0, "no_match"
+
+
+class NearDuplicateIndex:
+    def __init__(self, db_path=None, persist=True):
+        self.db_path = db_path or NEAR_DUPLICATE_DB
+        self.persist = persist
+        self._docs = {}       # doc_key -> _Doc
+        self._buckets = {}    # band key -> set(doc_key)
+        self._active = set()  # şu an geçmişte/pending'de bulunan doc_key'ler
+        self._lock = threading.RLock()
+        self._loaded = not persist
+        self.stats = {"docs_built": 0, "candidates_checked": 0, "comparisons_skipped": 0}
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA busy_timeout = 30000")
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS near_dup_docs (
+                doc_key TEXT PRIMARY KEY,
+                title_cmp TEXT,
+                features TEXT,
+                content_cmp TEXT,
+                content_short INTEGER,
+                signatures BLOB,
+                version TEXT,
+                created_at REAL
+            )
+        ''')
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(near_dup_docs)")}
+        for column, kind in (("version", "TEXT"), ("created_at", "REAL")):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE near_dup_docs ADD COLUMN {column} {kind}")
+        return conn
+
+    # ------------------------------------------------------------------
+    # Kalıcılık
+    # ------------------------------------------------------------------
+    def load(self):
+        """Kayıtlı özellik ve imzaları belleğe al - süreç başına bir kez"""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            with self._connect() as conn:
+                stale = conn.execute("DELETE FROM near_dup_docs WHERE version IS NOT ?", (FEATURE_VERSION,)).rowcount
+                if stale:
+                    print(f"ℹ️ Yakın duplikat indeksi: eski sürümlü {stale} belge silindi")
+                self._prune(conn)
+                rows = conn.execute("SELECT doc_key, title_cmp, features, content_cmp, content_short, signatures "
+                                    "FROM near_dup_docs").fetchall()
+            for doc_key, title_cmp, features, content_cmp, content_short, blob in rows:
+                signatures = self._unpack_signatures(blob)
+                doc = _Doc(doc_key, title_cmp or "", frozenset(json.loads(features or "[]")),
+                           content_cmp or "", bool(content_short), signatures)
+                self._insert_memory(doc)
+            self._loaded = True
+
+    @staticmethod
+    def _pack_signatures(signatures):
+        packed = array('Q')
+        for kind in SIGNATURE_KINDS:
+            signature = signatures.get(kind)
+            packed.extend(signature if signature is not None else array('Q', [0] * NUM_PERM))
+        flags = bytes(1 if signatures.get(kind) is not None else 0 for kind in SIGNATURE_KINDS)
+        return flags + packed.tobytes()
+
+    @staticmethod
+    def _unpack_signatures(blob):
+        flags, data = blob[:len(SIGNATURE_KINDS)], blob[len(SIGNATURE_KINDS):]
+        values = array('Q')
+        values.frombytes(data)
+        signatures = {}
+        for i, kind in enumerate(SIGNATURE_KINDS):
+            signatures[kind] = values[i * NUM_PERM:(i + 1) * NUM_PERM] if flags[i] else None
+        return signatures
+
+    def _persist_docs(self, docs):
+        if not self.persist or not docs:
+            return
+        try:
+            with self._connect() as conn:
+                now = time.time()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO near_dup_docs (doc_key, title_cmp, features, content_cmp, content_short, "
+                    "signatures, version, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(d.key, d.title_cmp, json.dumps(sorted(d.features), ensure_ascii=False), d.content_cmp,
+                      1 if d.content_short else 0, self._pack_signatures(d.signatures), FEATURE_VERSION, now)
+                     for d in docs]
+                )
+                self._prune(conn)
+        except Exception as e:
+            print(f"⚠️ Yakın duplikat indeksi kaydedilemedi: {e}")
+
+    @staticmethod
+    def _prune(conn):
+        """Tabloyu MAX_DOCS belgeyle sınırla - en eski kaydedilenler düşer (gerekirse yeniden hesaplanır)"""
+        count = conn.execute("SELECT COUNT(*) FROM near_dup_docs").fetchone()[0]
+        if count > MAX_DOCS:
+            conn.execute("DELETE FROM near_dup_docs WHERE doc_key IN (SELECT doc_key FROM near_dup_docs "
+                         "ORDER BY created_at LIMIT ?)", (count - MAX_DOCS,))
+
+    # ------------------------------------------------------------------
+    # İndeks yönetimi
+    # ------------------------------------------------------------------
+    def _insert_memory(self, doc):
+        self._docs[doc.key] = doc
+        for kind in SIGNATURE_KINDS:
+            for band_key in _band_keys(kind, doc.signatures.get(kind)):
+                self._buckets.setdefault(band_key, set()).add(doc.key)
+
+    def add(self, article):
+        """Makaleyi indekse ekle ve aktif işaretle"""
+        return self.add_many([article])[0]
+
+    def add_many(self, articles, activate=True):
+        """Yeni makaleleri toplu ekle - özellikler yalnızca ilk görüşte hesaplanır"""
+        self.load()
+        keys = []
+        new_docs = []
+        with self._lock:
+            for article in articles:
+                key = article_doc_key(article)
+                if key not in self._docs:
+                    doc = build_doc(article, key)
+                    self._insert_memory(doc)
+                    new_docs.append(doc)
+                    self.stats["docs_built"] += 1
+                if activate:
+                    self._active.add(key)
+                keys.append(key)
+        self._persist_docs(new_docs)
+        return keys
+
+    def sync(self, existing_articles):
+        """Aktif kümeyi mevcut geçmiş + pending listesine eşitle"""
+        self.load()
+        with self._lock:
+            # Paralel çekme kademeleri aynı anda sorgulayabilir; küme tek adımda değiştirilir
+            self._active = set(self.add_many(existing_articles, activate=False))
+            if len(self._docs) > MAX_DOCS:
+                # Bellekte sadece aktif belgeler kalır; kovalar onlardan yeniden kurulur
+                docs = [self._docs[key] for key in self._active if key in self._docs]
+                self._docs, self._buckets = {}, {}
+                for doc in docs:
+                    self._insert_memory(doc)
+        return len(self._active)
+
+    def candidates(self, doc):
+        """Aynı LSH kovasına düşen aktif makaleler"""
+        found = set()
+        with self._lock:
+            for kind in SIGNATURE_KINDS:
+                for band_key in _band_keys(kind, doc.signatures.get(kind)):
+                    bucket = self._buckets.get(band_key)
+                    if bucket:
+                        found.update(bucket)
+            return found & self._active
+
+    def find_duplicate(self, article, title_threshold, content_threshold, doc=None):
+        """Yakın duplikat ara: (is_duplicate, score, match_type, matched_key)"""
+        self.load()
+        doc = doc or self.get_doc(article)
+        candidate_keys = self.candidates(doc)
+        self.stats["candidates_checked"] += len(candidate_keys)
+        self.stats["comparisons_skipped"] += max(0, len(self._active) - len(candidate_keys))
+        for key in candidate_keys:
+            existing_doc = self._docs.get(key)
+            if existing_doc is None:
+                continue
+            is_similar, score, match_type = compare_docs(doc, existing_doc, title_threshold, content_threshold)
+            if is_similar:
+                return True, score, match_type, key
+        return False, 0.0, "no_match", None
+
+    def get_doc(self, article):
+        """Makalenin özelliklerini döndür (indekste varsa yeniden hesaplanmaz)"""
+        key = article_doc_key(article)
+        doc = self._docs.get(key)
+        if doc is None:
+            doc = build_doc(article, key)
+        return doc
+
+    def get_stats(self):
+        """İndeks boyutu ve aday istatistikleri"""
+        return {
+            "indexed_docs": len(self._docs),
+            "active_docs": len(self._active),
+            "buckets": len(self._buckets),
+            **self.stats,
+        }
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_near_duplicate_index():
+    """Süreç genelinde tek NearDuplicateIndex örneği"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = NearDuplicateIndex()
+    return _index
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Asenkron Toplu Tweet Üretimi
+check_and_post_articles aday makalelerin tweet'lerini sırayla değil aynı anda
+üretir; bir çalışma en yavaş makale kadar sürer.
+
+Toplu üretim sırasında yapılan OpenRouter istekleri süreç genelindeki
+OpenRouterRateLimiter'dan geçer: aynı anda en fazla OPENROUTER_MAX_CONCURRENCY
+istek ve 60 saniyelik pencerede en fazla OPENROUTER_REQUESTS_PER_MINUTE istek.
+Arayüzden gelen tekil çağrılar (create_tweet, testler) sınırlayıcıya girmez;
+openrouter_call sınırlayıcıyı openrouter_slot() üzerinden sadece toplu üretim
+bağlamında kullanır.
+
+HTTP katmanı ortak requests oturumudur (aiohttp bağımlılığı eklenmedi);
+asyncio tarafında istekler asyncio.to_thread ile çalıştırılır.
+
+Ayarlar (.env):
+    OPENROUTER_MAX_CONCURRENCY      - eşzamanlı istek (varsayılan 4)
+    OPENROUTER_REQUESTS_PER_MINUTE  - dakikalık istek sınırı (varsayılan 20, ücretsiz model limiti)
+    TWEET_BATCH_CONCURRENCY         - aynı anda işlenen makale (varsayılan 5)
+"""
+
+import os
+import time
+import asyncio
+import threading
+import contextlib
+import contextvars
+from collections import deque
+from datetime import datetime
+
+
+def _env_number(name, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class OpenRouterRateLimiter:
+    """Eşzamanlılık + dakikalık istek sınırı (thread-safe; senkron ve async çağrılar ortak kullanır)"""
+
+    def __init__(self, max_concurrency=None, requests_per_minute=None):
+        self.max_concurrency = max(1, max_concurrency or _env_number('OPENROUTER_MAX_CONCURRENCY', 4))
+        self.requests_per_minute = max(1, requests_per_minute or _env_number('OPENROUTER_REQUESTS_PER_MINUTE', 20))
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._window = deque()
+        self._window_lock = threading.Lock()
+        self._stats = {"acquired": 0, "waited": 0, "total_wait_seconds": 0.0}
+
+    def _wait_for_window(self):
+        """Son 60 saniyedeki istek sayısı sınırın altına inene kadar bekle"""
+        waited = 0.0
+        while True:
+            with self._window_lock:
+                now = time.time()
+                while self._window and now - self._window[0] >= 60:
+                    self._window.popleft()
+                if len(self._window) < self.requests_per_minute:
+                    self._window.append(now)
+                    return waited
+                sleep_for = 60 - (now - self._window[0]) + 0.05
+            time.sleep(sleep_for)
+            waited += sleep_for
+
+    def acquire(self):
+        started = time.time()
+        # Önce pencere beklenir; slot tutulurken uyunmaz
+        self._wait_for_window()
+        self._slots.acquire()
+        waited = time.time() - started
+        with self._window_lock:
+            self._stats["acquired"] += 1
+            if waited > 0.01:
+                self._stats["waited"] += 1
+                self._stats["total_wait_seconds"] += waited
+
+    def release(self):
+        self._slots.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    def stats(self):
+        with self._window_lock:
+            now = time.time()
+            in_window = sum(1 for t in self._window if now - t < 60)
+            return {
+                **self._stats,
+                "total_wait_seconds": round(self._stats["total_wait_seconds"], 2),
+                "requests_last_minute": in_window,
+                "max_concurrency": self.max_concurrency,
+                "requests_per_minute": self.requests_per_minute,
+            }
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_openrouter_limiter():
+    """Süreç genelinde tek OpenRouterRateLimiter örneği"""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = OpenRouterRateLimiter()
+    return _limiter
+
+
+# Toplu üretim bağlamı - asyncio.to_thread context'i kopyaladığı için işçi thread'lerine de geçer
+_batch_scope = contextvars.ContextVar("openrouter_batch_scope", default=False)
+
+
+def openrouter_slot():
+    """openrouter_call için: toplu üretim içindeyse hız sınırlayıcı, değilse boş context"""
+    return get_openrouter_limiter() if _batch_scope.get() else contextlib.nullcontext()
+
+
+async def generate_tweets_async(articles, api_key, theme="bilgilendirici", concurrency=None):
+    """Makalelerin tweet'lerini eşzamanlı üret (generate_ai_tweet_with_content: analiz + kalite kontrolü).
+
+    Dönüş makalelerle aynı sırada: [{"tweet_data", "elapsed", "error"}]
+    """
+    from utils import generate_ai_tweet_with_content, trace_span, bind_context
+
+    semaphore = asyncio.Semaphore(max(1, concurrency or _env_number('TWEET_BATCH_CONCURRENCY', 5)))
+    # Görevler oluşturulurken context kopyalanır; bu çalışmanın tüm AI çağrıları sınırlayıcıdan geçer
+    _batch_scope.set(True)
+
+    async def generate(article):
+        async with semaphore:
+            started = time.time()
+            try:
+                # Her görev kendi context kopyasında çalışır; AI çağrıları bu makale span'inin altına düşer
+                with trace_span((article.get('title') or '')[:80], kind="article"):
+                    tweet_data = await asyncio.to_thread(bind_context(generate_ai_tweet_with_content),
+                                                         article, api_key, theme)
+                return {"tweet_data": tweet_data, "elapsed": round(time.time() - started, 2), "error": None}
+            except Exception as e:
+                return {"tweet_data": None, "elapsed": round(time.time() - started, 2), "error": str(e)}
+
+    return await asyncio.gather(*(generate(article) for article in articles))
+
+
+def generate_tweets_batch(articles, api_key, theme="bilgilendirici", concurrency=None):
+    """Senkron kodlar için toplu tweet üretimi (arka plan thread'lerinde ve Flask isteklerinde güvenli)"""
+    if not articles:
+        return []
+    started = time.time()
+    try:
+        asyncio.get_running_loop()
+        in_loop = True
+    except RuntimeError:
+        in_loop = False
+
+    if in_loop:
+        # Çalışan bir event loop içinden çağrıldıysa ayrı thread'de yeni loop aç
+        result = {}
+        from utils import bind_context
+        worker = threading.Thread(
+            target=bind_context(lambda: result.setdefault("value", asyncio.run(generate_tweets_async(articles, api_key, theme, concurrency)))),
+            daemon=True
+        )
+        worker.start()
+        worker.join()
+        results = result.get("value", [])
+    else:
+        results = asyncio.run(generate_tweets_async(articles, api_key, theme, concurrency))
+
+    total = time.time() - started
+    slowest = max((r["elapsed"] for r in results), default=0)
+    timestamp = datetime.now().strftime('%H:%M:%S')
+    print(f"⚡ [{timestamp}] [OpenRouterAsync] {len(articles)} tweet paralel üretildi: "
+          f"{total:.1f}s (en yavaş makale {slowest:.1f}s, sıralı toplam {sum(r['elapsed'] for r in results):.1f}s)")
+    return results
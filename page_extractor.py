@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tek Geçişli Sayfa Çıkarıcı
+extract_main_content her sayfada 11 CSS selector'ı tek tek deniyor, seçilen
+alt ağaçları decompose edip get_text çağırıyor, yetmezse body'ye düşüyordu;
+mcp_firecrawl_scrape ise aynı HTML'i linkler için bir kez daha parse ediyordu.
+
+extract_page HTML'i ağaç kurmadan, olay tabanlı tek bir geçişte okur ve
+ana metin, dış linkler, başlık, yayın tarihi ve canonical URL'yi birlikte
+üretir. lxml kuruluysa libxml2'nin C parser'ı (target arayüzü), değilse
+standart kütüphanedeki html.parser kullanılır.
+
+    - Ana metin seçimi eski sırayı korur: 200 karakteri geçen ilk selector
+      (article, [role="main"], main, .post-content, ...), yoksa body
+    - script/style/nav/footer/header/aside ile reklam, paylaşım, menü ve
+      kenar çubuğu sınıflı/id'li elementlerin metni atlanır
+    - Blok elementler arasına boşluk konur (get_text(strip=True) kelimeleri
+      bitiştiriyordu); satır içi elementler kelimeyi bölmez
+    - Linkler tüm sayfadan toplanır: metni 5 karakterden uzun, http(s) veya
+      köke göre göreli ("/...") adresler
+    - Yayın tarihi: meta etiketleri > itemprop=datePublished > JSON-LD >
+      ilk <time datetime>
+"""
+
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+try:
+    from lxml import etree  # type: ignore
+    LXML_AVAILABLE = True
+except ImportError:
+    etree = None  # type: ignore
+    LXML_AVAILABLE = False
+
+# Ana içerik adayları (öncelik sırasına göre) - (tür, değer)
+MAIN_CONTENT_SELECTORS = [
+    ("tag", "article"),
+    ("role", "main"),
+    ("tag", "main"),
+    ("class", "post-content"),
+    ("class", "entry-content"),
+    ("class", "article-content"),
+    ("class", "content"),
+    ("class", "story-body"),
+    ("class", "article-body"),
+    ("id", "content"),
+    ("class", "main-content"),
+]
+
+MIN_MAIN_CONTENT_LENGTH = 200
+MIN_LINK_TEXT_LENGTH = 5
+
+# Metni hiç okunmayan elementler
+SKIP_TAGS = frozenset([
+    "script", "style", "noscript", "template", "svg", "iframe",
+    "nav", "footer", "header", "aside",
+])
+SKIP_CLASSES = frozenset(["advertisement", "ads", "social-share", "menu", "sidebar"])
+# Görünür metin taşımayan elementler (link ve başlık metnine de girmez)
+RAW_TEXT_TAGS = frozenset(["script", "style", "template"])
+
+# Kapanış etiketi olmayan elementler (yığına konmaz)
+VOID_TAGS = frozenset([
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link",
+    "meta", "param", "source", "track", "wbr",
+])
+
+# Metni kelime içinde bölmeyen elementler; diğerlerinin sınırına boşluk eklenir
+INLINE_TAGS = frozenset([
+    "a", "abbr", "b", "bdi", "bdo", "cite", "code", "data", "dfn", "em",
+    "font", "i", "kbd", "label", "mark", "q", "s", "samp", "small", "span",
+    "strong", "sub", "sup", "time", "u", "var",
+])
+
+# Yayın tarihi meta etiketleri (property/name, küçük harf)
+DATE_META_KEYS = frozenset([
+    "article:published_time", "og:published_time", "published_time",
+    "pubdate", "publishdate", "publish-date", "publish_date", "date",
+    "dc.date", "dc.date.issued", "dcterms.created", "parsely-pub-date",
+    "sailthru.date", "datepublished",
+])
+
+_JSON_LD_DATE = re.compile(r'"datePublished"\s*:\s*"([^"]+)"')
+
+# Tarih kaynaklarının önceliği (küçük olan kazanır)
+_DATE_META, _DATE_ITEMPROP, _DATE_JSON_LD, _DATE_TIME_TAG = range(4)
+
+
+def _normalize(text):
+    return " ".join(text.split())
+
+
+class _PageHandler:
+    """Parser olaylarını (start/end/data) tek geçişte toplayan hedef
+
+    lxml'in target arayüzüyle birebir uyumludur; html.parser için
+    _StdlibParser aynı metodları çağırır.
+    """
+
+    def __init__(self, base_url=None):
+        self.base_url = base_url
+        self._stack = []  # (tag, içerik dışı mı, ham metin mi, açtığı selector indeksleri)
+        self._skip_depth = 0
+        self._raw_depth = 0
+        self._head_depth = 0
+        self._selector_buffers = [None] * len(MAIN_CONTENT_SELECTORS)
+        self._selector_done = [False] * len(MAIN_CONTENT_SELECTORS)
+        self._active = []  # metin eklenen tamponlar (body dahil)
+        self._body = []
+        self._active.append(self._body)
+        self._link = None  # (href, metin parçaları)
+        self.links = []
+        self._title = None  # <title> metni
+        self._title_parts = None
+        self._h1 = None
+        self._h1_parts = None
+        self._meta_title = None
+        self._canonical = None
+        self._og_url = None
+        self._date = None
+        self._date_rank = None
+        self._json_ld = None
+
+    # ------------------------------------------------------------------
+    # Parser olayları
+    # ------------------------------------------------------------------
+    def start(self, tag, attrib, nsmap=None):
+        tag = tag.lower() if isinstance(tag, str) else ""
+        attrs = attrib if attrib is not None else {}
+
+        if tag in ("meta", "link", "time") or "itemprop" in attrs:
+            self._read_metadata(tag, attrs)
+
+        if tag == "a":
+            href = (attrs.get("href") or "").strip()
+            self._link = (href, []) if href else None
+
+        if tag in VOID_TAGS:
+            if tag == "br" or tag == "hr":
+                self._separate()
+            return
+
+        classes = (attrs.get("class") or "").split()
+        element_id = (attrs.get("id") or "").strip()
+
+        skip = tag in SKIP_TAGS or element_id in SKIP_CLASSES or any(c in SKIP_CLASSES for c in classes)
+        if tag == "script" and (attrs.get("type") or "").lower() == "application/ld+json":
+            self._json_ld = []
+
+        opened = []
+        if not skip and not self._skip_depth:
+            for index, (kind, value) in enumerate(MAIN_CONTENT_SELECTORS):
+                if self._selector_done[index] or self._selector_buffers[index] is not None:
+                    continue
+                if ((kind == "tag" and tag == value) or
+                        (kind == "class" and value in classes) or
+                        (kind == "id" and element_id == value) or
+                        (kind == "role" and (attrs.get("role") or "").strip() == value)):
+                    buffer = []
+                    self._selector_buffers[index] = buffer
+                    self._active.append(buffer)
+                    opened.append(index)
+
+        raw = tag in RAW_TEXT_TAGS
+        if skip:
+            self._skip_depth += 1
+        if raw:
+            self._raw_depth += 1
+        if tag == "head":
+            self._head_depth += 1
+        elif tag == "title" and self._title is None:
+            self._title_parts = []
+        elif tag == "h1" and self._h1 is None:
+            self._h1_parts = []
+
+        if tag not in INLINE_TAGS:
+            self._separate()
+        self._stack.append((tag, skip, raw, opened))
+
+    def end(self, tag):
+        tag = tag.lower() if isinstance(tag, str) else ""
+        if tag in VOID_TAGS:
+            return
+        # Kapatılmamış alt elementleri de kapat; hiç açılmamış etiketi yok say
+        for depth in range(len(self._stack) - 1, -1, -1):
+            if self._stack[depth][0] == tag:
+                break
+        else:
+            return
+        while len(self._stack) > depth:
+            self._close(self._stack.pop())
+
+    def data(self, text):
+        if self._json_ld is not None:
+            self._json_ld.append(text)
+            return
+        if self._raw_depth:
+            return
+        if self._title_parts is not None:
+            self._title_parts.append(text)
+        if self._link is not None:
+            self._link[1].append(text)
+        if self._h1_parts is not None:
+            self._h1_parts.append(text)
+        if self._skip_depth or self._head_depth:
+            return
+        for buffer in self._active:
+            buffer.append(text)
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        while self._stack:
+            self._close(self._stack.pop())
+        return self.result()
+
+    # ------------------------------------------------------------------
+    # Yardımcılar
+    # ------------------------------------------------------------------
+    def _separate(self):
+        if not self._skip_depth and not self._head_depth:
+            for buffer in self._active:
+                buffer.append(" ")
+
+    def _close(self, frame):
+        tag, skip, raw, opened = frame
+        if tag not in INLINE_TAGS:
+            self._separate()
+        if skip:
+            self._skip_depth -= 1
+        if raw:
+            self._raw_depth -= 1
+        for index in opened:
+            self._selector_done[index] = True
+            self._active.remove(self._selector_buffers[index])
+        if tag == "head":
+            self._head_depth = max(0, self._head_depth - 1)
+        elif tag == "title" and self._title_parts is not None:
+            self._title = _normalize("".join(self._title_parts))
+            self._title_parts = None
+        elif tag == "h1" and self._h1_parts is not None:
+            self._h1 = _normalize("".join(self._h1_parts)) or None
+            self._h1_parts = None
+        elif tag == "a" and self._link is not None:
+            self._add_link(*self._link)
+            self._link = None
+        elif tag == "script" and self._json_ld is not None:
+            match = _JSON_LD_DATE.search("".join(self._json_ld))
+            if match:
+                self._set_date(match.group(1), _DATE_JSON_LD)
+            self._json_ld = None
+
+    def _add_link(self, href, parts):
+        text = _normalize("".join(parts))
+        if len(text) <= MIN_LINK_TEXT_LENGTH:
+            return
+        if href.startswith("/"):
+            href = urljoin(self.base_url, href) if self.base_url else href
+        elif not href.startswith("http"):
+            return
+        self.links.append({"text": text, "url": href})
+
+    def _set_date(self, value, rank):
+        value = (value or "").strip()
+        if value and (self._date_rank is None or rank < self._date_rank):
+            self._date = value
+            self._date_rank = rank
+
+    def _read_metadata(self, tag, attrs):
+        if tag == "meta":
+            key = (attrs.get("property") or attrs.get("name") or "").strip().lower()
+            content = attrs.get("content") or ""
+            if key in DATE_META_KEYS:
+                self._set_date(content, _DATE_META)
+            elif key == "og:title" and self._meta_title is None:
+                self._meta_title = _normalize(content) or None
+            elif key == "og:url" and self._og_url is None:
+                self._og_url = content.strip() or None
+        elif tag == "link":
+            rel = (attrs.get("rel") or "").lower().split()
+            if "canonical" in rel and self._canonical is None:
+                self._canonical = (attrs.get("href") or "").strip() or None
+        elif tag == "time" and attrs.get("datetime"):
+            self._set_date(attrs.get("datetime"), _DATE_TIME_TAG)
+        if (attrs.get("itemprop") or "").strip() == "datePublished":
+            self._set_date(attrs.get("content") or attrs.get("datetime"), _DATE_ITEMPROP)
+
+    def result(self):
+        content = ""
+        for buffer in self._selector_buffers:
+            if buffer is None:
+                continue
+            content = _normalize("".join(buffer))
+            if len(content) > MIN_MAIN_CONTENT_LENGTH:
+                break
+        if len(content) < MIN_MAIN_CONTENT_LENGTH:
+            content = _normalize("".join(self._body))
+
+        canonical = self._canonical or self._og_url
+        if canonical and self.base_url:
+            canonical = urljoin(self.base_url, canonical)
+
+        return {
+            "title": self._meta_title or self._h1 or self._title or "",
+            "content": content,
+            "links": self.links,
+            "published_date": self._date,
+            "canonical_url": canonical,
+        }
+
+
+class _StdlibParser(HTMLParser):
+    """html.parser olaylarını _PageHandler'a aktarır"""
+
+    def __init__(self, handler):
+        super().__init__(convert_charrefs=True)
+        self.handler = handler
+
+    def handle_starttag(self, tag, attrs):
+        self.handler.start(tag, {name: value or "" for name, value in attrs})
+
+    def handle_startendtag(self, tag, attrs):
+        self.handler.start(tag, {name: value or "" for name, value in attrs})
+        self.handler.end(tag)
+
+    def handle_endtag(self, tag):
+        self.handler.end(tag)
+
+    def handle_data(self, data):
+        self.handler.data(data)
+
+
+def _parse_stdlib(html, base_url):
+    handler = _PageHandler(base_url)
+    parser = _StdlibParser(handler)
+    parser.feed(html)
+    parser.close()
+    return handler.close()
+
+
+def _parse_lxml(html, base_url):
+    handler = _PageHandler(base_url)
+    parser = etree.HTMLParser(target=handler, remove_comments=True)
+    parser.feed(html)
+    return parser.close()
+
+
+def extract_page(html, base_url=None):
+    """HTML'den tek geçişte başlık, ana metin, linkler, yayın tarihi ve canonical URL
+
+    Dönen sözlük: title, content, links ([{"text", "url"}]), published_date,
+    canonical_url, parser ("lxml" / "html.parser").
+    """
+    if isinstance(html, bytes):
+        html = html.decode("utf-8", errors="replace")
+    if not html:
+        return {"title": "", "content": "", "links": [], "published_date": None,
+                "canonical_url": None, "parser": None}
+
+    if LXML_AVAILABLE:
+        try:
+            result = _parse_lxml(html, base_url)
+            result["parser"] = "lxml"
+            return result
+        except Exception:
+            # Bozuk belge / kodlama bildirimi sorunu - saf Python parser'a düş
+            pass
+
+    result = _parse_stdlib(html, base_url)
+    result["parser"] = "html.parser"
+    return result
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Arka Plan Paylaşım Kuyruğu
+Toplu onayda tweet'ler istek içinde tek tek paylaşılıyordu; 20 tweet'lik bir
+seçim HTTP isteğini dakikalarca açık tutuyor, rate limit'e takılan tweet'ler
+ise sadece hata mesajı olarak dönüyordu. Artık onaylanan tweet'ler bir iş
+(job) olarak bu kuyruğa verilir, istek hemen iş kimliğiyle döner ve arayüz
+/api/post_jobs/<job_id> üzerinden ilerlemeyi sorgular.
+
+    - Tek çalışan thread işleri sırayla paylaşır; kuyruk boşalınca kapanır
+    - Her paylaşımdan önce rate_check() sorulur; limit doluysa pencere
+      açılana kadar beklenir (iş durumu "waiting", resume_at ile)
+    - rate_limited dönen paylaşım beklemeden sonra aynı tweet ile yeniden
+      denenir; yapılandırma hatası işin kalanını durdurur
+    - submit_unique aynı öğe (ör. pending tweet ID'si) bitmemiş bir işte hâlâ
+      sıradaysa onu tekrar kuyruğa almaz (çift tıklama / iki sekme)
+    - İş durumu bellekte tutulur; süreç yeniden başlarsa paylaşılmamış
+      tweet'ler pending listesinde kalır (paylaşım başarılı olmadan
+      kaldırılmazlar)
+
+Ayarlar (.env):
+    POST_QUEUE_DELAY_SECONDS    - iki paylaşım arası bekleme (varsayılan 2)
+    POST_QUEUE_MAX_RATE_WAITS   - tweet başına rate limit bekleme hakkı (varsayılan 3)
+    POST_QUEUE_KEEP_JOBS        - saklanan bitmiş iş sayısı (varsayılan 50)
+"""
+
+import os
+import time
+import uuid
+import threading
+from collections import OrderedDict, deque
+from datetime import datetime
+
+# Rate limit sonucu bekleme süresi bildirmezse
+DEFAULT_RATE_WAIT_SECONDS = 15 * 60
+
+_FINISHED = ("completed", "cancelled")
+
+
+def _env_number(name, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _iso(timestamp):
+    return datetime.fromtimestamp(timestamp).isoformat() if timestamp else None
+
+
+class PostJob:
+    """Tek toplu paylaşım işi - öğe başına durum ve sayaçlar"""
+
+    def __init__(self, items, label):
+        self.id = uuid.uuid4().hex[:12]
+        self.label = label
+        self.status = "queued"
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.resume_at = None
+        self.cancelled = False
+        self.items = [{"item": item, "status": "queued", "error": None, "result": None} for item in items]
+        self.position = 0
+
+    def counts(self):
+        counts = {"queued": 0, "posted": 0, "failed": 0, "skipped": 0}
+        for entry in self.items:
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        return counts
+
+    def snapshot(self):
+        """JSON'a çevrilebilir durum (arayüz sorgusu için)"""
+        counts = self.counts()
+        return {
+            "job_id": self.id,
+            "label": self.label,
+            "status": self.status,
+            "total": len(self.items),
+            "done": len(self.items) - counts["queued"],
+            **counts,
+            "created_at": _iso(self.created_at),
+            "started_at": _iso(self.started_at),
+            "finished_at": _iso(self.finished_at),
+            "resume_at": _iso(self.resume_at),
+            "items": [{
+                "id": entry["item"].get("id"),
+                "title": (entry["item"].get("title") or "")[:80],
+                "status": entry["status"],
+                "error": entry["error"],
+                "tweet_url": (entry["result"] or {}).get("url") or (entry["result"] or {}).get("tweet_url"),
+            } for entry in self.items],
+        }
+
+
+class PostQueue:
+    """post_func(item) -> tweet sonucu, rate_check() -> {"allowed", "wait_time"} ile çalışan kuyruk"""
+
+    def __init__(self, post_func, rate_check=None, delay=None, max_rate_waits=None, keep_jobs=None):
+        self.post_func = post_func
+        self.rate_check = rate_check
+        self.delay = max(0.0, delay if delay is not None else _env_number('POST_QUEUE_DELAY_SECONDS', 2, float))
+        self.max_rate_waits = max(0, max_rate_waits if max_rate_waits is not None else _env_number('POST_QUEUE_MAX_RATE_WAITS', 3))
+        self.keep_jobs = max(1, keep_jobs or _env_number('POST_QUEUE_KEEP_JOBS', 50))
+        self._jobs = OrderedDict()
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stats = {"jobs": 0, "posted": 0, "failed": 0, "rate_waits": 0, "rate_wait_seconds": 0.0}
+
+    def _log(self, message, level="info"):
+        """Paylaşım kuyruğu logları"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        prefix = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"}.get(level, "ℹ️")
+        print(f"{prefix} [{timestamp}] [PostQueue] {message}")
+
+    # ------------------------------------------------------------------
+    # İş gönderme / sorgulama
+    # ------------------------------------------------------------------
+    def submit(self, items, label="bulk_approve"):
+        """Öğeleri yeni bir iş olarak kuyruğa ekle, iş kimliğini döndür"""
+        job = PostJob(list(items), label)
+        with self._condition:
+            self._jobs[job.id] = job
+            self._queue.append(job)
+            self._stats["jobs"] += 1
+            self._prune()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="PostQueue", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+        self._log(f"İş {job.id} kuyruğa alındı: {len(job.items)} tweet ({label})")
+        return job.id
+
+    def submit_unique(self, items, key, label="bulk_approve"):
+        """Bitmemiş işlerde hâlâ sırada olan öğeleri (key(item) ile) atlayıp kalanı kuyruğa ekle.
+
+        Kontrol ve ekleme aynı kilitte yapılır. Dönüş: (iş kimliği veya None, atlanan öğeler)"""
+        with self._condition:
+            active = set()
+            for job in self._jobs.values():
+                if job.status in _FINISHED or job.cancelled:
+                    continue
+                active.update(key(entry["item"]) for entry in job.items if entry["status"] == "queued")
+            fresh, skipped = [], []
+            for item in items:
+                item_key = key(item)
+                if item_key in active:
+                    skipped.append(item)
+                else:
+                    active.add(item_key)
+                    fresh.append(item)
+            # Condition yeniden girilebilir (RLock) - submit aynı kilidi alır
+            job_id = self.submit(fresh, label) if fresh else None
+        return job_id, skipped
+
+    def job(self, job_id):
+        """İşin anlık durumu (bilinmeyen kimlikte None)"""
+        with self._condition:
+            job = self._jobs.get(job_id)
+            return job.snapshot() if job else None
+
+    def jobs(self, limit=10):
+        """Son işlerin özeti (yeniden eskiye)"""
+        with self._condition:
+            recent = list(self._jobs.values())[-limit:]
+            summaries = []
+            for job in reversed(recent):
+                snapshot = job.snapshot()
+                snapshot.pop("items")
+                summaries.append(snapshot)
+            return summaries
+
+    def cancel(self, job_id):
+        """Henüz paylaşılmamış öğeleri iptal et - paylaşılmış olanlar etkilenmez"""
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None or job.status in _FINISHED:
+                return False
+            job.cancelled = True
+            self._condition.notify_all()
+        return True
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in _FINISHED]
+        for job_id in finished[:max(0, len(finished) - self.keep_jobs)]:
+            del self._jobs[job_id]
+
+    # ------------------------------------------------------------------
+    # Çalışan thread
+    # ------------------------------------------------------------------
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._queue:
+                    self._thread = None
+                    return
+                job = self._queue.popleft()
+                job.status = "running"
+                job.started_at = time.time()
+            try:
+                self._process(job)
+            except Exception as e:
+                self._log(f"İş {job.id} beklenmeyen hata: {e}", "error")
+                self._finish_remaining(job, "failed", str(e))
+            with self._condition:
+                job.status = "cancelled" if job.cancelled else "completed"
+                job.finished_at = time.time()
+                job.resume_at = None
+                self._prune()
+            counts = job.counts()
+            self._log(f"İş {job.id} bitti: {counts['posted']} paylaşıldı, {counts['failed']} hata, "
+                      f"{counts['skipped']} atlandı", "success" if not counts['failed'] else "warning")
+
+    def _process(self, job):
+        rate_waits = 0
+        while job.position < len(job.items):
+            if job.cancelled:
+                self._finish_remaining(job, "skipped", "İptal edildi")
+                return
+            entry = job.items[job.position]
+
+            wait_seconds = self._rate_wait()
+            if wait_seconds:
+                self._wait(job, wait_seconds)
+                continue
+
+            try:
+                result = self.post_func(entry["item"]) or {}
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+
+            if result.get("success"):
+                self._settle(job, entry, "posted", None, result)
+                rate_waits = 0
+                if job.position < len(job.items) and self.delay:
+                    self._wait(job, self.delay, status="running")
+                continue
+
+            error = result.get("error") or "API hatası"
+            if result.get("rate_limited") and rate_waits < self.max_rate_waits:
+                rate_waits += 1
+                wait_minutes = result.get("wait_minutes")
+                self._wait(job, wait_minutes * 60 if wait_minutes else DEFAULT_RATE_WAIT_SECONDS)
+                continue
+
+            self._settle(job, entry, "failed", error, result)
+            rate_waits = 0
+            if result.get("config_error"):
+                # Yapılandırma düzelmeden sonraki paylaşımlar da başarısız olur
+                self._finish_remaining(job, "failed", f"API yapılandırma hatası - {error}")
+                return
+
+    def _settle(self, job, entry, status, error, result):
+        with self._condition:
+            entry["status"] = status
+            entry["error"] = error
+            entry["result"] = result
+            job.position += 1
+            self._stats["posted" if status == "posted" else "failed"] += 1
+        if status == "failed":
+            self._log(f"İş {job.id}: {entry['item'].get('id')} paylaşılamadı - {error}", "warning")
+
+    def _finish_remaining(self, job, status, error):
+        with self._condition:
+            for entry in job.items[job.position:]:
+                if entry["status"] == "queued":
+                    entry["status"] = status
+                    entry["error"] = error
+                    if status == "failed":
+                        self._stats["failed"] += 1
+            job.position = len(job.items)
+
+    def _rate_wait(self):
+        """Limit doluysa beklenecek saniye, değilse 0"""
+        if self.rate_check is None:
+            return 0
+        try:
+            status = self.rate_check() or {}
+        except Exception as e:
+            self._log(f"Rate limit kontrolü hatası: {e}", "warning")
+            return 0
+        if status.get("allowed", True):
+            return 0
+        return max(1.0, float(status.get("wait_time") or DEFAULT_RATE_WAIT_SECONDS))
+
+    def _wait(self, job, seconds, status="waiting"):
+        """İptal edilebilir bekleme"""
+        deadline = time.time() + seconds
+        with self._condition:
+            job.status = status
+            if status == "waiting":
+                job.resume_at = deadline
+                self._stats["rate_waits"] += 1
+                self._stats["rate_wait_seconds"] += seconds
+                self._log(f"İş {job.id}: rate limit, {seconds / 60:.1f} dk bekleniyor", "warning")
+            while not job.cancelled:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            job.status = "running"
+            job.resume_at = None
+
+    def stats(self):
+        """İş/paylaşım sayaçları"""
+        with self._condition:
+            active = [job.id for job in self._jobs.values() if job.status not in _FINISHED]
+            return {
+                **self._stats,
+                "rate_wait_seconds": round(self._stats["rate_wait_seconds"], 1),
+                "active_jobs": active,
+                "queued_jobs": len(self._queue),
+                "running": self._thread is not None,
+            }
+
+
+_post_queue = None
+_post_queue_lock = threading.Lock()
+
+
+def get_post_queue(post_func=None, rate_check=None):
+    """Süreç genelinde tek PostQueue örneği (ilk çağrıda post_func verilmeli)"""
+    global _post_queue
+    if _post_queue is None:
+        with _post_queue_lock:
+            if _post_queue is None:
+                if post_func is None:
+                    raise RuntimeError("PostQueue ilk kullanımda post_func gerektirir")
+                _post_queue = PostQueue(post_func, rate_check)
+    return _post_queue
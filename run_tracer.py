@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Çalışma İzleme (Tracing) Katmanı
+check_and_post_articles çalışmalarını iç içe span'ler olarak kaydeder:
+run → tier → source → article → ai_call (ve duplicate_filter, post gibi aşamalar).
+Her span duvar saati süresini, indirilen byte'ı ve AI token sayılarını tutar.
+
+Çalışma bitince ağaç articles.db içindeki run_traces tablosuna yazılır;
+/api/run_traces son çalışmaları ve aşama bazlı p50/p95 sürelerini döndürür.
+
+Aktif bir çalışma yoksa veya RUN_TRACING_ENABLED=false ise span() paylaşılan
+boş bir nesne döndürür - maliyeti tek bir contextvar okumasıdır.
+
+profiling() bloğu içinde başlayan çalışmalar ayrıca örneklemeli profiler ile
+izlenir; collapsed stack profili çalışma kaydının profile sütununa yazılır.
+"""
+
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+import contextvars
+import functools
+from contextlib import contextmanager
+from datetime import datetime
+
+from article_store import ARTICLE_STORE_DB
+
+RUN_TRACE_DB = os.environ.get('RUN_TRACE_DB', ARTICLE_STORE_DB)
+
+# Saklanan en fazla çalışma sayısı
+RUN_TRACE_KEEP = 200
+
+_current_span = contextvars.ContextVar('run_tracer_current_span', default=None)
+_profile_requested = contextvars.ContextVar('run_tracer_profile_requested', default=False)
+# Çalışmanın profiler'ı - bind_context ile işi yürüten thread'ler buna kaydolur
+_active_profiler = contextvars.ContextVar('run_tracer_active_profiler', default=None)
+
+
+def is_tracing_enabled():
+    """RUN_TRACING_ENABLED=false ile izleme tamamen kapatılır"""
+    return os.getenv('RUN_TRACING_ENABLED', 'true').strip().lower() not in ('0', 'false', 'no', 'off')
+
+
+class Span:
+    __slots__ = ("name", "kind", "start", "end", "attrs", "children", "_token", "_lock")
+
+    def __init__(self, name, kind, attrs=None):
+        self.name = name
+        self.kind = kind
+        self.start = time.time()
+        self.end = None
+        self.attrs = dict(attrs) if attrs else {}
+        self.children = []
+        self._token = None
+        self._lock = threading.Lock()
+
+    @property
+    def duration(self):
+        return (self.end or time.time()) - self.start
+
+    def add(self, **counters):
+        """Sayısal değerleri ekle (bytes, prompt_tokens...), diğerlerini üzerine yaz"""
+        with self._lock:
+            for key, value in counters.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    self.attrs[key] = self.attrs.get(key, 0) + value
+                else:
+                    self.attrs[key] = value
+
+    def set(self, **attrs):
+        with self._lock:
+            self.attrs.update(attrs)
+
+    def __enter__(self):
+        parent = _current_span.get()
+        if parent is not None:
+            with parent._lock:
+                parent.children.append(self)
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end = time.time()
+        if exc_type is not None:
+            self.attrs["error"] = f"{exc_type.__name__}: {str(exc)[:200]}"
+        if self._token is not None:
+            try:
+                _current_span.reset(self._token)
+            except ValueError:
+                # Farklı bir context'te kapatıldı (ör. thread) - sadece geri al
+                _current_span.set(None)
+            self._token = None
+        return False
+
+    def to_dict(self):
+        with self._lock:
+            children = list(self.children)
+            attrs = dict(self.attrs)
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "start": self.start,
+            "duration": round(self.duration, 4),
+            "attrs": attrs,
+            "children": [child.to_dict() for child in children],
+        }
+
+
+class _NoopSpan:
+    """İzleme kapalıyken kullanılan boş span"""
+    __slots__ = ()
+
+    def add(self, **counters):
+        pass
+
+    def set(self, **attrs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+def span(name, kind="stage", **attrs):
+    """Aktif çalışma varsa iç içe span aç, yoksa boş span döndür"""
+    if _current_span.get() is None:
+        return NOOP_SPAN
+    return Span(name, kind, attrs)
+
+
+def current_span():
+    """İçinde bulunulan span (yoksa boş span)"""
+    return _current_span.get() or NOOP_SPAN
+
+
+def record(**counters):
+    """Mevcut span'e sayaç ekle (bytes, tokens)"""
+    active = _current_span.get()
+    if active is not None:
+        active.add(**counters)
+
+
+def bind_context(fn):
+    """Thread havuzuna gönderilen işin aktif span'in altında kalması için context'i bağla"""
+    if _current_span.get() is None:
+        return fn
+    ctx = contextvars.copy_context()
+    profiler = ctx.get(_active_profiler)
+
+    @functools.wraps(fn)
+    def runner(*args, **kwargs):
+        if profiler is None:
+            return ctx.run(fn, *args, **kwargs)
+        # İş sürdükçe bu thread çalışmanın profilinde örneklenir
+        profiler.add_thread()
+        try:
+            return ctx.run(fn, *args, **kwargs)
+        finally:
+            profiler.remove_thread()
+    return runner
+
+
+def traced(name=None, kind="stage"):
+    """Fonksiyonu aktif çalışma içinde span olarak kaydeden dekoratör"""
+    def decorator(fn):
+        span_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return fn(*args, **kwargs)
+            with Span(span_name, kind):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def profiling(enabled=True):
+    """Bu blokta başlayan çalışmaları örneklemeli profiler ile kaydet"""
+    token = _profile_requested.set(bool(enabled))
+    try:
+        yield
+    finally:
+        _profile_requested.reset(token)
+
+
+def _percentile(values, percentile):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(percentile / 100.0 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+class RunTracer:
+    def __init__(self, db_path=None):
+        self.db_path = db_path or RUN_TRACE_DB
+        self._local = threading.local()
+        self._init_db()
+
+    def _log(self, message, level="info"):
+        """İzleme logları"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        prefix = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"}.get(level, "ℹ️")
+        print(f"{prefix} [{timestamp}] [RunTracer] {message}")
+
+    def _get_connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA busy_timeout = 30000")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        conn = self._get_connection()
+        with conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS run_traces (
+                    run_id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    started_at TEXT NOT NULL,
+                    duration REAL,
+                    status TEXT,
+                    summary TEXT,
+                    trace TEXT NOT NULL
+                )
+            ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_run_traces_started ON run_traces(started_at)")
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(run_traces)")}
+            if "profile" not in columns:
+                conn.execute("ALTER TABLE run_traces ADD COLUMN profile TEXT")
+
+    # ------------------------------------------------------------------
+    # Çalışma yaşam döngüsü
+    # ------------------------------------------------------------------
+    def start_run(self, name, **attrs):
+        """Kök span'i başlat - izleme kapalıysa boş span"""
+        if not is_tracing_enabled():
+            return NOOP_SPAN
+        root = Span(name, "run", attrs)
+        root.attrs["run_id"] = uuid.uuid4().hex[:12]
+        return root
+
+    def finish_run(self, root, status="ok", profile=None, **attrs):
+        """Kök span'i kaydet (profile: collapsed stack metni)"""
+        if not isinstance(root, Span):
+            return None
+        if root.end is None:
+            root.end = time.time()
+        root.set(status=status, **attrs)
+        trace = root.to_dict()
+        summary = self._summarize(trace)
+        try:
+            conn = self._get_connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO run_traces (run_id, name, started_at, duration, status, summary, trace, profile) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (root.attrs["run_id"], root.name, datetime.fromtimestamp(root.start).isoformat(),
+                     round(root.duration, 3), status, json.dumps(summary, ensure_ascii=False),
+                     json.dumps(trace, ensure_ascii=False), profile)
+                )
+                conn.execute("DELETE FROM run_traces WHERE run_id NOT IN "
+                             "(SELECT run_id FROM run_traces ORDER BY started_at DESC LIMIT ?)", (RUN_TRACE_KEEP,))
+        except Exception as e:
+            self._log(f"Çalışma izi kaydedilemedi: {e}", "warning")
+        return root.attrs["run_id"]
+
+    @staticmethod
+    def _walk(node, depth=0):
+        yield node, depth
+        for child in node.get("children", []):
+            yield from RunTracer._walk(child, depth + 1)
+
+    def _summarize(self, trace):
+        """Aşama bazlı toplam süre, byte ve token özeti"""
+        stages = {}
+        totals = {"bytes": 0, "prompt_tokens": 0, "completion_tokens": 0, "ai_calls": 0, "spans": 0}
+        for node, depth in self._walk(trace):
+            totals["spans"] += 1
+            attrs = node.get("attrs", {})
+            # record() sayaçları sadece o anki span'e yazar; toplam için tüm düğümler toplanır
+            totals["bytes"] += attrs.get("bytes", 0)
+            if node["kind"] == "ai_call":
+                totals["ai_calls"] += 1
+                totals["prompt_tokens"] += attrs.get("prompt_tokens", 0)
+                totals["completion_tokens"] += attrs.get("completion_tokens", 0)
+            if depth == 0:
+                continue
+            key = f"{node['kind']}:{node['name']}" if node["kind"] in ("stage", "tier") else node["kind"]
+            entry = stages.setdefault(key, {"count": 0, "total_seconds": 0.0})
+            entry["count"] += 1
+            entry["total_seconds"] = round(entry["total_seconds"] + node["duration"], 3)
+        return {"stages": stages, "totals": totals}
+
+    # ------------------------------------------------------------------
+    # Sorgulama
+    # ------------------------------------------------------------------
+    def list_runs(self, limit=20):
+        rows = self._get_connection().execute(
+            "SELECT run_id, name, started_at, duration, status, summary, profile IS NOT NULL FROM run_traces "
+            "ORDER BY started_at DESC LIMIT ?", (int(limit),)).fetchall()
+        return [{
+            "run_id": run_id, "name": name, "started_at": started_at, "duration": duration,
+            "status": status, "summary": json.loads(summary or "{}"), "has_profile": bool(has_profile)
+        } for run_id, name, started_at, duration, status, summary, has_profile in rows]
+
+    def get_run(self, run_id):
+        row = self._get_connection().execute(
+            "SELECT trace FROM run_traces WHERE run_id = ?", (run_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_profile(self, run_id):
+        """Çalışmanın collapsed stack profili ve örnekleme aralığı (yoksa None)"""
+        row = self._get_connection().execute(
+            "SELECT name, profile, trace FROM run_traces WHERE run_id = ?", (run_id,)).fetchone()
+        if not row or row[1] is None:
+            return None
+        name, collapsed, trace_json = row
+        try:
+            summary = json.loads(trace_json).get("attrs", {}).get("profile_summary", {})
+        except ValueError:
+            summary = {}
+        return {"name": name, "collapsed": collapsed, "interval_ms": summary.get("interval_ms", 10)}
+
+    def stage_histograms(self, last_runs=50):
+        """Son çalışmalardaki span sürelerinden aşama bazlı p50/p95"""
+        rows = self._get_connection().execute(
+            "SELECT trace FROM run_traces ORDER BY started_at DESC LIMIT ?", (int(last_runs),)).fetchall()
+        samples = {}
+        for (trace_json,) in rows:
+            try:
+                trace = json.loads(trace_json)
+            except ValueError:
+                continue
+            for node, depth in self._walk(trace):
+                key = node["kind"] if node["kind"] not in ("stage", "tier") else f"{node['kind']}:{node['name']}"
+                samples.setdefault(key, []).append(node["duration"])
+        return {
+            key: {
+                "count": len(values),
+                "p50": round(_percentile(values, 50), 3),
+                "p95": round(_percentile(values, 95), 3),
+                "max": round(max(values), 3),
+            }
+            for key, values in sorted(samples.items())
+        }
+
+
+_tracer = None
+_tracer_lock = threading.Lock()
+
+
+def get_run_tracer():
+    """Süreç genelinde tek RunTracer örneği"""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = RunTracer()
+    return _tracer
+
+
+def _start_profiler():
+    """profiling() istendiyse profiler'ı başlat"""
+    if not _profile_requested.get():
+        return None
+    try:
+        from sampling_profiler import SamplingProfiler
+        return SamplingProfiler().start()
+    except Exception as e:
+        get_run_tracer()._log(f"Profiler başlatılamadı: {e}", "warning")
+        return None
+
+
+def traced_run(name, stage_name=None):
+    """Fonksiyonun her çağrısını ayrı bir çalışma izi olarak kaydeden dekoratör.
+
+    Zaten bir çalışmanın içindeyse (iç içe çağrı) sadece stage span'i açar
+    (stage_name verilmişse o adla).
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is not None:
+                with Span(stage_name or name, "stage"):
+                    return fn(*args, **kwargs)
+            tracer = get_run_tracer()
+            root = tracer.start_run(name)
+            if root is NOOP_SPAN:
+                return fn(*args, **kwargs)
+            status = "ok"
+            result = None
+            profiler = _start_profiler()
+            profiler_token = None
+            if profiler is not None:
+                profiler_token = _active_profiler.set(profiler)
+                profiler.add_thread()
+            try:
+                with root:
+                    result = fn(*args, **kwargs)
+                if isinstance(result, dict) and result.get("success") is False:
+                    status = "failed"
+                return result
+            except Exception:
+                status = "error"
+                raise
+            finally:
+                extra = {}
+                if isinstance(result, dict):
+                    extra = {k: result[k] for k in ("message", "posted_count", "pending_count") if k in result}
+                elif isinstance(result, list):
+                    extra["article_count"] = len(result)
+                profile = None
+                if profiler is not None:
+                    profiler.remove_thread()
+                    _active_profiler.reset(profiler_token)
+                    profiler.stop()
+                    profile = profiler.collapsed()
+                    extra["profile_summary"] = profiler.summary()
+                run_id = tracer.finish_run(root, status, profile=profile, **extra)
+                if isinstance(result, dict) and run_id:
+                    result.setdefault("run_id", run_id)
+        return wrapper
+    return decorator
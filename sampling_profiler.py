@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Örneklemeli (Sampling) Profiler
+İsteğe bağlı olarak bir çalışma boyunca o çalışmanın thread'lerinin stack'lerini
+belirli aralıklarla örnekler ve "collapsed stack" (flame graph) biçiminde toplar.
+Böylece BeautifulSoup ayrıştırma, SequenceMatcher ve extract_key_content_features
+gibi regex yoğun kodlarda CPU'nun nereye gittiği görülebilir.
+
+Sadece çalışmaya kayıtlı thread'ler örneklenir: traced_run'ı başlatan thread
+ve run_tracer.bind_context ile çalışmanın işini yürüten havuz thread'leri (iş
+sürdüğü sürece). Flask istekleri, zamanlayıcı döngüsü ve yazıcı/olay kuyruğu
+thread'leri profile karışmaz. Kayıtlı thread'lerin beklemeleri (wait, acquire)
+de örneklendiği için profil duvar saati profilidir.
+
+Profil run_tracer ile çalışma kaydının yanında saklanır ve speedscope
+(https://www.speedscope.app) formatında indirilebilir.
+
+Ayarlar (.env):
+    PROFILER_INTERVAL_MS  - örnekleme aralığı (varsayılan 10)
+    PROFILER_MAX_SECONDS  - en uzun profil süresi (varsayılan 600)
+"""
+
+import os
+import sys
+import time
+import threading
+from collections import Counter
+
+def _env_number(name, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _frame_label(code):
+    """Frame etiketi: fonksiyon (dosya:ilk_satır) - satır bazında bölünmez"""
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    def __init__(self, interval_ms=None, max_seconds=None):
+        self.interval = max(1, interval_ms or _env_number('PROFILER_INTERVAL_MS', 10)) / 1000.0
+        self.max_seconds = max_seconds or _env_number('PROFILER_MAX_SECONDS', 600, float)
+        self.stacks = Counter()
+        self.sample_count = 0
+        self.started_at = None
+        self.stopped_at = None
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._threads = Counter()  # thread ident -> kayıt sayısı (iç içe işler için)
+        self._threads_lock = threading.Lock()
+
+    def add_thread(self, ident=None):
+        """Thread'i (varsayılan: çağıran) örneklenenlere ekle"""
+        with self._threads_lock:
+            self._threads[ident or threading.get_ident()] += 1
+
+    def remove_thread(self, ident=None):
+        ident = ident or threading.get_ident()
+        with self._threads_lock:
+            self._threads[ident] -= 1
+            if self._threads[ident] <= 0:
+                del self._threads[ident]
+
+    def _sample(self, own_ident):
+        with self._threads_lock:
+            idents = [ident for ident in self._threads if ident != own_ident]
+        frames = sys._current_frames()
+        for ident in idents:
+            frame = frames.get(ident)
+            if frame is None:
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            labels.reverse()
+            self.stacks[";".join(labels)] += 1
+        self.sample_count += 1
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        deadline = self.started_at + self.max_seconds
+        while not self._stop_event.wait(self.interval):
+            self._sample(own_ident)
+            if time.time() > deadline:
+                break
+
+    def start(self):
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name="SamplingProfiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self.stopped_at = time.time()
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def collapsed(self):
+        """Brendan Gregg collapsed stack formatı: 'a;b;c 12' satırları"""
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common())
+
+    def summary(self):
+        return {
+            "samples": self.sample_count,
+            "unique_stacks": len(self.stacks),
+            "interval_ms": round(self.interval * 1000, 2),
+            "duration": round((self.stopped_at or time.time()) - (self.started_at or time.time()), 3),
+        }
+
+
+def parse_collapsed(text):
+    """Collapsed stack metnini [(frame listesi, sayı)] listesine çevir"""
+    stacks = []
+    for line in (text or "").splitlines():
+        stack, _, count = line.rpartition(" ")
+        if not stack:
+            continue
+        try:
+            stacks.append((stack.split(";"), int(count)))
+        except ValueError:
+            continue
+    return stacks
+
+
+def collapsed_to_speedscope(text, name="profile", interval_ms=10):
+    """Collapsed stack metnini speedscope 'sampled' profil JSON'una çevir"""
+    frames = []
+    frame_index = {}
+    samples = []
+    weights = []
+    for stack, count in parse_collapsed(text):
+        indices = []
+        for label in stack:
+            if label not in frame_index:
+                frame_index[label] = len(frames)
+                func, _, location = label.partition(" (")
+                file_name, _, line = location.rstrip(")").rpartition(":")
+                frame = {"name": func}
+                if file_name:
+                    frame["file"] = file_name
+                if line.isdigit():
+                    frame["line"] = int(line)
+                frames.append(frame)
+            indices.append(frame_index[label])
+        samples.append(indices)
+        weights.append(round(count * interval_ms / 1000.0, 6))
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "flask_tweet_app sampling_profiler",
+        "activeProfileIndex": 0,
+        "shared": {"frames": frames},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": round(sum(weights), 6),
+            "samples": samples,
+            "weights": weights,
+        }],
+    }
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tam Metin Arama İndeksi (SQLite FTS5)
+Geçmiş bir makaleyi bulmak için posted_articles.json'ı tarayıcıda açmak ya da
+grep'lemek gerekiyordu. Bu modül makale deposundaki (articles.db) tüm
+koleksiyonlar - paylaşılan, bekleyen, reddedilen, silinen, arşivlenen - için
+bir ters indeks (articles_search) tutar:
+
+    başlık, tweet metni, içerik önizlemesi, etiketler/konular, kaynak
+
+İndeks articles tablosundaki tetikleyicilerle (trigger) aynı transaction içinde
+güncellenir; başka süreçlerin (start_scheduler.py) yazımları da anında
+indekse yansır. Sonuçlar bm25 ile sıralanır ve (skor, rowid) imleciyle
+sayfalanır; 100k+ kayıtta sorgular milisaniyeler içinde döner.
+
+    python search_index.py rebuild          # indeksi baştan kur
+    python search_index.py "openai model"   # komut satırından ara
+
+Ayarlar (.env):
+    SEARCH_RANK_WINDOW - çok genel terimlerde alaka sıralamasına giren en yeni
+                         eşleşme sayısı (varsayılan 10000, 0 = sınırsız); toplam
+                         sonuç sayısı her zaman tüm eşleşmelerdir
+"""
+
+import os
+import re
+import sys
+import html
+import time
+import threading
+from datetime import datetime
+
+from article_store import STORE_COLLECTIONS, encode_cursor, decode_cursor
+
+
+def _env_number(name, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# Tanımlar değişirse artırılır - indeks bir sonraki aramada yeniden kurulur
+SEARCH_INDEX_VERSION = "1"
+
+# İçerik önizlemesinden indekslenen karakter - tetikleyicilere gömülür; değişirse sürümü artırın
+SEARCH_CONTENT_CHARS = 2000
+
+# Sütun ağırlıkları (bm25): başlık > tweet metni > etiketler > kaynak > içerik.
+# kind sütunu kaydın kümesini tek terim olarak tutar; küme filtresi FTS sorgusunun
+# parçası olur (articles ile join gerekmez) ve sıralamaya katılmaz
+TEXT_COLUMNS = ("title", "body", "content", "tags", "source")
+SEARCH_COLUMNS = TEXT_COLUMNS + ("kind",)
+SEARCH_WEIGHTS = (10.0, 4.0, 1.0, 3.0, 2.0, 0.0)
+
+# Aranabilir kümeler (silinmiş paylaşımlar posted koleksiyonunda deleted durumuyla tutulur)
+SEARCH_SETS = ("posted", "pending", "rejected", "deleted", "archived")
+
+SEARCH_MAX_LIMIT = 100
+SNIPPET_WORDS = 24
+
+
+def _column_values(ref):
+    """Tetikleyici/yeniden kurma için satırdan indeks sütunlarını üreten SQL ifadeleri"""
+    def js(path):
+        return f"json_extract({ref}.data, '{path}')"
+    content = (f"substr(coalesce({js('$.content')}, {js('$.article.content')}, {js('$.description')}, "
+               f"{js('$.summary')}, {js('$.article.excerpt')}, ''), 1, {SEARCH_CONTENT_CHARS})")
+    tags = (f"trim(coalesce({js('$.tags')}, '') || ' ' || coalesce({js('$.topics')}, '') || ' ' || "
+            f"coalesce({js('$.category')}, '') || ' ' || coalesce({js('$.language')}, ''))")
+    kind = (f"CASE WHEN {ref}.collection = 'posted' AND {ref}.status = 'deleted' THEN 'deleted' "
+            f"ELSE {ref}.collection END")
+    return [f"{ref}.title", f"{ref}.body", content, tags, f"{ref}.source", kind]
+
+
+def query_terms(text):
+    return re.findall(r"\w+", str(text or "").lower())
+
+
+def build_match_query(text, sets=None):
+    """Kullanıcı metnini güvenli bir FTS5 sorgusuna çevir - terimler AND ile bağlanır,
+    son terim önek olarak aranır (yazarken arama). Terim yoksa None."""
+    terms = query_terms(text)
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    if len(terms[-1]) > 1:
+        # 2-3 harfli önekler FTS5 önek indeksinden okunur
+        quoted[-1] += "*"
+    query = "{" + " ".join(TEXT_COLUMNS) + "} : (" + " ".join(quoted) + ")"
+    sets = [s for s in (sets or []) if s in SEARCH_SETS]
+    if sets:
+        query += " AND kind : (" + " OR ".join(f'"{s}"' for s in sets) + ")"
+    return query
+
+
+def make_snippet(texts, terms, words=SNIPPET_WORDS):
+    """İlk eşleşmenin çevresinden HTML-güvenli kısa alıntı; terimler <mark> ile işaretlenir.
+
+    FTS5 snippet() sıralanan her satır için çalıştığından genel terimlerde yüzlerce
+    ms sürüyordu; alıntı sadece sayfadaki kayıtlar için burada üretilir."""
+    if not terms:
+        return ""
+    # Son terim önek olarak arandığı için kelimenin geri kalanı da işaretlenir
+    alternatives = [re.escape(term) for term in terms[:-1]] + [re.escape(terms[-1]) + r"\w*"]
+    pattern = re.compile(r"\b(?:" + "|".join(alternatives) + r")\b", re.IGNORECASE)
+    for text in texts:
+        text = " ".join(str(text or "").split())
+        match = pattern.search(text)
+        if not match:
+            continue
+        tokens = text.split(" ")
+        index = len(text[:match.start()].split(" ")) - 1
+        start = max(0, index - words // 3)
+        window = " ".join(tokens[start:start + words])
+        parts, last = [], 0
+        for m in pattern.finditer(window):
+            parts.append(html.escape(window[last:m.start()]))
+            parts.append(f"<mark>{html.escape(m.group(0))}</mark>")
+            last = m.end()
+        parts.append(html.escape(window[last:]))
+        prefix = "…" if start > 0 else ""
+        suffix = "…" if start + words < len(tokens) else ""
+        return prefix + "".join(parts) + suffix
+    return ""
+
+
+def result_set(collection, status):
+    """Kaydın ait olduğu arama kümesi"""
+    if collection == "posted":
+        return "deleted" if status == "deleted" else "posted"
+    return collection
+
+
+class SearchIndex:
+    def __init__(self, store, rank_window=None):
+        self.store = store
+        self.rank_window = max(0, rank_window if rank_window is not None else _env_number('SEARCH_RANK_WINDOW', 10000))
+        self._build_lock = threading.Lock()
+        self._built = False
+        self._stats = {"queries": 0, "query_seconds": 0.0, "rebuilds": 0}
+        self._init_table()
+
+    def _log(self, message, level="info"):
+        """Arama indeksi logları"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        prefix = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"}.get(level, "ℹ️")
+        print(f"{prefix} [{timestamp}] [SearchIndex] {message}")
+
+    def _init_table(self):
+        """Tablo ve tetikleyiciler yoksa oluştur"""
+        conn = self.store._conn()
+        with conn:
+            self._create_schema(conn)
+
+    def _create_schema(self, conn):
+        """FTS5 tablosunu ve articles tetikleyicilerini oluştur (çağıranın transaction'ında)"""
+        columns = ", ".join(SEARCH_COLUMNS)
+        new_values = ", ".join(_column_values("new"))
+        conn.execute(f'''
+            CREATE VIRTUAL TABLE IF NOT EXISTS articles_search USING fts5(
+                {columns}, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+            )
+        ''')
+        # INSERT OR REPLACE, REPLACE ile silinen satır için DELETE tetikleyicisi
+        # çalıştırmaz (recursive_triggers kapalı); eski girdi BEFORE INSERT'te düşülür
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS articles_search_bi BEFORE INSERT ON articles BEGIN
+                DELETE FROM articles_search WHERE rowid = (
+                    SELECT rowid FROM articles WHERE collection = new.collection AND position = new.position
+                );
+            END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS articles_search_ai AFTER INSERT ON articles BEGIN
+                INSERT INTO articles_search (rowid, {columns}) VALUES (new.rowid, {new_values});
+            END
+        ''')
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS articles_search_ad AFTER DELETE ON articles BEGIN
+                DELETE FROM articles_search WHERE rowid = old.rowid;
+            END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS articles_search_au AFTER UPDATE ON articles BEGIN
+                DELETE FROM articles_search WHERE rowid = old.rowid;
+                INSERT INTO articles_search (rowid, {columns}) VALUES (new.rowid, {new_values});
+            END
+        ''')
+
+    # ------------------------------------------------------------------
+    # Kurulum
+    # ------------------------------------------------------------------
+    def rebuild(self):
+        """İndeksi articles tablosundan baştan kur - indekslenen kayıt sayısını döndürür"""
+        for collection in STORE_COLLECTIONS.values():
+            self.store.ensure_migrated(collection)
+        conn = self.store._conn()
+        columns = ", ".join(SEARCH_COLUMNS)
+        started = time.perf_counter()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # Tablo ve tetikleyiciler eski tanımlarla kalmasın
+            for trigger in ("bi", "ai", "ad", "au"):
+                conn.execute(f"DROP TRIGGER IF EXISTS articles_search_{trigger}")
+            conn.execute("DROP TABLE IF EXISTS articles_search")
+            self._create_schema(conn)
+            conn.execute(f"INSERT INTO articles_search (rowid, {columns}) "
+                         f"SELECT a.rowid, {', '.join(_column_values('a'))} FROM articles a")
+            conn.execute("INSERT INTO articles_search (articles_search) VALUES ('optimize')")
+            conn.execute("INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)",
+                         ("search_index_version", SEARCH_INDEX_VERSION))
+            count = conn.execute("SELECT count(*) FROM articles_search").fetchone()[0]
+        self._built = True
+        self._stats["rebuilds"] += 1
+        self._log(f"Arama indeksi {count} kayıttan kuruldu ({time.perf_counter() - started:.2f}s)", "success")
+        return count
+
+    def ensure_built(self):
+        """İndeks hiç kurulmadıysa (veya tanımlar değiştiyse) kur"""
+        if self._built:
+            return
+        with self._build_lock:
+            if self._built:
+                return
+            for collection in STORE_COLLECTIONS.values():
+                self.store.ensure_migrated(collection)
+            row = self.store._conn().execute(
+                "SELECT value FROM store_meta WHERE key = 'search_index_version'"
+            ).fetchone()
+            if row and row[0] == SEARCH_INDEX_VERSION:
+                self._built = True
+                return
+            self.rebuild()
+
+    # ------------------------------------------------------------------
+    # Arama
+    # ------------------------------------------------------------------
+    def search(self, text, sets=None, cursor=None, limit=20):
+        """Sıralı ve sayfalı arama: {"items", "next_cursor", "total", "ranked", "took_ms"}
+
+        sets: SEARCH_SETS anahtarlarından liste (boşsa hepsi). cursor bir önceki
+        sayfanın next_cursor değeridir."""
+        started = time.perf_counter()
+        match = build_match_query(text, sets)
+        if match is None:
+            return {"items": [], "next_cursor": None, "total": 0, "ranked": 0, "took_ms": 0.0}
+        self.ensure_built()
+        limit = max(1, min(int(limit or 20), SEARCH_MAX_LIMIT))
+
+        conn = self.store._conn()
+        total = conn.execute("SELECT count(*) FROM articles_search WHERE articles_search MATCH ?",
+                             (match,)).fetchone()[0]
+
+        # bm25 eşleşme sayısıyla orantılı maliyetlidir; çok genel terimlerde sadece en
+        # yeni rank_window eşleşme sıralanır (taban rowid imleçte taşınır, sayfalar tutarlı kalır)
+        after = decode_cursor(cursor)
+        if after is not None and isinstance(after[0], list) and len(after[0]) == 2:
+            (after_score, floor), after_rowid = after
+        else:
+            after_score = after_rowid = None
+            floor = 0
+            if self.rank_window and total > self.rank_window:
+                row = conn.execute("SELECT rowid FROM articles_search WHERE articles_search MATCH ? "
+                                   "ORDER BY rowid DESC LIMIT 1 OFFSET ?", (match, self.rank_window - 1)).fetchone()
+                floor = row[0] if row else 0
+
+        score = f"bm25(articles_search, {', '.join(str(w) for w in SEARCH_WEIGHTS)})"
+        where, params = "articles_search MATCH ?", [match]
+        if floor:
+            where += " AND rowid >= ?"
+            params.append(floor)
+        if after_rowid is not None:
+            # bm25 küçük = daha alakalı; (skor, rowid) ile kaldığı yerden devam
+            where += f" AND ({score} > ? OR ({score} = ? AND rowid > ?))"
+            params.extend([after_score, after_score, after_rowid])
+        # Önce sadece sayfa seçilir; kayıt alanları yalnızca bu satırlar için okunur
+        rows = conn.execute(
+            f"SELECT a.rowid, a.collection, a.position, a.status, a.title, a.body, a.source, a.sort_date, a.url, "
+            f"page.score, articles_search.content FROM ("
+            f"  SELECT rowid, {score} AS score FROM articles_search WHERE {where} ORDER BY score, rowid LIMIT ?"
+            f") AS page JOIN articles a ON a.rowid = page.rowid "
+            f"JOIN articles_search ON articles_search.rowid = page.rowid ORDER BY page.score, page.rowid",
+            [*params, limit + 1]
+        ).fetchall()
+        terms = query_terms(text)
+
+        items = []
+        for rowid, collection, position, status, title, body, source, sort_date, url, rank, content in rows[:limit]:
+            items.append({
+                "set": result_set(collection, status),
+                "collection": collection,
+                "position": position,
+                "status": status,
+                "title": title,
+                "body": body,
+                "source": source,
+                "date": sort_date,
+                "url": url,
+                "score": round(-rank, 4),
+                "snippet": make_snippet((body, content, title), terms),
+            })
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor([[last[9], floor], last[0]])
+
+        elapsed = time.perf_counter() - started
+        self._stats["queries"] += 1
+        self._stats["query_seconds"] += elapsed
+        return {"items": items, "next_cursor": next_cursor, "total": total,
+                "ranked": min(total, self.rank_window) if floor else total,
+                "took_ms": round(elapsed * 1000, 2)}
+
+    def stats(self):
+        """İndeks boyutu ve sorgu süreleri"""
+        indexed = self.store._conn().execute("SELECT count(*) FROM articles_search").fetchone()[0]
+        queries = self._stats["queries"]
+        return {
+            "indexed": indexed,
+            "rank_window": self.rank_window,
+            "queries": queries,
+            "rebuilds": self._stats["rebuilds"],
+            "avg_query_ms": round(self._stats["query_seconds"] * 1000 / queries, 2) if queries else 0.0,
+        }
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_search_index(store=None):
+    """Süreç genelinde tek SearchIndex örneği (varsayılan: ortak makale deposu)"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                if store is None:
+                    from article_store import get_article_store
+                    store = get_article_store()
+                _index = SearchIndex(store)
+    return _index
+
+
+if __name__ == "__main__":
+    # python search_index.py rebuild | python search_index.py "sorgu"
+    index = get_search_index()
+    if len(sys.argv) > 1 and sys.argv[1] == "rebuild":
+        index.rebuild()
+        sys.exit(0)
+    query = " ".join(sys.argv[1:])
+    result = index.search(query, limit=10)
+    print(f"🔎 '{query}': {result['total']} sonuç ({result['took_ms']} ms)")
+    for item in result["items"]:
+        print(f"  [{item['set']}] {item['score']:.2f} {item['title'][:80]}")
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kalıcı URL / Hash Görülme İndeksi
+Paylaşılan, onay bekleyen ve reddedilen makalelerin URL, kanonik URL ve
+başlık hash'lerini tek bir kümede tutar. Süreç başına bir kez yüklenir,
+kayıt eklendikçe artımlı olarak güncellenir ve O(1) is_seen() sağlar.
+
+Depodan kaldırılan kayıtların anahtarları, kayıt başka bir koleksiyonda hâlâ
+duruyorsa o koleksiyonun durumuna çekilir, hiçbir yerde yoksa silinir; böylece
+silinen bekleyen tweet ya da kaldırılan reddedilmiş makale tekrar çekilebilir.
+"""
+
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from article_store import ARTICLE_STORE_DB, STORE_COLLECTIONS, get_article_store, is_store_enabled
+
+SEEN_INDEX_DB = os.environ.get('SEEN_INDEX_DB', ARTICLE_STORE_DB)
+
+# İndekslenen koleksiyonlar -> durum
+SEEN_STATUSES = ("posted", "pending", "rejected")
+
+# Depo koleksiyonu -> indeksteki durum (arşivlenen tweet paylaşılmış sayılır)
+COLLECTION_STATUS = {"posted": "posted", "pending": "pending", "rejected": "rejected", "archived": "posted"}
+
+# Diğer süreçlerin (start_scheduler.py) eklediği anahtarları çekme aralığı
+REFRESH_INTERVAL = 5
+
+TRACKING_PARAMS = re.compile(r'^(utm_\w+|ref|ref_src|fbclid|gclid|mc_cid|mc_eid|guccounter|source)$', re.IGNORECASE)
+
+
+def canonicalize_url(url):
+    """URL'yi karşılaştırma için kanonik hale getir (www, fragment, utm_*, sondaki /)"""
+    if not url:
+        return ""
+    try:
+        parts = urlsplit(url.strip())
+        netloc = parts.netloc.lower()
+        if netloc.startswith("www."):
+            netloc = netloc[4:]
+        path = parts.path.rstrip('/') or '/'
+        query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                           if not TRACKING_PARAMS.match(k)])
+        scheme = (parts.scheme or 'https').lower()
+        if scheme == 'http':
+            scheme = 'https'
+        return urlunsplit((scheme, netloc, path, query, ''))
+    except Exception:
+        return url.strip().lower()
+
+
+def title_hash(title):
+    """Repo genelinde kullanılan başlık hash'i (md5)"""
+    if not title:
+        return ""
+    return hashlib.md5(title.encode()).hexdigest()
+
+
+def _record_article(record):
+    """pending kayıtlarında makale 'article' altında tutulur"""
+    if isinstance(record, dict) and isinstance(record.get('article'), dict):
+        return record['article'], record
+    return record if isinstance(record, dict) else {}, record if isinstance(record, dict) else {}
+
+
+def _record_keys(record):
+    """Kayıttan indeks anahtarlarını ve tarihini çıkar"""
+    article, outer = _record_article(record)
+    keys = []
+    url = article.get('url', '')
+    if url:
+        keys.append("u:" + url)
+        keys.append("c:" + canonicalize_url(url))
+    if article.get('hash'):
+        keys.append("h:" + article['hash'])
+    if article.get('title'):
+        keys.append("h:" + title_hash(article['title']))
+    seen_at = (outer.get('posted_date') or outer.get('created_at') or outer.get('rejected_at')
+               or article.get('posted_date') or article.get('fetch_date') or datetime.now().isoformat())
+    return keys, str(seen_at)
+
+
+def _parse_date(value):
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00').replace('+00:00', ''))
+    except Exception:
+        return None
+
+
+class SeenIndex:
+    def __init__(self, db_path=None):
+        self.db_path = db_path or SEEN_INDEX_DB
+        self._keys = {}  # key -> (seen_at, status)
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._building = False
+        self._last_rowid = 0
+        self._last_refresh = 0
+        self._generation = None
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA busy_timeout = 30000")
+        return conn
+
+    def _init_table(self, conn):
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS seen_keys (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                key TEXT UNIQUE NOT NULL,
+                seen_at TEXT,
+                status TEXT
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS store_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        ''')
+
+    # ------------------------------------------------------------------
+    # Yükleme
+    # ------------------------------------------------------------------
+    def load(self):
+        """İndeksi süreç başına bir kez yükle; ilk kullanımda geçmişten oluştur"""
+        if self._loaded:
+            return
+        with self._lock:
+            # Yeniden oluşturma sırasında depo dinleyicisinden tekrar girişi önle
+            if self._loaded or self._building:
+                return
+            self._building = True
+            try:
+                with self._connect() as conn:
+                    self._init_table(conn)
+                    built = conn.execute("SELECT value FROM store_meta WHERE key = 'seen_index_built'").fetchone()
+                if not built:
+                    self.rebuild()
+                else:
+                    self._pull_new_rows()
+                self._loaded = True
+                self._last_refresh = time.time()
+            finally:
+                self._building = False
+
+    def rebuild(self):
+        """posted/pending/rejected koleksiyonlarından indeksi baştan oluştur"""
+        from utils import load_json
+
+        # Öncelik sırasıyla: sonra gelen durum öncekinin üzerine yazar
+        sources = (
+            ("archived", "archived_articles.json"),
+            ("rejected", "rejected_articles.json"),
+            ("pending", "pending_tweets.json"),
+            ("posted", "posted_articles.json"),
+        )
+        with self._lock:
+            self._keys = {}
+            for collection, path in sources:
+                status = COLLECTION_STATUS[collection]
+                for record in load_json(path, []):
+                    keys, seen_at = _record_keys(record)
+                    for key in keys:
+                        self._keys[key] = (seen_at, status)
+            rows = [(key, seen_at, status) for key, (seen_at, status) in self._keys.items()]
+            with self._connect() as conn:
+                self._init_table(conn)
+                conn.execute("DELETE FROM seen_keys")
+                conn.executemany("INSERT OR REPLACE INTO seen_keys (key, seen_at, status) VALUES (?, ?, ?)", rows)
+                conn.execute("INSERT OR REPLACE INTO store_meta (key, value) VALUES ('seen_index_built', ?)",
+                             (datetime.now().isoformat(),))
+                self._last_rowid = conn.execute("SELECT COALESCE(MAX(id), 0) FROM seen_keys").fetchone()[0]
+                self._generation = self._bump_generation(conn)
+        return len(rows)
+
+    def _bump_generation(self, conn):
+        """Anahtar silindiğini diğer süreçlere bildir - sayaç değişince tablo yeniden okunur"""
+        conn.execute("INSERT OR IGNORE INTO store_meta (key, value) VALUES ('seen_index_generation', '0')")
+        conn.execute("UPDATE store_meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'seen_index_generation'")
+        return conn.execute("SELECT value FROM store_meta WHERE key = 'seen_index_generation'").fetchone()[0]
+
+    def _pull_new_rows(self):
+        """Son okumadan sonra eklenen satırları belleğe al (başka süreçler için).
+
+        Başka bir süreç anahtar sildiyse (nesil sayacı değiştiyse) tablo baştan okunur."""
+        with self._connect() as conn:
+            self._init_table(conn)
+            row = conn.execute("SELECT value FROM store_meta WHERE key = 'seen_index_generation'").fetchone()
+            generation = row[0] if row else '0'
+            if self._generation is not None and generation != self._generation:
+                self._keys = {}
+                self._last_rowid = 0
+            rows = conn.execute("SELECT id, key, seen_at, status FROM seen_keys WHERE id > ? ORDER BY id",
+                                (self._last_rowid,)).fetchall()
+        self._generation = generation
+        for rowid, key, seen_at, status in rows:
+            self._keys[key] = (seen_at, status)
+            self._last_rowid = rowid
+
+    def refresh(self, force=False):
+        """Diğer süreçlerin eklediği anahtarları çek - REFRESH_INTERVAL ile sınırlı"""
+        self.load()
+        if not force and time.time() - self._last_refresh < REFRESH_INTERVAL:
+            return
+        with self._lock:
+            try:
+                self._pull_new_rows()
+            except Exception as e:
+                print(f"⚠️ Görülme indeksi yenileme hatası: {e}")
+            self._last_refresh = time.time()
+
+    # ------------------------------------------------------------------
+    # Sorgulama
+    # ------------------------------------------------------------------
+    def lookup(self, url=None, title=None, hash_value=None, within_hours=None, statuses=None):
+        """Eşleşen ilk anahtarın durumunu döndür (posted/pending/rejected) ya da None"""
+        self.refresh()
+        candidates = []
+        if url:
+            candidates.append("u:" + url)
+            candidates.append("c:" + canonicalize_url(url))
+        if hash_value:
+            candidates.append("h:" + hash_value)
+        if title:
+            candidates.append("h:" + title_hash(title))
+
+        cutoff = datetime.now() - timedelta(hours=within_hours) if within_hours else None
+        for key in candidates:
+            entry = self._keys.get(key)
+            if not entry:
+                continue
+            seen_at, status = entry
+            if statuses and status not in statuses:
+                continue
+            if cutoff:
+                seen_date = _parse_date(seen_at)
+                # Tarih parse edilemezse duplikat say
+                if seen_date and seen_date < cutoff:
+                    continue
+            return status
+        return None
+
+    def is_seen(self, url=None, title=None, hash_value=None, within_hours=None, statuses=None):
+        """URL, kanonik URL veya başlık hash'i daha önce görüldü mü - O(1)"""
+        return self.lookup(url, title, hash_value, within_hours, statuses) is not None
+
+    # ------------------------------------------------------------------
+    # Güncelleme
+    # ------------------------------------------------------------------
+    def add(self, record, status):
+        """Tek kaydı indekse ekle"""
+        self.add_many([record], status)
+
+    def add_many(self, records, status):
+        """Kayıtları indekse ekle - sadece yeni veya durumu değişen anahtarlar yazılır"""
+        self.load()
+        rows = []
+        with self._lock:
+            for record in records:
+                keys, seen_at = _record_keys(record)
+                for key in keys:
+                    current = self._keys.get(key)
+                    if current and current[1] == status and current[0] >= seen_at:
+                        continue
+                    # Paylaşılmış makale başka bir duruma düşürülmez
+                    if current and current[1] == "posted" and status != "posted":
+                        continue
+                    self._keys[key] = (seen_at, status)
+                    rows.append((key, seen_at, status))
+            if not rows:
+                return 0
+            try:
+                with self._connect() as conn:
+                    self._init_table(conn)
+                    conn.executemany("INSERT OR REPLACE INTO seen_keys (key, seen_at, status) VALUES (?, ?, ?)", rows)
+            except Exception as e:
+                print(f"⚠️ Görülme indeksi yazma hatası: {e}")
+        return len(rows)
+
+    def forget_many(self, records, collection):
+        """Koleksiyondan kaldırılan kayıtların anahtarlarını düşür.
+
+        Sadece bu koleksiyonun durumundaki anahtarlara dokunulur. Kayıt depoda
+        hâlâ bulunuyorsa (yeri kaymış ya da başka koleksiyona taşınmış) anahtarlar
+        o kaydın durumuna çekilir, hiçbir koleksiyonda yoksa silinir."""
+        status = COLLECTION_STATUS.get(collection)
+        if not status:
+            return 0
+        self.load()
+        deleted, moved = [], []
+        with self._lock:
+            for record in records:
+                keys, _ = _record_keys(record)
+                keys = [key for key in keys if key in self._keys and self._keys[key][1] == status]
+                if not keys:
+                    continue
+                holder = self._find_holder(record)
+                for key in keys:
+                    if holder is None:
+                        del self._keys[key]
+                        deleted.append(key)
+                    elif self._keys[key] != holder:
+                        self._keys[key] = holder
+                        moved.append((key, *holder))
+            if not deleted and not moved:
+                return 0
+            try:
+                with self._connect() as conn:
+                    self._init_table(conn)
+                    conn.executemany("DELETE FROM seen_keys WHERE key = ?", [(key,) for key in deleted])
+                    conn.executemany("INSERT OR REPLACE INTO seen_keys (key, seen_at, status) VALUES (?, ?, ?)", moved)
+                    if deleted:
+                        generation = self._bump_generation(conn)
+                    self._last_rowid = max(self._last_rowid, conn.execute(
+                        "SELECT COALESCE(MAX(id), 0) FROM seen_keys").fetchone()[0])
+                if deleted:
+                    self._generation = generation
+            except Exception as e:
+                print(f"⚠️ Görülme indeksi silme hatası: {e}")
+        return len(deleted) + len(moved)
+
+    def _find_holder(self, record):
+        """Kaydı (URL ya da hash ile) hâlâ tutan koleksiyonun (seen_at, durum) ikilisi"""
+        article, _ = _record_article(record)
+        url = article.get('url') or None
+        hash_value = article.get('hash') or title_hash(article.get('title')) or None
+        if not url and not hash_value:
+            return None
+        # Öncelik: paylaşılmış > beklemede > reddedilmiş
+        for collection in ("posted", "archived", "pending", "rejected"):
+            found = self._find_in_collection(collection, url, hash_value)
+            if found is not None:
+                _, seen_at = _record_keys(found)
+                return seen_at, COLLECTION_STATUS[collection]
+        return None
+
+    def _find_in_collection(self, collection, url, hash_value):
+        """Koleksiyonda URL/hash ile eşleşen kayıt - depo kapalıysa JSON dosyası taranır"""
+        if is_store_enabled():
+            _, found = get_article_store().find(collection, url=url, hash_value=hash_value)
+            return found
+        from utils import load_json
+
+        path = next(name for name, value in STORE_COLLECTIONS.items() if value == collection)
+        for record in load_json(path, []):
+            article, _ = _record_article(record)
+            if (url and url == article.get('url')) or (hash_value and hash_value == article.get('hash')):
+                return record
+        return None
+
+    def on_store_change(self, collection, records, removed=()):
+        """ArticleStore dinleyicisi - posted/pending/rejected/archived yazım ve silmelerini yakala"""
+        status = COLLECTION_STATUS.get(collection)
+        if not status:
+            return
+        if records:
+            self.add_many(records, status)
+        if removed:
+            self.forget_many(removed, collection)
+
+    def stats(self):
+        """İndeks boyutu"""
+        self.load()
+        counts = {}
+        for _, status in self._keys.values():
+            counts[status] = counts.get(status, 0) + 1
+        return {"total_keys": len(self._keys), "by_status": counts}
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_seen_index():
+    """Süreç genelinde tek SeenIndex örneği"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = SeenIndex()
+    return _index
+
+
+def is_seen(url=None, title=None, hash_value=None, within_hours=None, statuses=None):
+    """Kısayol: get_seen_index().is_seen(...)"""
+    return get_seen_index().is_seen(url, title, hash_value, within_hours, statuses)
+
+
+if __name__ == "__main__":
+    # İndeksi geçmişten yeniden oluştur: python seen_index.py
+    count = get_seen_index().rebuild()
+    print(f"✅ Görülme indeksi oluşturuldu: {count} anahtar")
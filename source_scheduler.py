@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Uyarlanabilir Kaynak Zamanlayıcısı
+news_sources.json'daki her aktif kaynak, gerçekte ne sıklıkla yayın yaptığına
+bakılmadan her çalışmada taranıyordu; tek geri bildirim success_rate'e
+yapılan +10/-20/-30 düzeltmeleriydi.
+
+SourceScheduler her kaynağın getirisini (çekim başına yeni, daha önce
+görülmemiş makale) ve yayın temposunu (saatte yeni makale, üstel hareketli
+ortalama) öğrenir ve bir sonraki çekim zamanını buna göre belirler:
+
+    - Sık yayın yapan kaynak: beklenen yeni makale sayısı hedefe ulaşınca
+      (varsayılan 1) tekrar çekilir; çekim başına üst sınıra dayanan kaynağın
+      aralığı yarıya iner
+    - Art arda boş dönen kaynak: aralık her boş çekimde ikiye katlanır
+    - Hata veren kaynak: en kısa aralıktan başlayarak üstel geri çekilme
+    - Hiçbir kaynak en uzun aralıktan daha seyrek çekilmez (tazelik sınırı)
+
+Öğrenilen durum kaynağın kendi kaydında ("schedule" alanı) tutulur ve
+news_sources.json ile birlikte kaydedilir.
+
+Ayarlar (.env):
+    SOURCE_SCHEDULE_ENABLED            - "false" ile her çalışmada tüm kaynaklar taranır (varsayılan true)
+    SOURCE_SCHEDULE_MIN_MINUTES        - en kısa çekim aralığı (varsayılan 15)
+    SOURCE_SCHEDULE_BASE_MINUTES       - tempo bilinmezken aralık (varsayılan 60)
+    SOURCE_SCHEDULE_MAX_MINUTES        - en uzun çekim aralığı (varsayılan 720)
+    SOURCE_SCHEDULE_MAX_ERROR_MINUTES  - hata geri çekilmesinin üst sınırı (varsayılan 1440)
+    SOURCE_SCHEDULE_TARGET_NEW         - çekim başına hedeflenen yeni makale (varsayılan 1)
+    SOURCE_SCHEDULE_TOLERANCE_MINUTES  - zamanı bu kadar yaklaşan kaynak da çekilir (varsayılan 5)
+"""
+
+import os
+import hashlib
+import threading
+from datetime import datetime, timedelta
+
+# Hareketli ortalamada son gözlemin ağırlığı
+EMA_ALPHA = 0.3
+# Kaynak başına hatırlanan son makale anahtarı
+RECENT_KEYS = 60
+
+
+def _env_number(name, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def is_source_schedule_enabled():
+    """SOURCE_SCHEDULE_ENABLED=false ile uyarlanabilir zamanlama kapatılır"""
+    return os.getenv('SOURCE_SCHEDULE_ENABLED', 'true').strip().lower() not in ('0', 'false', 'no', 'off')
+
+
+def article_key(article):
+    """Makalenin kaynak içi kimliği (URL, yoksa başlık üzerinden kısa hash)"""
+    raw = article.get("url") or article.get("link") or article.get("title") or ""
+    return hashlib.md5(raw.strip().encode("utf-8", "ignore")).hexdigest()[:12]
+
+
+def _parse_time(value):
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+        return parsed.replace(tzinfo=None) if parsed.tzinfo else parsed
+    except ValueError:
+        return None
+
+
+def _format_minutes(minutes):
+    if minutes is None:
+        return "-"
+    if minutes < 60:
+        return f"{minutes:.0f} dk"
+    if minutes < 1440:
+        return f"{minutes / 60:.1f} sa"
+    return f"{minutes / 1440:.1f} gün"
+
+
+class SourceScheduler:
+    def __init__(self, min_minutes=None, base_minutes=None, max_minutes=None, max_error_minutes=None,
+                 target_new=None, tolerance_minutes=None):
+        self.min_minutes = max(1.0, min_minutes or _env_number('SOURCE_SCHEDULE_MIN_MINUTES', 15, float))
+        self.base_minutes = base_minutes or _env_number('SOURCE_SCHEDULE_BASE_MINUTES', 60, float)
+        self.max_minutes = max(self.min_minutes, max_minutes or _env_number('SOURCE_SCHEDULE_MAX_MINUTES', 720, float))
+        self.max_error_minutes = max_error_minutes or _env_number('SOURCE_SCHEDULE_MAX_ERROR_MINUTES', 1440, float)
+        self.target_new = max(0.1, target_new or _env_number('SOURCE_SCHEDULE_TARGET_NEW', 1, float))
+        self.tolerance_minutes = (tolerance_minutes if tolerance_minutes is not None
+                                  else _env_number('SOURCE_SCHEDULE_TOLERANCE_MINUTES', 5, float))
+
+    # ------------------------------------------------------------------
+    # Hangi kaynaklar çekilecek
+    # ------------------------------------------------------------------
+    def is_due(self, source, now=None):
+        """Kaynağın çekim zamanı geldi mi (hiç çekilmemiş kaynak her zaman)"""
+        now = now or datetime.now()
+        next_due = _parse_time((source.get("schedule") or {}).get("next_due"))
+        return next_due is None or next_due - timedelta(minutes=self.tolerance_minutes) <= now
+
+    def split_due(self, sources, now=None):
+        """(çekilecek, bu çalışmada atlanacak) kaynak listeleri - atlananların sayacı artar"""
+        now = now or datetime.now()
+        due, waiting = [], []
+        for source in sources:
+            (due if self.is_due(source, now) else waiting).append(source)
+        for source in waiting:
+            schedule = source.setdefault("schedule", {})
+            schedule["skipped_runs"] = schedule.get("skipped_runs", 0) + 1
+        return due, waiting
+
+    # ------------------------------------------------------------------
+    # Çekim sonucu -> yeni aralık
+    # ------------------------------------------------------------------
+    def record_fetch(self, source, articles=None, status="ok", is_new=None, per_fetch_cap=None, now=None):
+        """Çekim sonucunu öğren ve bir sonraki çekim zamanını yaz
+
+        status "ok" dışındaki her değer hata sayılır. is_new(article) verilirse
+        kaynağın daha önce döndürmediği makaleler ayrıca bununla süzülür
+        (ör. paylaşılmış/reddedilmiş olanlar). Dönüş: yeni makale sayısı.
+        """
+        now = now or datetime.now()
+        schedule = source.setdefault("schedule", {})
+        last_fetch = _parse_time(schedule.get("last_fetch"))
+        previous_interval = schedule.get("interval_minutes") or self.base_minutes
+        schedule["fetches"] = schedule.get("fetches", 0) + 1
+        schedule["last_fetch"] = now.isoformat()
+
+        if status != "ok":
+            schedule["error_streak"] = schedule.get("error_streak", 0) + 1
+            interval = min(self.max_error_minutes, self.min_minutes * 2 ** schedule["error_streak"])
+            schedule["state"] = "backoff"
+            self._set_interval(schedule, interval, now, clamp=False)
+            return 0
+
+        schedule["error_streak"] = 0
+        recent = schedule.get("recent") or []
+        seen = set(recent)
+        new_keys = []
+        for article in articles or []:
+            key = article_key(article)
+            if key in seen:
+                continue
+            seen.add(key)
+            if is_new is None or is_new(article):
+                new_keys.append(key)
+            recent.insert(0, key)
+        schedule["recent"] = recent[:RECENT_KEYS]
+        new_count = len(new_keys)
+
+        schedule["last_yield"] = new_count
+        schedule["new_total"] = schedule.get("new_total", 0) + new_count
+        schedule["ema_yield"] = round(self._ema(schedule.get("ema_yield"), new_count), 3)
+        if new_count:
+            schedule["last_new_at"] = now.isoformat()
+            schedule["empty_streak"] = 0
+        else:
+            schedule["empty_streak"] = schedule.get("empty_streak", 0) + 1
+
+        # Yayın temposu: iki çekim arasında çıkan yeni makale / saat
+        if last_fetch is not None:
+            hours = max((now - last_fetch).total_seconds() / 3600, 1 / 60)
+            schedule["ema_rate_per_hour"] = round(self._ema(schedule.get("ema_rate_per_hour"), new_count / hours), 4)
+        rate = schedule.get("ema_rate_per_hour")
+
+        if rate:
+            interval = self.target_new / rate * 60
+        else:
+            interval = self.base_minutes
+        if schedule["empty_streak"]:
+            # Art arda boş çekimler: öncekinin iki katından az olmasın
+            interval = max(interval, previous_interval * 2)
+            schedule["state"] = "quiet"
+        elif per_fetch_cap and new_count >= per_fetch_cap:
+            # Kaynak çekim başına üst sınıra dayandı - arada makale kaçıyor olabilir
+            interval = min(interval, previous_interval / 2)
+            schedule["state"] = "hot"
+        else:
+            schedule["state"] = "active"
+        self._set_interval(schedule, interval, now)
+        return new_count
+
+    def _ema(self, previous, value):
+        return value if previous is None else EMA_ALPHA * value + (1 - EMA_ALPHA) * previous
+
+    def _set_interval(self, schedule, minutes, now, clamp=True):
+        if clamp:
+            minutes = min(self.max_minutes, max(self.min_minutes, minutes))
+        schedule["interval_minutes"] = round(minutes, 1)
+        schedule["next_due"] = (now + timedelta(minutes=minutes)).isoformat()
+
+    def reset(self, source):
+        """Öğrenilen durumu sil (kaynak bir sonraki çalışmada çekilir)"""
+        source.pop("schedule", None)
+
+    # ------------------------------------------------------------------
+    # Görünüm
+    # ------------------------------------------------------------------
+    def describe(self, source, now=None):
+        """/news_sources için öğrenilmiş takvim özeti"""
+        now = now or datetime.now()
+        schedule = source.get("schedule") or {}
+        next_due = _parse_time(schedule.get("next_due"))
+        interval = schedule.get("interval_minutes")
+        rate = schedule.get("ema_rate_per_hour")
+        if next_due is None:
+            next_label = "Sıradaki çalışmada"
+        elif next_due <= now:
+            next_label = "Zamanı geldi"
+        else:
+            next_label = f"{_format_minutes((next_due - now).total_seconds() / 60)} sonra"
+        return {
+            "state": schedule.get("state", "new"),
+            "interval_minutes": interval,
+            "interval_label": _format_minutes(interval) if interval else "Öğreniliyor",
+            "next_due": schedule.get("next_due"),
+            "next_due_label": next_label,
+            "due": self.is_due(source, now),
+            "fetches": schedule.get("fetches", 0),
+            "skipped_runs": schedule.get("skipped_runs", 0),
+            "ema_yield": schedule.get("ema_yield"),
+            "new_per_day": round(rate * 24, 1) if rate is not None else None,
+            "fetches_per_day": round(1440 / interval, 1) if interval else None,
+            "error_streak": schedule.get("error_streak", 0),
+            "empty_streak": schedule.get("empty_streak", 0),
+            "last_new_at": schedule.get("last_new_at"),
+        }
+
+    def overview(self, sources, now=None):
+        """Aktif kaynaklar için günlük tahmini çekim sayısı ve atlanan çalışma toplamı"""
+        now = now or datetime.now()
+        enabled = [source for source in sources if source.get("enabled", True)]
+        views = [self.describe(source, now) for source in enabled]
+        return {
+            "enabled": is_source_schedule_enabled(),
+            "fetches_per_day": round(sum(view["fetches_per_day"] or 0 for view in views), 1),
+            "learning_sources": sum(1 for view in views if view["fetches_per_day"] is None),
+            "due_now": sum(1 for view in views if view["due"]),
+            "skipped_runs": sum(view["skipped_runs"] for view in views),
+            "min_minutes": self.min_minutes,
+            "max_minutes": self.max_minutes,
+        }
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_source_scheduler():
+    """Süreç genelinde tek SourceScheduler örneği"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = SourceScheduler()
+    return _scheduler
@@ -4,13 +4,16 @@
 """
 Otomatik Tweet Zamanlayıcı Başlatıcı
 Bu script otomatik tweet paylaşım sistemini başlatır.
+
+app.py ile aynı zamanlayıcıyı (job_scheduler) kullanır: son/sonraki çalışma
+zamanları ortak tabloda tutulur ve dosya kilidi sayesinde Flask içindeki
+zamanlayıcı ile aynı anda kontrol çalıştırılmaz.
 """
 
 import os
 import sys
 import time
 from datetime import datetime
-from apscheduler.schedulers.blocking import BlockingScheduler
 import logging
 
 # Logging ayarları
@@ -23,72 +26,33 @@ logging.basicConfig(
     ]
 )
 
-def run_auto_check():
-    """Otomatik haber kontrolü ve tweet paylaşımı"""
-    try:
-        logging.info("🔄 Otomatik haber kontrolü başlatılıyor...")
-        
-        # app.py'den fonksiyonu import et
-        from app import check_and_post_articles, load_automation_settings
-        
-        # Ayarları kontrol et
-        settings = load_automation_settings()
-        if not settings.get('auto_mode', False):
-            logging.info("⏸️ Otomatik mod devre dışı, atlanıyor...")
-            return
-        
-        # Haber kontrolü yap
-        result = check_and_post_articles()
-        logging.info(f"✅ Otomatik kontrol tamamlandı: {result.get('message', 'Sonuç yok')}")
-        
-    except Exception as e:
-        logging.error(f"❌ Otomatik kontrol hatası: {e}")
-
 def main():
     """Ana zamanlayıcı fonksiyonu"""
     logging.info("🚀 AI Tweet Bot Otomatik Zamanlayıcı Başlatıldı")
     logging.info("=" * 60)
     
-    # Ayarlardan kontrol aralığını al
-    try:
-        from app import load_automation_settings
-        settings = load_automation_settings()
-        interval_hours = settings.get('check_interval_hours', 3)
-        logging.info(f"📋 Ayarlardan okunan kontrol aralığı: {interval_hours} saat")
-    except Exception as e:
-        interval_hours = 3
-        logging.warning(f"⚠️ Ayar okuma hatası, varsayılan 3 saat kullanılacak: {e}")
-    
-    # Zamanlayıcı oluştur
-    scheduler = BlockingScheduler()
+    # app.py'deki iş tanımını kullan (kontrol aralığı ayarlardan, değişiklikte yeniden planlanır)
+    from app import register_automation_jobs, load_automation_settings, AUTOMATION_JOB_ID
+    scheduler = register_automation_jobs()
     
-    # Ayarlardan okunan aralık ile çalışacak şekilde ayarla
-    scheduler.add_job(
-        run_auto_check,
-        'interval',
-        hours=interval_hours,
-        id='auto_tweet_job',
-        name='Otomatik Tweet Paylaşımı'
-    )
+    settings = load_automation_settings()
+    logging.info(f"📋 Ayarlardan okunan kontrol aralığı: {settings.get('check_interval_hours', 3)} saat")
+    if not settings.get('auto_mode', False):
+        logging.info("⏸️ Otomatik mod devre dışı, ayar açılana kadar beklenecek...")
     
-    logging.info(f"⏰ Zamanlayıcı ayarlandı: Her {interval_hours} saatte bir çalışacak")
+    job_status = scheduler.status()['jobs'].get(AUTOMATION_JOB_ID, {})
+    logging.info(f"⏰ Son kontrol: {job_status.get('last_run') or 'yok'}, sonraki kontrol: {job_status.get('next_run') or 'planlanmadı'}")
     logging.info("🛑 Durdurmak için Ctrl+C tuşlayın")
     logging.info("=" * 60)
     
     try:
-        # İlk çalışmayı hemen yap
-        logging.info("🔄 İlk kontrol başlatılıyor...")
-        run_auto_check()
-        
-        # Zamanlayıcıyı başlat
-        scheduler.start()
-        
+        scheduler.run_forever()
     except KeyboardInterrupt:
         logging.info("🛑 Zamanlayıcı kullanıcı tarafından durduruldu")
-        scheduler.shutdown()
+        scheduler.stop()
     except Exception as e:
         logging.error(f"❌ Zamanlayıcı hatası: {e}")
-        scheduler.shutdown()
+        scheduler.stop()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
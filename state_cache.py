@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Durum Dosyaları İçin Bellek İçi Önbellek
+index, api_dashboard_data, get_pending_tweets_api, rejected_articles ve
+statistics gibi route'lar her istekte aynı JSON dosyalarını / depo
+koleksiyonlarını yeniden okuyup parse ediyordu. load_json artık sonucu süreç
+genelindeki bu önbellekten alır; kayıt yalnızca kaynağı değiştiğinde yeniden
+yüklenir:
+
+    - JSON dosyaları: os.stat (mtime_ns, boyut, inode) - atomic move ile
+      yapılan her yazım inode'u da değiştirir
+    - SQLite depo koleksiyonları: PRAGMA data_version (diğer thread ve
+      süreçlerin commit'leri dahil)
+
+Önbellekteki nesne çağırana hiçbir zaman verilmez; her isabette hızlı bir
+JSON kopyası döner (copy.deepcopy'den ~3-4 kat hızlı, yeniden parse etmekten
+ucuz). Böylece çağıranların listeyi yerinde değiştirmesi önbelleği bozmaz.
+
+Ayarlar (.env):
+    STATE_CACHE_MAX_ENTRIES - önbellekte tutulacak en fazla kayıt (varsayılan 64, 0 = kapalı)
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+
+def _env_number(name, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def json_copy(value):
+    """JSON tiplerinden oluşan veriyi kopyala (dict/list yeni, yapraklar değişmez)"""
+    value_type = type(value)
+    if value_type is dict:
+        return {key: json_copy(item) for key, item in value.items()}
+    if value_type is list:
+        return [json_copy(item) for item in value]
+    return value
+
+
+def file_token(path):
+    """Dosyanın değişip değişmediğini gösteren imza - dosya yoksa None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return ("file", stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class StateCache:
+    """token_func(path) ile doğrulanan, kopya döndüren LRU önbellek"""
+
+    def __init__(self, token_func=None, max_entries=None):
+        self.token_func = token_func or file_token
+        self.max_entries = max_entries if max_entries is not None else _env_number('STATE_CACHE_MAX_ENTRIES', 64)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0, "evictions": 0,
+                       "load_seconds": 0.0, "copy_seconds": 0.0}
+        self._by_path = {}
+
+    def _log(self, message, level="info"):
+        """Önbellek logları"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        prefix = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"}.get(level, "ℹ️")
+        print(f"{prefix} [{timestamp}] [StateCache] {message}")
+
+    @property
+    def enabled(self):
+        return self.max_entries > 0
+
+    def _count(self, path, field):
+        self._stats[field] += 1
+        counters = self._by_path.setdefault(path, {"hits": 0, "misses": 0})
+        counters[field] += 1
+
+    def get(self, path, loader, variant=None):
+        """Geçerli kaydın kopyasını döndür; yoksa loader() ile yükle.
+
+        loader None döndürürse (dosya yok, okuma hatası) sonuç önbelleğe alınmaz."""
+        if not self.enabled:
+            return loader()
+
+        # İmza yüklemeden ÖNCE alınır: yükleme sırasında gelen yazım bir
+        # sonraki çağrıda farklı imza olarak görülür, eski veri kalmaz
+        token = self.token_func(path)
+        key = (path, variant)
+        if token is not None:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] == token:
+                    self._entries.move_to_end(key)
+                    self._count(path, "hits")
+                    value = entry[1]
+                else:
+                    value = None
+                    self._count(path, "misses")
+            if value is not None:
+                started = time.perf_counter()
+                result = json_copy(value)
+                with self._lock:
+                    self._stats["copy_seconds"] += time.perf_counter() - started
+                return result
+        else:
+            with self._lock:
+                self._count(path, "misses")
+
+        started = time.perf_counter()
+        value = loader()
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._stats["load_seconds"] += elapsed
+        if value is None or token is None:
+            return value
+
+        with self._lock:
+            self._entries[key] = (token, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+        return json_copy(value)
+
+    def memoize(self, name, paths, compute, extra=None):
+        """paths'teki kaynaklar (ve extra) değişmedikçe compute() sonucunu tekrar kullan"""
+        if not self.enabled:
+            return compute()
+        token = (tuple(self.token_func(path) for path in paths), extra)
+        key = (f"memo:{name}", None)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == token:
+                self._entries.move_to_end(key)
+                self._count(key[0], "hits")
+                return json_copy(entry[1])
+            self._count(key[0], "misses")
+
+        value = compute()
+        with self._lock:
+            self._entries[key] = (token, json_copy(value))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+        return value
+
+    def invalidate(self, path=None):
+        """Yolun tüm kayıtlarını (path=None ise her şeyi) düşür"""
+        with self._lock:
+            if path is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                keys = [key for key in self._entries if key[0] == path]
+                for key in keys:
+                    del self._entries[key]
+                removed = len(keys)
+            self._stats["invalidations"] += removed
+        return removed
+
+    def stats(self):
+        """İsabet oranları - toplam ve dosya bazında"""
+        with self._lock:
+            stats = dict(self._stats)
+            by_path = {path: dict(counters) for path, counters in self._by_path.items()}
+            entries = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        stats["load_seconds"] = round(stats["load_seconds"], 3)
+        stats["copy_seconds"] = round(stats["copy_seconds"], 3)
+        for counters in by_path.values():
+            total = counters["hits"] + counters["misses"]
+            counters["hit_ratio"] = round(counters["hits"] / total, 3) if total else 0.0
+        stats["entries"] = entries
+        stats["max_entries"] = self.max_entries
+        stats["by_path"] = by_path
+        return stats
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_state_cache(token_func=None):
+    """Süreç genelinde tek StateCache örneği (token_func ilk çağrıda verilir)"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = StateCache(token_func)
+    return _cache
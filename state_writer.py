@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tek Yazıcılı Durum Kuyruğu
+pending_tweets.json, posted_articles.json ve news_sources.json üzerindeki
+oku-değiştir-yaz işlemleri tek bir yazıcı thread'e küçük işlemler (mutator)
+olarak gönderilir. Yazıcı kısa bir pencere içinde biriken işlemleri dosya
+başına birleştirir:
+dosyanın kilidini alır, güncel halini bir kez okur, tüm işlemleri sırayla
+uygular ve bir kez yazar. Arayüzden art arda gelen N işlem N tam yazım yerine
+tek yazım olur; aynı anda çalışan Flask thread'leri, zamanlayıcı ve
+start_scheduler.py birbirinin güncellemesini ezemez.
+
+Süreçler arası koruma <dosya>.lock üzerindeki flock kilidiyle sağlanır.
+
+Ayarlar (.env):
+    STATE_WRITER_COALESCE_MS  - işlemleri birleştirme penceresi (varsayılan 25)
+    STATE_WRITER_LOCK_TIMEOUT - dosya kilidi bekleme süresi (varsayılan 30 sn)
+"""
+
+import os
+import copy
+import time
+import queue
+import atexit
+import threading
+from concurrent.futures import Future
+from datetime import datetime
+
+from job_scheduler import FileLock
+
+# Tek yazıcı üzerinden yönetilen dosyalar
+STATE_WRITER_PATHS = ("pending_tweets.json", "posted_articles.json", "news_sources.json")
+
+# Bir birleştirmede en fazla işlem
+MAX_BATCH_OPERATIONS = 500
+
+_REPLACE = "replace"
+_APPEND = "append"
+_EXTEND = "extend"
+_MUTATE = "mutate"
+
+
+def _env_number(name, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def is_managed_path(path):
+    """Dosya tek yazıcı kuyruğundan mı geçiyor?"""
+    if not path:
+        return False
+    normalized = os.path.normpath(str(path))
+    return os.path.dirname(normalized) in ('', '.') and os.path.basename(normalized) in STATE_WRITER_PATHS
+
+
+class _Operation:
+    __slots__ = ("path", "kind", "payload", "default", "future")
+
+    def __init__(self, path, kind, payload, default):
+        self.path = path
+        self.kind = kind
+        self.payload = payload
+        self.default = default
+        self.future = Future()
+
+
+class StateWriter:
+    """loader(path, default) / saver(path, data) / appender(path, records) ile çalışan tek yazıcı"""
+
+    def __init__(self, loader, saver, appender=None, coalesce_ms=None, lock_timeout=None):
+        self.loader = loader
+        self.saver = saver
+        self.appender = appender
+        self.coalesce = max(0, coalesce_ms if coalesce_ms is not None else _env_number('STATE_WRITER_COALESCE_MS', 25)) / 1000.0
+        self.lock_timeout = lock_timeout if lock_timeout is not None else _env_number('STATE_WRITER_LOCK_TIMEOUT', 30, float)
+        self._queue = queue.Queue()
+        self._held_paths = set()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {"operations": 0, "writes": 0, "append_writes": 0, "failed_operations": 0,
+                       "max_batch": 0, "lock_wait_seconds": 0.0}
+
+    def _log(self, message, level="info"):
+        """Yazıcı logları"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        prefix = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"}.get(level, "ℹ️")
+        print(f"{prefix} [{timestamp}] [StateWriter] {message}")
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="StateWriter", daemon=True)
+                self._thread.start()
+
+    def _in_writer_thread(self):
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    # ------------------------------------------------------------------
+    # İşlem gönderme
+    # ------------------------------------------------------------------
+    def submit(self, path, kind, payload, default=None):
+        """İşlemi kuyruğa ekle, Future döndür"""
+        operation = _Operation(path, kind, payload, default)
+        if self._in_writer_thread():
+            # Mutator içinden gelen iç içe çağrı - kuyruğu beklemeden uygula
+            self._apply(path, [operation])
+            return operation.future
+        self._ensure_thread()
+        self._queue.put(operation)
+        return operation.future
+
+    def update(self, path, mutator, default=None, wait=True, timeout=None):
+        """mutator(data) güncel veri üzerinde çalışır (yerinde değiştirir); dönüş değeri çağırana iletilir"""
+        future = self.submit(path, _MUTATE, mutator, default)
+        return future.result(timeout) if wait else future
+
+    def append(self, path, record, wait=True, timeout=None):
+        """Listeye tek kayıt ekle"""
+        future = self.submit(path, _APPEND, record, [])
+        return future.result(timeout) if wait else future
+
+    def extend(self, path, records, wait=True, timeout=None):
+        """Listeye birden çok kaydı tek işlemde ekle"""
+        future = self.submit(path, _EXTEND, list(records), [])
+        return future.result(timeout) if wait else future
+
+    def replace(self, path, data, wait=True, timeout=None):
+        """Dosyanın tamamını yaz (save_json uyumluluğu) - diğer işlemlerle sıralı"""
+        future = self.submit(path, _REPLACE, data)
+        return future.result(timeout) if wait else future
+
+    def flush(self, timeout=None):
+        """Kuyruktaki tüm işlemler yazılana kadar bekle"""
+        if self._thread is None or self._in_writer_thread():
+            return
+        self.submit(None, _MUTATE, None).result(timeout)
+
+    # ------------------------------------------------------------------
+    # Yazıcı thread'i
+    # ------------------------------------------------------------------
+    def _collect_batch(self):
+        batch = [self._queue.get()]
+        deadline = time.time() + self.coalesce
+        while len(batch) < MAX_BATCH_OPERATIONS:
+            remaining = deadline - time.time()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect_batch()
+            # Dosya başına grupla, sıra korunur
+            grouped = {}
+            for operation in batch:
+                grouped.setdefault(operation.path, []).append(operation)
+            for path, operations in grouped.items():
+                if path is None:
+                    for operation in operations:
+                        operation.future.set_result(None)
+                    continue
+                self._apply(path, operations)
+            with self._stats_lock:
+                self._stats["max_batch"] = max(self._stats["max_batch"], len(batch))
+
+    def _apply(self, path, operations):
+        """Kilidi al, bir kez oku, işlemleri uygula, bir kez yaz"""
+        with self._stats_lock:
+            self._stats["operations"] += len(operations)
+
+        # İç içe çağrıda kilit zaten bu thread'de
+        lock = None if path in self._held_paths else FileLock(f"{path}.lock")
+        if lock is not None:
+            wait_started = time.time()
+            if not lock.acquire(timeout=self.lock_timeout):
+                error = TimeoutError(f"{path} kilidi {self.lock_timeout:.0f} sn içinde alınamadı")
+                self._fail(operations, error)
+                return
+            self._held_paths.add(path)
+            with self._stats_lock:
+                self._stats["lock_wait_seconds"] += time.time() - wait_started
+
+        try:
+            if self.appender is not None and all(op.kind in (_APPEND, _EXTEND) for op in operations):
+                # Sadece ekleme varsa dosyanın tamamı okunmaz
+                records = []
+                for operation in operations:
+                    if operation.kind == _EXTEND:
+                        records.extend(operation.payload)
+                    else:
+                        records.append(operation.payload)
+                self.appender(path, records)
+                with self._stats_lock:
+                    self._stats["append_writes"] += 1
+                for operation in operations:
+                    operation.future.set_result(True)
+                return
+
+            data = None
+            loaded = False
+            results = []
+            for operation in operations:
+                if operation.kind == _REPLACE:
+                    data = operation.payload
+                    loaded = True
+                    results.append((operation, None, None))
+                    continue
+                if not loaded:
+                    default = operation.default if operation.default is not None else []
+                    data = self.loader(path, copy.deepcopy(default))
+                    loaded = True
+                try:
+                    if operation.kind == _APPEND:
+                        data.append(operation.payload)
+                        results.append((operation, True, None))
+                    elif operation.kind == _EXTEND:
+                        data.extend(operation.payload)
+                        results.append((operation, True, None))
+                    else:
+                        # Hata veren mutator yarım değişikliğini yazdırmasın - kopyada çalışır
+                        working = copy.deepcopy(data)
+                        result = operation.payload(working)
+                        data = working
+                        results.append((operation, result, None))
+                except Exception as e:
+                    results.append((operation, None, e))
+
+            self.saver(path, data)
+            with self._stats_lock:
+                self._stats["writes"] += 1
+            for operation, result, error in results:
+                if error is not None:
+                    with self._stats_lock:
+                        self._stats["failed_operations"] += 1
+                    operation.future.set_exception(error)
+                else:
+                    operation.future.set_result(result)
+        except Exception as e:
+            self._log(f"{path} yazılamadı: {e}", "error")
+            self._fail([op for op in operations if not op.future.done()], e)
+        finally:
+            if lock is not None:
+                self._held_paths.discard(path)
+                lock.release()
+
+    def _fail(self, operations, error):
+        with self._stats_lock:
+            self._stats["failed_operations"] += len(operations)
+        for operation in operations:
+            operation.future.set_exception(error)
+
+    def stats(self):
+        """İşlem/yazım sayaçları - operations / writes birleştirme oranını gösterir"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        total_writes = stats["writes"] + stats["append_writes"]
+        stats["lock_wait_seconds"] = round(stats["lock_wait_seconds"], 3)
+        stats["coalesce_ratio"] = round(stats["operations"] / total_writes, 2) if total_writes else 0.0
+        stats["queued"] = self._queue.qsize()
+        stats["managed_paths"] = list(STATE_WRITER_PATHS)
+        return stats
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_state_writer(loader=None, saver=None, appender=None):
+    """Süreç genelinde tek StateWriter örneği (ilk çağrıda loader/saver verilmeli)"""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                if loader is None or saver is None:
+                    raise RuntimeError("StateWriter ilk kullanımda loader ve saver gerektirir")
+                _writer = StateWriter(loader, saver, appender)
+                atexit.register(_flush_on_exit)
+    return _writer
+
+
+def _flush_on_exit():
+    """Süreç kapanırken kuyruğu boşalt (wait=False gönderilen işlemler kaybolmasın)"""
+    if _writer is not None:
+        try:
+            _writer.flush(timeout=10)
+        except Exception:
+            pass
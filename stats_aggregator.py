@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Artımlı İstatistik Sayaçları
+get_data_statistics ve get_posted_articles_summary her çağrıda tüm paylaşılan
+makaleleri dolaşıp tarihleri datetime.fromisoformat ile parse ediyordu.
+Bu modül makale deposundaki (articles.db) her yazımı aynı transaction içinde
+yakalar ve stats_counters tablosundaki sayaçları günceller:
+
+    (koleksiyon, metrik, gün, boyut) -> değer
+
+gün boş ise sayaç tüm zamanlara aittir; boyut kaynak, çekme yöntemi, kategori,
+dil gibi kırılımları tutar. Panel ve /statistics artık makale sayısıyla değil
+gün sayısıyla orantılı okuma yapar.
+
+Sayaçlar kayıtlardan türetildiği için her zaman yeniden kurulabilir:
+
+    python stats_aggregator.py rebuild   # geçmişten yeniden hesapla, farkları raporla
+    python stats_aggregator.py verify    # sadece karşılaştır
+"""
+
+import sys
+import json
+import threading
+from collections import Counter
+from datetime import datetime, date, timedelta
+
+from article_store import STORE_COLLECTIONS
+
+# Sayaç tanımları değişirse artırılır - tablo bir sonraki açılışta yeniden kurulur
+AGGREGATOR_VERSION = "2"
+
+# Koleksiyon -> olay tarihinin okunduğu alanlar (ilk dolu alan kullanılır)
+EVENT_DATE_FIELDS = {
+    "pending": ("created_date", "created_at"),
+    "rejected": ("rejected_at", "rejected_date"),
+    "deleted": ("deleted_date",),
+    "archived": ("archived_at", "archived_date"),
+}
+
+
+def parse_day(value):
+    """ISO tarih metnini 'YYYY-MM-DD' gününe çevir - parse edilemezse None"""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value).date().isoformat()
+    except (ValueError, TypeError):
+        return None
+
+
+def _field(record, name):
+    """Alanı kayıttan, yoksa iç içe article sözlüğünden al"""
+    value = record.get(name)
+    if value in (None, ""):
+        article = record.get('article')
+        if isinstance(article, dict):
+            value = article.get(name)
+    return value
+
+
+def _source(record):
+    return str(_field(record, 'source') or "Bilinmiyor")
+
+
+def _method(record):
+    return str(_field(record, 'fetch_method') or _field(record, 'post_method') or "unknown")
+
+
+def is_github_record(record):
+    return record.get('type') == 'github_repo' or record.get('source_type') == 'github'
+
+
+def github_language(record):
+    if 'repo_data' in record and isinstance(record['repo_data'], dict):
+        return record['repo_data'].get('language', 'Unknown')
+    if 'language' in record:
+        return record['language']
+    return 'Unknown'
+
+
+def _posted_contributions(record, counts):
+    deleted = bool(record.get("deleted", False))
+    posted_day = parse_day(record.get("posted_date"))
+
+    counts[("total", "", "")] += 1
+    counts[("category", "", str(record.get("category", "Genel")))] += 1
+    score = record.get("score", 0)
+    if isinstance(score, (int, float)) and not isinstance(score, bool) and score > 0:
+        counts[("score", "", repr(score))] += 1
+    if posted_day:
+        # Silinmişler dahil - 7 günlük özet için
+        counts[("posted_any", posted_day, "")] += 1
+
+    if deleted:
+        counts[("deleted", "", "")] += 1
+        deleted_day = parse_day(record.get("deleted_date"))
+        if deleted_day:
+            counts[("deleted", deleted_day, "")] += 1
+    else:
+        counts[("active", "", "")] += 1
+        if posted_day:
+            counts[("posted", posted_day, "")] += 1
+            counts[("posted_by_source", posted_day, _source(record))] += 1
+            counts[("posted_by_method", posted_day, _method(record))] += 1
+        if record.get('source_type', 'news') == 'news' or record.get('type') != 'github_repo':
+            counts[("news", "", "")] += 1
+
+    if is_github_record(record):
+        counts[("github_total", "", "")] += 1
+        if deleted:
+            counts[("github_deleted", "", "")] += 1
+        else:
+            counts[("github_active", "", "")] += 1
+            language = github_language(record)
+            if language:
+                counts[("github_language", "", str(language))] += 1
+            if posted_day:
+                counts[("github_posted", posted_day, "")] += 1
+
+
+def _event_contributions(collection, record, counts):
+    counts[("total", "", "")] += 1
+    if collection == "pending":
+        counts[("status", "", str(record.get("status") or ""))] += 1
+    elif collection == "rejected":
+        counts[("reason", "", str(record.get("reason", "Bilinmeyen")))] += 1
+    day = None
+    for field in EVENT_DATE_FIELDS.get(collection, ()):
+        if record.get(field):
+            day = parse_day(record.get(field))
+            break
+    if not day:
+        return
+    if collection == "pending":
+        # Status yoksa pending kabul edilir (eski get_data_statistics davranışı)
+        counts[("created", day, str(record.get("status", "pending")))] += 1
+    counts[(collection, day, "")] += 1
+    counts[(f"{collection}_by_source", day, _source(record))] += 1
+    counts[(f"{collection}_by_method", day, _method(record))] += 1
+
+
+def record_contributions(collection, record, counts=None):
+    """Bir kaydın sayaçlara katkısı: Counter{(metrik, gün, boyut): adet}"""
+    counts = counts if counts is not None else Counter()
+    if not isinstance(record, dict):
+        return counts
+    if collection == "posted":
+        _posted_contributions(record, counts)
+    else:
+        _event_contributions(collection, record, counts)
+    return counts
+
+
+class StatsAggregator:
+    def __init__(self, store):
+        self.store = store
+        self._build_lock = threading.Lock()
+        self._built = False
+        self._init_table()
+        store.add_change_hook(self.apply_changes)
+
+    def _log(self, message, level="info"):
+        """Sayaç logları"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        prefix = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"}.get(level, "ℹ️")
+        print(f"{prefix} [{timestamp}] [StatsAggregator] {message}")
+
+    def _init_table(self):
+        conn = self.store._conn()
+        with conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS stats_counters (
+                    collection TEXT NOT NULL,
+                    metric TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    dimension TEXT NOT NULL,
+                    value INTEGER NOT NULL,
+                    PRIMARY KEY (collection, metric, day, dimension)
+                )
+            ''')
+
+    # ------------------------------------------------------------------
+    # Artımlı güncelleme (ArticleStore yazım transaction'ı içinde)
+    # ------------------------------------------------------------------
+    def apply_changes(self, conn, collection, removed, added):
+        """Çıkan kayıtların katkısını düş, gelenlerinkini ekle"""
+        delta = Counter()
+        for record in added:
+            record_contributions(collection, record, delta)
+        if removed:
+            negative = Counter()
+            for record in removed:
+                record_contributions(collection, record, negative)
+            delta.subtract(negative)
+        rows = [(collection, metric, day, dimension, value)
+                for (metric, day, dimension), value in delta.items() if value]
+        if not rows:
+            return
+        conn.executemany(
+            "INSERT INTO stats_counters (collection, metric, day, dimension, value) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(collection, metric, day, dimension) DO UPDATE SET value = value + excluded.value",
+            rows
+        )
+        conn.execute("DELETE FROM stats_counters WHERE collection = ? AND value = 0", (collection,))
+
+    # ------------------------------------------------------------------
+    # Yeniden kurma / doğrulama
+    # ------------------------------------------------------------------
+    def compute_from_history(self, collection):
+        """Koleksiyonun sayaçlarını kayıtlardan baştan hesapla"""
+        self.store.ensure_migrated(collection)
+        counts = Counter()
+        for (data,) in self.store._conn().execute(
+            "SELECT data FROM articles WHERE collection = ?", (collection,)
+        ):
+            record_contributions(collection, json.loads(data), counts)
+        return +counts
+
+    def _stored_counters(self, conn, collection):
+        return Counter({
+            (metric, day, dimension): value
+            for metric, day, dimension, value in conn.execute(
+                "SELECT metric, day, dimension, value FROM stats_counters WHERE collection = ?", (collection,)
+            )
+        })
+
+    def rebuild(self, verify=True, write=True):
+        """Tüm sayaçları geçmişten yeniden hesapla.
+
+        verify=True ise tablodaki değerlerle karşılaştırılır; fark varsa
+        mismatches listesinde döner. write=False sadece doğrulama yapar."""
+        for collection in STORE_COLLECTIONS.values():
+            self.store.ensure_migrated(collection)
+        conn = self.store._conn()
+        report = {"equal": True, "mismatches": [], "collections": {}}
+        with conn:
+            # Yazma kilidi baştan alınır; hesaplama sırasında sayaçlar değişemez
+            conn.execute("BEGIN IMMEDIATE")
+            for collection in STORE_COLLECTIONS.values():
+                expected = self.compute_from_history(collection)
+                if verify:
+                    stored = self._stored_counters(conn, collection)
+                    for key in sorted(set(expected) | set(stored)):
+                        if expected.get(key, 0) != stored.get(key, 0):
+                            report["equal"] = False
+                            if len(report["mismatches"]) < 50:
+                                metric, day, dimension = key
+                                report["mismatches"].append({
+                                    "collection": collection, "metric": metric, "day": day,
+                                    "dimension": dimension, "expected": expected.get(key, 0),
+                                    "stored": stored.get(key, 0),
+                                })
+                report["collections"][collection] = {"counters": len(expected),
+                                                     "records": expected.get(("total", "", ""), 0)}
+                if write:
+                    conn.execute("DELETE FROM stats_counters WHERE collection = ?", (collection,))
+                    conn.executemany(
+                        "INSERT INTO stats_counters (collection, metric, day, dimension, value) VALUES (?, ?, ?, ?, ?)",
+                        [(collection, *key, value) for key, value in expected.items()]
+                    )
+            if write:
+                conn.execute("INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)",
+                             ("stats_aggregator_version", AGGREGATOR_VERSION))
+        if write:
+            self._built = True
+        return report
+
+    def ensure_built(self):
+        """Sayaç tablosu hiç kurulmadıysa (veya tanımlar değiştiyse) geçmişten kur"""
+        if self._built:
+            return
+        with self._build_lock:
+            if self._built:
+                return
+            row = self.store._conn().execute(
+                "SELECT value FROM store_meta WHERE key = 'stats_aggregator_version'"
+            ).fetchone()
+            if row and row[0] == AGGREGATOR_VERSION:
+                self._built = True
+                return
+            report = self.rebuild(verify=False)
+            total = sum(c["records"] for c in report["collections"].values())
+            self._log(f"İstatistik sayaçları {total} kayıttan kuruldu", "success")
+
+    # ------------------------------------------------------------------
+    # Okuma
+    # ------------------------------------------------------------------
+    def total(self, collection, metric, dimension="", day=""):
+        """Tek sayaç değeri"""
+        self.ensure_built()
+        row = self.store._conn().execute(
+            "SELECT value FROM stats_counters WHERE collection = ? AND metric = ? AND day = ? AND dimension = ?",
+            (collection, metric, day, dimension)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def breakdown(self, collection, metric, day=""):
+        """Boyut kırılımı: {boyut: değer}"""
+        self.ensure_built()
+        return dict(self.store._conn().execute(
+            "SELECT dimension, value FROM stats_counters WHERE collection = ? AND metric = ? AND day = ?",
+            (collection, metric, day)
+        ).fetchall())
+
+    def daily(self, collection, metric, start_day, end_day=None):
+        """Gün aralığındaki (dahil) değerler: {gün: toplam} - boyutlar toplanır"""
+        self.ensure_built()
+        end_day = end_day or date.today().isoformat()
+        return dict(self.store._conn().execute(
+            "SELECT day, SUM(value) FROM stats_counters WHERE collection = ? AND metric = ? "
+            "AND day != '' AND day >= ? AND day <= ? GROUP BY day",
+            (collection, metric, start_day, end_day)
+        ).fetchall())
+
+    def daily_breakdown(self, collection, metric, days=7):
+        """Son N günün boyut kırılımı: {gün: {boyut: değer}}"""
+        self.ensure_built()
+        start_day = (date.today() - timedelta(days=days - 1)).isoformat()
+        result = {}
+        for day, dimension, value in self.store._conn().execute(
+            "SELECT day, dimension, value FROM stats_counters WHERE collection = ? AND metric = ? "
+            "AND day != '' AND day >= ? ORDER BY day",
+            (collection, metric, start_day)
+        ):
+            result.setdefault(day, {})[dimension] = value
+        return result
+
+
+_aggregator = None
+_aggregator_lock = threading.Lock()
+
+
+def get_stats_aggregator(store=None):
+    """Süreç genelinde tek StatsAggregator örneği (varsayılan: ortak makale deposu)"""
+    global _aggregator
+    if _aggregator is None:
+        with _aggregator_lock:
+            if _aggregator is None:
+                if store is None:
+                    from article_store import get_article_store
+                    store = get_article_store()
+                _aggregator = StatsAggregator(store)
+    return _aggregator
+
+
+if __name__ == "__main__":
+    # python stats_aggregator.py [rebuild|verify]
+    command = sys.argv[1] if len(sys.argv) > 1 else "verify"
+    aggregator = get_stats_aggregator()
+    report = aggregator.rebuild(verify=True, write=(command == "rebuild"))
+    for collection, info in report["collections"].items():
+        print(f"📊 {collection}: {info['records']} kayıt, {info['counters']} sayaç")
+    for mismatch in report["mismatches"]:
+        print(f"⚠️ {mismatch['collection']}/{mismatch['metric']} {mismatch['day'] or '-'} "
+              f"{mismatch['dimension'] or '-'}: beklenen {mismatch['expected']}, kayıtlı {mismatch['stored']}")
+    if report["equal"]:
+        print("✅ Sayaçlar geçmişle birebir aynı")
+    else:
+        print("🔧 Sayaçlar yeniden kuruldu" if command == "rebuild" else "❌ Sayaçlar geçmişle uyuşmuyor")
+    sys.exit(0 if report["equal"] or command == "rebuild" else 1)
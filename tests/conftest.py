@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Test ortamı: depo köküne import yolu ve geçici çalışma dizini.
+
+articles.db, pending_tweets.json vb. göreli yollar çalışma dizinine yazılır;
+modüller ilk import edildiğinde bağlantılarını açtığı için dizin, herhangi bir
+test (kökteki eski testler dahil) çalışmadan önce değiştirilir.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+_ORIGINAL_CWD = os.getcwd()
+WORK_DIR = tempfile.mkdtemp(prefix="tweet_app_tests_")
+os.chdir(WORK_DIR)
+
+
+def pytest_unconfigure(config):
+    os.chdir(_ORIGINAL_CWD)
+    shutil.rmtree(WORK_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def utils_module():
+    """Geçici çalışma dizininde yüklenmiş utils (gerçek veri dosyalarına dokunulmaz)"""
+    import utils
+    yield utils
+    utils.get_state_writer_stats()
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+ArticleStore.replace_all satır farkı testleri
+"""
+
+import random
+
+import pytest
+
+from article_store import ArticleStore
+
+
+def _record(name):
+    return {"title": name, "url": f"https://example.com/{name}", "hash": f"h-{name}"}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ArticleStore(str(tmp_path / "articles.db"))
+    writes = []
+    store.add_listener(lambda collection, added, removed: writes.append((len(added), len(removed))))
+    store.writes = writes
+    return store
+
+
+def test_removal_near_front_touches_only_removed_row(store):
+    records = [_record(f"a{i}") for i in range(500)]
+    store.replace_all("posted", records)
+
+    del records[2]
+    store.replace_all("posted", records)
+    records.insert(0, _record("front"))
+    store.replace_all("posted", records)
+    records[10] = {**records[10], "status": "edited"}
+    store.replace_all("posted", records)
+
+    assert store.writes[1:] == [(0, 1), (1, 0), (1, 1)]
+    assert store.load("posted") == records
+
+
+def test_listing_returns_list_index_after_sparse_positions(store):
+    records = [_record(f"a{i}") for i in range(20)]
+    store.replace_all("rejected", records)
+    rnd = random.Random(7)
+    for step in range(60):
+        if rnd.random() < 0.4 and records:
+            records.pop(rnd.randrange(len(records)))
+        else:
+            records.insert(rnd.randrange(len(records) + 1), _record(f"r{step}"))
+        store.replace_all("rejected", records)
+        assert store.load("rejected") == records
+
+    rows, _ = store.list_page("rejected", sort="title", descending=False, limit=len(records))
+    assert all(records[index] == record for index, record, _ in rows)
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""
+JobScheduler yeniden planlama testleri
+"""
+
+import time
+
+from job_scheduler import JobScheduler, ScheduledJob
+
+
+def test_reschedule_keeps_due_daily_run(tmp_path):
+    scheduler = JobScheduler(db_path=str(tmp_path / "jobs.db"), settings_path=str(tmp_path / "settings.json"))
+    scheduler.register(ScheduledJob("daily", lambda: None, daily_at="00:00"))
+    due = time.time() - 3600
+    with scheduler._get_connection() as conn:
+        conn.execute("UPDATE scheduled_jobs SET next_run = ? WHERE job_id = 'daily'", (due,))
+
+    # Ayar kaydı / yeniden kayıt zamanı gelmiş çalışmayı ertesi güne taşımamalı
+    scheduler.reschedule()
+    scheduler.register(ScheduledJob("daily", lambda: None, daily_at="00:00"))
+
+    assert scheduler._row("daily")["next_run"] == due
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Pending tweet ID'leri, sayfalı listeleme ve durum önbelleği testleri
+"""
+
+import json
+
+import pytest
+
+PENDING = "pending_tweets.json"
+
+
+def _tweet(name, **extra):
+    return {"content": f"Tweet {name}", "article": {"url": f"https://example.com/{name}", "title": name}, **extra}
+
+
+def _write_legacy(utils, records):
+    """ID'siz eski kayıtları yazım kuyruğunu atlayarak yaz (eski sürümden kalan veri)"""
+    utils.get_state_writer_stats()
+    collection = utils._store_collection(PENDING)
+    if collection:
+        utils.get_article_store().replace_all(collection, records)
+    else:
+        with open(PENDING, "w", encoding="utf-8") as f:
+            json.dump(records, f)
+    utils._invalidate_state_cache(PENDING)
+    utils._pending_ids_checked = False
+
+
+def _pending(utils):
+    return [(tweet["article"]["title"], tweet.get("id")) for tweet in utils.load_json(PENDING, [])]
+
+
+@pytest.fixture
+def utils(utils_module):
+    _write_legacy(utils_module, [])
+    return utils_module
+
+
+def test_removal_uses_persisted_ids_not_shifting_positions(utils):
+    """[A, B, C] içinden 2 ve 3 sırayla kaldırılınca A kalır (eskiden A ve C kalıyordu)"""
+    _write_legacy(utils, [_tweet("A"), _tweet("B"), _tweet("C")])
+
+    selected, errors = utils._select_pending_tweets(["2", "3"])
+    assert errors == []
+    assert [tweet["article"]["title"] for _, tweet in selected] == ["B", "C"]
+
+    for _, tweet in selected:
+        utils.remove_pending_tweets([tweet["id"]])
+
+    assert _pending(utils) == [("A", 1)]
+
+
+def test_add_pending_tweet_assigns_max_id_plus_one(utils):
+    """Yeni kayıt en büyük ID+1 alır; aynı URL ikinci kez eklenmez"""
+    _write_legacy(utils, [_tweet("A", id=7), _tweet("B")])
+
+    added, tweet = utils.add_pending_tweet(_tweet("C"))
+    assert added and tweet["id"] == 8
+
+    added, existing = utils.add_pending_tweet(_tweet("C"))
+    assert not added and existing["id"] == 8
+    assert _pending(utils) == [("A", 7), ("B", 2), ("C", 8)]
+
+
+def test_save_json_persists_missing_ids(utils):
+    """Tam liste yazımında ID'siz kayıtlara kalıcı ID verilir"""
+    utils.save_json(PENDING, [_tweet("A", id=1), _tweet("B"), _tweet("C", id=2)])
+    utils.get_state_writer_stats()
+
+    assert _pending(utils) == [("A", 1), ("B", 3), ("C", 2)]
+
+
+def test_listing_ids_match_stored_positions(utils):
+    """Yeniden eskiye sayfadaki ID'ler sayfa sırası değil, kayıtlı ID'dir"""
+    _write_legacy(utils, [_tweet(name) for name in "ABCDE"])
+
+    page = utils.list_records("pending", sort="date", descending=True, limit=2)
+    assert [(item["article"]["title"], item["id"]) for item in page["items"]] == [("E", 5), ("D", 4)]
+    assert _pending(utils) == [(name, i + 1) for i, name in enumerate("ABCDE")]
+
+
+def test_listing_cursor_walks_every_record_once(utils):
+    """next_cursor ile sayfalar kayıt atlamadan ve tekrar etmeden ilerler"""
+    for name in "ABCDEFG":
+        utils.add_pending_tweet(_tweet(name))
+
+    seen = []
+    cursor = None
+    while True:
+        page = utils.list_records("pending", cursor=cursor, limit=3)
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert sorted(seen) == list(range(1, 8))
+    assert page["total"] == 7
+
+
+def test_statistics_follow_pending_changes(utils):
+    """Önbellekteki istatistik pending eklenip kaldırılınca yenilenir"""
+    before = utils.get_data_statistics()["pending_tweets"]
+    _, tweet = utils.add_pending_tweet(_tweet("S", status="pending"))
+    assert utils.get_data_statistics()["pending_tweets"] == before + 1
+
+    utils.remove_pending_tweets([tweet["id"]])
+    assert utils.get_data_statistics()["pending_tweets"] == before
+
+
+def test_cache_token_ignores_other_collections(utils):
+    """Başka koleksiyona veya yardımcı tablolara yazım pending önbelleğini geçersiz kılmaz"""
+    if not utils._store_collection(PENDING):
+        pytest.skip("makale deposu kapalı")
+    utils.load_json(PENDING, [])
+    token = utils._state_cache_token(PENDING)
+
+    utils.append_json_record("rejected_articles.json", {"url": "https://example.com/r", "title": "R"})
+    utils.get_state_writer_stats()
+    conn = utils.get_article_store()._conn()
+    with conn:
+        conn.execute("INSERT OR REPLACE INTO store_meta (key, value) VALUES ('test', '1')")
+    assert utils._state_cache_token(PENDING) == token
+
+    utils.add_pending_tweet(_tweet("T"))
+    assert utils._state_cache_token(PENDING) != token
+
+
+def test_assigned_ids_never_collide(utils):
+    """Sıra+1 ve en büyük ID+1 atamaları birbirini tekrar etmez"""
+    records = [{}, {"id": 1}, {}, {}, {"id": 2}, {}]
+    assert utils.assign_pending_ids(records) == 4
+    ids = [record["id"] for record in records]
+    assert len(ids) == len(set(ids))
+    assert ids[1] == 1 and ids[4] == 2
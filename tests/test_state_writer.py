@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+StateWriter testleri - birleştirme, sıra ve kayıpsız oku-değiştir-yaz
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from state_writer import StateWriter
+
+
+class MemoryFiles:
+    """loader/saver/appender yerine geçen bellek içi dosyalar"""
+
+    def __init__(self):
+        self.files = {}
+        self.loads = 0
+        self.appends = []
+
+    def load(self, path, default):
+        self.loads += 1
+        return list(self.files.get(path, default))
+
+    def save(self, path, data):
+        self.files[path] = list(data)
+
+    def append(self, path, records):
+        self.appends.append(list(records))
+        self.files.setdefault(path, []).extend(records)
+
+
+def _writer(files, appender=False, coalesce_ms=50):
+    return StateWriter(files.load, files.save, files.append if appender else None,
+                       coalesce_ms=coalesce_ms, lock_timeout=5)
+
+
+def test_concurrent_mutations_are_coalesced_without_losing_records(tmp_path):
+    """Aynı anda gelen işlemler tek okuma + tek yazımda birleşir, hiçbiri kaybolmaz"""
+    files = MemoryFiles()
+    writer = _writer(files)
+    path = str(tmp_path / "pending_tweets.json")
+
+    futures = [writer.update(path, lambda data, i=i: data.append(i), [], wait=False) for i in range(20)]
+    for future in futures:
+        future.result(5)
+
+    assert sorted(files.files[path]) == list(range(20))
+    stats = writer.stats()
+    assert stats["operations"] == 20
+    assert stats["writes"] < 20
+
+
+def test_replace_is_ordered_with_later_mutations(tmp_path):
+    """REPLACE sonrası gelen ekleme, yazılan listenin üzerine uygulanır"""
+    files = MemoryFiles()
+    writer = _writer(files)
+    path = str(tmp_path / "posted_articles.json")
+
+    first = writer.replace(path, [1, 2], wait=False)
+    second = writer.update(path, lambda data: data.append(3) or len(data), [], wait=False)
+
+    assert first.result(5) is None
+    assert second.result(5) == 3
+    assert files.files[path] == [1, 2, 3]
+
+
+def test_failing_mutator_does_not_drop_other_operations(tmp_path):
+    """Hata veren mutator sadece kendi çağıranına hata döndürür, yarım değişikliği yazılmaz"""
+    files = MemoryFiles()
+    writer = _writer(files)
+    path = str(tmp_path / "pending_tweets.json")
+
+    def broken(data):
+        data.append("half")
+        data.remove("a")
+        raise ValueError("bozuk")
+
+    futures = [
+        writer.update(path, lambda data: data.append("a"), [], wait=False),
+        writer.update(path, broken, [], wait=False),
+        writer.update(path, lambda data: data.append("b"), [], wait=False),
+    ]
+
+    assert futures[0].result(5) is None
+    with pytest.raises(ValueError):
+        futures[1].result(5)
+    assert futures[2].result(5) is None
+    assert files.files[path] == ["a", "b"]
+
+
+def test_append_only_batches_skip_full_load(tmp_path):
+    """Sadece ekleme içeren grup appender ile yazılır, liste okunmaz"""
+    files = MemoryFiles()
+    writer = _writer(files, appender=True)
+    path = str(tmp_path / "posted_articles.json")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: writer.append(path, {"i": i}), range(16)))
+
+    assert files.loads == 0
+    assert sorted(record["i"] for record in files.files[path]) == list(range(16))
+    assert sum(len(batch) for batch in files.appends) == 16
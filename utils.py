@@ -18,7 +18,10 @@ import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import time
+import threading
+import functools
 import re
+import unicodedata
 from difflib import SequenceMatcher
 from email.utils import parsedate_to_datetime
 
@@ -31,6 +34,238 @@ except ImportError:
     feedparser = None
 # emoji kütüphanesi yerine regex kullanacağız
 
+# SQLite makale deposu (posted/pending/rejected/deleted/archived)
+try:
+    from article_store import (get_article_store, collection_for_path, display_fields,
+                               STORE_COLLECTIONS, SORT_COLUMNS, encode_cursor, decode_cursor)
+    ARTICLE_STORE_AVAILABLE = True
+except ImportError:
+    ARTICLE_STORE_AVAILABLE = False
+    get_article_store = None
+    collection_for_path = None
+
+# URL / hash görülme indeksi (duplikat kontrolleri için O(1))
+try:
+    from seen_index import get_seen_index, SEEN_STATUSES
+    SEEN_INDEX_AVAILABLE = True
+except ImportError:
+    SEEN_INDEX_AVAILABLE = False
+    get_seen_index = None
+    SEEN_STATUSES = ()
+
+# Anahtar kelime tabloları bir kez derlenir, metin tek geçişte taranır
+from keyword_matcher import KeywordMatcher, get_keyword_matcher
+# Sayfa metni, linkler, tarih ve canonical URL tek parse'ta (lxml varsa onunla)
+from page_extractor import extract_page
+# JS gerektiren sayfalar sıcak tutulan headless tarayıcı havuzunda render edilir
+from browser_pool import get_render_pool, get_render_pool_stats
+# Kaynaklar öğrenilen yayın temposuna göre çekilir (her çalışmada hepsi değil)
+from source_scheduler import get_source_scheduler, is_source_schedule_enabled
+
+# MinHash/LSH yakın duplikat indeksi
+try:
+    from near_duplicate import get_near_duplicate_index, NearDuplicateIndex
+    NEAR_DUPLICATE_AVAILABLE = True
+except ImportError:
+    NEAR_DUPLICATE_AVAILABLE = False
+    get_near_duplicate_index = None
+    NearDuplicateIndex = None
+
+# Ortak HTTP istemcisi (bağlantı havuzu, keep-alive, retry)
+try:
+    from http_client import get_http_client
+    HTTP_CLIENT_AVAILABLE = True
+except ImportError:
+    HTTP_CLIENT_AVAILABLE = False
+    get_http_client = None
+
+# LLM yanıt önbelleği (model + prompt hash + max_tokens + temperature)
+try:
+    from llm_cache import get_llm_cache, is_llm_cache_enabled
+    LLM_CACHE_AVAILABLE = True
+except ImportError:
+    LLM_CACHE_AVAILABLE = False
+    get_llm_cache = None
+    is_llm_cache_enabled = None
+
+# Makale içerik önbelleği (canonical URL + ETag/Last-Modified)
+try:
+    from content_cache import get_content_cache, is_content_cache_enabled
+    CONTENT_CACHE_AVAILABLE = True
+except ImportError:
+    CONTENT_CACHE_AVAILABLE = False
+    get_content_cache = None
+    is_content_cache_enabled = None
+
+# OpenRouter eşzamanlılık / dakikalık istek sınırı
+try:
+    from openrouter_async import openrouter_slot
+    OPENROUTER_LIMITER_AVAILABLE = True
+except ImportError:
+    OPENROUTER_LIMITER_AVAILABLE = False
+    openrouter_slot = None
+
+# Tek yazıcılı durum kuyruğu (pending/posted oku-değiştir-yaz işlemleri)
+try:
+    from state_writer import get_state_writer, is_managed_path
+    STATE_WRITER_AVAILABLE = True
+except ImportError:
+    STATE_WRITER_AVAILABLE = False
+
+# Artımlı istatistik sayaçları (makale deposu yazımlarıyla aynı transaction'da)
+try:
+    from stats_aggregator import get_stats_aggregator
+    STATS_AGGREGATOR_AVAILABLE = True
+except ImportError:
+    STATS_AGGREGATOR_AVAILABLE = False
+
+# Tam metin arama (articles.db üzerinde FTS5 indeksi)
+try:
+    from search_index import get_search_index
+    SEARCH_INDEX_AVAILABLE = True
+except ImportError:
+    SEARCH_INDEX_AVAILABLE = False
+
+# /api/events aboneleri durum değişikliklerinden hemen haberdar edilir
+try:
+    from event_bus import get_event_bus
+    EVENT_BUS_AVAILABLE = True
+except ImportError:
+    EVENT_BUS_AVAILABLE = False
+
+# Toplu onayda tweet'ler arka planda, rate limit'e uyarak paylaşılır
+try:
+    from post_queue import get_post_queue
+    POST_QUEUE_AVAILABLE = True
+except ImportError:
+    POST_QUEUE_AVAILABLE = False
+
+# Durum dosyaları için bellek içi önbellek (mtime / koleksiyon sayacı doğrulamalı)
+try:
+    from state_cache import get_state_cache, file_token
+    STATE_CACHE_AVAILABLE = True
+except ImportError:
+    STATE_CACHE_AVAILABLE = False
+
+# Ortak iş zamanlayıcısı - ayar kaydında uyandırılır
+try:
+    from job_scheduler import notify_settings_changed
+    JOB_SCHEDULER_AVAILABLE = True
+except ImportError:
+    JOB_SCHEDULER_AVAILABLE = False
+
+    def notify_settings_changed():
+        pass
+
+# Çalışma izleme (run → tier → source → article → ai_call)
+try:
+    from run_tracer import span as trace_span, traced, traced_run, bind_context, record as trace_record
+    from run_tracer import get_run_tracer, profiling
+    RUN_TRACER_AVAILABLE = True
+except ImportError:
+    RUN_TRACER_AVAILABLE = False
+
+    class _NullSpan:
+        def add(self, **counters):
+            pass
+
+        def set(self, **attrs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    def trace_span(name, kind="stage", **attrs):
+        return _NullSpan()
+
+    def traced(name=None, kind="stage"):
+        return lambda fn: fn
+
+    def traced_run(name, stage_name=None):
+        return lambda fn: fn
+
+    def profiling(enabled=True):
+        return _NullSpan()
+
+    def bind_context(fn):
+        return fn
+
+    def trace_record(**counters):
+        pass
+
+if ARTICLE_STORE_AVAILABLE and SEEN_INDEX_AVAILABLE:
+    get_article_store().add_listener(get_seen_index().on_store_change)
+if ARTICLE_STORE_AVAILABLE and STATS_AGGREGATOR_AVAILABLE:
+    # Hook'un import anında kurulması gerekir; aksi halde bu süreçteki yazımlar sayaçlara yansımaz
+    get_stats_aggregator(get_article_store())
+if ARTICLE_STORE_AVAILABLE and SEARCH_INDEX_AVAILABLE:
+    # Tetikleyiciler ilk yazımdan önce kurulmalı
+    get_search_index(get_article_store())
+
+
+def http_get(url, **kwargs):
+    """Ortak HTTP oturumu üzerinden GET (bağlantı havuzu + retry)"""
+    if HTTP_CLIENT_AVAILABLE:
+        return get_http_client().get(url, **kwargs)
+    return requests.get(url, **kwargs)
+
+
+def http_post(url, **kwargs):
+    """Ortak HTTP oturumu üzerinden POST"""
+    if HTTP_CLIENT_AVAILABLE:
+        return get_http_client().post(url, **kwargs)
+    return requests.post(url, **kwargs)
+
+
+def get_http_stats():
+    """Ortak HTTP istemcisinin istek ve bağlantı yeniden kullanım sayaçları"""
+    if not HTTP_CLIENT_AVAILABLE:
+        return {"available": False}
+    return {"available": True, **get_http_client().stats()}
+
+
+def get_llm_cache_stats():
+    """LLM yanıt önbelleğinin hit/miss sayaçları ve disk kullanımı"""
+    if not LLM_CACHE_AVAILABLE:
+        return {"available": False}
+    return {"available": True, "enabled": is_llm_cache_enabled(), **get_llm_cache().stats()}
+
+def get_content_cache_stats():
+    """Makale içerik önbelleğinin boyutu, hit oranı ve alan adı dağılımı"""
+    if not CONTENT_CACHE_AVAILABLE:
+        return {"available": False}
+    return {"available": True, "enabled": is_content_cache_enabled(), **get_content_cache().stats()}
+
+def get_run_traces(limit=20, run_id=None, histogram_runs=50):
+    """Son çalışma izleri (veya tek bir çalışmanın span ağacı) ve aşama bazlı p50/p95"""
+    if not RUN_TRACER_AVAILABLE:
+        return {"available": False}
+    tracer = get_run_tracer()
+    if run_id:
+        return {"available": True, "trace": tracer.get_run(run_id)}
+    return {
+        "available": True,
+        "runs": tracer.list_runs(limit),
+        "stage_histograms": tracer.stage_histograms(histogram_runs),
+    }
+
+
+def get_run_profile(run_id, fmt="speedscope"):
+    """Çalışmanın örneklemeli profili: speedscope JSON (dict) veya collapsed metin; yoksa None"""
+    if not RUN_TRACER_AVAILABLE:
+        return None
+    stored = get_run_tracer().get_profile(run_id)
+    if stored is None:
+        return None
+    if fmt == "collapsed":
+        return stored["collapsed"]
+    from sampling_profiler import collapsed_to_speedscope
+    return collapsed_to_speedscope(stored["collapsed"], name=f"{stored['name']} {run_id}",
+                                   interval_ms=stored["interval_ms"])
+
 # .env dosyasını yükle
 load_dotenv()
 
@@ -86,33 +321,19 @@ def mcp_firecrawl_scrape(params):
                 
                 safe_print(f"[MCP] Gelişmiş scraper başarılı: {len(content)} karakter ({result.get('method', 'unknown')})")
                 
-                # HTML içeriğinden linkleri çıkar
-                links = []
-                html_content = result.get("html", "")
-                if html_content:
-                    from bs4 import BeautifulSoup
-                    soup = BeautifulSoup(html_content, 'html.parser')
-                    
-                    # Tüm linkleri bul
-                    for link_elem in soup.find_all('a', href=True):
-                        href = link_elem.get('href', '')
-                        text = link_elem.get_text(strip=True)
-                        
-                        if href and text and len(text) > 5:
-                            # Relative URL'leri absolute yap
-                            if href.startswith('/'):
-                                from urllib.parse import urljoin
-                                href = urljoin(url, href)
-                            elif not href.startswith('http'):
-                                continue
-                            
-                            links.append({"text": text, "url": href})
+                # Linkler scraper'ın tek parse'ında çıkarıldı (HTML yeniden parse edilmez)
+                links = result.get("links", [])
                 
                 return {
                     "success": True,
                     "content": content,
                     "markdown": content,
                     "links": links,
+                    "title": result.get("title", ""),
+                    "published_date": result.get("published_date"),
+                    "canonical_url": result.get("canonical_url"),
+                    "etag": result.get("etag"),
+                    "last_modified": result.get("last_modified"),
                     "source": f"advanced_scraper_{result.get('method', 'unknown')}",
                     "method": result.get('method', 'unknown')
                 }
@@ -134,14 +355,11 @@ def mcp_firecrawl_scrape(params):
                 'Connection': 'keep-alive'
             }
             
-            session = requests.Session()
-            session.headers.update(headers)
-            
-            response = session.get(url, timeout=30, allow_redirects=True)
+            response = http_get(url, headers=headers, timeout=30, allow_redirects=True)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            content = extract_main_content(soup)
+            page = extract_page(response.text, base_url=url)
+            content = page["content"]
             
             if content and len(content) > 100:
                 safe_print(f"[MCP] Basit fallback başarılı: {len(content)} karakter")
@@ -150,6 +368,12 @@ def mcp_firecrawl_scrape(params):
                     "success": True,
                     "content": content,
                     "markdown": content,
+                    "links": page["links"],
+                    "title": page["title"],
+                    "published_date": page["published_date"],
+                    "canonical_url": page["canonical_url"],
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
                     "source": "simple_fallback"
                 }
             else:
@@ -162,7 +386,7 @@ def mcp_firecrawl_scrape(params):
         try:
             safe_print(f"[MCP] Son çare: Sadece başlık çekiliyor...")
             
-            response = requests.get(url, timeout=15)
+            response = http_get(url, timeout=15)
             soup = BeautifulSoup(response.text, 'html.parser')
             
             title = ""
@@ -202,11 +426,6 @@ MCP_CONFIG_FILE = "mcp_config.json"
 def fetch_latest_ai_articles_with_firecrawl():
     """Firecrawl MCP ile gelişmiş haber çekme - Sadece son 4 makale"""
     try:
-        # Önce mevcut yayınlanan makaleleri yükle
-        posted_articles = load_json(HISTORY_FILE)
-        posted_urls = [article.get('url', '') for article in posted_articles]
-        posted_hashes = [article.get('hash', '') for article in posted_articles]
-        
         safe_print("🔍 TechCrunch AI kategorisinden Firecrawl MCP ile makale çekiliyor...")
         
         # Firecrawl MCP ile ana sayfa çek
@@ -254,8 +473,8 @@ def fetch_latest_ai_articles_with_firecrawl():
                     is_article = re.search(date_pattern, url)
                     
                     if (year_check and is_article and 
-                        url not in posted_urls and 
                         url not in article_urls and
+                        not is_article_seen(url=url, statuses=("posted",)) and
                         len(article_urls) < 10):  # Daha fazla URL topla
                         article_urls.append(url)
                         print(f"   📰 MCP Link: {url}")
@@ -277,8 +496,8 @@ def fetch_latest_ai_articles_with_firecrawl():
                     is_article = re.search(date_pattern, url)
                     
                     if (year_check and is_article and 
-                        url not in posted_urls and 
                         url not in article_urls and
+                        not is_article_seen(url=url, statuses=("posted",)) and
                         len(article_urls) < 10):
                         article_urls.append(url)
                         safe_print(f"   📄 Markdown Link: {url}")
@@ -306,7 +525,7 @@ def fetch_latest_ai_articles_with_firecrawl():
                     article_hash = hashlib.md5(title.encode()).hexdigest()
                     
                     # Tekrar kontrolü
-                    if article_hash not in posted_hashes:
+                    if not is_article_seen(hash_value=article_hash, statuses=("posted",)):
                         articles_data.append({
                             "title": title,
                             "url": url,
@@ -367,13 +586,8 @@ def fetch_latest_ai_articles_fallback():
         now = datetime.now()
         twenty_four_hours_ago = now - timedelta(hours=24)
         
-        # Önce mevcut yayınlanan makaleleri yükle
-        posted_articles = load_json(HISTORY_FILE)
-        posted_urls = [article.get('url', '') for article in posted_articles]
-        posted_hashes = [article.get('hash', '') for article in posted_articles]
-        
         headers = {'User-Agent': 'Mozilla/5.0'}
-        html = requests.get("https://techcrunch.com/category/artificial-intelligence/", headers=headers).text
+        html = http_get("https://techcrunch.com/category/artificial-intelligence/", headers=headers).text
         soup = BeautifulSoup(html, "html.parser")
         article_links = soup.select("a.loop-card__title-link")[:4]  # Sadece son 4 makale
         
@@ -405,7 +619,7 @@ def fetch_latest_ai_articles_fallback():
             article_hash = hashlib.md5(title.encode()).hexdigest()
             
             # Tekrar kontrolü - URL ve hash bazlı
-            is_already_posted = url in posted_urls or article_hash in posted_hashes
+            is_already_posted = is_article_seen(url=url, hash_value=article_hash, statuses=("posted",))
             
             if is_already_posted:
                 safe_print(f"[ATLA] Makale zaten paylaşılmış, atlanıyor: {title[:50]}...")
@@ -446,6 +660,101 @@ def fetch_latest_ai_articles_fallback():
         safe_print(f"[HATA] Fallback haber çekme hatası: {e}")
         return []
 
+_content_cache_scope = threading.local()
+
+def _content_from_cache(entry, url, max_chars):
+    metadata = entry.get("metadata") or {}
+    return {
+        "title": entry.get("title") or "Başlık bulunamadı",
+        "content": (entry.get("content") or "")[:max_chars],
+        "url": url,
+        "canonical_url": metadata.get("canonical_url"),
+        "published_date": metadata.get("published_date"),
+        "source": "content_cache"
+    }
+
+def _limit_content(result, max_chars):
+    """Çekici sonucunun içeriğini çağıranın sınırına kırp"""
+    if isinstance(result, dict) and isinstance(result.get("content"), str):
+        result["content"] = result["content"][:max_chars]
+    return result
+
+def _content_cached(max_chars):
+    """Makale içerik çekicisini içerik önbelleğinden geçir.
+    
+    Taze kayıt ağa çıkmadan döner; bayat kayıt ETag/Last-Modified ile koşullu
+    GET'le doğrulanır (304 -> kayıt, 200 -> tek geçişli çıkarıcıyla yenilenir).
+    Kayıt yoksa asıl çekici çalışır ve sonucu saklanır. Çekicinin içinden
+    çağrılan diğer çekiciler (fallback'ler) önbelleği ikinci kez sorgulamaz.
+    
+    Önbelleğe kırpılmamış metin yazılır; max_chars okurken uygulanır, böylece
+    farklı sınırlı çekiciler aynı kaydı paylaşabilir."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(url):
+            if getattr(_content_cache_scope, "active", False):
+                # Dıştaki çekici sonucu kendi sınırıyla kırpar
+                return func(url)
+            if not CONTENT_CACHE_AVAILABLE or not url or not is_content_cache_enabled():
+                return _limit_content(func(url), max_chars)
+            
+            cache = get_content_cache()
+            entry = cache.get(url)
+            if entry and entry["fresh"]:
+                cache.note_hit(entry)
+                safe_print(f"💾 İçerik önbellekten: {url[:60]}")
+                return _content_from_cache(entry, url, max_chars)
+            
+            conditional = cache.validators(entry)
+            if conditional:
+                try:
+                    response = http_get(url, headers=conditional, timeout=15)
+                    if response.status_code == 304:
+                        cache.note_hit(entry, revalidated=True)
+                        safe_print(f"💾 İçerik değişmemiş (304): {url[:60]}")
+                        return _content_from_cache(entry, url, max_chars)
+                    if response.status_code == 200:
+                        page = extract_page(response.text, base_url=url)
+                        if len(page["content"]) >= 100:
+                            cache.note_miss(refreshed=True)
+                            metadata = {"source": "conditional_get", "published_date": page["published_date"],
+                                        "canonical_url": page["canonical_url"]}
+                            cache.put(url, page["title"] or entry["title"], page["content"], metadata,
+                                      etag=response.headers.get("ETag"),
+                                      last_modified=response.headers.get("Last-Modified"),
+                                      canonical_url=page["canonical_url"])
+                            return {
+                                "title": page["title"] or entry["title"] or "Başlık bulunamadı",
+                                "content": page["content"][:max_chars],
+                                "url": url,
+                                "canonical_url": page["canonical_url"],
+                                "published_date": page["published_date"],
+                                "source": "conditional_get"
+                            }
+                except Exception as e:
+                    safe_log(f"Koşullu GET hatası ({url}): {e}", "WARNING")
+            
+            cache.note_miss(refreshed=entry is not None)
+            _content_cache_scope.active = True
+            try:
+                result = func(url)
+            finally:
+                _content_cache_scope.active = False
+            
+            if isinstance(result, dict):
+                etag = result.pop("etag", None)
+                last_modified = result.pop("last_modified", None)
+                content = result.get("content") or ""
+                if result.get("source") != "error" and len(content) >= 100:
+                    metadata = {"source": result.get("source"), "published_date": result.get("published_date"),
+                                "canonical_url": result.get("canonical_url")}
+                    cache.put(url, result.get("title"), content, metadata, etag=etag,
+                              last_modified=last_modified, canonical_url=result.get("canonical_url"))
+            return _limit_content(result, max_chars)
+        return wrapper
+    return decorator
+
+@_content_cached(max_chars=2500)
 def fetch_article_content_with_firecrawl(url):
     """Firecrawl MCP ile makale içeriği çekme"""
     try:
@@ -490,14 +799,16 @@ def fetch_article_content_with_firecrawl(url):
         content = content.replace('*', '').replace('**', '').replace('_', '')
         content = ' '.join(content.split())  # Çoklu boşlukları tek boşluğa çevir
         
-        # İçeriği sınırla
-        content = content[:2500]
-        
+        # İçerik _content_cached tarafından sınırlanır (önbellekte tam metin kalır)
         safe_print(f"✅ Firecrawl ile içerik çekildi: {len(content)} karakter")
         
         return {
-            "title": title or "Başlık bulunamadı",
+            "title": title or scrape_result.get("title") or "Başlık bulunamadı",
             "content": content,
+            "canonical_url": scrape_result.get("canonical_url"),
+            "published_date": scrape_result.get("published_date"),
+            "etag": scrape_result.get("etag"),
+            "last_modified": scrape_result.get("last_modified"),
             "source": "firecrawl_mcp"
         }
         
@@ -506,11 +817,13 @@ def fetch_article_content_with_firecrawl(url):
         safe_print("🔄 Fallback yönteme geçiliyor...")
         return fetch_article_content_advanced_fallback(url)
 
+@_content_cached(max_chars=2000)
 def fetch_article_content_advanced_fallback(url):
     """Fallback makale içeriği çekme - BeautifulSoup ile"""
     try:
         headers = {'User-Agent': 'Mozilla/5.0'}
-        article_html = requests.get(url, headers=headers, timeout=10).text
+        response = http_get(url, headers=headers, timeout=10)
+        article_html = response.text
         article_soup = BeautifulSoup(article_html, "html.parser")
         
         # Başlığı bul
@@ -545,11 +858,12 @@ def fetch_article_content_advanced_fallback(url):
             all_paragraphs = article_soup.find_all('p')
             content = "\n".join([p.text.strip() for p in all_paragraphs if len(p.text.strip()) > 50])
         
-        content = content[:2000]  # İçeriği sınırla
-        
+        # İçerik _content_cached tarafından sınırlanır (önbellekte tam metin kalır)
         return {
             "title": title or "Başlık bulunamadı",
             "content": content,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
             "source": "fallback"
         }
         
@@ -562,8 +876,92 @@ def fetch_article_content_advanced(url, headers):
     result = fetch_article_content_advanced_fallback(url)
     return result.get("content", "") if result else ""
 
+def _store_collection(path):
+    """Makale deposuna yönlendirilen dosyalar için koleksiyon adını döndür"""
+    if not ARTICLE_STORE_AVAILABLE:
+        return None
+    return collection_for_path(path)
+
+def _seen_status_for_path(path):
+    """Görülme indeksine yansıyan dosyanın durumu (posted/pending/rejected) ya da None"""
+    if not SEEN_INDEX_AVAILABLE:
+        return None
+    status = {
+        "posted_articles.json": "posted",
+        "pending_tweets.json": "pending",
+        "rejected_articles.json": "rejected",
+    }.get(os.path.basename(str(path)))
+    if status and os.path.dirname(os.path.normpath(str(path))) in ('', '.'):
+        return status
+    return None
+
+def _note_seen_records(status, data, previous=None):
+    """Depo kapalıyken (ARTICLE_STORE=json) görülme indeksini güncel tut.
+    
+    Dosya yazıldıktan sonra çağrılır; listeden çıkan kayıtlar (onay/ret/silme)
+    indeksten de düşülür, depo yolundaki forget_many ile aynı davranış."""
+    try:
+        index = get_seen_index()
+        index.add_many(data, status)
+        if previous:
+            current = {json.dumps(record, sort_keys=True, default=str) for record in data}
+            removed = [record for record in previous
+                       if json.dumps(record, sort_keys=True, default=str) not in current]
+            if removed:
+                index.forget_many(removed, status)
+    except Exception as e:
+        print(f"⚠️ Görülme indeksi güncellenemedi ({status}): {e}")
+
+def is_article_seen(url=None, title=None, hash_value=None, within_hours=None, statuses=None):
+    """Makale daha önce paylaşıldı/beklemede/reddedildi mi - O(1) indeks kontrolü"""
+    if SEEN_INDEX_AVAILABLE:
+        try:
+            return get_seen_index().is_seen(url, title, hash_value, within_hours, statuses)
+        except Exception as e:
+            safe_log(f"Görülme indeksi hatası, dosya taramasına geçiliyor: {e}", "WARNING")
+    paths = {"posted": HISTORY_FILE, "pending": "pending_tweets.json", "rejected": "rejected_articles.json"}
+    for status, path in paths.items():
+        if statuses and status not in statuses:
+            continue
+        if json_record_exists(path, url=url, hash_value=hash_value or (hashlib.md5(title.encode()).hexdigest() if title else None)):
+            return True
+    return False
+
+def get_article_seen_status(url=None, title=None, hash_value=None):
+    """Eşleşen kaydın durumunu döndür: posted / pending / rejected / None"""
+    if SEEN_INDEX_AVAILABLE:
+        try:
+            return get_seen_index().lookup(url, title, hash_value)
+        except Exception as e:
+            safe_log(f"Görülme indeksi hatası: {e}", "WARNING")
+    for status in ("posted", "pending", "rejected"):
+        if is_article_seen(url, title, hash_value, statuses=(status,)):
+            return status
+    return None
+
 def load_json(path, default=None, limit=None):
-    """JSON dosyasını yükle - limit parametresi ile performans optimizasyonu"""
+    """JSON dosyasını yükle - limit parametresi ile performans optimizasyonu.
+    
+    Sonuç süreç genelindeki durum önbelleğinden gelir; dosya/depo değişmedikçe
+    yeniden parse edilmez. Dönen nesne her çağrıda yeni bir kopyadır."""
+    if STATE_CACHE_AVAILABLE:
+        data = get_state_cache(_state_cache_token).get(path, lambda: _read_json(path, limit), variant=limit)
+    else:
+        data = _read_json(path, limit)
+    if data is None:
+        return default if default is not None else []
+    return data
+
+def _read_json(path, limit=None):
+    """Dosyayı/depo koleksiyonunu oku - bulunamazsa veya okunamazsa None"""
+    collection = _store_collection(path)
+    if collection:
+        try:
+            return get_article_store().load(collection, limit=limit)
+        except Exception as e:
+            print(f"Makale deposu okuma hatası ({path}): {e}")
+            return None
+    
     if os.path.exists(path):
         try:
             with open(path, 'r', encoding='utf-8') as f:
@@ -576,18 +974,68 @@ def load_json(path, default=None, limit=None):
                 return data
         except json.JSONDecodeError as e:
             print(f"JSON parse hatası ({path}): {e}")
-            return default if default is not None else []
+            return None
         except Exception as e:
             print(f"Dosya okuma hatası ({path}): {e}")
-            return default if default is not None else []
+            return None
+    
+    return None
+
+def _state_cache_token(path):
+    """Önbellek imzası: depo koleksiyonlarında koleksiyon sayacı, dosyalarda stat.
     
-    return default if default is not None else []
+    Veritabanı geneli data_version kullanılmaz - görülme indeksi, istatistik
+    sayaçları veya başka bir koleksiyona yazım bu kaydı geçersiz kılmamalı."""
+    collection = _store_collection(path)
+    if collection:
+        try:
+            return ("store", collection, get_article_store().collection_version(collection))
+        except Exception:
+            return None
+    return file_token(path)
+
+def _invalidate_state_cache(path):
+    if STATE_CACHE_AVAILABLE:
+        get_state_cache(_state_cache_token).invalidate(path)
+
+def _notify_state_changed():
+    """Yazım sonrası olay izleyicilerini uyandır (abone yoksa maliyetsiz)"""
+    if EVENT_BUS_AVAILABLE:
+        get_event_bus().poke()
+
+def get_state_cache_stats():
+    """Durum önbelleğinin isabet oranları"""
+    if not STATE_CACHE_AVAILABLE:
+        return {"available": False}
+    return {"available": True, **get_state_cache(_state_cache_token).stats()}
 
 def save_json(path, data):
-    """JSON dosyasını kaydet - atomic write ile"""
-    import tempfile
+    """JSON dosyasını kaydet - atomic write ile.
+    
+    pending_tweets.json / posted_articles.json yazımları tek yazıcı kuyruğundan
+    geçer (dosya kilidi + diğer güncellemelerle sıralı)."""
+    if STATE_WRITER_AVAILABLE and is_managed_path(path):
+        _get_json_state_writer().replace(path, data)
+        return
+    _write_json(path, data)
+
+def _write_json(path, data):
+    """save_json'un asıl yazım adımı (kuyruk yazıcısı da bunu kullanır)"""
     import shutil
     
+    if _is_pending_path(path) and isinstance(data, list):
+        assign_pending_ids(data)
+    
+    collection = _store_collection(path)
+    if collection and isinstance(data, list):
+        # Sadece değişen satırlar yazılır
+        get_article_store().replace_all(collection, data)
+        _notify_state_changed()
+        return
+    
+    seen_status = _seen_status_for_path(path) if isinstance(data, list) else None
+    previous = load_json(path, []) if seen_status else None
+    
     try:
         # Geçici dosyaya yaz
         temp_path = f"{path}.tmp"
@@ -596,6 +1044,10 @@ def save_json(path, data):
         
         # Atomic move
         shutil.move(temp_path, path)
+        _invalidate_state_cache(path)
+        if seen_status:
+            _note_seen_records(seen_status, data, previous)
+        _notify_state_changed()
         
     except Exception as e:
         # Geçici dosyayı temizle
@@ -606,6 +1058,752 @@ def save_json(path, data):
                 pass
         raise e
 
+def _append_json_records(path, records):
+    """Kayıtları ekle - depo etkinse dosyanın tamamı yeniden yazılmaz"""
+    collection = _store_collection(path)
+    if collection and not _is_pending_path(path):
+        get_article_store().append_many(collection, records)
+        _notify_state_changed()
+        return
+    data = load_json(path, [])
+    data.extend(records)
+    _write_json(path, data)
+
+def _get_json_state_writer():
+    return get_state_writer(load_json, _write_json, _append_json_records)
+
+def append_json_record(path, record):
+    """Listeye tek kayıt ekle - depo etkinse dosyanın tamamı yeniden yazılmaz"""
+    if STATE_WRITER_AVAILABLE and is_managed_path(path):
+        _get_json_state_writer().append(path, record)
+        return
+    _append_json_records(path, [record])
+
+def append_json_records(path, records):
+    """Listeye birden çok kaydı tek yazımda ekle (toplu işlemler için)"""
+    records = list(records)
+    if not records:
+        return
+    if STATE_WRITER_AVAILABLE and is_managed_path(path):
+        _get_json_state_writer().extend(path, records)
+        return
+    _append_json_records(path, records)
+
+def update_json(path, mutator, default=None, wait=True):
+    """Oku-değiştir-yaz işlemini kayıpsız yap.
+    
+    mutator(data) güncel veriyi yerinde değiştirir, dönüş değeri çağırana iletilir.
+    Yönetilen dosyalarda işlem tek yazıcı kuyruğuna gider; art arda gelen
+    işlemler tek okuma + tek yazımda birleştirilir. wait=False ise Future döner."""
+    if STATE_WRITER_AVAILABLE and is_managed_path(path):
+        return _get_json_state_writer().update(path, mutator, default, wait=wait)
+    data = load_json(path, default)
+    result = mutator(data)
+    _write_json(path, data)
+    return result
+
+def get_state_writer_stats():
+    """Tek yazıcı kuyruğunun işlem/yazım sayaçları"""
+    if not STATE_WRITER_AVAILABLE:
+        return {"available": False}
+    return {"available": True, **_get_json_state_writer().stats()}
+
+# Listeleme türü -> (dosya, sabit filtreler)
+LISTING_KINDS = {
+    "pending": ("pending_tweets.json", {}),
+    "rejected": ("rejected_articles.json", {}),
+    "archived": ("archived_articles.json", {}),
+    "shared": ("posted_articles.json", {"status": "posted"}),
+    "deleted": ("posted_articles.json", {"status": "deleted"}),
+}
+LISTING_MAX_LIMIT = 200
+
+def list_records(kind, filters=None, sort="date", descending=True, cursor=None, limit=20):
+    """Sayfalı, sunucu tarafında süzülmüş ve sıralanmış listeleme.
+    
+    filters: status, source_type, fetch_method, source, date_from, date_to (YYYY-MM-DD), q (metin arama)
+    sort: date | title | source. cursor bir önceki sayfanın next_cursor değeridir.
+    Dönüş: {"items", "next_cursor", "total", "limit"} - items görüntü alanları eklenmiş kayıtlardır."""
+    if kind not in LISTING_KINDS:
+        raise ValueError(f"Bilinmeyen liste türü: {kind}")
+    path, fixed_filters = LISTING_KINDS[kind]
+    filters = {key: value for key, value in (filters or {}).items() if value not in (None, "")}
+    filters.update(fixed_filters)
+    limit = max(1, min(int(limit or 20), LISTING_MAX_LIMIT))
+    
+    if kind == "pending":
+        # Sayfadaki ID'ler kalıcı olmalı (sayfa içi sıra+1 başka kaydı gösterir)
+        ensure_pending_ids()
+    
+    collection = _store_collection(path)
+    if collection:
+        store = get_article_store()
+        rows, next_cursor = store.list_page(collection, filters, sort, descending, cursor, limit)
+        total = store.count_matching(collection, filters)
+    else:
+        rows, next_cursor, total = _list_records_in_memory(path, filters, sort, descending, cursor, limit)
+    
+    return {
+        "items": [_listing_item(kind, record, display, position) for position, record, display in rows],
+        "next_cursor": next_cursor,
+        "total": total,
+        "limit": limit,
+    }
+
+def _list_records_in_memory(path, filters, sort, descending, cursor, limit):
+    """Depo kapalıyken (ARTICLE_STORE=json) aynı filtre/sıralama anlamıyla liste"""
+    records = load_json(path, [])
+    if not ARTICLE_STORE_AVAILABLE:
+        # Görüntü alanları hesaplanamıyor - sadece son kayıtlar
+        indexed = list(enumerate(records))
+        window = list(reversed(indexed))[:limit] if descending else indexed[:limit]
+        return [(i, r, {}) for i, r in window], None, len(records)
+    
+    collection = STORE_COLLECTIONS[path]
+    column = SORT_COLUMNS.get(sort, "sort_date")
+    terms = str(filters.get("q", "")).lower().split()
+    
+    def matches(display):
+        for key in ("status", "source_type", "fetch_method", "source"):
+            wanted = filters.get(key)
+            if wanted:
+                wanted = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+                if display[key] not in [str(w) for w in wanted]:
+                    return False
+        if filters.get("date_from") and display["sort_date"] < str(filters["date_from"]):
+            return False
+        if filters.get("date_to") and display["sort_date"][:10] > str(filters["date_to"])[:10]:
+            return False
+        return all(term in display["search"] for term in terms)
+    
+    rows = []
+    for position, record in enumerate(records):
+        display = display_fields(collection, record)
+        if matches(display):
+            rows.append((position, record, display))
+    rows.sort(key=lambda row: (row[2][column], row[0]), reverse=descending)
+    
+    after = decode_cursor(cursor)
+    if after is not None:
+        key = tuple(after)
+        rows_after = [row for row in rows
+                      if ((row[2][column], row[0]) < key if descending else (row[2][column], row[0]) > key)]
+    else:
+        rows_after = rows
+    page = rows_after[:limit]
+    next_cursor = None
+    if len(rows_after) > limit:
+        next_cursor = encode_cursor([page[-1][2][column], page[-1][0]])
+    return page, next_cursor, len(rows)
+
+def _listing_item(kind, record, display, position):
+    """Şablonların beklediği görüntü alanlarını kayda ekle (sadece sayfadaki kayıtlar için)"""
+    if not isinstance(record, dict):
+        return record
+    if kind == "pending":
+        article = record.get('article') if isinstance(record.get('article'), dict) else None
+        body = display.get("body") or record.get('content', '')
+        record['content'] = body
+        record['title'] = article.get('title', 'Başlık bulunamadı') if article is not None else record.get('content', 'Başlık bulunamadı')
+        record['url'] = article.get('url', '') if article is not None else ''
+        record['tweet'] = body
+        record['article_title'] = display.get("title", "")
+        record.setdefault('source_type', display.get("source_type") or 'news')
+        if record.get('id') is None:
+            # Henüz ID yazılmamış kayıt - dosyadaki sıra+1 (assign_pending_ids ile aynı)
+            record['id'] = position + 1
+    elif kind == "rejected":
+        record['rejected_at_formatted'] = _format_listing_date(record.get('rejected_at'))
+        # Sil/tekrar dene/toplu sil uç noktaları dosyadaki sıra numarasını bekler
+        record['list_position'] = position
+    return record
+
+def _format_listing_date(value):
+    """ISO tarihi gg.aa.yyyy ss:dd biçimine çevir"""
+    if not value:
+        return 'Bilinmiyor'
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00')).strftime('%d.%m.%Y %H:%M')
+    except (ValueError, TypeError):
+        return value
+
+SEARCH_SET_FILES = {
+    "posted": ("posted_articles.json", lambda display: display["status"] != "deleted"),
+    "pending": ("pending_tweets.json", None),
+    "rejected": ("rejected_articles.json", None),
+    "deleted": ("posted_articles.json", lambda display: display["status"] == "deleted"),
+    "archived": ("archived_articles.json", None),
+}
+
+def search_articles(query, sets=None, cursor=None, limit=20):
+    """Tüm makale kümelerinde tam metin arama - alaka sırasına göre sayfalı.
+    
+    sets: posted, pending, rejected, deleted, archived (boşsa hepsi).
+    Dönüş: {"items", "next_cursor", "total", "ranked", "took_ms"}"""
+    if SEARCH_INDEX_AVAILABLE and _store_collection("posted_articles.json"):
+        return get_search_index(get_article_store()).search(query, sets, cursor, limit)
+    return _search_articles_in_memory(query, sets, cursor, limit)
+
+def _search_articles_in_memory(query, sets, cursor, limit):
+    """Depo kapalıyken (ARTICLE_STORE=json) basit tarama: tüm terimler geçmeli,
+    başlıkta geçen terimler öne alınır; imleç sıradaki kaydın konumudur"""
+    started = time.time()
+    terms = str(query or "").lower().split()
+    if not terms or not ARTICLE_STORE_AVAILABLE:
+        return {"items": [], "next_cursor": None, "total": 0, "ranked": 0, "took_ms": 0.0}
+    limit = max(1, min(int(limit or 20), 100))
+    
+    matches = []
+    for name in (sets or SEARCH_SET_FILES):
+        if name not in SEARCH_SET_FILES:
+            continue
+        path, accept = SEARCH_SET_FILES[name]
+        collection = STORE_COLLECTIONS[path]
+        for position, record in enumerate(load_json(path, [])):
+            display = display_fields(collection, record)
+            if (accept and not accept(display)) or not all(term in display["search"] for term in terms):
+                continue
+            title = display["title"].lower()
+            score = sum(3 if term in title else 1 for term in terms)
+            matches.append((-score, display["sort_date"], name, collection, position, record, display))
+    # Aynı skorda en yeni kayıt önce
+    matches.sort(key=lambda m: m[1], reverse=True)
+    matches.sort(key=lambda m: m[0])
+    
+    offset = decode_cursor(cursor)
+    start = int(offset[1]) if offset else 0
+    page = matches[start:start + limit]
+    items = [{
+        "set": name, "collection": collection, "position": position, "status": display["status"],
+        "title": display["title"], "body": display["body"], "source": display["source"],
+        "date": display["sort_date"], "url": record.get("url", "") if isinstance(record, dict) else "",
+        "score": float(-score), "snippet": "",
+    } for score, _, name, collection, position, record, display in page]
+    next_cursor = encode_cursor(["offset", start + limit]) if start + limit < len(matches) else None
+    return {"items": items, "next_cursor": next_cursor, "total": len(matches), "ranked": len(matches),
+            "took_ms": round((time.time() - started) * 1000, 2)}
+
+def get_rejected_stats():
+    """Reddedilen makaleler sayfası istatistikleri (sayaçlardan; depo kapalıysa tarayarak)"""
+    from datetime import date
+    today = date.today()
+    week_ago = (today - timedelta(days=7)).isoformat()
+    aggregator = _stats_aggregator()
+    if aggregator is not None:
+        reasons = aggregator.breakdown("rejected", "reason")
+        return {
+            "total_rejected": aggregator.total("rejected", "total"),
+            "rejected_today": aggregator.total("rejected", "rejected", day=today.isoformat()),
+            "rejected_this_week": sum(aggregator.daily("rejected", "rejected", week_ago).values()),
+            "common_reasons": dict(sorted(reasons.items(), key=lambda x: x[1], reverse=True)[:5]),
+        }
+    
+    rejected_articles = load_json("rejected_articles.json", [])
+    stats = {"total_rejected": len(rejected_articles), "rejected_today": 0, "rejected_this_week": 0, "common_reasons": {}}
+    for article in rejected_articles:
+        try:
+            if 'rejected_at' in article:
+                rejected_date = datetime.fromisoformat(article['rejected_at'].replace('Z', '+00:00')).date()
+                if rejected_date == today:
+                    stats["rejected_today"] += 1
+                if rejected_date.isoformat() >= week_ago:
+                    stats["rejected_this_week"] += 1
+        except Exception:
+            pass
+        reason = article.get('reason', 'Bilinmeyen')
+        stats["common_reasons"][reason] = stats["common_reasons"].get(reason, 0) + 1
+    stats["common_reasons"] = dict(sorted(stats["common_reasons"].items(), key=lambda x: x[1], reverse=True)[:5])
+    return stats
+
+def get_deleted_stats():
+    """Silinmiş tweetler sayfası istatistikleri (sayaçlardan; depo kapalıysa tarayarak)"""
+    from datetime import date
+    today = date.today()
+    week_ago = (today - timedelta(days=7)).isoformat()
+    month_ago = (today - timedelta(days=30)).isoformat()
+    aggregator = _stats_aggregator()
+    if aggregator is not None:
+        daily = aggregator.daily("posted", "deleted", month_ago)
+        return {
+            "total_deleted": aggregator.total("posted", "deleted"),
+            "deleted_today": daily.get(today.isoformat(), 0),
+            "deleted_this_week": sum(v for day, v in daily.items() if day >= week_ago),
+            "deleted_this_month": sum(daily.values()),
+        }
+    
+    deleted_articles = [a for a in load_json("posted_articles.json", []) if a.get('deleted', False)]
+    stats = {"total_deleted": len(deleted_articles), "deleted_today": 0, "deleted_this_week": 0, "deleted_this_month": 0}
+    for article in deleted_articles:
+        deleted_date_str = article.get('deleted_date', '')
+        if not deleted_date_str:
+            continue
+        try:
+            deleted_date = datetime.fromisoformat(deleted_date_str.replace('Z', '+00:00')).date().isoformat()
+        except Exception:
+            continue
+        if deleted_date == today.isoformat():
+            stats['deleted_today'] += 1
+        if deleted_date >= week_ago:
+            stats['deleted_this_week'] += 1
+        if deleted_date >= month_ago:
+            stats['deleted_this_month'] += 1
+    return stats
+
+def _pending_tweet_url_hash(tweet):
+    article = tweet.get('article', {}) if isinstance(tweet.get('article'), dict) else {}
+    return (article.get('url') or tweet.get('url') or ''), (article.get('hash') or tweet.get('hash') or '')
+
+def _is_pending_path(path):
+    return os.path.basename(str(path)) == "pending_tweets.json"
+
+def _pending_id_number(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def assign_pending_ids(pending_tweets):
+    """ID'siz pending kayıtlarına kalıcı ID ver - boşsa eski sıra+1 değeri
+    (açık sayfalardaki bağlantılar bozulmasın), doluysa en büyük ID+1 (kullanılan
+    ID'ler izlendiği için sıra+1 ile çakışmaz).
+    Atanan kayıt sayısını döndürür"""
+    used = {str(t['id']) for t in pending_tweets if isinstance(t, dict) and t.get('id') is not None}
+    next_id = max((n for n in map(_pending_id_number, used) if n is not None), default=0) + 1
+    assigned = 0
+    for i, tweet in enumerate(pending_tweets):
+        if not isinstance(tweet, dict) or tweet.get('id') is not None:
+            continue
+        if str(i + 1) in used:
+            tweet['id'] = next_id
+            next_id += 1
+        else:
+            tweet['id'] = i + 1
+            next_id = max(next_id, i + 2)
+        used.add(str(tweet['id']))
+        assigned += 1
+    return assigned
+
+_pending_ids_checked = False
+
+def ensure_pending_ids():
+    """pending_tweets.json'daki ID'siz kayıtlara ID yazar (süreç başına bir kez kontrol edilir;
+    sonraki tüm yazımlar _write_json üzerinden ID atar). Atanan kayıt sayısını döndürür"""
+    global _pending_ids_checked
+    if _pending_ids_checked:
+        return 0
+    pending_tweets = load_json("pending_tweets.json", [])
+    assigned = 0
+    if any(isinstance(t, dict) and t.get('id') is None for t in pending_tweets):
+        assigned = update_json("pending_tweets.json", assign_pending_ids, [])
+        safe_log(f"🔢 {assigned} pending tweet'e kalıcı ID verildi", "INFO")
+    _pending_ids_checked = True
+    return assigned
+
+def add_pending_tweet(new_tweet):
+    """Pending listesine tweet ekle - URL/hash duplikatı varsa eklenmez.
+    
+    Kontrol, ID ataması (en büyük ID+1) ve ekleme aynı kuyruk işleminde yapılır
+    (arada başka ekleme giremez). Dönüş: (eklendi_mi, eklenen veya mevcut kayıt)"""
+    url, hash_value = _pending_tweet_url_hash(new_tweet)
+    
+    def mutate(pending_tweets):
+        for existing in pending_tweets:
+            if not isinstance(existing, dict):
+                continue
+            existing_url, existing_hash = _pending_tweet_url_hash(existing)
+            if (url and url == existing_url) or (hash_value and hash_value == existing_hash):
+                return False, existing
+        assign_pending_ids(pending_tweets)
+        existing_ids = [_pending_id_number(t.get('id')) for t in pending_tweets if isinstance(t, dict)]
+        new_tweet['id'] = max((n for n in existing_ids if n is not None), default=0) + 1
+        pending_tweets.append(new_tweet)
+        return True, new_tweet
+    
+    return update_json("pending_tweets.json", mutate, [])
+
+def remove_pending_tweets(tweet_ids):
+    """ID'si verilen pending tweet'leri kaldır - eşleşme sadece kalıcı ID ile yapılır
+    (sıra numarası her silmede kayar). Kaldırılanları döndürür"""
+    wanted = {str(tweet_id) for tweet_id in tweet_ids}
+    
+    def mutate(pending_tweets):
+        assign_pending_ids(pending_tweets)
+        removed = []
+        keep = []
+        for tweet in pending_tweets:
+            if isinstance(tweet, dict) and str(tweet.get('id')) in wanted:
+                removed.append(tweet)
+            else:
+                keep.append(tweet)
+        pending_tweets[:] = keep
+        return removed
+    
+    return update_json("pending_tweets.json", mutate, [])
+
+def json_record_exists(path, url=None, hash_value=None):
+    """URL/hash ile kayıt var mı - depo etkinse indeks kullanılır"""
+    collection = _store_collection(path)
+    if collection:
+        return get_article_store().exists(collection, url=url, hash_value=hash_value)
+    for record in load_json(path, []):
+        article = record.get('article', {}) if isinstance(record.get('article'), dict) else {}
+        if url and url == (record.get('url') or article.get('url')):
+            return True
+        if hash_value and hash_value == (record.get('hash') or article.get('hash')):
+            return True
+    return False
+
+def _existing_hashes(path, hashes, deleted=None):
+    """Verilen hash'lerden dosyada bulunanlar - depo etkinse tek indeks sorgusu, değilse tek tarama"""
+    hashes = {str(h) for h in hashes if h}
+    if not hashes:
+        return set()
+    collection = _store_collection(path)
+    if collection:
+        return get_article_store().existing_hashes(collection, hashes, deleted=deleted)
+    found = set()
+    for record in load_json(path, []):
+        if not isinstance(record, dict):
+            continue
+        if deleted is not None and bool(record.get('deleted')) != deleted:
+            continue
+        article = record.get('article', {}) if isinstance(record.get('article'), dict) else {}
+        hash_value = record.get('hash') or article.get('hash')
+        if hash_value in hashes:
+            found.add(hash_value)
+    return found
+
+# =============================================================================
+# TOPLU İŞLEMLER
+# Seçilen ID/URL'ler bir kez indekslenir, kayıtlar tek geçişte işlenir ve
+# etkilenen her dosya tek kez yazılır (eskiden her ID için liste taranıyor,
+# her ret için posted_articles.json yeniden okunuyordu).
+# =============================================================================
+
+def pending_tweet_text(tweet):
+    """Pending kaydının tweet metni - content, tweet_data.tweet, tweet sırasıyla"""
+    if not isinstance(tweet, dict):
+        return ''
+    tweet_text = tweet.get('content', '')
+    if not tweet_text and isinstance(tweet.get('tweet_data'), dict):
+        tweet_text = tweet['tweet_data'].get('tweet', '')
+    if not tweet_text:
+        tweet_text = tweet.get('tweet', '')
+    return tweet_text or ''
+
+def _pending_article_view(tweet):
+    """Pending kaydının alanları - çoğu kayıtta başlık/url/hash article altında"""
+    article = tweet.get('article') if isinstance(tweet.get('article'), dict) else {}
+    return {**article, **{key: value for key, value in tweet.items() if key != 'article' and value}}
+
+def _pending_tweet_hash(tweet):
+    """Kayıt hash'i - yoksa başlığın md5'i"""
+    view = _pending_article_view(tweet)
+    hash_value = view.get('hash', '')
+    if not hash_value and view.get('title'):
+        hash_value = hashlib.md5(view['title'].encode()).hexdigest()
+    return hash_value
+
+def _select_pending_tweets(tweet_ids):
+    """Seçilen ID'leri pending listesinin tek geçişlik indeksiyle eşle.
+    Dönüş: ([(id, tweet)], hatalar)"""
+    ensure_pending_ids()
+    index = {}
+    for tweet in load_json("pending_tweets.json", []):
+        if isinstance(tweet, dict):
+            index.setdefault(str(tweet.get('id')), tweet)
+    selected = []
+    errors = []
+    seen = set()
+    for tweet_id in tweet_ids:
+        key = str(tweet_id)
+        if key in seen:
+            continue
+        seen.add(key)
+        tweet = index.get(key)
+        if not isinstance(tweet, dict):
+            errors.append(f"Tweet ID {tweet_id} bulunamadı")
+            continue
+        selected.append((key, tweet))
+    return selected, errors
+
+def bulk_reject_pending(tweet_ids):
+    """Seçilen pending tweet'leri reddet: pending tek işlemde güncellenir,
+    silindi kayıtları posted_articles.json'a tek yazımda eklenir.
+    Dönüş: (reddedilen sayısı, hatalar)"""
+    selected, errors = _select_pending_tweets(tweet_ids)
+    already_rejected = _existing_hashes(HISTORY_FILE, [_pending_tweet_hash(t) for _, t in selected], deleted=True)
+    
+    reject_ids = []
+    for tweet_id, tweet in selected:
+        hash_value = _pending_tweet_hash(tweet)
+        if hash_value and hash_value in already_rejected:
+            errors.append(f"Tweet ID {tweet_id}: Bu tweet zaten reddedilmiş")
+            continue
+        reject_ids.append(tweet_id)
+    if not reject_ids:
+        return 0, errors
+    
+    # Arada başkası tarafından kaldırılanlar için kayıt oluşturulmaz
+    removed = remove_pending_tweets(reject_ids)
+    now = datetime.now().isoformat()
+    deleted_articles = []
+    for tweet in removed:
+        view = _pending_article_view(tweet)
+        deleted_article = {
+            "title": view.get('title', ''),
+            "url": view.get('url', ''),
+            "hash": _pending_tweet_hash(tweet),
+            "content": view.get('content', ''),
+            "source": view.get('source', ''),
+            "source_type": view.get('source_type', 'news'),
+            "published_date": view.get('created_at', now),
+            "posted_date": now,
+            "tweet_text": pending_tweet_text(tweet),
+            "deleted": True,
+            "deleted_date": now,
+            "deletion_reason": 'Bulk rejection',
+            "bulk_operation": True,
+            "is_posted": False
+        }
+        # GitHub repo ise ek bilgileri ekle
+        if view.get('source_type') == 'github':
+            deleted_article.update({
+                "type": "github_repo",
+                "repo_data": view.get('repo_data', {}),
+                "language": view.get('language', ''),
+                "stars": view.get('stars', 0),
+                "forks": view.get('forks', 0),
+                "owner": view.get('owner', ''),
+                "topics": view.get('topics', [])
+            })
+        deleted_articles.append(deleted_article)
+    append_json_records(HISTORY_FILE, deleted_articles)
+    
+    if len(removed) < len(reject_ids):
+        errors.append(f"{len(reject_ids) - len(removed)} tweet işlem sırasında pending listesinden kaldırılmıştı")
+    return len(removed), errors
+
+def _post_queued_tweet(item):
+    """Paylaşım kuyruğunun çalışanı: paylaş, posted'a ekle, pending'den kaldır"""
+    # Kuyruğa alındıktan sonra başka bir işte/istekte paylaşılmış olabilir
+    hash_value = item['article_data'].get('hash')
+    if hash_value and json_record_exists(HISTORY_FILE, hash_value=hash_value):
+        return {"success": False, "error": "Bu tweet zaten paylaşılmış"}
+    tweet_result = post_tweet(item['tweet_text'], item.get('title', ''))
+    if tweet_result.get('success'):
+        mark_article_as_posted(item['article_data'], tweet_result)
+        # Pending'den sadece başarılı paylaşım sonrası, kalıcı ID ile kaldırılır
+        # (sıra numarası önceki kaldırmalarla kayar)
+        remove_pending_tweets([item['id']])
+    return tweet_result
+
+def _get_post_queue():
+    return get_post_queue(_post_queued_tweet, lambda: check_rate_limit("tweets"))
+
+def queue_pending_for_posting(tweet_ids):
+    """Seçilen pending tweet'leri doğrulayıp arka plan paylaşım kuyruğuna ver.
+    Dönüş: {"job_id", "queued_count", "errors"}"""
+    if not POST_QUEUE_AVAILABLE:
+        return {"job_id": None, "queued_count": 0, "errors": ["Paylaşım kuyruğu kullanılamıyor"]}
+    
+    selected, errors = _select_pending_tweets(tweet_ids)
+    already_posted = _existing_hashes(HISTORY_FILE, [_pending_tweet_hash(t) for _, t in selected])
+    
+    items = []
+    queued_hashes = set()
+    for tweet_id, tweet in selected:
+        hash_value = _pending_tweet_hash(tweet)
+        if hash_value and (hash_value in already_posted or hash_value in queued_hashes):
+            errors.append(f"Tweet ID {tweet_id}: Bu tweet zaten paylaşılmış")
+            continue
+        tweet_text = pending_tweet_text(tweet)
+        if not tweet_text.strip():
+            errors.append(f"Tweet ID {tweet_id}: Tweet metni boş olamaz")
+            continue
+        if hash_value:
+            queued_hashes.add(hash_value)
+        view = _pending_article_view(tweet)
+        items.append({
+            "id": tweet['id'],
+            "title": view.get('title', ''),
+            "tweet_text": tweet_text,
+            "article_data": {
+                'id': tweet.get('id'),
+                'title': view.get('title', ''),
+                'hash': hash_value,
+                'content': view.get('content', ''),
+                'url': view.get('url', ''),
+                'source': view.get('source', ''),
+                'category': view.get('category', 'ai_general'),
+                'tags': view.get('tags', []),
+                'score': view.get('score', 0),
+                'posted_date': datetime.now().isoformat(),
+                'tweet_text': tweet_text,
+                'manual_approval': True,
+                'bulk_operation': True
+            }
+        })
+    
+    # Önceki bir toplu onayda hâlâ sırada olanlar tekrar kuyruğa alınmaz
+    job_id, skipped = _get_post_queue().submit_unique(items, lambda item: str(item['id']), "bulk_approve")
+    for item in skipped:
+        errors.append(f"Tweet ID {item['id']}: Zaten paylaşım kuyruğunda")
+    return {"job_id": job_id, "queued_count": len(items) - len(skipped), "errors": errors}
+
+def get_post_job(job_id):
+    """Paylaşım işinin durumu (bilinmeyen kimlikte None)"""
+    if not POST_QUEUE_AVAILABLE:
+        return None
+    return _get_post_queue().job(job_id)
+
+def cancel_post_job(job_id):
+    """İşin henüz paylaşılmamış tweet'lerini iptal et (pending'de kalırlar)"""
+    if not POST_QUEUE_AVAILABLE:
+        return False
+    return _get_post_queue().cancel(job_id)
+
+def get_post_queue_stats():
+    """Paylaşım kuyruğu sayaçları ve son işler"""
+    if not POST_QUEUE_AVAILABLE:
+        return {"available": False}
+    post_queue = _get_post_queue()
+    return {"available": True, **post_queue.stats(), "recent_jobs": post_queue.jobs()}
+
+def bulk_convert_rejected_articles(urls):
+    """Reddedilen makaleleri pending tweet'e çevir - her dosya tek kez yazılır.
+    Dönüş: (çevrilen başlıklar, hatalar)"""
+    wanted = list(dict.fromkeys(url for url in urls if url))
+    articles = {}
+    for article in load_json("rejected_articles.json", []):
+        if isinstance(article, dict) and article.get('url') in wanted:
+            articles.setdefault(article['url'], article)
+    errors = [f"Makale bulunamadı: {url}" for url in wanted if url not in articles]
+    found = [url for url in wanted if url in articles]
+    if not found:
+        return [], errors
+    
+    created_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+    def add_to_pending(pending_tweets):
+        existing = set()
+        existing_ids = [len(pending_tweets)]
+        for tweet in pending_tweets:
+            if isinstance(tweet, dict):
+                existing.update(value for value in _pending_tweet_url_hash(tweet) if value)
+                if isinstance(tweet.get('id'), int):
+                    existing_ids.append(tweet['id'])
+        next_id = max(existing_ids) + 1
+        added = []
+        for url in found:
+            article = articles[url]
+            if url in existing or (article.get('hash') and article['hash'] in existing):
+                continue
+            tweet_content = f"🤖 {article.get('title', 'Haber')}\n\n📰 Kaynak: {article.get('source', 'Bilinmeyen')}\n🔗 Detaylar: {url}\n\n#AI #Haber #Teknoloji"
+            pending_tweets.append({
+                'id': next_id,
+                'content': tweet_content,
+                'article': article,
+                'created_at': created_at,
+                'source_type': 'rejected_converted'
+            })
+            next_id += 1
+            added.append(url)
+        return added
+    
+    added = set(update_json("pending_tweets.json", add_to_pending, []))
+    errors.extend(f"Zaten bekleyen listesinde: {url}" for url in found if url not in added)
+    
+    # Pending'de olanlar (yeni eklenen veya zaten bulunan) reddedilenlerden çıkar
+    found_set = set(found)
+    
+    def remove_from_rejected(rejected):
+        rejected[:] = [a for a in rejected if not (isinstance(a, dict) and a.get('url') in found_set)]
+    
+    update_json("rejected_articles.json", remove_from_rejected, [])
+    return [articles[url].get('title', 'Bilinmeyen') for url in found if url in added], errors
+
+def bulk_remove_rejected_articles(urls):
+    """Reddedilen makaleleri URL ile kalıcı sil - tek geçiş, tek yazım.
+    Dönüş: (silinen başlıklar, hatalar)"""
+    wanted = set(url for url in urls if url)
+    
+    def mutate(rejected):
+        removed = {}
+        keep = []
+        for article in rejected:
+            url = article.get('url') if isinstance(article, dict) else None
+            if url in wanted:
+                removed.setdefault(url, article)
+            else:
+                keep.append(article)
+        rejected[:] = keep
+        return removed
+    
+    removed = update_json("rejected_articles.json", mutate, []) if wanted else {}
+    errors = [f"Makale bulunamadı: {url}" for url in dict.fromkeys(urls) if url not in removed]
+    return [article.get('title', 'Bilinmeyen') for article in removed.values()], errors
+
+def bulk_delete_rejected_positions(positions):
+    """Reddedilen makaleleri liste sırasıyla sil - tek geçiş, tek yazım.
+    Dönüş: (silinen başlıklar, hatalar)"""
+    wanted = set()
+    errors = []
+    for position in positions:
+        try:
+            wanted.add(int(position))
+        except (TypeError, ValueError):
+            errors.append(f"Makale ID {position} geçersiz")
+    
+    def mutate(rejected):
+        errors.extend(f"Makale ID {position} geçersiz" for position in sorted(wanted)
+                      if not 0 <= position < len(rejected))
+        removed = [article for i, article in enumerate(rejected) if i in wanted]
+        rejected[:] = [article for i, article in enumerate(rejected) if i not in wanted]
+        return removed
+    
+    removed = update_json("rejected_articles.json", mutate, []) if wanted else []
+    return [article.get('title', '') if isinstance(article, dict) else '' for article in removed], errors
+
+def bulk_archive_posted(tweet_ids, archive_reason='bulk_archive'):
+    """Paylaşılan tweet'leri hash/id/tweet_id ile arşivle - posted tek geçişte
+    bölünür, her dosya tek kez yazılır. Dönüş: arşivlenen kayıtlar"""
+    wanted = {str(tweet_id) for tweet_id in tweet_ids}
+    archived_at = datetime.now().isoformat()
+    
+    def mutate(articles):
+        archived = []
+        keep = []
+        for article in articles:
+            if isinstance(article, dict) and (str(article.get('hash', '')) in wanted or
+                                              str(article.get('id', '')) in wanted or
+                                              str(article.get('tweet_id', '')) in wanted):
+                article['archived'] = True
+                article['archived_at'] = archived_at
+                article['archive_reason'] = archive_reason
+                archived.append(article)
+            else:
+                keep.append(article)
+        if archived:
+            articles[:] = keep
+        return archived
+    
+    archived = update_json(HISTORY_FILE, mutate, [])
+    append_json_records("archived_articles.json", archived)
+    return archived
+
+def backup_json_file(path, backup_path):
+    """Dosyayı yedekle - depo koleksiyonları JSON olarak dışa aktarılır"""
+    import shutil
+    collection = _store_collection(path)
+    if collection:
+        get_article_store().export_to_json(collection, backup_path)
+        return True
+    if os.path.exists(path):
+        shutil.copy2(path, backup_path)
+        return True
+    return False
+
 def summarize_article(article_content, api_key):
     """LLM ile gelişmiş makale özetleme"""
     prompt = f"""Aşağıdaki AI/teknoloji haberini Türkçe olarak özetle. Özet tweet formatında, ilgi çekici ve bilgilendirici olsun:
@@ -649,12 +1847,33 @@ Seçenekler: Developer, Investor, General
 Cevap:"""
     return gemini_call(prompt, api_key, max_tokens=10).strip()
 
-def openrouter_call(prompt, api_key, max_tokens=100, model="moonshotai/kimi-k2:free"):
-    """OpenRouter API çağrısı - Ücretsiz model ile yedek sistem"""
+def openrouter_call(prompt, api_key, max_tokens=100, model="moonshotai/kimi-k2:free", temperature=0.7, use_cache=True,
+                    validate=None):
+    """OpenRouter API çağrısı - Ücretsiz model ile yedek sistem
+    
+    use_cache=False taze yanıt gerektiren çağrılar (bağlantı/model testleri) içindir.
+    Yanıt önbelleğe sadece validate(yanıt) doğru dönerse yazılır; validate verilmezse
+    yazılmaz. Önbellekteki yanıt validate'ten geçmezse silinir ve API tekrar çağrılır.
+    """
     if not api_key:
         safe_log("OpenRouter API anahtarı bulunamadı", "WARNING")
         return None
     
+    cache = get_llm_cache() if LLM_CACHE_AVAILABLE and is_llm_cache_enabled() else None
+    if cache is not None:
+        if use_cache:
+            cached = cache.get(model, prompt, max_tokens, temperature)
+            if cached is not None and validate is not None and not validate(cached):
+                safe_log(f"Önbellekteki OpenRouter yanıtı geçersiz, siliniyor ({model})", "WARNING")
+                cache.invalidate(model, prompt, max_tokens, temperature)
+                cached = None
+            if cached is not None:
+                safe_log(f"OpenRouter önbellekten yanıt: {len(cached)} karakter ({model})", "DEBUG")
+                trace_record(llm_cache_hits=1)
+                return cached
+        else:
+            cache.note_bypass()
+    
     try:
         import requests
         
@@ -677,26 +1896,45 @@ def openrouter_call(prompt, api_key, max_tokens=100, model="moonshotai/kimi-k2:f
                 }
             ],
             "max_tokens": max_tokens,
-            "temperature": 0.7,
+            "temperature": temperature,
             "top_p": 0.9,
             "frequency_penalty": 0.1,
             "presence_penalty": 0.1
         }
         
-        response = requests.post(
-            "https://openrouter.ai/api/v1/chat/completions",
-            headers=headers,
-            json=data,
-            timeout=30
-        )
+        with trace_span("openrouter", kind="ai_call", model=model, max_tokens=max_tokens) as ai_span:
+            # Paralel tweet üretiminde sağlayıcı limitini aşmamak için ortak sınırlayıcıdan geç
+            # (tekil arayüz çağrıları beklemez)
+            if OPENROUTER_LIMITER_AVAILABLE:
+                with openrouter_slot():
+                    response = http_post(
+                        "https://openrouter.ai/api/v1/chat/completions",
+                        headers=headers,
+                        json=data,
+                        timeout=30
+                    )
+            else:
+                response = http_post(
+                    "https://openrouter.ai/api/v1/chat/completions",
+                    headers=headers,
+                    json=data,
+                    timeout=30
+                )
+            ai_span.set(status_code=response.status_code)
         
         safe_log(f"OpenRouter API Response Status: {response.status_code}", "DEBUG")
         
         if response.status_code == 200:
             result = response.json()
+            usage = result.get("usage") or {}
+            if usage:
+                ai_span.add(prompt_tokens=usage.get("prompt_tokens", 0) or 0,
+                            completion_tokens=usage.get("completion_tokens", 0) or 0)
             if result.get("choices") and len(result["choices"]) > 0:
                 content = result["choices"][0]["message"]["content"].strip()
                 safe_log(f"OpenRouter API yanıtı alındı: {len(content)} karakter", "DEBUG")
+                if cache is not None and use_cache and content and validate is not None and validate(content):
+                    cache.put(model, prompt, max_tokens, temperature, content)
                 return content
             else:
                 safe_log("OpenRouter API yanıtında choices bulunamadı", "WARNING")
@@ -719,8 +1957,15 @@ def openrouter_call(prompt, api_key, max_tokens=100, model="moonshotai/kimi-k2:f
         safe_log(f"OpenRouter API çağrı hatası: {str(e)}", "ERROR")
         return None
 
-def ai_call(prompt, api_key=None, max_tokens=100):
-    """AI API çağrısı - Sadece OpenRouter kullanılır"""
+def _is_usable_ai_reply(result):
+    """ai_call'un kabul ettiği yanıt (en az 10 karakter, hata metni değil)"""
+    return bool(result) and result != "API hatası" and len(result.strip()) > 10
+
+def ai_call(prompt, api_key=None, max_tokens=100, use_cache=True, validate=None):
+    """AI API çağrısı - Sadece OpenRouter kullanılır
+    
+    validate(yanıt) verilirse yanıt ayrıca bununla doğrulanır (ör. JSON ayrıştırma);
+    önbelleğe sadece her iki kontrolden geçen yanıt yazılır."""
     
     # OpenRouter API anahtarını al
     openrouter_key = api_key or os.environ.get('OPENROUTER_API_KEY')
@@ -732,8 +1977,9 @@ def ai_call(prompt, api_key=None, max_tokens=100):
     safe_log("[OpenRouter] API çağrısı yapılıyor...", "INFO")
     
     try:
-        result = openrouter_call(prompt, openrouter_key, max_tokens)
-        if result and result != "API hatası" and len(result.strip()) > 10:  # Minimum 10 karakter kontrolü
+        accept = lambda reply: _is_usable_ai_reply(reply) and (validate is None or validate(reply))
+        result = openrouter_call(prompt, openrouter_key, max_tokens, use_cache=use_cache, validate=accept)
+        if _is_usable_ai_reply(result):  # Minimum 10 karakter kontrolü
             safe_log(f"✅ OpenRouter başarılı: {len(result)} karakter", "SUCCESS")
             return result
         else:
@@ -745,9 +1991,9 @@ def ai_call(prompt, api_key=None, max_tokens=100):
         return None  # None döndür, hata mesajı değil
 
 # Geriye uyumluluk için gemini_call fonksiyonunu ai_call'a yönlendir
-def gemini_call(prompt, api_key, max_tokens=100):
+def gemini_call(prompt, api_key, max_tokens=100, use_cache=True, validate=None):
     """Geriye uyumluluk için - artık OpenRouter kullanır"""
-    return ai_call(prompt, api_key, max_tokens)
+    return ai_call(prompt, api_key, max_tokens, use_cache=use_cache, validate=validate)
 
 def try_openrouter_fallback(prompt, max_tokens=100):
     """OpenRouter yedek sistemini dene"""
@@ -774,7 +2020,8 @@ def try_openrouter_fallback(prompt, max_tokens=100):
         for model in free_models:
             try:
                 safe_log(f"[TEST] OpenRouter modeli deneniyor: {model}", "DEBUG")
-                result = openrouter_call(prompt, openrouter_key, max_tokens, model)
+                result = openrouter_call(prompt, openrouter_key, max_tokens, model,
+                                         validate=lambda reply: len(reply.strip()) > 5)
                 
                 if result and len(result.strip()) > 5:
                     safe_log(f"[BASARILI] OpenRouter başarılı! Model: {model}", "SUCCESS")
@@ -794,10 +2041,76 @@ def try_openrouter_fallback(prompt, max_tokens=100):
     except Exception as e:
         safe_log(f"[HATA] OpenRouter yedek sistem hatası: {e}", "ERROR")
         return None
+# (kategori, anahtar kelimeler, hashtag'ler) - liste sırası öncelik sırasıdır.
+# Eşleşmeler kelime sınırlıdır ("meta" metadata'da, "ar" are'da eşleşmez),
+# bu yüzden ek almış biçimler ayrıca yazılır.
+COMPANY_HASHTAG_RULES = [
+    ("openai", ["openai"], ["#OpenAI", "#ChatGPT", "#GPT"]),
+    ("google", ["google"], ["#Google", "#GoogleAI", "#Gemini"]),
+    ("microsoft", ["microsoft"], ["#Microsoft", "#Azure", "#Copilot"]),
+    ("meta", ["meta"], ["#Meta", "#MetaAI", "#Llama"]),
+    ("apple", ["apple"], ["#Apple", "#iOS", "#AppleAI"]),
+    ("tesla", ["tesla"], ["#Tesla", "#ElonMusk", "#Autopilot"]),
+    ("nvidia", ["nvidia"], ["#NVIDIA", "#GPU", "#CUDA"]),
+    ("anthropic", ["anthropic"], ["#Anthropic", "#Claude"]),
+    ("amazon", ["amazon"], ["#Amazon", "#AWS", "#Alexa"]),
+    ("xai", ["x.ai", "xai"], ["#xAI", "#ElonMusk"]),
+]
+
+TECH_HASHTAG_RULES = [
+    ("tech_ai", ["artificial intelligence", "ai", "machine learning", "ml", "neural", "neural network",
+                 "deep learning", "llm", "large language model"],
+     ["#ArtificialIntelligence", "#MachineLearning", "#DeepLearning", "#LLM"]),
+    ("tech_robotics", ["robotics", "robot", "automation", "autonomous", "self-driving"],
+     ["#Robotics", "#Automation", "#AutonomousVehicles"]),
+    ("tech_quantum", ["quantum", "quantum computing", "quantum supremacy"],
+     ["#QuantumComputing", "#QuantumSupremacy", "#QuantumTech"]),
+    ("tech_blockchain", ["blockchain", "crypto", "cryptocurrency", "bitcoin", "ethereum", "web3", "nft"],
+     ["#Blockchain", "#Cryptocurrency", "#Web3", "#NFT"]),
+    ("tech_xr", ["ar", "vr", "augmented reality", "virtual reality", "metaverse", "mixed reality"],
+     ["#AR", "#VR", "#Metaverse", "#MixedReality"]),
+    ("tech_security", ["cybersecurity", "security", "privacy", "encryption", "data breach"],
+     ["#Cybersecurity", "#DataPrivacy", "#InfoSec"]),
+    ("tech_cloud", ["cloud", "aws", "azure", "gcp", "serverless"],
+     ["#CloudComputing", "#ServerlessComputing", "#CloudNative"]),
+    ("tech_iot", ["iot", "internet of things", "smart home", "smart city"],
+     ["#IoT", "#SmartHome", "#SmartCity"]),
+    ("tech_network", ["5g", "6g", "network", "networking", "connectivity", "telecommunications"],
+     ["#5G", "#6G", "#Telecommunications"]),
+    ("tech_biotech", ["biotech", "biotechnology", "medical ai", "healthcare ai"],
+     ["#BioTech", "#MedicalAI", "#HealthTech"]),
+]
+
+BUSINESS_HASHTAG_RULES = [
+    ("business_investment", ["startup", "funding", "investment", "venture", "ipo", "acquisition"],
+     ["#Startup", "#Investment", "#VentureCapital", "#IPO"]),
+    ("business_finance", ["billion", "million", "revenue", "valuation", "profit"],
+     ["#Business", "#Revenue", "#TechBusiness"]),
+]
+
+PRODUCT_HASHTAG_RULES = [
+    ("product_chatgpt", ["chatgpt", "gpt-4", "gpt-5"], ["#ChatGPT", "#GPT4", "#GPT5"]),
+    ("product_claude", ["claude", "claude-3", "claude-4"], ["#Claude", "#ClaudeAI"]),
+    ("product_gemini", ["gemini", "bard", "palm"], ["#Gemini", "#GoogleAI", "#PaLM"]),
+    ("product_copilot", ["github copilot", "copilot", "code assistant"], ["#GitHubCopilot", "#CodeAssistant"]),
+]
+
+_HASHTAG_MATCHER = KeywordMatcher({
+    category: keywords
+    for rules in (COMPANY_HASHTAG_RULES, TECH_HASHTAG_RULES, BUSINESS_HASHTAG_RULES, PRODUCT_HASHTAG_RULES)
+    for category, keywords, _ in rules
+})
+
+def _rule_hashtags(rules, hits):
+    hashtags = []
+    for category, _, rule_hashtags in rules:
+        if category in hits:
+            hashtags.extend(rule_hashtags)
+    return hashtags
+
 def generate_smart_hashtags(title, content):
     """Makale içeriğine göre akıllı hashtag oluşturma - İçeriğe özgü analiz"""
-    combined_text = f"{title.lower()} {content.lower()}"
-    hashtags = []
+    combined_text = f"{title} {content}"
     priority_hashtags = []  # Yüksek öncelikli hashtag'ler
     
     # Makale başlığından anahtar kelimeleri çıkar
@@ -809,69 +2122,12 @@ def generate_smart_hashtags(title, content):
         if hashtag:
             priority_hashtags.append(hashtag)
     
-    # Şirket özel hashtag'leri (yüksek öncelik)
-    company_hashtags = []
-    if "openai" in combined_text:
-        company_hashtags.extend(["#OpenAI", "#ChatGPT", "#GPT"])
-    if "google" in combined_text:
-        company_hashtags.extend(["#Google", "#GoogleAI", "#Gemini"])
-    if "microsoft" in combined_text:
-        company_hashtags.extend(["#Microsoft", "#Azure", "#Copilot"])
-    if "meta" in combined_text:
-        company_hashtags.extend(["#Meta", "#MetaAI", "#Llama"])
-    if "apple" in combined_text:
-        company_hashtags.extend(["#Apple", "#iOS", "#AppleAI"])
-    if "tesla" in combined_text:
-        company_hashtags.extend(["#Tesla", "#ElonMusk", "#Autopilot"])
-    if "nvidia" in combined_text:
-        company_hashtags.extend(["#NVIDIA", "#GPU", "#CUDA"])
-    if "anthropic" in combined_text:
-        company_hashtags.extend(["#Anthropic", "#Claude"])
-    if "amazon" in combined_text:
-        company_hashtags.extend(["#Amazon", "#AWS", "#Alexa"])
-    if "x.ai" in combined_text or "xai" in combined_text:
-        company_hashtags.extend(["#xAI", "#ElonMusk"])
-    
-    # Teknoloji alanları (orta öncelik)
-    tech_hashtags = []
-    if any(keyword in combined_text for keyword in ["artificial intelligence", "ai", "machine learning", "ml", "neural", "deep learning", "llm", "large language model"]):
-        tech_hashtags.extend(["#ArtificialIntelligence", "#MachineLearning", "#DeepLearning", "#LLM"])
-    if any(keyword in combined_text for keyword in ["robotics", "robot", "automation", "autonomous", "self-driving"]):
-        tech_hashtags.extend(["#Robotics", "#Automation", "#AutonomousVehicles"])
-    if any(keyword in combined_text for keyword in ["quantum", "quantum computing", "quantum supremacy"]):
-        tech_hashtags.extend(["#QuantumComputing", "#QuantumSupremacy", "#QuantumTech"])
-    if any(keyword in combined_text for keyword in ["blockchain", "crypto", "bitcoin", "ethereum", "web3", "nft"]):
-        tech_hashtags.extend(["#Blockchain", "#Cryptocurrency", "#Web3", "#NFT"])
-    if any(keyword in combined_text for keyword in ["ar", "vr", "augmented reality", "virtual reality", "metaverse", "mixed reality"]):
-        tech_hashtags.extend(["#AR", "#VR", "#Metaverse", "#MixedReality"])
-    if any(keyword in combined_text for keyword in ["cybersecurity", "security", "privacy", "encryption", "data breach"]):
-        tech_hashtags.extend(["#Cybersecurity", "#DataPrivacy", "#InfoSec"])
-    if any(keyword in combined_text for keyword in ["cloud", "aws", "azure", "gcp", "serverless"]):
-        tech_hashtags.extend(["#CloudComputing", "#ServerlessComputing", "#CloudNative"])
-    if any(keyword in combined_text for keyword in ["iot", "internet of things", "smart home", "smart city"]):
-        tech_hashtags.extend(["#IoT", "#SmartHome", "#SmartCity"])
-    if any(keyword in combined_text for keyword in ["5g", "6g", "network", "connectivity", "telecommunications"]):
-        tech_hashtags.extend(["#5G", "#6G", "#Telecommunications"])
-    if any(keyword in combined_text for keyword in ["biotech", "biotechnology", "medical ai", "healthcare ai"]):
-        tech_hashtags.extend(["#BioTech", "#MedicalAI", "#HealthTech"])
-    
-    # İş ve finansal hashtag'ler
-    business_hashtags = []
-    if any(keyword in combined_text for keyword in ["startup", "funding", "investment", "venture", "ipo", "acquisition"]):
-        business_hashtags.extend(["#Startup", "#Investment", "#VentureCapital", "#IPO"])
-    if any(keyword in combined_text for keyword in ["billion", "million", "revenue", "valuation", "profit"]):
-        business_hashtags.extend(["#Business", "#Revenue", "#TechBusiness"])
-    
-    # Spesifik ürün/teknoloji hashtag'leri
-    product_hashtags = []
-    if any(keyword in combined_text for keyword in ["chatgpt", "gpt-4", "gpt-5"]):
-        product_hashtags.extend(["#ChatGPT", "#GPT4", "#GPT5"])
-    if any(keyword in combined_text for keyword in ["claude", "claude-3", "claude-4"]):
-        product_hashtags.extend(["#Claude", "#ClaudeAI"])
-    if any(keyword in combined_text for keyword in ["gemini", "bard", "palm"]):
-        product_hashtags.extend(["#Gemini", "#GoogleAI", "#PaLM"])
-    if any(keyword in combined_text for keyword in ["github copilot", "copilot", "code assistant"]):
-        product_hashtags.extend(["#GitHubCopilot", "#CodeAssistant"])
+    # Tüm kural tabloları için tek tarama
+    hits = _HASHTAG_MATCHER.categories(combined_text)
+    company_hashtags = _rule_hashtags(COMPANY_HASHTAG_RULES, hits)    # Şirketler (yüksek öncelik)
+    tech_hashtags = _rule_hashtags(TECH_HASHTAG_RULES, hits)          # Teknoloji alanları (orta öncelik)
+    business_hashtags = _rule_hashtags(BUSINESS_HASHTAG_RULES, hits)  # İş ve finans
+    product_hashtags = _rule_hashtags(PRODUCT_HASHTAG_RULES, hits)    # Spesifik ürünler
     
     # Öncelik sırasına göre hashtag'leri birleştir
     priority_hashtags.extend(company_hashtags[:2])  # En fazla 2 şirket hashtag'i
@@ -895,35 +2151,27 @@ def generate_smart_hashtags(title, content):
     
     return selected_hashtags[:5]
 
+# Teknoloji terimleri ve şirket isimleri (liste sırası öncelik sırasıdır)
+ARTICLE_TECH_TERMS = [
+    'artificial intelligence', 'machine learning', 'deep learning', 'neural network',
+    'quantum computing', 'blockchain', 'cryptocurrency', 'robotics', 'automation',
+    'augmented reality', 'virtual reality', 'cloud computing', 'cybersecurity',
+    'internet of things', '5g', '6g', 'biotechnology', 'nanotechnology'
+]
+ARTICLE_COMPANIES = [
+    'OpenAI', 'Google', 'Microsoft', 'Apple', 'Meta', 'Tesla', 'NVIDIA', 
+    'Amazon', 'Anthropic', 'xAI', 'DeepMind', 'Hugging Face'
+]
+_ARTICLE_TERM_MATCHER = KeywordMatcher({"term": ARTICLE_TECH_TERMS, "company": ARTICLE_COMPANIES})
+
 def extract_article_keywords(title, content):
     """Makale başlığından anahtar kelimeleri çıkar"""
-    import re
-    
     # Başlık ve içerikteki önemli kelimeleri bul
     text = f"{title} {content[:500]}"
+    found = _ARTICLE_TERM_MATCHER.find(text)
     
-    # Teknoloji terimlerini önceliklendirme
-    tech_terms = [
-        'artificial intelligence', 'machine learning', 'deep learning', 'neural network',
-        'quantum computing', 'blockchain', 'cryptocurrency', 'robotics', 'automation',
-        'augmented reality', 'virtual reality', 'cloud computing', 'cybersecurity',
-        'internet of things', '5g', '6g', 'biotechnology', 'nanotechnology'
-    ]
-    
-    found_terms = []
-    for term in tech_terms:
-        if term.lower() in text.lower():
-            found_terms.append(term)
-    
-    # Şirket isimleri
-    companies = [
-        'OpenAI', 'Google', 'Microsoft', 'Apple', 'Meta', 'Tesla', 'NVIDIA', 
-        'Amazon', 'Anthropic', 'xAI', 'DeepMind', 'Hugging Face'
-    ]
-    
-    for company in companies:
-        if company.lower() in text.lower():
-            found_terms.append(company)
+    found_terms = [term for term in ARTICLE_TECH_TERMS if term in found]
+    found_terms.extend(company for company in ARTICLE_COMPANIES if company.lower() in found)
     
     # Önemli sayısal değerler
     numbers = re.findall(r'\b(\d+(?:\.\d+)?)\s*(billion|million|percent|%|x|times)\b', text.lower())
@@ -974,32 +2222,31 @@ def create_hashtag_from_keyword(keyword):
     
     return None
 
+# (anahtar kelimeler, emojiler) - kelime sınırlı eşleşme, ek almış biçimler ayrıca yazılır
+EMOJI_RULES = [
+    (["ai", "artificial intelligence", "robot", "machine learning"], ["🤖", "🧠", "⚡"]),
+    (["funding", "investment", "billion", "million", "money"], ["💰", "💸", "📈"]),
+    (["launch", "launched", "launching", "release", "released", "unveil", "unveiled",
+      "announce", "announced", "announcement", "announcing"], ["🚀", "🎉", "✨"]),
+    (["research", "development", "breakthrough", "discovery", "discoveries"], ["🔬", "💡", "🧪"]),
+    (["security", "privacy", "protection", "safe", "safety"], ["🔒", "🛡️", "🔐"]),
+    (["acquisition", "merger", "partnership"], ["🤝", "🔗", "💼"]),
+    (["search", "query", "find", "discover"], ["🔍", "🔎", "📊"]),
+    (["mobile", "phone", "app", "smartphone"], ["📱", "📲", "💻"]),
+    (["cloud", "server", "data", "storage"], ["☁️", "💾", "🗄️"]),
+    (["game", "gaming", "entertainment"], ["🎮", "🕹️", "🎯"]),
+]
+_EMOJI_MATCHER = KeywordMatcher({index: keywords for index, (keywords, _) in enumerate(EMOJI_RULES)})
+
 def generate_smart_emojis(title, content):
     """Makale içeriğine göre akıllı emoji seçimi"""
-    combined_text = f"{title.lower()} {content.lower()}"
+    hits = _EMOJI_MATCHER.categories(f"{title} {content}")
     emojis = []
     
     # Konu bazlı emojiler
-    if any(keyword in combined_text for keyword in ["ai", "artificial intelligence", "robot", "machine learning"]):
-        emojis.extend(["🤖", "🧠", "⚡"])
-    if any(keyword in combined_text for keyword in ["funding", "investment", "billion", "million", "money"]):
-        emojis.extend(["💰", "💸", "📈"])
-    if any(keyword in combined_text for keyword in ["launch", "release", "unveil", "announce"]):
-        emojis.extend(["🚀", "🎉", "✨"])
-    if any(keyword in combined_text for keyword in ["research", "development", "breakthrough", "discovery"]):
-        emojis.extend(["🔬", "💡", "🧪"])
-    if any(keyword in combined_text for keyword in ["security", "privacy", "protection", "safe"]):
-        emojis.extend(["🔒", "🛡️", "🔐"])
-    if any(keyword in combined_text for keyword in ["acquisition", "merger", "partnership"]):
-        emojis.extend(["🤝", "🔗", "💼"])
-    if any(keyword in combined_text for keyword in ["search", "query", "find", "discover"]):
-        emojis.extend(["🔍", "🔎", "📊"])
-    if any(keyword in combined_text for keyword in ["mobile", "phone", "app", "smartphone"]):
-        emojis.extend(["📱", "📲", "💻"])
-    if any(keyword in combined_text for keyword in ["cloud", "server", "data", "storage"]):
-        emojis.extend(["☁️", "💾", "🗄️"])
-    if any(keyword in combined_text for keyword in ["game", "gaming", "entertainment"]):
-        emojis.extend(["🎮", "🕹️", "🎯"])
+    for index, (_, rule_emojis) in enumerate(EMOJI_RULES):
+        if index in hits:
+            emojis.extend(rule_emojis)
     
     # Eğer emoji bulunamadıysa varsayılan emojiler
     if not emojis:
@@ -1008,7 +2255,206 @@ def generate_smart_emojis(title, content):
     # En fazla 3 emoji seç
     return emojis[:3]
 
-def generate_comprehensive_analysis(article_data, api_key):
+# Tek çağrılık yapılandırılmış analiz: alan -> doğrulayıcı/normalleştirici (geçersizse None döner)
+TWEET_CHAR_LIMIT = 280
+
+def _structured_text(min_length):
+    def validate(value):
+        if isinstance(value, str) and len(value.strip()) >= min_length:
+            return value.strip()
+        return None
+    return validate
+
+
+def _structured_string_list(limit, prefix=""):
+    def validate(value):
+        if isinstance(value, str):
+            value = [item for item in re.split(r'[,\s]+', value) if item]
+        if not isinstance(value, list):
+            return None
+        items = []
+        for item in value:
+            if not isinstance(item, str) or not item.strip():
+                continue
+            item = item.strip()
+            if prefix and not item.startswith(prefix):
+                item = prefix + re.sub(r'\W+', '', item)
+            if item not in items and item != prefix:
+                items.append(item)
+        return items[:limit]
+    return validate
+
+
+def _is_emoji_token(item):
+    """Kısa ve sadece emoji karakterlerinden (birleştiriciler dahil) oluşan token mı"""
+    if not item or len(item) > 8:
+        return False
+    # So: simge, Sk: ten rengi, Mn/Me: varyasyon seçici ve keycap, Cf: ZWJ
+    return any(unicodedata.category(ch) == 'So' for ch in item) and all(
+        unicodedata.category(ch) in ('So', 'Sk', 'Mn', 'Me', 'Cf') for ch in item)
+
+
+def _structured_emoji_list(limit):
+    """Emoji listesi - kelime, yer tutucu ya da metin içeren öğeler atılır"""
+    validate_list = _structured_string_list(limit * 3)
+
+    def validate(value):
+        items = validate_list(value)
+        if items is None:
+            return None
+        return [item for item in items if _is_emoji_token(item)][:limit]
+    return validate
+
+
+def _structured_tweet_text(min_length):
+    """Tweet metni - tweet sınırını aşan ya da şablon yer tutucusu kalan metin reddedilir"""
+    validate_text = _structured_text(min_length)
+
+    def validate(value):
+        text = validate_text(value)
+        if text is None or len(text) > TWEET_CHAR_LIMIT:
+            return None
+        if re.search(r'\{[^{}]*\}|<[^<>]+>|\[[A-Z][^\[\]]*\]', text):
+            return None
+        return text
+    return validate
+
+
+def _structured_impact(value):
+    try:
+        impact = int(float(str(value).strip().split()[0]))
+    except (ValueError, TypeError, IndexError):
+        return None
+    return impact if 1 <= impact <= 10 else None
+
+
+def _structured_audience(value):
+    if isinstance(value, str) and value.strip().capitalize() in ("Developer", "Investor", "General"):
+        return value.strip().capitalize()
+    return None
+
+
+STRUCTURED_ANALYSIS_FIELDS = {
+    "innovation": _structured_text(10),
+    "companies": _structured_string_list(3),
+    "impact_level": _structured_impact,
+    "audience": _structured_audience,
+    "hashtags": _structured_string_list(3, prefix="#"),
+    "emojis": _structured_emoji_list(3),
+    "tweet_text": _structured_tweet_text(20),
+}
+
+
+def parse_structured_analysis(response_text, fields=None):
+    """LLM'in JSON yanıtını ayrıştır ve şemaya göre doğrula.
+    
+    Sadece geçerli alanları normalize edilmiş haliyle döndürür; ayrıştırılamayan
+    veya şemaya uymayan alanlar sonuçta yer almaz.
+    """
+    fields = fields or STRUCTURED_ANALYSIS_FIELDS
+    if not response_text or not isinstance(response_text, str):
+        return {}
+    
+    # ```json ... ``` blokları veya açıklama metni içindeki ilk JSON nesnesini bul
+    text = re.sub(r'^```(?:json)?|```$', '', response_text.strip(), flags=re.MULTILINE).strip()
+    start, end = text.find('{'), text.rfind('}')
+    if start == -1 or end <= start:
+        return {}
+    try:
+        data = json.loads(text[start:end + 1])
+    except (ValueError, TypeError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    
+    valid = {}
+    for name, validate in fields.items():
+        if name in data:
+            value = validate(data[name])
+            if value not in (None, [], ""):
+                valid[name] = value
+    return valid
+
+
+def request_structured_analysis(title, content, api_key, tweet_theme=None):
+    """Tüm analiz alanlarını (ve istenirse tweet metnini) tek OpenRouter çağrısıyla iste"""
+    tweet_field = ""
+    tweet_rules = ""
+    if tweet_theme:
+        tweet_field = ',\n  "tweet_text": "English tweet, max 200 characters"'
+        tweet_rules = f"""
+tweet_text rules: style {tweet_theme.get('style', 'informative')}, tone {tweet_theme.get('tone', 'clear')}.
+Include specific numbers, capabilities or company names; active voice; no hashtags, emojis, URLs or impact ratings.
+Avoid vague phrases like "major development" or "breakthrough announced".
+Example style: "{tweet_theme.get('example', '')}"
+"""
+    
+    prompt = f"""Analyze this AI/tech news and answer with ONLY a JSON object (no markdown, no commentary) in exactly this shape:
+{{
+  "innovation": "key innovation with specific details such as numbers, capabilities, who is involved (max 60 words)",
+  "companies": ["max 3 main companies"],
+  "impact_level": 5,
+  "audience": "Developer | Investor | General",
+  "hashtags": ["#Three", "#Relevant", "#Hashtags"],
+  "emojis": ["three", "suitable", "emojis"]{tweet_field}
+}}
+impact_level is an integer 1-10 for impact on the tech sector. Everything in English.
+{tweet_rules}
+Title: {title}
+Content: {content[:1000]}
+
+JSON:"""
+    # Ayrıştırılamayan yanıt önbelleğe yazılmaz; tekrar denemede yeni yanıt istenir
+    response = gemini_call(prompt, api_key, max_tokens=450 if tweet_theme else 350,
+                           validate=lambda reply: bool(parse_structured_analysis(reply)))
+    return parse_structured_analysis(response)
+
+
+# AI ilgisi kontrolleri - analiz ve haber kaynağı filtreleri ortak kullanır
+AI_RELEVANCE_KEYWORDS = {
+    "ai": ['ai', 'artificial intelligence', 'machine learning', 'deep learning', 'neural', 'neural network',
+           'gpt', 'llm', 'large language model', 'chatbot', 'openai', 'anthropic', 'claude', 'chatgpt',
+           'gemini', 'copilot', 'automation', 'robot', 'robotics', 'algorithm'],
+    # Analizde AI sayılan genel teknoloji terimleri
+    "tech": ['tech', 'technology', 'software', 'data', 'computer'],
+    "non_ai": ['wood', 'dried', 'kiln', 'furniture', 'cooking', 'recipe', 'travel', 'music', 'art',
+               'painting', 'photography'],
+    "non_ai_broad": ['sports', 'fashion', 'food', 'health', 'medicine', 'politics', 'economy', 'finance',
+                     'real estate'],
+}
+_AI_RELEVANCE_MATCHER = KeywordMatcher(AI_RELEVANCE_KEYWORDS)
+
+# Analiz yedeğinde eylem ve teknoloji alanı tespiti (sıra öncelik sırasıdır)
+_ACTION_MATCHER = KeywordMatcher({
+    'launch': ['launch', 'launches', 'launching', 'released', 'releases'],
+    'announce': ['announce', 'announces', 'announced', 'unveils', 'reveals'],
+    'develop': ['develop', 'develops', 'developed', 'creates', 'builds'],
+    'acquire': ['acquire', 'acquires', 'acquired', 'buys', 'purchases'],
+    'partner': ['partner', 'partners', 'partnership', 'collaborate'],
+    'invest': ['invest', 'invests', 'investment', 'funding', 'raises'],
+    'improve': ['improve', 'improves', 'enhanced', 'upgrade', 'better'],
+    'achieve': ['achieve', 'achieves', 'breakthrough', 'milestone', 'success']
+})
+_TECH_AREA_MATCHER = KeywordMatcher({
+    'AI': ['ai', 'artificial intelligence', 'machine learning', 'neural', 'gpt', 'llm'],
+    'robotics': ['robot', 'robotics', 'automation', 'autonomous'],
+    'cloud': ['cloud', 'aws', 'azure', 'gcp', 'serverless'],
+    'mobile': ['mobile', 'app', 'ios', 'android', 'smartphone'],
+    'web': ['web', 'website', 'browser', 'internet', 'online'],
+    'data': ['data', 'analytics', 'database', 'big data', 'analysis'],
+    'security': ['security', 'cybersecurity', 'privacy', 'encryption'],
+    'blockchain': ['blockchain', 'crypto', 'bitcoin', 'ethereum', 'nft']
+})
+
+def is_ai_related_text(text):
+    """Metin AI ile ilgili mi (kelime sınırlı eşleşme)"""
+    return _AI_RELEVANCE_MATCHER.matches(text, "ai")
+
+def is_non_ai_text(text):
+    """Metinde AI dışı konu işaretleri var mı"""
+    return _AI_RELEVANCE_MATCHER.matches(text, "non_ai")
+
+def generate_comprehensive_analysis(article_data, api_key, tweet_theme=None):
     """Makale için kapsamlı AI analizi - Ayrı ayrı çağrılar ile güvenilir sonuç (İngilizce)"""
     title = article_data.get("title", "")
     content = article_data.get("content", "")
@@ -1019,15 +2465,10 @@ def generate_comprehensive_analysis(article_data, api_key):
     title_lower = title.lower()
     content_lower = content.lower()
     
-    # AI anahtar kelimeleri
-    ai_keywords = ['ai', 'artificial intelligence', 'machine learning', 'deep learning', 'neural', 'gpt', 'llm', 'openai', 'anthropic', 'claude', 'chatgpt', 'algorithm', 'automation', 'robot', 'tech', 'software', 'data', 'computer']
-    
-    # AI ile ilgili olmayan anahtar kelimeler
-    non_ai_keywords = ['wood', 'dried', 'kiln', 'furniture', 'cooking', 'recipe', 'travel', 'music', 'art', 'painting', 'photography', 'sports', 'fashion', 'food', 'health', 'medicine', 'politics', 'economy', 'finance', 'real estate']
-    
-    # AI ile ilgili mi kontrol et
-    has_ai_content = any(keyword in title_lower or keyword in content_lower for keyword in ai_keywords)
-    has_non_ai_content = any(keyword in title_lower or keyword in content_lower for keyword in non_ai_keywords)
+    # AI ile ilgili mi kontrol et (başlık + içerik tek taramada)
+    relevance = _AI_RELEVANCE_MATCHER.categories(f"{title}\n{content}")
+    has_ai_content = "ai" in relevance or "tech" in relevance
+    has_non_ai_content = "non_ai" in relevance or "non_ai_broad" in relevance
     
     # Eğer AI ile ilgili değilse veya AI olmayan içerik varsa uyarı ver
     if not has_ai_content or has_non_ai_content:
@@ -1044,6 +2485,25 @@ def generate_comprehensive_analysis(article_data, api_key):
         "tweet_text": ""
     }
     
+    # Yapılandırılmış mod: tüm alanlar tek JSON yanıtında istenir, sadece eksik/geçersiz alanlar ayrı çağrılarla tamamlanır
+    structured = {}
+    try:
+        if load_automation_settings().get("structured_analysis_enabled", True):
+            structured = request_structured_analysis(title, content, api_key, tweet_theme)
+            missing = [name for name in STRUCTURED_ANALYSIS_FIELDS
+                       if name not in structured and (name != "tweet_text" or tweet_theme)]
+            if structured:
+                safe_print(f"🧩 Yapılandırılmış analiz: tek çağrıda {len(structured)} alan alındı"
+                           + (f", ayrı çağrı ile tamamlanacak: {', '.join(missing)}" if missing else ""))
+            else:
+                safe_print(f"⚠️ Yapılandırılmış analiz yanıtı ayrıştırılamadı, alan bazlı çağrılara geçiliyor")
+    except Exception as structured_error:
+        safe_print(f"⚠️ Yapılandırılmış analiz hatası: {structured_error}")
+        structured = {}
+    
+    if structured.get("tweet_text"):
+        analysis_result["tweet_text"] = structured["tweet_text"]
+    
     try:
         # 1. Main innovation/insight analysis (ENGLISH) - İyileştirilmiş prompt
         innovation_prompt = f"""Analyze this AI/tech news and extract the key innovation. Be specific and include important details like numbers, capabilities, or improvements (max 60 words, in English):
@@ -1058,7 +2518,7 @@ Focus on:
 - Who is involved (companies/researchers)?
 
 Main innovation:"""
-        innovation = gemini_call(innovation_prompt, api_key, max_tokens=100)
+        innovation = structured.get("innovation") or gemini_call(innovation_prompt, api_key, max_tokens=100)
         
         # İyileştirilmiş fallback sistemi
         if innovation == "API hatası" or not innovation or len(innovation.strip()) < 10:
@@ -1082,40 +2542,10 @@ Main innovation:"""
                         companies_found.append(match)
             
             # Eylemi belirle
-            action_keywords = {
-                'launch': ['launch', 'launches', 'launching', 'released', 'releases'],
-                'announce': ['announce', 'announces', 'announced', 'unveils', 'reveals'],
-                'develop': ['develop', 'develops', 'developed', 'creates', 'builds'],
-                'acquire': ['acquire', 'acquires', 'acquired', 'buys', 'purchases'],
-                'partner': ['partner', 'partners', 'partnership', 'collaborate'],
-                'invest': ['invest', 'invests', 'investment', 'funding', 'raises'],
-                'improve': ['improve', 'improves', 'enhanced', 'upgrade', 'better'],
-                'achieve': ['achieve', 'achieves', 'breakthrough', 'milestone', 'success']
-            }
-            
-            detected_action = None
-            for action, keywords in action_keywords.items():
-                if any(keyword in title_lower or keyword in content_lower[:200] for keyword in keywords):
-                    detected_action = action
-                    break
+            detected_action = _ACTION_MATCHER.first_category(f"{title_lower}\n{content_lower[:200]}")
             
             # Teknoloji alanını belirle
-            tech_areas = {
-                'AI': ['ai', 'artificial intelligence', 'machine learning', 'neural', 'gpt', 'llm'],
-                'robotics': ['robot', 'robotics', 'automation', 'autonomous'],
-                'cloud': ['cloud', 'aws', 'azure', 'gcp', 'serverless'],
-                'mobile': ['mobile', 'app', 'ios', 'android', 'smartphone'],
-                'web': ['web', 'website', 'browser', 'internet', 'online'],
-                'data': ['data', 'analytics', 'database', 'big data', 'analysis'],
-                'security': ['security', 'cybersecurity', 'privacy', 'encryption'],
-                'blockchain': ['blockchain', 'crypto', 'bitcoin', 'ethereum', 'nft']
-            }
-            
-            detected_tech = None
-            for tech, keywords in tech_areas.items():
-                if any(keyword in title_lower or keyword in content_lower[:200] for keyword in keywords):
-                    detected_tech = tech
-                    break
+            detected_tech = _TECH_AREA_MATCHER.first_category(f"{title_lower}\n{content_lower[:200]}")
             
             # Sayısal bilgileri ve önemli detayları çıkar
             import re
@@ -1217,31 +2647,43 @@ Main innovation:"""
             analysis_result["innovation"] = innovation.strip()
         
         # 2. Company analysis (ENGLISH)
-        company_prompt = f"""List the main companies mentioned in this news (max 3, comma separated, in English):\n\nTitle: {title}\nContent: {content[:600]}\n\nCompanies:"""
-        companies_text = gemini_call(company_prompt, api_key, max_tokens=50)
-        if companies_text != "API hatası":
-            companies = [c.strip() for c in companies_text.split(",") if c.strip()]
-            analysis_result["companies"] = companies[:3]
+        if "companies" in structured:
+            analysis_result["companies"] = structured["companies"]
+        else:
+            company_prompt = f"""List the main companies mentioned in this news (max 3, comma separated, in English):\n\nTitle: {title}\nContent: {content[:600]}\n\nCompanies:"""
+            companies_text = gemini_call(company_prompt, api_key, max_tokens=50)
+            if companies_text != "API hatası":
+                companies = [c.strip() for c in companies_text.split(",") if c.strip()]
+                analysis_result["companies"] = companies[:3]
         
         # 3. Impact level analysis (ENGLISH)
-        impact_prompt = f"""Rate the impact of this news on the tech sector from 1 to 10 (just a number):\n\nTitle: {title}\nContent: {content[:600]}\n\nImpact score (1-10):"""
-        impact_text = gemini_call(impact_prompt, api_key, max_tokens=10)
-        try:
-            impact_level = int(impact_text.strip().split()[0])
-            if 1 <= impact_level <= 10:
-                analysis_result["impact_level"] = impact_level
-        except:
-            analysis_result["impact_level"] = 5
+        if "impact_level" in structured:
+            analysis_result["impact_level"] = structured["impact_level"]
+        else:
+            impact_prompt = f"""Rate the impact of this news on the tech sector from 1 to 10 (just a number):\n\nTitle: {title}\nContent: {content[:600]}\n\nImpact score (1-10):"""
+            impact_text = gemini_call(impact_prompt, api_key, max_tokens=10)
+            try:
+                impact_level = int(impact_text.strip().split()[0])
+                if 1 <= impact_level <= 10:
+                    analysis_result["impact_level"] = impact_level
+            except:
+                analysis_result["impact_level"] = 5
         
         # 4. Audience analysis (ENGLISH)
-        audience_prompt = f"""Determine the target audience for this news (Developer/Investor/General):\n\nTitle: {title}\nContent: {content[:500]}\n\nAudience:"""
-        audience = gemini_call(audience_prompt, api_key, max_tokens=15)
-        if audience != "API hatası" and audience.strip() in ["Developer", "Investor", "General"]:
-            analysis_result["audience"] = audience.strip()
+        if "audience" in structured:
+            analysis_result["audience"] = structured["audience"]
+        else:
+            audience_prompt = f"""Determine the target audience for this news (Developer/Investor/General):\n\nTitle: {title}\nContent: {content[:500]}\n\nAudience:"""
+            audience = gemini_call(audience_prompt, api_key, max_tokens=15)
+            if audience != "API hatası" and audience.strip() in ["Developer", "Investor", "General"]:
+                analysis_result["audience"] = audience.strip()
         
         # 5. Hashtag analysis (ENGLISH)
-        hashtag_prompt = f"""Suggest the 3 most relevant hashtags for this news (in English, only hashtags, comma separated):\n\nTitle: {title}\nContent: {content[:800]}\n\nExample: #AI, #Technology, #Innovation\n\nHashtags:"""
-        ai_hashtags_text = gemini_call(hashtag_prompt, api_key, max_tokens=50)
+        if "hashtags" in structured:
+            ai_hashtags_text = ", ".join(structured["hashtags"])
+        else:
+            hashtag_prompt = f"""Suggest the 3 most relevant hashtags for this news (in English, only hashtags, comma separated):\n\nTitle: {title}\nContent: {content[:800]}\n\nExample: #AI, #Technology, #Innovation\n\nHashtags:"""
+            ai_hashtags_text = gemini_call(hashtag_prompt, api_key, max_tokens=50)
         ai_hashtags = []
         if ai_hashtags_text != "API hatası":
             clean_text = ai_hashtags_text.replace("Hashtags:", "").replace("Hashtag'ler:", "").replace("Hashtag'ler", "").strip()
@@ -1265,8 +2707,11 @@ Main innovation:"""
                 combined_hashtags.append(tag)
         analysis_result["hashtags"] = combined_hashtags[:3]
         # 6. Emoji analysis (unchanged, universal)
-        emoji_prompt = f"""Suggest the 3 most suitable emojis for this news (just emojis, no spaces):\n\nTitle: {title}\nContent: {content[:500]}\n\nEmojis:"""
-        ai_emojis_text = gemini_call(emoji_prompt, api_key, max_tokens=20)
+        if "emojis" in structured:
+            ai_emojis_text = "".join(structured["emojis"])
+        else:
+            emoji_prompt = f"""Suggest the 3 most suitable emojis for this news (just emojis, no spaces):\n\nTitle: {title}\nContent: {content[:500]}\n\nEmojis:"""
+            ai_emojis_text = gemini_call(emoji_prompt, api_key, max_tokens=20)
         ai_emojis = []
         if ai_emojis_text != "API hatası":
             import re
@@ -1306,7 +2751,7 @@ Main innovation:"""
             "audience": "General",
             "hashtags": generate_smart_hashtags(title, content)[:3],
             "emojis": generate_smart_emojis(title, content)[:3],
-            "tweet_text": ""
+            "tweet_text": structured.get("tweet_text", "")
         }
 
 def generate_ai_tweet_with_mcp_analysis(article_data, api_key, theme="bilgilendirici"):
@@ -1367,7 +2812,7 @@ def generate_ai_tweet_with_mcp_analysis(article_data, api_key, theme="bilgilendi
     
     try:
         # Kapsamlı analiz yap
-        analysis = generate_comprehensive_analysis(article_data, api_key)
+        analysis = generate_comprehensive_analysis(article_data, api_key, tweet_theme=theme_info)
         
         # Tweet metni oluştur - tema özelliklerine göre
         companies_text = ', '.join(analysis['companies'][:2]) if analysis['companies'] else ""
@@ -1408,7 +2853,8 @@ EXAMPLES OF GOOD SPECIFICITY:
 
 Tweet text:"""
         
-        tweet_text = gemini_call(tweet_prompt, api_key, max_tokens=80)
+        # Yapılandırılmış analiz tweet metnini zaten ürettiyse ayrı çağrı yapılmaz
+        tweet_text = analysis.get('tweet_text') or gemini_call(tweet_prompt, api_key, max_tokens=80)
 
         # API yok/hata veya anlamsız kısa çıktı durumunda fallback
         # None kontrolü ve hata mesajı kontrolü eklendi
@@ -2131,17 +3577,11 @@ def post_tweet(tweet_text, article_title=""):
 def mark_article_as_posted(article_data, tweet_result):
     """Makaleyi paylaşıldı olarak işaretle - API ve manuel paylaşımları destekler"""
     try:
-        posted_articles = load_json(HISTORY_FILE)
-        
-        # Hash kontrolü - tekrar paylaşımı önle
+        # Hash kontrolü - tekrar paylaşımı önle (indeks üzerinden)
         hash_value = article_data.get("hash", "")
-        if hash_value:
-            # Aynı hash'e sahip makale zaten paylaşılmış mı kontrol et
-            for posted in posted_articles:
-                posted_hash = posted.get("hash", "")
-                if hash_value == posted_hash:
-                    safe_log(f"⚠️ Tweet zaten paylaşılmış (hash kontrolü): {article_data.get('title', '')[:50]}...", "WARNING")
-                    return False  # Tekrar paylaşımı engelle
+        if hash_value and json_record_exists(HISTORY_FILE, hash_value=hash_value):
+            safe_log(f"⚠️ Tweet zaten paylaşılmış (hash kontrolü): {article_data.get('title', '')[:50]}...", "WARNING")
+            return False  # Tekrar paylaşımı engelle
         
         # Manuel paylaşım kontrolü
         is_manual_post = tweet_result.get("manual_post", False)
@@ -2195,8 +3635,7 @@ def mark_article_as_posted(article_data, tweet_result):
                 "theme": article_data.get("theme", "")
             })
         
-        posted_articles.append(posted_article)
-        save_json(HISTORY_FILE, posted_articles)
+        append_json_record(HISTORY_FILE, posted_article)
         
         # İstatistikleri güncelle
         update_statistics_after_post(posted_article)
@@ -2277,85 +3716,87 @@ def update_statistics_after_post(posted_article):
         safe_log(f"📊 İstatistikler güncellendi: {today} - Toplam: {today_stats['total_posts']}", "INFO")
         
     except Exception as e:
-        safe_log(f"⚠️ İstatistik güncelleme hatası: {e}", "WARNING")
-
-def check_duplicate_articles():
-    """Tekrarlanan makaleleri temizle"""
-    try:
-        posted_articles = load_json(HISTORY_FILE)
-        
-        # Son 30 günlük makaleleri tut
-        cutoff_date = datetime.now() - timedelta(days=30)
-        
-        filtered_articles = []
-        seen_hashes = set()
-        seen_urls = set()
-        seen_titles = set()
-        
-        stats = {
-            "original_count": len(posted_articles),
-            "hash_duplicates": 0,
-            "url_duplicates": 0,
-            "title_duplicates": 0,
-            "old_articles": 0,
-            "kept_articles": 0
-        }
-        
-        for article in posted_articles:
-            try:
-                posted_date_str = article.get("posted_date", "")
-                if posted_date_str:
-                    posted_date = datetime.fromisoformat(posted_date_str.replace('Z', '+00:00').replace('+00:00', ''))
-                else:
-                    # Tarih yoksa eski sayalım ve temizleyelim
-                    stats["old_articles"] += 1
-                    continue
+        safe_log(f"⚠️ İstatistik güncelleme hatası: {e}", "WARNING")
+
+def check_duplicate_articles():
+    """Tekrarlanan makaleleri temizle"""
+    try:
+        # Oku-süz-yaz tek kuyruk işleminde (arada eklenen paylaşımlar silinmez)
+        def mutate(posted_articles):
+            # Son 30 günlük makaleleri tut
+            cutoff_date = datetime.now() - timedelta(days=30)
+            
+            filtered_articles = []
+            seen_hashes = set()
+            seen_urls = set()
+            seen_titles = set()
+            
+            stats = {
+                "original_count": len(posted_articles),
+                "hash_duplicates": 0,
+                "url_duplicates": 0,
+                "title_duplicates": 0,
+                "old_articles": 0,
+                "kept_articles": 0
+            }
+            
+            for article in posted_articles:
+                try:
+                    posted_date_str = article.get("posted_date", "")
+                    if posted_date_str:
+                        posted_date = datetime.fromisoformat(posted_date_str.replace('Z', '+00:00').replace('+00:00', ''))
+                    else:
+                        # Tarih yoksa eski sayalım ve temizleyelim
+                        stats["old_articles"] += 1
+                        continue
                 
-                # 30 günden eski makaleleri temizle
-                if posted_date <= cutoff_date:
-                    stats["old_articles"] += 1
-                    continue
+                    # 30 günden eski makaleleri temizle
+                    if posted_date <= cutoff_date:
+                        stats["old_articles"] += 1
+                        continue
                 
-                article_hash = article.get("hash", "")
-                article_url = article.get("url", "")
-                article_title = article.get("title", "").strip().lower()
+                    article_hash = article.get("hash", "")
+                    article_url = article.get("url", "")
+                    article_title = article.get("title", "").strip().lower()
                 
-                # Hash duplicate kontrolü
-                if article_hash and article_hash in seen_hashes:
-                    stats["hash_duplicates"] += 1
-                    safe_log(f"🔄 Hash duplikat kaldırıldı: {article.get('title', '')[:50]}", "INFO")
-                    continue
+                    # Hash duplicate kontrolü
+                    if article_hash and article_hash in seen_hashes:
+                        stats["hash_duplicates"] += 1
+                        safe_log(f"🔄 Hash duplikat kaldırıldı: {article.get('title', '')[:50]}", "INFO")
+                        continue
                 
-                # URL duplicate kontrolü
-                if article_url and article_url in seen_urls:
-                    stats["url_duplicates"] += 1
-                    safe_log(f"🔄 URL duplikat kaldırıldı: {article.get('title', '')[:50]}", "INFO")
-                    continue
+                    # URL duplicate kontrolü
+                    if article_url and article_url in seen_urls:
+                        stats["url_duplicates"] += 1
+                        safe_log(f"🔄 URL duplikat kaldırıldı: {article.get('title', '')[:50]}", "INFO")
+                        continue
                 
-                # Title duplicate kontrolü (aynı başlık)
-                if article_title and article_title in seen_titles:
-                    stats["title_duplicates"] += 1
-                    safe_log(f"🔄 Title duplikat kaldırıldı: {article.get('title', '')[:50]}", "INFO")
-                    continue
+                    # Title duplicate kontrolü (aynı başlık)
+                    if article_title and article_title in seen_titles:
+                        stats["title_duplicates"] += 1
+                        safe_log(f"🔄 Title duplikat kaldırıldı: {article.get('title', '')[:50]}", "INFO")
+                        continue
                 
-                # Benzersiz makale - listeye ekle
-                filtered_articles.append(article)
+                    # Benzersiz makale - listeye ekle
+                    filtered_articles.append(article)
                 
-                if article_hash:
-                    seen_hashes.add(article_hash)
-                if article_url:
-                    seen_urls.add(article_url)
-                if article_title:
-                    seen_titles.add(article_title)
+                    if article_hash:
+                        seen_hashes.add(article_hash)
+                    if article_url:
+                        seen_urls.add(article_url)
+                    if article_title:
+                        seen_titles.add(article_title)
                 
-                stats["kept_articles"] += 1
+                    stats["kept_articles"] += 1
                 
-            except Exception as article_error:
-                safe_log(f"⚠️ Makale işleme hatası: {article_error}", "WARNING")
-                continue
+                except Exception as article_error:
+                    safe_log(f"⚠️ Makale işleme hatası: {article_error}", "WARNING")
+                    continue
+            
+            posted_articles[:] = filtered_articles
+            return stats
         
-        # Güncellenmiş listeyi kaydet
-        save_json(HISTORY_FILE, filtered_articles)
+        stats = update_json(HISTORY_FILE, mutate, [])
         
         # Sonuçları logla
         removed_count = stats["original_count"] - stats["kept_articles"]
@@ -2408,7 +3849,53 @@ def create_pdf(summaries, filename="daily_digest.pdf"):
         return None
 
 def get_posted_articles_summary():
-    """Paylaşılmış makalelerin özetini döndür - gelişmiş istatistiklerle"""
+    """Paylaşılmış makalelerin özetini döndür - gelişmiş istatistiklerle.
+    
+    Depo etkinse sayılar artımlı sayaçlardan, örnek makaleler indeksli
+    sorgulardan gelir; tüm geçmiş taranmaz."""
+    aggregator = _stats_aggregator()
+    if aggregator is not None:
+        try:
+            return _aggregated_posted_articles_summary(aggregator)
+        except Exception as e:
+            print(f"Özet sayaçları okunamadı, tam taramaya geçiliyor: {e}")
+    return _scan_posted_articles_summary()
+
+def _aggregated_posted_articles_summary(aggregator):
+    """get_posted_articles_summary - sayaçlardan (son 7 gün = bugün dahil 7 takvim günü)"""
+    from datetime import datetime, date, timedelta
+    
+    store = get_article_store()
+    today = date.today()
+    week_start = (today - timedelta(days=6)).isoformat()
+    
+    total_posted = aggregator.total("posted", "total")
+    week_posted = sum(aggregator.daily("posted", "posted_any", week_start, today.isoformat()).values())
+    
+    # En yüksek skor sayaçtan, makalenin kendisi ilk eşleşen kayıttan
+    scores = aggregator.breakdown("posted", "score")
+    highest_score = max((float(score) for score in scores), default=0)
+    highest_scored = None
+    if highest_score > 0:
+        highest_scored = next((a for a in load_json(HISTORY_FILE)
+                               if isinstance(a.get("score"), (int, float)) and a.get("score") == highest_score), None)
+    
+    return {
+        "total_posted": total_posted,
+        "recent_posted": week_posted,
+        "recent_articles": store.load_since("posted", week_start, limit=5),  # Son 5 makale
+        "today_articles": aggregator.total("posted", "posted_any", day=today.isoformat()),
+        "week_articles": week_posted,
+        "highest_scored": highest_scored,
+        "latest_posted": store.latest("posted"),
+        "success_rate": (total_posted / max(total_posted + 1, 1)) * 100,
+        "category_distribution": aggregator.breakdown("posted", "category"),
+        "average_score": highest_score / max(total_posted, 1) if highest_score > 0 else 0,
+        "last_check_time": datetime.now().strftime("%H:%M") if total_posted else "Henüz yok"
+    }
+
+def _scan_posted_articles_summary():
+    """get_posted_articles_summary - tüm kayıtları tarayarak (depo kapalıyken)"""
     try:
         from datetime import datetime, date, timedelta
         posted_articles = load_json(HISTORY_FILE)
@@ -2522,9 +4009,8 @@ def create_automatic_backup():
         
         backup_count = 0
         for file_path in files_to_backup:
-            if os.path.exists(file_path):
-                backup_path = os.path.join(backup_dir, file_path)
-                shutil.copy2(file_path, backup_path)
+            backup_path = os.path.join(backup_dir, file_path)
+            if backup_json_file(file_path, backup_path):
                 backup_count += 1
         
         return {
@@ -2562,9 +4048,8 @@ def reset_all_data():
         # Önce yedekle
         backup_count = 0
         for file_path in files_to_reset:
-            if os.path.exists(file_path):
-                backup_path = os.path.join(backup_dir, file_path)
-                shutil.copy2(file_path, backup_path)
+            backup_path = os.path.join(backup_dir, file_path)
+            if backup_json_file(file_path, backup_path):
                 backup_count += 1
                 print(f"📦 {file_path} yedeklendi -> {backup_path}")
         
@@ -2597,14 +4082,14 @@ def reset_all_data():
 def clear_pending_tweets():
     """Sadece bekleyen tweet'leri temizle"""
     try:
-        pending_tweets = load_json("pending_tweets.json")
-        
-        # Sadece posted olanları tut, pending olanları sil
-        posted_tweets = [t for t in pending_tweets if t.get("status") == "posted"]
-        
-        save_json("pending_tweets.json", posted_tweets)
+        def mutate(pending_tweets):
+            # Sadece posted olanları tut, pending olanları sil
+            posted_tweets = [t for t in pending_tweets if t.get("status") == "posted"]
+            cleared = len(pending_tweets) - len(posted_tweets)
+            pending_tweets[:] = posted_tweets
+            return cleared
         
-        cleared_count = len(pending_tweets) - len(posted_tweets)
+        cleared_count = update_json("pending_tweets.json", mutate, [])
         
         return {
             "success": True,
@@ -2619,254 +4104,24 @@ def clear_pending_tweets():
             "cleared_count": 0
         }
 
+# get_data_statistics sonucunu etkileyen kaynaklar - biri değişince yeniden hesaplanır
+_DATA_STATISTICS_SOURCES = ("posted_articles.json", "pending_tweets.json", "summaries.json",
+                            "hashtags.json", "accounts.json", "automation_settings.json")
+
 def get_data_statistics():
-    """Veri istatistiklerini döndür - bugünkü analizler dahil - Cache'li versiyon"""
+    """Veri istatistiklerini döndür - bugünkü analizler dahil.
+    
+    Sonuç bellekte tutulur; kaynak dosyalar/depo değişmedikçe veya gün
+    dönmedikçe yeniden hesaplanmaz."""
     try:
-        from datetime import datetime, date, timedelta
-        import time
-        import os
-        
-        # Cache mekanizması (30 saniye cache)
-        cache_file = "stats_cache.json"
-        cache_duration = 30  # saniye
-        
-        # Cache kontrol et
-        if os.path.exists(cache_file):
-            try:
-                cache_data = load_json(cache_file)
-                if cache_data and 'timestamp' in cache_data:
-                    cache_age = time.time() - cache_data['timestamp']
-                    if cache_age < cache_duration:
-                        # Cache geçerli, cache'den döndür
-                        return cache_data['stats']
-            except:
-                pass  # Cache hatası, yeni hesaplama yap
-        
-        today = date.today()
-        stats = {}
-        
-        # Paylaşılan makaleler
-        posted_articles = load_json("posted_articles.json")
-        stats["posted_articles"] = len(posted_articles)
-        stats["total_articles"] = len(posted_articles)  # Template uyumluluğu için
-        
-        # Bugünkü paylaşılan makaleler (silinmemiş olanlar)
-        today_articles = []
-        active_articles = []
-        deleted_articles = []
-        
-        for article in posted_articles:
-            # Silinmiş/aktif ayrımı
-            if article.get("deleted", False):
-                deleted_articles.append(article)
-            else:
-                active_articles.append(article)
-            
-            # Bugünkü makaleler (sadece aktif olanlar)
-            if article.get("posted_date") and not article.get("deleted", False):
-                try:
-                    # ISO format tarihini parse et
-                    posted_date_str = article["posted_date"]
-                    # Z suffix'ini kaldır ve parse et
-                    if posted_date_str.endswith('Z'):
-                        posted_date_str = posted_date_str[:-1] + '+00:00'
-                    
-                    posted_date = datetime.fromisoformat(posted_date_str)
-                    article_date = posted_date.date()
-                    
-                    if article_date == today:
-                        today_articles.append(article)
-                        
-                except (ValueError, TypeError) as e:
-                    print(f"[DEBUG] Tarih parse hatası: {e} - {article.get('posted_date')}")
-                    continue
-        
-        # Paylaşılan tweetler (silinmemiş olanlar)
-        stats["posted_tweets"] = len(active_articles)
-        
-        # Silinmiş tweetler istatistikleri
-        stats["deleted_tweets"] = len(deleted_articles)
-        
-        # Bugünkü silinmiş tweetler
-        today_deleted = []
-        for article in deleted_articles:
-            if article.get("deleted_date"):
-                try:
-                    deleted_date_str = article["deleted_date"]
-                    if deleted_date_str.endswith('Z'):
-                        deleted_date_str = deleted_date_str[:-1] + '+00:00'
-                    
-                    deleted_date = datetime.fromisoformat(deleted_date_str)
-                    if deleted_date.date() == today:
-                        today_deleted.append(article)
-                        
-                except (ValueError, TypeError):
-                    continue
-        
-        stats["today_deleted"] = len(today_deleted)
-        
-        # GitHub repo istatistikleri
-        github_repos = [article for article in posted_articles if article.get('type') == 'github_repo' or article.get('source_type') == 'github']
-        active_github_repos = [repo for repo in github_repos if not repo.get('deleted', False)]
-        deleted_github_repos = [repo for repo in github_repos if repo.get('deleted', False)]
-        
-        stats["github_repos_total"] = len(github_repos)
-        stats["github_repos_active"] = len(active_github_repos)
-        stats["github_repos_deleted"] = len(deleted_github_repos)
-        
-        # GitHub dil dağılımı
-        github_languages = {}
-        for repo in active_github_repos:
-            if 'repo_data' in repo:
-                lang = repo['repo_data'].get('language', 'Unknown')
-            elif 'language' in repo:
-                lang = repo['language']
-            else:
-                lang = 'Unknown'
-            
-            if lang:
-                github_languages[lang] = github_languages.get(lang, 0) + 1
-        
-        stats["github_languages"] = github_languages
-        
-        # En popüler GitHub dili
-        if github_languages:
-            stats["github_top_language"] = max(github_languages.items(), key=lambda x: x[1])
-        else:
-            stats["github_top_language"] = ("Veri yok", 0)
-        
-        # Bugünkü GitHub repoları
-        today_github = []
-        for repo in active_github_repos:
-            if repo.get("posted_date"):
-                try:
-                    posted_date_str = repo["posted_date"]
-                    if posted_date_str.endswith('Z'):
-                        posted_date_str = posted_date_str[:-1] + '+00:00'
-                    
-                    posted_date = datetime.fromisoformat(posted_date_str)
-                    if posted_date.date() == today:
-                        today_github.append(repo)
-                        
-                except (ValueError, TypeError):
-                    continue
-        
-        stats["today_github"] = len(today_github)
-        
-        # Kaynak türü dağılımı
-        news_articles = [article for article in active_articles if article.get('source_type', 'news') == 'news' or article.get('type') != 'github_repo']
-        stats["news_articles"] = len(news_articles)
-        
-        # Dünkü makaleler de hesapla
-        yesterday = today - timedelta(days=1)
-        yesterday_articles = []
-        
-        for article in active_articles:
-            if article.get("posted_date"):
-                try:
-                    posted_date_str = article["posted_date"]
-                    if posted_date_str.endswith('Z'):
-                        posted_date_str = posted_date_str[:-1] + '+00:00'
-                    
-                    posted_date = datetime.fromisoformat(posted_date_str)
-                    article_date = posted_date.date()
-                    
-                    if article_date == yesterday:
-                        yesterday_articles.append(article)
-                        
-                except (ValueError, TypeError):
-                    continue
-        
-        stats["today_articles"] = len(today_articles)
-        stats["yesterday_articles"] = len(yesterday_articles)
-        stats["active_articles"] = len(active_articles)
-        stats["deleted_articles"] = len(deleted_articles)
-        
-        # Bekleyen tweet'ler
-        pending_tweets = load_json("pending_tweets.json")
-        pending_count = len([t for t in pending_tweets if t.get("status") == "pending"])
-        posted_count = len([t for t in pending_tweets if t.get("status") == "posted"])
-        stats["pending_tweets"] = pending_count
-        stats["posted_tweets_in_pending"] = posted_count
-        
-        # Bugünkü bekleyen tweet'ler
-        today_pending = []
-        for tweet in pending_tweets:
-            # created_date veya created_at alanını kontrol et
-            date_field = tweet.get("created_date") or tweet.get("created_at")
-            if date_field:
-                try:
-                    created_date = datetime.fromisoformat(date_field.replace('Z', '+00:00'))
-                    # Status kontrolü - eğer status yoksa pending kabul et
-                    tweet_status = tweet.get("status", "pending")
-                    if created_date.date() == today and tweet_status == "pending":
-                        today_pending.append(tweet)
-                except (ValueError, TypeError):
-                    continue
-        
-        stats["today_pending"] = len(today_pending)
-        
-        # Debug için log ekle
-        print(f"[DEBUG] Bugünkü pending tweet'ler: {len(today_pending)} / {len(pending_tweets)} toplam")
-        
-        # Özetler
-        summaries = load_json("summaries.json")
-        stats["summaries"] = len(summaries)
-        
-        # Hashtag'ler
-        hashtags = load_json("hashtags.json")
-        stats["hashtags"] = len(hashtags)
-        
-        # Hesaplar
-        accounts = load_json("accounts.json")
-        stats["accounts"] = len(accounts)
-        
-        # Bugünkü toplam aktivite
-        stats["today_total_activity"] = stats["today_articles"] + stats["today_pending"]
-        
-        # Dosya boyutlarını hesapla
-        import os
-        
-        def format_file_size(size_bytes):
-            """Dosya boyutunu okunabilir formata çevir"""
-            if size_bytes == 0:
-                return "0 B"
-            size_names = ["B", "KB", "MB", "GB"]
-            i = 0
-            while size_bytes >= 1024 and i < len(size_names) - 1:
-                size_bytes /= 1024.0
-                i += 1
-            return f"{size_bytes:.1f} {size_names[i]}"
-        
-        def get_file_size(filename):
-            """Dosya boyutunu güvenli şekilde al"""
-            try:
-                if os.path.exists(filename):
-                    size = os.path.getsize(filename)
-                    return format_file_size(size)
-                else:
-                    return "Dosya yok"
-            except Exception as e:
-                return f"Hata: {str(e)}"
-        
-        # Dosya boyutlarını hesapla
-        stats["articles_file_size"] = get_file_size("posted_articles.json")
-        stats["pending_file_size"] = get_file_size("pending_tweets.json")
-        stats["settings_file_size"] = get_file_size("automation_settings.json")
-        
-        print(f"[DEBUG] İstatistikler: Bugün {stats['today_articles']} paylaşım, {stats['today_pending']} bekleyen (Paylaşım tarihine göre)")
-        
-        # Cache'e kaydet
-        try:
-            cache_data = {
-                'stats': stats,
-                'timestamp': time.time()
-            }
-            save_json(cache_file, cache_data)
-        except:
-            pass  # Cache kaydetme hatası, önemli değil
+        from datetime import date
         
-        return stats
+        if STATE_CACHE_AVAILABLE:
+            return get_state_cache(_state_cache_token).memoize(
+                "data_statistics", _DATA_STATISTICS_SOURCES, _compute_data_statistics,
+                extra=date.today().isoformat()
+            )
+        return _compute_data_statistics()
         
     except Exception as e:
         print(f"İstatistik hatası: {e}")
@@ -2895,6 +4150,301 @@ def get_data_statistics():
             "pending_file_size": "N/A",
             "settings_file_size": "N/A"
         }
+
+def _aggregated_article_statistics(aggregator):
+    """Makale/pending istatistikleri - artımlı sayaçlardan, gün sayısıyla orantılı"""
+    from datetime import date, timedelta
+    
+    today = date.today().isoformat()
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+    stats = {}
+    
+    stats["posted_articles"] = aggregator.total("posted", "total")
+    stats["total_articles"] = stats["posted_articles"]  # Template uyumluluğu için
+    stats["posted_tweets"] = aggregator.total("posted", "active")
+    stats["deleted_tweets"] = aggregator.total("posted", "deleted")
+    stats["today_deleted"] = aggregator.total("posted", "deleted", day=today)
+    
+    # GitHub repo istatistikleri
+    stats["github_repos_total"] = aggregator.total("posted", "github_total")
+    stats["github_repos_active"] = aggregator.total("posted", "github_active")
+    stats["github_repos_deleted"] = aggregator.total("posted", "github_deleted")
+    github_languages = aggregator.breakdown("posted", "github_language")
+    stats["github_languages"] = github_languages
+    if github_languages:
+        stats["github_top_language"] = max(github_languages.items(), key=lambda x: x[1])
+    else:
+        stats["github_top_language"] = ("Veri yok", 0)
+    stats["today_github"] = aggregator.total("posted", "github_posted", day=today)
+    
+    stats["news_articles"] = aggregator.total("posted", "news")
+    stats["today_articles"] = aggregator.total("posted", "posted", day=today)
+    stats["yesterday_articles"] = aggregator.total("posted", "posted", day=yesterday)
+    stats["active_articles"] = stats["posted_tweets"]
+    stats["deleted_articles"] = stats["deleted_tweets"]
+    
+    # Bekleyen tweet'ler
+    statuses = aggregator.breakdown("pending", "status")
+    stats["pending_tweets"] = statuses.get("pending", 0)
+    stats["posted_tweets_in_pending"] = statuses.get("posted", 0)
+    stats["today_pending"] = aggregator.total("pending", "created", dimension="pending", day=today)
+    
+    print(f"[DEBUG] Bugünkü pending tweet'ler: {stats['today_pending']} / {sum(statuses.values())} toplam")
+    
+    return stats
+
+def _scan_article_statistics():
+    """Makale/pending istatistikleri - tüm kayıtları tarayarak (depo kapalıyken)"""
+    from datetime import datetime, date, timedelta
+    
+    today = date.today()
+    stats = {}
+    
+    # Paylaşılan makaleler
+    posted_articles = load_json("posted_articles.json")
+    stats["posted_articles"] = len(posted_articles)
+    stats["total_articles"] = len(posted_articles)  # Template uyumluluğu için
+    
+    # Bugünkü paylaşılan makaleler (silinmemiş olanlar)
+    today_articles = []
+    active_articles = []
+    deleted_articles = []
+    
+    for article in posted_articles:
+        # Silinmiş/aktif ayrımı
+        if article.get("deleted", False):
+            deleted_articles.append(article)
+        else:
+            active_articles.append(article)
+        
+        # Bugünkü makaleler (sadece aktif olanlar)
+        if article.get("posted_date") and not article.get("deleted", False):
+            try:
+                # ISO format tarihini parse et
+                posted_date_str = article["posted_date"]
+                # Z suffix'ini kaldır ve parse et
+                if posted_date_str.endswith('Z'):
+                    posted_date_str = posted_date_str[:-1] + '+00:00'
+                
+                posted_date = datetime.fromisoformat(posted_date_str)
+                article_date = posted_date.date()
+                
+                if article_date == today:
+                    today_articles.append(article)
+                    
+            except (ValueError, TypeError) as e:
+                print(f"[DEBUG] Tarih parse hatası: {e} - {article.get('posted_date')}")
+                continue
+    
+    # Paylaşılan tweetler (silinmemiş olanlar)
+    stats["posted_tweets"] = len(active_articles)
+    
+    # Silinmiş tweetler istatistikleri
+    stats["deleted_tweets"] = len(deleted_articles)
+    
+    # Bugünkü silinmiş tweetler
+    today_deleted = []
+    for article in deleted_articles:
+        if article.get("deleted_date"):
+            try:
+                deleted_date_str = article["deleted_date"]
+                if deleted_date_str.endswith('Z'):
+                    deleted_date_str = deleted_date_str[:-1] + '+00:00'
+                
+                deleted_date = datetime.fromisoformat(deleted_date_str)
+                if deleted_date.date() == today:
+                    today_deleted.append(article)
+                    
+            except (ValueError, TypeError):
+                continue
+    
+    stats["today_deleted"] = len(today_deleted)
+    
+    # GitHub repo istatistikleri
+    github_repos = [article for article in posted_articles if article.get('type') == 'github_repo' or article.get('source_type') == 'github']
+    active_github_repos = [repo for repo in github_repos if not repo.get('deleted', False)]
+    deleted_github_repos = [repo for repo in github_repos if repo.get('deleted', False)]
+    
+    stats["github_repos_total"] = len(github_repos)
+    stats["github_repos_active"] = len(active_github_repos)
+    stats["github_repos_deleted"] = len(deleted_github_repos)
+    
+    # GitHub dil dağılımı
+    github_languages = {}
+    for repo in active_github_repos:
+        if 'repo_data' in repo:
+            lang = repo['repo_data'].get('language', 'Unknown')
+        elif 'language' in repo:
+            lang = repo['language']
+        else:
+            lang = 'Unknown'
+        
+        if lang:
+            github_languages[lang] = github_languages.get(lang, 0) + 1
+    
+    stats["github_languages"] = github_languages
+    
+    # En popüler GitHub dili
+    if github_languages:
+        stats["github_top_language"] = max(github_languages.items(), key=lambda x: x[1])
+    else:
+        stats["github_top_language"] = ("Veri yok", 0)
+    
+    # Bugünkü GitHub repoları
+    today_github = []
+    for repo in active_github_repos:
+        if repo.get("posted_date"):
+            try:
+                posted_date_str = repo["posted_date"]
+                if posted_date_str.endswith('Z'):
+                    posted_date_str = posted_date_str[:-1] + '+00:00'
+                
+                posted_date = datetime.fromisoformat(posted_date_str)
+                if posted_date.date() == today:
+                    today_github.append(repo)
+                    
+            except (ValueError, TypeError):
+                continue
+    
+    stats["today_github"] = len(today_github)
+    
+    # Kaynak türü dağılımı
+    news_articles = [article for article in active_articles if article.get('source_type', 'news') == 'news' or article.get('type') != 'github_repo']
+    stats["news_articles"] = len(news_articles)
+    
+    # Dünkü makaleler de hesapla
+    yesterday = today - timedelta(days=1)
+    yesterday_articles = []
+    
+    for article in active_articles:
+        if article.get("posted_date"):
+            try:
+                posted_date_str = article["posted_date"]
+                if posted_date_str.endswith('Z'):
+                    posted_date_str = posted_date_str[:-1] + '+00:00'
+                
+                posted_date = datetime.fromisoformat(posted_date_str)
+                article_date = posted_date.date()
+                
+                if article_date == yesterday:
+                    yesterday_articles.append(article)
+                    
+            except (ValueError, TypeError):
+                continue
+    
+    stats["today_articles"] = len(today_articles)
+    stats["yesterday_articles"] = len(yesterday_articles)
+    stats["active_articles"] = len(active_articles)
+    stats["deleted_articles"] = len(deleted_articles)
+    
+    # Bekleyen tweet'ler
+    pending_tweets = load_json("pending_tweets.json")
+    pending_count = len([t for t in pending_tweets if t.get("status") == "pending"])
+    posted_count = len([t for t in pending_tweets if t.get("status") == "posted"])
+    stats["pending_tweets"] = pending_count
+    stats["posted_tweets_in_pending"] = posted_count
+    
+    # Bugünkü bekleyen tweet'ler
+    today_pending = []
+    for tweet in pending_tweets:
+        # created_date veya created_at alanını kontrol et
+        date_field = tweet.get("created_date") or tweet.get("created_at")
+        if date_field:
+            try:
+                created_date = datetime.fromisoformat(date_field.replace('Z', '+00:00'))
+                # Status kontrolü - eğer status yoksa pending kabul et
+                tweet_status = tweet.get("status", "pending")
+                if created_date.date() == today and tweet_status == "pending":
+                    today_pending.append(tweet)
+            except (ValueError, TypeError):
+                continue
+    
+    stats["today_pending"] = len(today_pending)
+    
+    # Debug için log ekle
+    print(f"[DEBUG] Bugünkü pending tweet'ler: {len(today_pending)} / {len(pending_tweets)} toplam")
+    
+    return stats
+
+def _stats_aggregator():
+    """Depo etkinse artımlı sayaçlar, değilse None (tam tarama yapılır)"""
+    if STATS_AGGREGATOR_AVAILABLE and _store_collection("posted_articles.json"):
+        return get_stats_aggregator(get_article_store())
+    return None
+
+def rebuild_statistics(write=True):
+    """İstatistik sayaçlarını geçmişten yeniden hesapla ve kayıtlı değerlerle karşılaştır.
+    
+    write=False sadece doğrulama yapar. Dönüş: {"equal", "mismatches", "collections"}"""
+    aggregator = _stats_aggregator()
+    if aggregator is None:
+        return {"available": False}
+    report = aggregator.rebuild(verify=True, write=write)
+    return {"available": True, **report}
+
+def _compute_data_statistics():
+    """get_data_statistics hesaplaması (önbelleksiz)"""
+    aggregator = _stats_aggregator()
+    if aggregator is not None:
+        try:
+            stats = _aggregated_article_statistics(aggregator)
+        except Exception as e:
+            print(f"İstatistik sayaçları okunamadı, tam taramaya geçiliyor: {e}")
+            stats = _scan_article_statistics()
+    else:
+        stats = _scan_article_statistics()
+    
+    # Özetler
+    summaries = load_json("summaries.json")
+    stats["summaries"] = len(summaries)
+    
+    # Hashtag'ler
+    hashtags = load_json("hashtags.json")
+    stats["hashtags"] = len(hashtags)
+    
+    # Hesaplar
+    accounts = load_json("accounts.json")
+    stats["accounts"] = len(accounts)
+    
+    # Bugünkü toplam aktivite
+    stats["today_total_activity"] = stats["today_articles"] + stats["today_pending"]
+    
+    # Dosya boyutlarını hesapla
+    import os
+    
+    def format_file_size(size_bytes):
+        """Dosya boyutunu okunabilir formata çevir"""
+        if size_bytes == 0:
+            return "0 B"
+        size_names = ["B", "KB", "MB", "GB"]
+        i = 0
+        while size_bytes >= 1024 and i < len(size_names) - 1:
+            size_bytes /= 1024.0
+            i += 1
+        return f"{size_bytes:.1f} {size_names[i]}"
+    
+    def get_file_size(filename):
+        """Dosya boyutunu güvenli şekilde al"""
+        try:
+            if _store_collection(filename):
+                # Depo koleksiyonları veritabanında tutulur
+                filename = get_article_store().db_path
+            if os.path.exists(filename):
+                size = os.path.getsize(filename)
+                return format_file_size(size)
+            else:
+                return "Dosya yok"
+        except Exception as e:
+            return f"Hata: {str(e)}"
+    
+    # Dosya boyutlarını hesapla
+    stats["articles_file_size"] = get_file_size("posted_articles.json")
+    stats["pending_file_size"] = get_file_size("pending_tweets.json")
+    stats["settings_file_size"] = get_file_size("automation_settings.json")
+    
+    print(f"[DEBUG] İstatistikler: Bugün {stats['today_articles']} paylaşım, {stats['today_pending']} bekleyen (Paylaşım tarihine göre)")
+    
+    return stats
 def load_automation_settings():
     """Otomatikleştirme ayarlarını yükle"""
     try:
@@ -2950,6 +4500,11 @@ def save_automation_settings(settings):
     try:
         settings["last_updated"] = datetime.now().isoformat()
         save_json("automation_settings.json", settings)
+        # Zamanlayıcı yeni kontrol aralığı / auto_mode ile hemen yeniden planlar
+        try:
+            notify_settings_changed()
+        except Exception as e:
+            print(f"Zamanlayıcı bilgilendirme hatası: {e}")
         return {"success": True, "message": "✅ Ayarlar başarıyla kaydedildi"}
     except Exception as e:
         return {"success": False, "message": f"❌ Ayarlar kaydedilemedi: {e}"}
@@ -3124,7 +4679,7 @@ def send_telegram_notification(message, tweet_url="", article_title=""):
             "disable_web_page_preview": False
         }
         
-        response = requests.post(url, json=payload, timeout=10)
+        response = http_post(url, json=payload, timeout=10)
         
         if response.status_code == 200:
             print(f"[SUCCESS] Telegram bildirimi gönderildi: {chat_id}")
@@ -3173,7 +4728,7 @@ def test_telegram_connection():
         
         # Bot bilgilerini al
         url = f"https://api.telegram.org/bot{bot_token}/getMe"
-        response = requests.get(url, timeout=10)
+        response = http_get(url, timeout=10)
         
         if response.status_code != 200:
             return {"success": False, "error": f"Bot token geçersiz: {response.status_code}"}
@@ -3190,7 +4745,7 @@ def test_telegram_connection():
             "parse_mode": "Markdown"
         }
         
-        send_response = requests.post(send_url, json=payload, timeout=10)
+        send_response = http_post(send_url, json=payload, timeout=10)
         
         if send_response.status_code == 200:
             return {
@@ -3273,7 +4828,7 @@ def get_telegram_chat_id(bot_token=None):
             }
         
         url = f"https://api.telegram.org/bot{bot_token}/getUpdates"
-        response = requests.get(url, timeout=10)
+        response = http_get(url, timeout=10)
         
         if response.status_code != 200:
             return {"success": False, "error": "Bot token geçersiz"}
@@ -3638,7 +5193,7 @@ def openrouter_ocr_image(image_path):
                     "temperature": 0.1
                 }
                 
-                response = requests.post(
+                response = http_post(
                     "https://openrouter.ai/api/v1/chat/completions",
                     headers=headers,
                     json=data,
@@ -3833,6 +5388,7 @@ def post_text_tweet_v2(tweet_text):
     except Exception as e:
         safe_log(f"Tweet paylaşım genel hatası: {e}", "ERROR")
         return {"success": False, "error": str(e)}
+@_content_cached(max_chars=2000)
 def fetch_url_content_with_mcp(url):
     """MCP ile URL içeriği çekme - Tweet oluşturma için"""
     try:
@@ -3877,15 +5433,17 @@ def fetch_url_content_with_mcp(url):
         content = content.replace('*', '').replace('**', '').replace('_', '')
         content = ' '.join(content.split())  # Çoklu boşlukları tek boşluğa çevir
         
-        # İçeriği sınırla
-        content = content[:2000]
-        
+        # İçerik _content_cached tarafından sınırlanır (önbellekte tam metin kalır)
         safe_print(f"✅ MCP ile URL içeriği çekildi: {len(content)} karakter")
         
         return {
-            "title": title or "Başlık bulunamadı",
+            "title": title or scrape_result.get("title") or "Başlık bulunamadı",
             "content": content,
             "url": url,
+            "canonical_url": scrape_result.get("canonical_url"),
+            "published_date": scrape_result.get("published_date"),
+            "etag": scrape_result.get("etag"),
+            "last_modified": scrape_result.get("last_modified"),
             "source": "mcp"
         }
         
@@ -3894,6 +5452,7 @@ def fetch_url_content_with_mcp(url):
         safe_print("🔄 Fallback yönteme geçiliyor...")
         return fetch_url_content_fallback(url)
 
+@_content_cached(max_chars=2000)
 def fetch_url_content_fallback(url):
     """Fallback URL içeriği çekme - BeautifulSoup ile"""
     try:
@@ -3903,7 +5462,7 @@ def fetch_url_content_fallback(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_get(url, headers=headers, timeout=10)
         response.raise_for_status()
         
         soup = BeautifulSoup(response.text, "html.parser")
@@ -3942,9 +5501,8 @@ def fetch_url_content_fallback(url):
             all_paragraphs = soup.find_all('p')
             content = "\n".join([p.text.strip() for p in all_paragraphs if len(p.text.strip()) > 30])
         
-        # İçeriği temizle ve sınırla
+        # İçeriği temizle - sınır _content_cached tarafından uygulanır
         content = ' '.join(content.split())  # Çoklu boşlukları temizle
-        content = content[:2000]  # İçeriği sınırla
         
         safe_print(f"✅ Fallback ile URL içeriği çekildi: {len(content)} karakter")
         
@@ -3952,6 +5510,8 @@ def fetch_url_content_fallback(url):
             "title": title or "Başlık bulunamadı",
             "content": content,
             "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
             "source": "fallback"
         }
         
@@ -4255,6 +5815,60 @@ def save_news_sources(config):
     except Exception as e:
         return {"success": False, "message": f"❌ Kaydetme hatası: {e}"}
 
+# Kaynak kayıtlarını tutan bölümler
+NEWS_SOURCE_SECTIONS = ("sources", "rss_sources")
+
+def _news_source_key(source):
+    return source.get("id") or source.get("url")
+
+def snapshot_news_sources(config):
+    """save_news_source_changes için çekme başındaki kaynak kayıtlarının kopyası"""
+    import copy
+    return {section: copy.deepcopy(config.get(section, [])) for section in NEWS_SOURCE_SECTIONS}
+
+def save_news_source_changes(before, config):
+    """Kaynak kayıtlarında bu çalışmanın yaptığı değişiklikleri alan bazında kaydet.
+    
+    Paralel çekme kademeleri dosyanın tamamını yazmaz: snapshot_news_sources ile
+    alınan kopyaya göre değişen/silinen alanlar çıkarılır ve güncel dosyaya tek
+    oku-değiştir-yaz ile uygulanır. Böylece aynı anda biten kademeler (ya da
+    arayüzden yapılan bir düzenleme) birbirinin istatistiklerini ezmez."""
+    deltas = []
+    for section in NEWS_SOURCE_SECTIONS:
+        previous_sources = {_news_source_key(source): source for source in before.get(section, [])}
+        for source in config.get(section, []):
+            key = _news_source_key(source)
+            previous = previous_sources.get(key)
+            if previous is None:
+                continue
+            changed = {field: value for field, value in source.items()
+                       if field not in previous or previous[field] != value}
+            removed = [field for field in previous if field not in source]
+            if changed or removed:
+                deltas.append((section, key, changed, removed))
+    if not deltas:
+        return {"success": True, "message": "✅ Kaynaklarda değişiklik yok", "updated": 0}
+    
+    def mutate(current):
+        updated = 0
+        for section, key, changed, removed in deltas:
+            # Kaynak bu arada silinmişse değişiklik atlanır
+            target = next((source for source in current.get(section, []) if _news_source_key(source) == key), None)
+            if target is None:
+                continue
+            target.update(changed)
+            for field in removed:
+                target.pop(field, None)
+            updated += 1
+        current.setdefault("settings", {})["last_updated"] = datetime.now().isoformat()
+        return updated
+    
+    try:
+        updated = update_json(NEWS_SOURCES_FILE, mutate, {})
+        return {"success": True, "message": "✅ Kaynak istatistikleri kaydedildi", "updated": updated}
+    except Exception as e:
+        return {"success": False, "message": f"❌ Kaydetme hatası: {e}"}
+
 def test_selectors_for_url(url):
     """URL için selector'ları test et ve otomatik tespit et - Gelişmiş sistem"""
     try:
@@ -4272,7 +5886,7 @@ def test_selectors_for_url(url):
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             }
             
-            response = requests.get(url, headers=headers, timeout=30)
+            response = http_get(url, headers=headers, timeout=30)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -4479,7 +6093,7 @@ def test_manual_selectors_for_url(url, selectors):
         
         # Sayfayı çek
         try:
-            response = requests.get(url, headers={
+            response = http_get(url, headers={
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             }, timeout=15)
             
@@ -4967,10 +6581,123 @@ def add_rss_source(name, url, description=""):
             "message": f"❌ RSS kaynağı ekleme hatası: {str(e)}"
         }
 
-def fetch_articles_from_custom_sources():
-    """Özel haber kaynaklarından makale çek"""
+def _scrape_custom_sources_concurrently(sources, max_workers=6, per_host_limit=1, source_deadline=30,
+                                        queue_timeout=None, log=None):
+    """Özel kaynakları paralel tara.
+    
+    Her kaynak kendi kopyası üzerinde fetch_articles_from_single_source ile çekilir; aynı host'a
+    aynı anda en fazla per_host_limit istek gider. source_deadline taramanın gerçekten başladığı
+    andan (işçi ve host sırası alındıktan sonra) sayılır, aşan kaynağın sonucu beklenmez ("timeout").
+    queue_timeout (varsayılan source_deadline) saniye içinde sırası gelmeyen kaynak hiç taranmadan
+    "skipped" olarak döner. Dönüş: {kaynak id: {"status", "articles", "elapsed", "error", "source_updates"}}
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+    from urllib.parse import urlparse
+    import copy
+    
+    log = log or (lambda msg, level='info': safe_print(msg))
+    host_locks = {}
+    for source in sources:
+        host = urlparse(source.get("url", "")).netloc.lower()
+        host_locks.setdefault(host, threading.BoundedSemaphore(max(1, per_host_limit)))
+    
+    queue_timeout = source_deadline if queue_timeout is None else queue_timeout
+    started_at = {}   # kaynak anahtarı -> taramanın başladığı an
+    abandoned = set() # sırası beklenirken vazgeçilen kaynaklar
+    state_lock = threading.Lock()
+    
+    def scrape(source_copy, host, key):
+        with host_locks[host], trace_span(source_copy.get('name', 'Bilinmeyen'), kind="source", host=host):
+            with state_lock:
+                if key in abandoned:
+                    return {"status": "skipped", "articles": [], "error": None, "elapsed": 0.0}
+                started = started_at[key] = time.time()
+            log(f"📰 {source_copy.get('name', 'Bilinmeyen')} kaynağı kontrol ediliyor...", "info")
+            try:
+                articles = fetch_articles_from_single_source(source_copy) or []
+                return {"status": "ok", "articles": articles, "error": None,
+                        "elapsed": round(time.time() - started, 2)}
+            except Exception as source_error:
+                return {"status": "error", "articles": [], "error": str(source_error)[:200],
+                        "elapsed": round(time.time() - started, 2)}
+    
+    results = {}
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(sources))), thread_name_prefix='custom-source')
+    futures = {}
+    try:
+        for source in sources:
+            source_copy = copy.deepcopy(source)
+            host = urlparse(source.get("url", "")).netloc.lower()
+            key = source.get("id") or source.get("url")
+            futures[executor.submit(bind_context(scrape), source_copy, host, key)] = (source, source_copy, key, time.time())
+        
+        def deadline_of(future):
+            # Başlamış kaynak: tarama süresi; sırada bekleyen: sıra bekleme süresi
+            _, _, key, submitted = futures[future]
+            started = started_at.get(key)
+            return started + source_deadline if started is not None else submitted + queue_timeout
+        
+        pending = set(futures)
+        while pending:
+            now = time.time()
+            with state_lock:
+                next_deadline = min(deadline_of(f) for f in pending)
+            done, pending = wait(pending, timeout=max(0.0, next_deadline - now), return_when=FIRST_COMPLETED)
+            for future in done:
+                source, source_copy, key, _ = futures[future]
+                result = future.result()
+                # Kaynağın kendi kopyasında yaptığı değişiklikler (ör. otomatik tespit edilen selector'lar)
+                result["source_updates"] = {k: v for k, v in source_copy.items() if source.get(k) != v}
+                results[key] = result
+            now = time.time()
+            with state_lock:
+                expired = [f for f in pending if deadline_of(f) <= now]
+                for future in expired:
+                    pending.discard(future)
+                    future.cancel()
+                    source, _, key, submitted = futures[future]
+                    started = started_at.get(key)
+                    if started is None:
+                        # Sırası hiç gelmedi - kaynağın kendi hatası sayılmaz
+                        abandoned.add(key)
+                        results[key] = {
+                            "status": "skipped", "articles": [], "source_updates": {},
+                            "error": f"{queue_timeout:.0f}s içinde tarama sırası gelmedi", "elapsed": 0.0
+                        }
+                    else:
+                        results[key] = {
+                            "status": "timeout", "articles": [], "source_updates": {},
+                            "error": f"{source_deadline:.0f}s süre sınırı aşıldı", "elapsed": round(now - started, 2)
+                        }
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def _is_unseen_article(article):
+    """Kaynak zamanlayıcısı için: makale paylaşılmış/bekleyen/reddedilmiş değil mi"""
+    return not is_article_seen(url=article.get("url") or None, hash_value=article.get("hash") or None,
+                               statuses=("posted", "pending", "rejected"))
+
+def _due_sources(sources, respect_schedule, log):
+    """Zamanı gelen kaynaklar - zamanlama kapalıysa veya istenmezse hepsi"""
+    if not respect_schedule or not is_source_schedule_enabled():
+        return sources
+    due, waiting = get_source_scheduler().split_due(sources)
+    if waiting:
+        scheduler = get_source_scheduler()
+        names = ", ".join(f"{s.get('name', '?')} ({scheduler.describe(s)['next_due_label']})" for s in waiting)
+        log(f"⏭️ Zamanı gelmeyen {len(waiting)} kaynak atlandı: {names}")
+    return due
+
+def fetch_articles_from_custom_sources(respect_schedule=True):
+    """Özel haber kaynaklarından makale çek.
+    
+    respect_schedule=True iken sadece kaynak zamanlayıcısına göre zamanı gelen
+    kaynaklar taranır; test/manuel çekimlerde False verilir."""
     try:
         config = load_news_sources()
+        before = snapshot_news_sources(config)
         all_articles = []
         
         enabled_sources = [s for s in config["sources"] if s.get("enabled", True)]
@@ -4979,6 +6706,13 @@ def fetch_articles_from_custom_sources():
             safe_print(f"⚠️ Aktif haber kaynağı bulunamadı")
             return []
         
+        enabled_sources = _due_sources(enabled_sources, respect_schedule, safe_print)
+        if not enabled_sources:
+            # Atlanma sayaçları kaydedilir
+            save_news_source_changes(before, config)
+            safe_print(f"⏭️ Bu çalışmada zamanı gelen özel kaynak yok")
+            return []
+        
         # Konsol log için import (terminal kaldırıldı)
         try:
             from app import terminal_log
@@ -4991,37 +6725,52 @@ def fetch_articles_from_custom_sources():
         
         terminal_log(f"🔍 {len(enabled_sources)} haber kaynağından makale çekiliyor...", "info")
         
+        settings = config.get("settings", {})
+        results = _scrape_custom_sources_concurrently(
+            enabled_sources,
+            max_workers=int(settings.get("custom_max_workers", 6)),
+            per_host_limit=int(settings.get("per_host_limit", 1)),
+            source_deadline=float(settings.get("source_timeout", 30)),
+            log=terminal_log
+        )
+        
+        # İstatistikler tek geçişte uygulanır - çalışma sırasında config değiştirilmez
+        checked_at = datetime.now().isoformat()
+        scheduler = get_source_scheduler()
+        per_fetch_cap = int(settings.get("articles_per_source", 5))
         for source in enabled_sources:
-            try:
-                terminal_log(f"📰 {source['name']} kaynağı kontrol ediliyor...", "info")
-                
-                # Kaynak URL'sini çek
-                try:
-                    articles = fetch_articles_from_single_source(source)
-                except Exception as source_error:
-                    terminal_log(f"❌ {source['name']} kaynak hatası: {source_error}", "error")
-                    source["success_rate"] = max(0, source.get("success_rate", 100) - 30)
-                    source["last_checked"] = datetime.now().isoformat()
-                    continue
-                
-                if articles:
-                    all_articles.extend(articles)
-                    source["article_count"] = len(articles)
-                    source["success_rate"] = min(100, source.get("success_rate", 0) + 10)
-                    terminal_log(f"✅ {source['name']}: {len(articles)} makale bulundu", "success")
-                else:
-                    source["success_rate"] = max(0, source.get("success_rate", 100) - 20)
-                    terminal_log(f"⚠️ {source['name']}: Makale bulunamadı", "warning")
-                
-                source["last_checked"] = datetime.now().isoformat()
-                
-            except Exception as e:
-                terminal_log(f"❌ {source['name']} hatası: {e}", "error")
+            result = results.get(source.get("id") or source.get("url"))
+            if not result:
+                continue
+            if result["status"] == "skipped":
+                # Sıra beklerken vazgeçilen kaynak cezalandırılmaz; zamanı geldiği için sonraki çalışmada taranır
+                terminal_log(f"⏭️ {source['name']}: {result['error']}", "warning")
+                continue
+            articles = result["articles"]
+            scheduler.record_fetch(source, articles, "ok" if result["status"] == "ok" else "error",
+                                   is_new=_is_unseen_article, per_fetch_cap=per_fetch_cap)
+            source.update(result["source_updates"])
+            source["last_checked"] = checked_at
+            source["last_fetch_seconds"] = result["elapsed"]
+            source["total_fetches"] = source.get("total_fetches", 0) + 1
+            
+            if result["status"] == "ok" and articles:
+                all_articles.extend(articles)
+                source["article_count"] = len(articles)
+                source["successful_fetches"] = source.get("successful_fetches", 0) + 1
+                source["success_rate"] = min(100, source.get("success_rate", 0) + 10)
+                source.pop("last_error", None)
+                terminal_log(f"✅ {source['name']}: {len(articles)} makale bulundu ({result['elapsed']:.1f}s)", "success")
+            elif result["status"] == "ok":
+                source["success_rate"] = max(0, source.get("success_rate", 100) - 20)
+                terminal_log(f"⚠️ {source['name']}: Makale bulunamadı ({result['elapsed']:.1f}s)", "warning")
+            else:
                 source["success_rate"] = max(0, source.get("success_rate", 100) - 30)
-                source["last_checked"] = datetime.now().isoformat()
+                source["last_error"] = result["error"]
+                terminal_log(f"❌ {source['name']} kaynak hatası: {result['error']}", "error")
         
-        # Güncellenmiş istatistikleri kaydet
-        save_news_sources(config)
+        # Güncellenmiş istatistikleri kaydet (sadece bu çalışmanın değiştirdiği alanlar)
+        save_news_source_changes(before, config)
         
         terminal_log(f"📊 Toplam {len(all_articles)} makale çekildi", "info")
         
@@ -5360,7 +7109,7 @@ def fetch_articles_from_single_source(source):
         }
         
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = http_get(url, headers=headers, timeout=30)
             response.raise_for_status()
         except requests.exceptions.RequestException as req_error:
             safe_print(f"❌ HTTP istek hatası ({source_name}): {req_error}")
@@ -5486,7 +7235,7 @@ def fetch_articles_from_single_source(source):
                 if title and link:
                     # Makale içeriğini çek (basit yöntem)
                     try:
-                        content_response = requests.get(link, headers=headers, timeout=15)
+                        content_response = http_get(link, headers=headers, timeout=15)
                         content_soup = BeautifulSoup(content_response.text, 'html.parser')
                         
                         # Ana içeriği çıkar
@@ -5601,6 +7350,11 @@ def get_news_sources_stats():
                 
             all_sources.append(rss_copy)
         
+        # Öğrenilen çekim takvimi
+        scheduler = get_source_scheduler()
+        for source_copy in all_sources:
+            source_copy["schedule_view"] = scheduler.describe(source_copy)
+        
         # İstatistikleri hesapla
         total_sources = len(all_sources)
         enabled_sources = len([s for s in all_sources if s.get("enabled", True)])
@@ -5613,6 +7367,7 @@ def get_news_sources_stats():
             "disabled_sources": total_sources - enabled_sources,
             "total_articles_fetched": total_articles,
             "average_success_rate": round(avg_success_rate, 1),
+            "schedule": scheduler.overview(all_sources),
             "sources": all_sources,  # Birleştirilmiş kaynaklar
             "scraping_sources": sources,  # Sadece scraping kaynakları
             "rss_sources": rss_sources,  # Sadece RSS kaynakları
@@ -5872,6 +7627,12 @@ def normalize_title_for_comparison(title):
     
     return ' '.join(filtered_words)
 
+_CONTENT_FEATURE_MATCHER = KeywordMatcher({"tech": [
+    'ai', 'artificial intelligence', 'machine learning', 'deep learning', 'neural network', 'algorithm',
+    'api', 'cloud', 'blockchain', 'cryptocurrency', 'robot', 'automation', 'quantum', '5g', 'iot',
+    'ar', 'vr', 'metaverse'
+]})
+
 def extract_key_content_features(content):
     """İçerikten anahtar özellikler çıkar"""
     if not content:
@@ -5892,8 +7653,7 @@ def extract_key_content_features(content):
     features.update([c.lower() for c in companies])
     
     # Önemli teknoloji terimleri
-    tech_terms = re.findall(r'\b(?:ai|artificial intelligence|machine learning|deep learning|neural network|algorithm|api|cloud|blockchain|cryptocurrency|robot|automation|quantum|5g|iot|ar|vr|metaverse)\b', normalized)
-    features.update(tech_terms)
+    features.update(_CONTENT_FEATURE_MATCHER.find(normalized))
     
     return features
 
@@ -5939,6 +7699,7 @@ def check_content_similarity(article1, article2, title_threshold=0.8, content_th
         print(f"Benzerlik kontrolü hatası: {e}")
         return False, 0.0, "error"
 
+@traced("duplicate_filter")
 def filter_duplicate_articles(new_articles, existing_articles=None):
     """Yeni makalelerden duplikatları filtrele"""
     try:
@@ -5956,14 +7717,18 @@ def filter_duplicate_articles(new_articles, existing_articles=None):
         
         safe_print(f"[FILTRE] Gelişmiş duplikat tespiti aktif (Başlık: {title_threshold:.0%}, İçerik: {content_threshold:.0%})")
         
-        if existing_articles is None:
-            # Mevcut paylaşılan makaleleri yükle
-            existing_articles = load_json(HISTORY_FILE, [])
-        
         # Bekleyen tweet'leri de kontrol et
         pending_tweets = load_json("pending_tweets.json", [])
         pending_articles = [tweet.get('article', {}) for tweet in pending_tweets if tweet.get('article')]
         
+        if existing_articles is None:
+            # Mevcut paylaşılan makaleleri yükle
+            existing_articles = load_json(HISTORY_FILE, [])
+            use_seen_index = SEEN_INDEX_AVAILABLE
+        else:
+            # Çağıran özel bir liste verdiyse indeks yerine o liste kullanılır
+            use_seen_index = False
+        
         # Tüm mevcut makaleleri birleştir (silinen makaleler de dahil)
         all_existing = existing_articles + pending_articles
         
@@ -5972,40 +7737,56 @@ def filter_duplicate_articles(new_articles, existing_articles=None):
         if deleted_articles:
             safe_print(f"🗑️ {len(deleted_articles)} silinen makale duplikat kontrole dahil edildi")
         
+        # URL -> en yeni tarih ve hash kümesi (indeks kullanılmıyorsa bir kez oluşturulur)
+        from datetime import datetime, timedelta
+        twenty_four_hours_ago = datetime.now() - timedelta(hours=24)
+        existing_url_dates = {}
+        existing_hashes = set()
+        if not use_seen_index:
+            for existing in all_existing:
+                existing_url = existing.get('url', '')
+                existing_date_str = existing.get('posted_date') or existing.get('fetch_date') or ''
+                if existing_url not in existing_url_dates or existing_date_str > existing_url_dates[existing_url]:
+                    existing_url_dates[existing_url] = existing_date_str
+                if existing.get('hash'):
+                    existing_hashes.add(existing['hash'])
+        
+        def url_seen_recently(url):
+            """URL son 24 saat içinde görüldü mü (tarih yoksa/okunamazsa duplikat say)"""
+            if use_seen_index:
+                return is_article_seen(url=url, within_hours=24, statuses=("posted", "pending"))
+            if url not in existing_url_dates:
+                return False
+            existing_date_str = existing_url_dates[url]
+            if not existing_date_str:
+                return True
+            try:
+                existing_date = datetime.fromisoformat(existing_date_str.replace('Z', '+00:00').replace('+00:00', ''))
+                return existing_date >= twenty_four_hours_ago
+            except:
+                return True
+        
+        # Yakın duplikat indeksi: özellikler makale başına bir kez hesaplanır
+        use_lsh = NEAR_DUPLICATE_AVAILABLE and settings.get('use_lsh_duplicate_index', True)
+        if use_lsh:
+            try:
+                near_index = get_near_duplicate_index()
+                near_index.sync(all_existing)
+                batch_index = NearDuplicateIndex(persist=False)
+            except Exception as index_error:
+                safe_print(f"⚠️ Yakın duplikat indeksi kullanılamadı, ikili karşılaştırmaya geçiliyor: {index_error}")
+                use_lsh = False
+        
         filtered_articles = []
         duplicate_count = 0
         
         for new_article in new_articles:
             is_duplicate = False
             
-            # URL kontrolü - AI Keywords için gevşetildi (sadece son 7 gün kontrol et)
-            new_url = new_article.get('url', '')
-            url_is_duplicate = False
-            
-            # Son 24 saat içindeki makaleleri kontrol et
-            from datetime import datetime, timedelta
-            twenty_four_hours_ago = datetime.now() - timedelta(hours=24)
-            
-            for existing in all_existing:
-                if new_url == existing.get('url', ''):
-                    # Tarih kontrolü yap
-                    existing_date_str = existing.get('posted_date') or existing.get('fetch_date')
-                    if existing_date_str:
-                        try:
-                            existing_date = datetime.fromisoformat(existing_date_str.replace('Z', '+00:00').replace('+00:00', ''))
-                            if existing_date >= twenty_four_hours_ago:
-                                url_is_duplicate = True
-                                break
-                        except:
-                            # Tarih parse edilemezse duplikat say
-                            url_is_duplicate = True
-                            break
-                    else:
-                        # Tarih yoksa duplikat say
-                        url_is_duplicate = True
-                        break
+            # URL kontrolü - AI Keywords için gevşetildi (sadece son 24 saat kontrol et)
+            new_url = new_article.get('url', '')
             
-            if url_is_duplicate:
+            if url_seen_recently(new_url):
                 duplicate_count += 1
                 safe_print(f"🔄 URL duplikatı atlandı (son 7 gün): {new_article.get('title', '')[:50]}...")
                 continue
@@ -6013,38 +7794,59 @@ def filter_duplicate_articles(new_articles, existing_articles=None):
             # Hash kontrolü (hızlı)
             new_hash = new_article.get('hash', '')
             if new_hash:
-                for existing in all_existing:
-                    if new_hash == existing.get('hash', ''):
-                        is_duplicate = True
-                        break
+                if use_seen_index:
+                    is_duplicate = is_article_seen(hash_value=new_hash, statuses=("posted", "pending"))
+                else:
+                    is_duplicate = new_hash in existing_hashes
             
             if is_duplicate:
                 duplicate_count += 1
                 safe_print(f"🔄 Hash duplikatı atlandı: {new_article.get('title', '')[:50]}...")
                 continue
             
-            # İçerik benzerliği kontrolü (yavaş ama etkili)
-            for existing in all_existing:
-                is_similar, similarity_score, match_type = check_content_similarity(
-                    new_article, existing, title_threshold, content_threshold
+            if use_lsh:
+                # İçerik benzerliği - sadece LSH aday kovalarıyla karşılaştır
+                new_doc = near_index.get_doc(new_article)
+                is_similar, similarity_score, match_type, _ = near_index.find_duplicate(
+                    new_article, title_threshold, content_threshold, doc=new_doc
                 )
                 if is_similar:
                     is_duplicate = True
                     safe_print(f"🔄 İçerik benzerliği ({match_type}: {similarity_score:.2f}) - atlandı: {new_article.get('title', '')[:50]}...")
-                    break
-            
-            if not is_duplicate:
-                # Aynı batch içinde de kontrol et
-                for other_article in filtered_articles:
-                    is_similar, similarity_score, match_type = check_content_similarity(
-                        new_article, other_article, title_threshold, content_threshold
+                
+                if not is_duplicate:
+                    # Aynı batch içinde de kontrol et
+                    is_similar, similarity_score, match_type, _ = batch_index.find_duplicate(
+                        new_article, title_threshold, content_threshold, doc=new_doc
                     )
                     if is_similar:
                         is_duplicate = True
                         safe_print(f"🔄 Batch içi benzerlik ({match_type}: {similarity_score:.2f}) - atlandı: {new_article.get('title', '')[:50]}...")
+            else:
+                # İçerik benzerliği kontrolü (yavaş ama etkili)
+                for existing in all_existing:
+                    is_similar, similarity_score, match_type = check_content_similarity(
+                        new_article, existing, title_threshold, content_threshold
+                    )
+                    if is_similar:
+                        is_duplicate = True
+                        safe_print(f"🔄 İçerik benzerliği ({match_type}: {similarity_score:.2f}) - atlandı: {new_article.get('title', '')[:50]}...")
                         break
+                
+                if not is_duplicate:
+                    # Aynı batch içinde de kontrol et
+                    for other_article in filtered_articles:
+                        is_similar, similarity_score, match_type = check_content_similarity(
+                            new_article, other_article, title_threshold, content_threshold
+                        )
+                        if is_similar:
+                            is_duplicate = True
+                            safe_print(f"🔄 Batch içi benzerlik ({match_type}: {similarity_score:.2f}) - atlandı: {new_article.get('title', '')[:50]}...")
+                            break
             
             if not is_duplicate:
+                if use_lsh:
+                    batch_index.add(new_article)
                 filtered_articles.append(new_article)
                 safe_print(f"✅ Yeni makale eklendi: {new_article.get('title', '')[:50]}...")
             else:
@@ -6059,8 +7861,10 @@ def filter_duplicate_articles(new_articles, existing_articles=None):
 def basic_duplicate_filter(new_articles, existing_articles=None):
     """Temel duplikat filtreleme - sadece URL ve hash kontrolü"""
     try:
+        # Varsayılan durumda geçmiş görülme indeksinden okunur, tam liste yüklenmez
+        use_seen_index = existing_articles is None and SEEN_INDEX_AVAILABLE
         if existing_articles is None:
-            existing_articles = load_json(HISTORY_FILE, [])
+            existing_articles = [] if use_seen_index else load_json(HISTORY_FILE, [])
         
         # Bekleyen tweet'leri de kontrol et
         pending_tweets = load_json("pending_tweets.json", [])
@@ -6079,6 +7883,7 @@ def basic_duplicate_filter(new_articles, existing_articles=None):
         existing_hashes = set(article.get('hash', '') for article in all_existing)
         
         filtered_articles = []
+        batch_urls = set()
         duplicate_count = 0
         
         for new_article in new_articles:
@@ -6086,24 +7891,24 @@ def basic_duplicate_filter(new_articles, existing_articles=None):
             new_hash = new_article.get('hash', '')
             
             # URL kontrolü
-            if new_url in existing_urls:
+            if new_url in existing_urls or (use_seen_index and is_article_seen(url=new_url, statuses=("posted", "pending"))):
                 duplicate_count += 1
                 safe_print(f"🔄 URL duplikatı atlandı: {new_article.get('title', '')[:50]}...")
                 continue
             
             # Hash kontrolü
-            if new_hash and new_hash in existing_hashes:
+            if new_hash and (new_hash in existing_hashes or (use_seen_index and is_article_seen(hash_value=new_hash, statuses=("posted", "pending")))):
                 duplicate_count += 1
                 safe_print(f"🔄 Hash duplikatı atlandı: {new_article.get('title', '')[:50]}...")
                 continue
             
             # Aynı batch içinde URL kontrolü
-            batch_urls = set(article.get('url', '') for article in filtered_articles)
             if new_url in batch_urls:
                 duplicate_count += 1
                 safe_print(f"🔄 Batch içi URL duplikatı atlandı: {new_article.get('title', '')[:50]}...")
                 continue
             
+            batch_urls.add(new_url)
             filtered_articles.append(new_article)
             safe_print(f"✅ Yeni makale eklendi: {new_article.get('title', '')[:50]}...")
         
@@ -6117,6 +7922,7 @@ def basic_duplicate_filter(new_articles, existing_articles=None):
 def clean_duplicate_pending_tweets():
     """Bekleyen tweet'lerdeki duplikatları temizle"""
     try:
+        ensure_pending_ids()
         pending_tweets = load_json("pending_tweets.json", [])
         
         if not pending_tweets:
@@ -6174,8 +7980,9 @@ def clean_duplicate_pending_tweets():
             
             safe_print(f"✅ Benzersiz tweet korundu: {title[:50]}...")
         
-        # Temizlenmiş listeyi kaydet
-        save_json("pending_tweets.json", unique_tweets)
+        # Sadece duplikatları kalıcı ID ile kaldır (arada eklenen tweet'ler korunur)
+        kept = {id(tweet) for tweet in unique_tweets}
+        remove_pending_tweets([tweet.get('id') for tweet in pending_tweets if id(tweet) not in kept])
         
         result = {
             "success": True,
@@ -6420,20 +8227,18 @@ def retry_pending_tweets_after_rate_limit():
             return {"success": False, "message": "Rate limit hala aktif"}
         
         # Bekleyen tweet'leri yükle
+        ensure_pending_ids()
         pending_tweets = load_json("pending_tweets.json", [])
         if not pending_tweets:
             return {"success": True, "message": "Bekleyen tweet yok"}
         
         # Rate limit hatası olan tweet'leri filtrele
         rate_limited_tweets = []
-        other_tweets = []
         
         for tweet in pending_tweets:
             error_reason = tweet.get('error_reason', '')
             if 'rate limit' in error_reason.lower() or '429' in error_reason:
                 rate_limited_tweets.append(tweet)
-            else:
-                other_tweets.append(tweet)
         
         if not rate_limited_tweets:
             return {"success": True, "message": "Rate limit hatası olan tweet yok"}
@@ -6442,6 +8247,9 @@ def retry_pending_tweets_after_rate_limit():
         
         successful_posts = 0
         failed_posts = 0
+        # Pending dosyasına sonda tek işlemde uygulanır (kalıcı ID ile)
+        posted_ids = set()
+        retry_updates = {}
         
         for tweet in rate_limited_tweets:
             try:
@@ -6464,38 +8272,43 @@ def retry_pending_tweets_after_rate_limit():
                     article['manual_post'] = False
                     
                     # Posted articles'a ekle
-                    posted_articles = load_json("posted_articles.json", [])
-                    posted_articles.append(article)
-                    save_json("posted_articles.json", posted_articles)
+                    append_json_record("posted_articles.json", article)
+                    posted_ids.add(str(tweet.get('id')))
                     
                     successful_posts += 1
                     safe_print(f"✅ Tweet başarıyla paylaşıldı: {article.get('title', '')[:50]}...")
                     
                 else:
-                    # Hala hata var - tweet'i other_tweets'e ekle
-                    tweet['retry_count'] = tweet.get('retry_count', 0) + 1
-                    tweet['error_reason'] = result.get('error', 'Bilinmeyen hata')
-                    other_tweets.append(tweet)
+                    # Hala hata var - tweet beklemede kalır
+                    retry_updates[str(tweet.get('id'))] = {
+                        'retry_count': tweet.get('retry_count', 0) + 1,
+                        'error_reason': result.get('error', 'Bilinmeyen hata'),
+                    }
                     failed_posts += 1
                     safe_print(f"❌ Tweet paylaşım hatası: {result.get('error', 'Bilinmeyen hata')}")
                     
                     # Rate limit hatası ise dur
                     if result.get('rate_limited'):
                         print("Rate limit tekrar aşıldı, kalan tweet'ler beklemede kalacak")
-                        # Kalan tweet'leri de other_tweets'e ekle
-                        remaining_tweets = rate_limited_tweets[rate_limited_tweets.index(tweet) + 1:]
-                        other_tweets.extend(remaining_tweets)
                         break
                 
             except Exception as e:
                 print(f"Tweet retry hatası: {e}")
-                tweet['retry_count'] = tweet.get('retry_count', 0) + 1
-                tweet['error_reason'] = str(e)
-                other_tweets.append(tweet)
+                retry_updates[str(tweet.get('id'))] = {
+                    'retry_count': tweet.get('retry_count', 0) + 1,
+                    'error_reason': str(e),
+                }
                 failed_posts += 1
         
-        # Güncellenmiş pending tweet'leri kaydet
-        save_json("pending_tweets.json", other_tweets)
+        # Paylaşılanları kaldır, başarısızların deneme bilgisini güncelle
+        # (tek kuyruk işlemi - arada eklenen tweet'ler korunur)
+        def mutate(current):
+            current[:] = [t for t in current if str(t.get('id')) not in posted_ids]
+            for t in current:
+                t.update(retry_updates.get(str(t.get('id')), {}))
+        
+        if posted_ids or retry_updates:
+            update_json("pending_tweets.json", mutate, [])
         
         message = f"✅ {successful_posts} tweet başarıyla paylaşıldı"
         if failed_posts > 0:
@@ -6535,6 +8348,23 @@ def terminal_log(message, level='info'):
     
     print(f"{color}[{timestamp}] [{level.upper()}] {message}{reset}")
 
+def _scraped_page(html, url, method, response=None):
+    """Çekilen HTML'i tek geçişte çözümle - içerik, linkler, tarih ve canonical URL birlikte"""
+    page = extract_page(html, base_url=url)
+    headers = response.headers if response is not None else {}
+    return {
+        "success": True,
+        "content": page["content"],
+        "html": html,
+        "links": page["links"],
+        "title": page["title"],
+        "published_date": page["published_date"],
+        "canonical_url": page["canonical_url"],
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "method": method
+    }
+
 def advanced_web_scraper(url, wait_time=3, use_js=False, return_html=False):
     """Gelişmiş web scraping - MCP'ye alternatif"""
     try:
@@ -6563,150 +8393,45 @@ def advanced_web_scraper(url, wait_time=3, use_js=False, return_html=False):
             'Cache-Control': 'max-age=0'
         }
         
-        # Yöntem 1: requests-html (JavaScript desteği ile)
-        if REQUESTS_HTML_AVAILABLE and use_js and requests_html:
-            try:
-                from requests_html import HTMLSession  # type: ignore
-                session = HTMLSession()
-                
-                safe_print(f"🚀 requests-html ile JavaScript render ediliyor...")
-                r = session.get(url, headers=headers, timeout=30)
-                r.html.render(wait=wait_time, timeout=20)
-                
-                content = r.html.html
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                safe_print(f"✅ requests-html başarılı: {len(content)} karakter")
-                return {
-                    "success": True,
-                    "content": extract_main_content(soup),
-                    "html": content,
-                    "method": "requests-html"
-                }
-                
-            except Exception as rh_error:
-                safe_print(f"⚠️ requests-html hatası: {rh_error}")
-        
-        # Yöntem 2: Selenium (headless Chrome)
-        if SELENIUM_AVAILABLE and use_js and webdriver and Options:
-            try:
-                safe_print(f"🚀 Selenium ile JavaScript render ediliyor...")
-                
-                chrome_options = Options()
-                chrome_options.add_argument('--headless')
-                chrome_options.add_argument('--no-sandbox')
-                chrome_options.add_argument('--disable-dev-shm-usage')
-                chrome_options.add_argument('--disable-gpu')
-                chrome_options.add_argument('--window-size=1920,1080')
-                chrome_options.add_argument(f'--user-agent={headers["User-Agent"]}')
-                
-                driver = webdriver.Chrome(options=chrome_options)
-                driver.set_page_load_timeout(30)
-                
-                driver.get(url)
-                
-                # Sayfanın yüklenmesini bekle
-                if WebDriverWait and EC and By:
-                    WebDriverWait(driver, wait_time).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
-                else:
-                    time.sleep(wait_time)
-                
-                # Biraz daha bekle (dinamik içerik için)
-                time.sleep(wait_time)
-                
-                content = driver.page_source
-                driver.quit()
-                
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                safe_print(f"✅ Selenium başarılı: {len(content)} karakter")
-                return {
-                    "success": True,
-                    "content": extract_main_content(soup),
-                    "html": content,
-                    "method": "selenium"
-                }
-                
-            except Exception as selenium_error:
-                safe_print(f"⚠️ Selenium hatası: {selenium_error}")
+        # Yöntem 1-2: Havuzdaki sıcak tarayıcıda render (requests-html, sonra Selenium)
+        if use_js:
+            for method, available in (("requests-html", REQUESTS_HTML_AVAILABLE and requests_html),
+                                      ("selenium", SELENIUM_AVAILABLE and webdriver)):
+                if not available:
+                    continue
                 try:
-                    driver.quit()
-                except:
-                    pass
+                    safe_print(f"🚀 {method} ile JavaScript render ediliyor (tarayıcı havuzu)...")
+                    pool = get_render_pool(method, user_agent=headers["User-Agent"])
+                    content = pool.render(url, wait_time=wait_time, headers=headers)
+                    
+                    safe_print(f"✅ {method} başarılı: {len(content)} karakter")
+                    return _scraped_page(content, url, method)
+                    
+                except Exception as render_error:
+                    safe_print(f"⚠️ {method} hatası: {render_error}")
         
         # Yöntem 3: Basit requests (fallback)
         safe_print(f"🔄 Basit HTTP request ile deneniyor...")
         
-        session = requests.Session()
-        session.headers.update(headers)
-        
-        response = session.get(url, timeout=30, allow_redirects=True)
+        response = http_get(url, headers=headers, timeout=30, allow_redirects=True)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
         safe_print(f"✅ Basit request başarılı: {len(response.text)} karakter")
-        return {
-            "success": True,
-            "content": extract_main_content(soup),
-            "html": response.text,
-            "method": "requests"
-        }
+        return _scraped_page(response.text, url, "requests", response)
         
     except Exception as e:
         safe_print(f"❌ Gelişmiş scraper hatası: {e}")
         return {"success": False, "error": str(e)}
 
 def extract_main_content(soup):
-    """Sayfadan ana içeriği çıkar"""
+    """Sayfadan ana içeriği çıkar (BeautifulSoup nesnesi veya HTML metni)
+
+    Seçim page_extractor.extract_page ile tek geçişte yapılır; yeni kodda
+    HTML doğrudan extract_page'e verilmeli (soup burada yeniden serileştirilir).
+    """
     try:
-        # Ana içerik selector'ları (öncelik sırasına göre)
-        main_content_selectors = [
-            'article',
-            '[role="main"]',
-            'main',
-            '.post-content',
-            '.entry-content',
-            '.article-content',
-            '.content',
-            '.story-body',
-            '.article-body',
-            '#content',
-            '.main-content'
-        ]
-        
-        content_text = ""
-        
-        for selector in main_content_selectors:
-            elements = soup.select(selector)
-            if elements:
-                element = elements[0]
-                
-                # Gereksiz elementleri kaldır
-                for unwanted in element(["script", "style", "nav", "footer", "header", "aside", ".advertisement", ".ads", ".social-share"]):
-                    unwanted.decompose()
-                
-                content_text = element.get_text(strip=True)
-                if len(content_text) > 200:  # Yeterli içerik varsa
-                    break
-        
-        # Eğer ana içerik bulunamazsa body'den al
-        if not content_text or len(content_text) < 200:
-            body = soup.find('body')
-            if body:
-                # Gereksiz elementleri kaldır
-                for unwanted in body(["script", "style", "nav", "footer", "header", "aside", ".advertisement", ".ads", ".social-share", ".menu", ".sidebar"]):
-                    unwanted.decompose()
-                
-                content_text = body.get_text(strip=True)
-        
-        # İçeriği temizle
-        content_text = ' '.join(content_text.split())
-        # content_text = content_text[:3000]  # İlk 3000 karakter sınırı kaldırıldı
-        
-        return content_text
+        html = soup if isinstance(soup, (str, bytes)) else str(soup)
+        return extract_page(html)["content"]
         
     except Exception as e:
         safe_print(f"❌ İçerik çıkarma hatası: {e}")
@@ -6719,11 +8444,6 @@ def extract_main_content(soup):
 def fetch_latest_ai_articles_pythonanywhere():
     """PythonAnywhere için optimize edilmiş haber çekme sistemi - Özel kaynaklar + API'ler"""
     try:
-        # Önce mevcut yayınlanan makaleleri yükle
-        posted_articles = load_json(HISTORY_FILE, [])
-        posted_urls = [article.get('url', '') for article in posted_articles]
-        posted_hashes = [article.get('hash', '') for article in posted_articles]
-        
         safe_print(f"🔍 PythonAnywhere uyumlu haber çekme sistemi başlatılıyor...")
         
         all_articles = []
@@ -6774,10 +8494,9 @@ def fetch_latest_ai_articles_pythonanywhere():
             article_url = article.get('url', '')
             
             # Zaten paylaşılmış mı kontrol et
-            if (article_hash not in posted_hashes and 
-                article_url not in posted_urls and
-                article_hash not in seen_hashes and
-                article_url not in seen_urls):
+            if (article_hash not in seen_hashes and
+                article_url not in seen_urls and
+                not is_article_seen(url=article_url, hash_value=article_hash, statuses=("posted",))):
                 
                 unique_articles.append(article)
                 seen_hashes.add(article_hash)
@@ -6803,6 +8522,7 @@ def fetch_articles_from_custom_sources_pythonanywhere():
     """PythonAnywhere uyumlu özel haber kaynakları çekme"""
     try:
         config = load_news_sources()
+        before = snapshot_news_sources(config)
         all_articles = []
         
         enabled_sources = [s for s in config["sources"] if s.get("enabled", True)]
@@ -6836,11 +8556,10 @@ def fetch_articles_from_custom_sources_pythonanywhere():
                 source["success_rate"] = max(0, source.get("success_rate", 100) - 30)
                 source["last_checked"] = datetime.now().isoformat()
         
-        # Güncellenmiş config'i kaydet
-        try:
-            save_json(NEWS_SOURCES_FILE, config)
-        except Exception as save_error:
-            safe_print(f"⚠️ Haber kaynakları kaydetme hatası: {save_error}")
+        # Güncellenmiş istatistikleri kaydet
+        result = save_news_source_changes(before, config)
+        if not result["success"]:
+            safe_print(f"⚠️ Haber kaynakları kaydetme hatası: {result['message']}")
         
         print(f"📊 Özel kaynaklardan toplam {len(all_articles)} makale bulundu")
         return all_articles
@@ -6862,7 +8581,7 @@ def fetch_articles_from_single_source_pythonanywhere(source):
         }
         
         # Timeout ile güvenli istek
-        response = requests.get(source['url'], headers=headers, timeout=15)
+        response = http_get(source['url'], headers=headers, timeout=15)
         response.raise_for_status()
         
         safe_print(f"✅ {source['name']}: HTTP {response.status_code} - {len(response.text)} karakter")
@@ -6923,11 +8642,7 @@ def fetch_articles_from_single_source_pythonanywhere(source):
                     continue
                 
                 # AI ile ilgili mi kontrol et
-                title_lower = title.lower()
-                ai_keywords = ['ai', 'artificial intelligence', 'machine learning', 'deep learning', 'neural', 'gpt', 'llm', 'chatbot', 'automation', 'anthropic', 'openai', 'claude', 'gemini', 'copilot']
-                is_ai_related = any(keyword in title_lower for keyword in ai_keywords)
-                
-                if not is_ai_related:
+                if not is_ai_related_text(title):
                     continue
                 
                 # Özet bul
@@ -6996,8 +8711,221 @@ def fetch_articles_from_single_source_pythonanywhere(source):
         safe_print(f"❌ {source.get('name', 'Bilinmeyen')} kaynak hatası: {e}")
         return []
 
-def fetch_articles_with_rss_only():
-    """Sadece RSS yöntemi ile haber kaynaklarından makale çekme - Son 24 saat filtreli"""
+def _fetch_rss_feed_conditional(rss_source, timeout=15):
+    """RSS feed'ini koşullu GET ile indir ve parse et.
+    
+    Önceki yanıtın ETag / Last-Modified değerleri rss_source içinde saklanır ve
+    If-None-Match / If-Modified-Since olarak gönderilir. Dönüş: (feed, validators);
+    304 dönerse feed None'dır (feed değişmemiş, parse edilmez). Yeni doğrulayıcılar
+    burada kaydedilmez - _commit_rss_validators feed'in tamamı tüketildiyse yazar.
+    """
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (compatible; AI-Tweet-Bot/1.0; +https://github.com/palamut62/flask_tweet_app)',
+        'Accept': 'application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8',
+    }
+    if rss_source.get('etag'):
+        headers['If-None-Match'] = rss_source['etag']
+    if rss_source.get('last_modified'):
+        headers['If-Modified-Since'] = rss_source['last_modified']
+    
+    response = http_get(rss_source['url'], headers=headers, timeout=timeout)
+    if response.status_code == 304:
+        return None, {}
+    response.raise_for_status()
+    
+    validators = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+    }
+    feed = feedparser.parse(response.content, response_headers={k.lower(): v for k, v in response.headers.items()})
+    return feed, validators
+
+
+def _commit_rss_validators(rss_source, validators, consumed):
+    """Doğrulayıcıları sadece feed'deki her entry işlendiyse kaydet.
+    
+    Okunmadan kalan (10 entry / 5 makale sınırı) veya bu çalışmada döndürülüp
+    henüz kaydedilmemiş entry varsa eski doğrulayıcılar da silinir: sonraki 304
+    bu entry'leri bir daha hiç çekilmeyecek şekilde gizlerdi."""
+    for key in ('etag', 'last_modified'):
+        if consumed and validators.get(key):
+            rss_source[key] = validators[key]
+        else:
+            rss_source.pop(key, None)
+
+
+def _fetch_single_rss_source(rss_source, twenty_four_hours_ago):
+    """Tek RSS kaynağını çek ve yeni makaleleri döndür - istatistikler rss_source üzerinde güncellenir"""
+    with trace_span(rss_source.get('name', 'RSS'), kind="source"):
+        return _fetch_single_rss_source_entries(rss_source, twenty_four_hours_ago)
+
+
+def _fetch_single_rss_source_entries(rss_source, twenty_four_hours_ago):
+    try:
+        safe_print(f"🔍 RSS çekiliyor: {rss_source['name']}")
+        rss_source.pop("last_error", None)
+        
+        try:
+            feed, validators = _fetch_rss_feed_conditional(rss_source)
+            if feed is None:
+                # 304 Not Modified - feed değişmemiş, başarı oranı etkilenmez
+                safe_print(f"⏭️ {rss_source['name']}: değişiklik yok (304), atlandı")
+                rss_source["not_modified_count"] = rss_source.get("not_modified_count", 0) + 1
+                rss_source["last_checked"] = datetime.now().isoformat()
+                return []
+            if hasattr(feed, 'bozo') and feed.bozo:
+                safe_print(f"⚠️ RSS feed format uyarısı ({rss_source['name']}): {getattr(feed, 'bozo_exception', 'Bilinmeyen format sorunu')}")
+        except Exception as feed_error:
+            safe_print(f"❌ RSS feed parse hatası ({rss_source['name']}): {feed_error}")
+            rss_source["success_rate"] = max(0, rss_source.get("success_rate", 100) - 30)
+            rss_source["last_error"] = str(feed_error)[:200]
+            rss_source["last_checked"] = datetime.now().isoformat()
+            return []
+        
+        if not feed.entries:
+            safe_print(f"⚠️ {rss_source['name']}: RSS feed'de entry bulunamadı")
+            _commit_rss_validators(rss_source, validators, consumed=False)
+            rss_source["success_rate"] = max(0, rss_source.get("success_rate", 100) - 20)
+            rss_source["last_checked"] = datetime.now().isoformat()
+            return []
+        
+        source_articles = []
+        # Her entry incelendi mi (10 entry sınırı yüzünden atlanan veya hata veren var mı)
+        all_examined = len(feed.entries) <= 10
+        
+        for entry in feed.entries[:10]:  # Her feed'den en fazla 10 makale kontrol et
+            try:
+                title = getattr(entry, 'title', '')
+                url = getattr(entry, 'link', '')
+                
+                if not title or not url:
+                    continue
+                
+                # URL kontrolü
+                if is_article_seen(url=url, statuses=("posted",)):
+                    safe_print(f"✅ RSS makale zaten paylaşılmış: {title[:50]}...")
+                    continue
+                
+                # Tarih kontrolü
+                entry_date = None
+                date_str = ""
+                
+                # RSS entry'den tarih al - Gelişmiş hata yakalama
+                if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                    try:
+                        entry_date = datetime(*entry.published_parsed[:6])
+                        date_str = getattr(entry, 'published', '')
+                    except (ValueError, TypeError, OverflowError) as date_error:
+                        safe_print(f"⚠️ RSS tarih parse hatası (published_parsed): {date_error}")
+                        entry_date = None
+                        date_str = ""
+                elif hasattr(entry, 'published'):
+                    try:
+                        entry_date = parsedate_to_datetime(entry.published)
+                        date_str = entry.published
+                    except (ValueError, TypeError) as date_error:
+                        safe_print(f"⚠️ RSS tarih parse hatası (published): {date_error}")
+                        entry_date = None
+                        date_str = ""
+                else:
+                    entry_date = None
+                    date_str = ""
+                
+                # 24 saat kontrolü
+                if entry_date:
+                    if entry_date < twenty_four_hours_ago:
+                        print(f"⏰ RSS makale 24 saatten eski: {entry_date.strftime('%Y-%m-%d %H:%M')} - {title[:50]}...")
+                        continue
+                
+                # İçerik al
+                content = ""
+                if hasattr(entry, 'summary'):
+                    content = entry.summary
+                elif hasattr(entry, 'description'):
+                    content = entry.description
+                elif hasattr(entry, 'content'):
+                    if isinstance(entry.content, list) and len(entry.content) > 0:
+                        content = entry.content[0].value
+                    else:
+                        content = str(entry.content)
+                
+                # HTML etiketlerini temizle
+                if content:
+                    from bs4 import BeautifulSoup
+                    content = BeautifulSoup(content, 'html.parser').get_text()
+                    content = ' '.join(content.split())[:2000]
+                
+                # Eğer içerik yoksa başlığı kullan
+                if not content:
+                    content = title
+                
+                # Hash oluştur
+                article_hash = hashlib.md5(title.encode()).hexdigest()
+                
+                # Tekrar kontrolü
+                if not is_article_seen(hash_value=article_hash, statuses=("posted",)):
+                    
+                    source_articles.append({
+                        "title": title,
+                        "url": url,
+                        "content": content,
+                        "hash": article_hash,
+                        "fetch_date": datetime.now().isoformat(),
+                        "is_new": True,
+                        "already_posted": False,
+                        "source": f"RSS - {rss_source['name']}",
+                        "source_id": rss_source["id"],
+                        "article_date": entry_date.isoformat() if entry_date else datetime.now().isoformat(),
+                        "is_within_7d": True,
+                        "rss_published": date_str,
+                        "fetch_method": "RSS Feed",
+                        "method_icon": "📡",
+                        "method_color": "green"
+                    })
+                    print(f"🆕 RSS ile yeni makale (24h içinde): {title[:50]}...")
+                else:
+                    if is_article_seen(hash_value=article_hash, within_hours=24, statuses=("posted",)):
+                        print(f"⏰ Son 24 saatte paylaşılmış: {title[:50]}...")
+                    else:
+                        safe_print(f"✅ Makale zaten paylaşılmış: {title[:50]}...")
+                
+                # En fazla 5 makale al
+                if len(source_articles) >= 5:
+                    break
+                
+            except Exception as entry_error:
+                safe_print(f"⚠️ RSS entry hatası: {entry_error}")
+                all_examined = False
+                continue
+        
+        # Döndürülen makaleler çağıranda (max_articles vb.) düşebilir; doğrulayıcılar
+        # ancak feed'de yeni entry kalmadığında (hepsi görülmüş/eski) kaydedilir
+        _commit_rss_validators(rss_source, validators, consumed=all_examined and not source_articles)
+                
+        if source_articles:
+            rss_source["article_count"] = len(source_articles)
+            rss_source["success_rate"] = min(100, rss_source.get("success_rate", 0) + 10)
+            safe_print(f"✅ {rss_source['name']}: {len(source_articles)} yeni makale bulundu")
+        else:
+            rss_source["success_rate"] = max(0, rss_source.get("success_rate", 100) - 10)
+            safe_print(f"⚠️ {rss_source['name']}: Yeni makale bulunamadı")
+        
+        rss_source["last_checked"] = datetime.now().isoformat()
+        return source_articles
+        
+    except Exception as source_error:
+        safe_print(f"❌ {rss_source['name']} RSS hatası: {source_error}")
+        rss_source["success_rate"] = max(0, rss_source.get("success_rate", 100) - 30)
+        rss_source["last_error"] = str(source_error)[:200]
+        rss_source["last_checked"] = datetime.now().isoformat()
+        return []
+
+
+def fetch_articles_with_rss_only(respect_schedule=True):
+    """Sadece RSS yöntemi ile haber kaynaklarından makale çekme - Son 24 saat filtreli.
+    
+    respect_schedule=True iken sadece kaynak zamanlayıcısına göre zamanı gelen
+    feed'ler çekilir."""
     try:
         safe_print("[RSS] RSS yöntemi ile haber çekme başlatılıyor (Son 24 saat)...")
         
@@ -7008,31 +8936,11 @@ def fetch_articles_with_rss_only():
         print(f"📅 Bugün: {now.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"⏰ 24 saat öncesi: {twenty_four_hours_ago.strftime('%Y-%m-%d %H:%M:%S')}")
         
-        # Önce mevcut yayınlanan makaleleri yükle
-        posted_articles = load_json(HISTORY_FILE, [])
-        posted_urls = [article.get('url', '') for article in posted_articles]
-        posted_hashes = [article.get('hash', '') for article in posted_articles]
-        
-        # Son 24 saat içinde paylaşılan makaleleri de kontrol et
-        recent_posted_urls = []
-        recent_posted_hashes = []
-        
-        for article in posted_articles:
-            posted_date_str = article.get('posted_date') or article.get('fetch_date')
-            if posted_date_str:
-                try:
-                    posted_date = datetime.fromisoformat(posted_date_str.replace('Z', '+00:00').replace('+00:00', ''))
-                    if posted_date >= twenty_four_hours_ago:
-                        recent_posted_urls.append(article.get('url', ''))
-                        recent_posted_hashes.append(article.get('hash', ''))
-                except Exception as date_error:
-                    safe_print(f"⚠️ Tarih parse hatası: {date_error}")
-                    continue
-        
-        print(f"📊 Son 24 saatte paylaşılan makale sayısı: {len(recent_posted_urls)}")
+        # Paylaşılan makaleler görülme indeksinden O(1) kontrol edilir
         
         # RSS kaynaklarını yükle
         config = load_news_sources()
+        before = snapshot_news_sources(config)
         rss_sources = config.get("rss_sources", [])
         enabled_rss_sources = [s for s in rss_sources if s.get("enabled", True)]
         
@@ -7040,163 +8948,46 @@ def fetch_articles_with_rss_only():
             safe_print(f"⚠️ Aktif RSS kaynağı bulunamadı")
             return []
         
-        print(f"📰 {len(enabled_rss_sources)} RSS kaynağından makale çekiliyor...")
+        enabled_rss_sources = _due_sources(enabled_rss_sources, respect_schedule, safe_print)
+        if not enabled_rss_sources:
+            save_news_source_changes(before, config)
+            safe_print(f"⏭️ Bu çalışmada zamanı gelen RSS kaynağı yok")
+            return []
         
-        all_articles = []
+        print(f"📰 {len(enabled_rss_sources)} RSS kaynağından makale çekiliyor...")
         
-        for rss_source in enabled_rss_sources:
-            try:
-                safe_print(f"🔍 RSS çekiliyor: {rss_source['name']}")
-                
-                # RSS feed'i parse et
-                if not FEEDPARSER_AVAILABLE:
-                    safe_print(f"❌ feedparser kütüphanesi yüklü değil: {rss_source['name']} atlanıyor")
-                    rss_source["success_rate"] = max(0, rss_source.get("success_rate", 100) - 20)
-                    rss_source["last_checked"] = datetime.now().isoformat()
-                    continue
-                
-                try:
-                    feed = feedparser.parse(rss_source['url'])
-                    if hasattr(feed, 'bozo') and feed.bozo:
-                        safe_print(f"⚠️ RSS feed format uyarısı ({rss_source['name']}): {getattr(feed, 'bozo_exception', 'Bilinmeyen format sorunu')}")
-                except Exception as feed_error:
-                    safe_print(f"❌ RSS feed parse hatası ({rss_source['name']}): {feed_error}")
-                    rss_source["success_rate"] = max(0, rss_source.get("success_rate", 100) - 30)
-                    rss_source["last_checked"] = datetime.now().isoformat()
-                    continue
-                
-                if not feed.entries:
-                    safe_print(f"⚠️ {rss_source['name']}: RSS feed'de entry bulunamadı")
-                    rss_source["success_rate"] = max(0, rss_source.get("success_rate", 100) - 20)
-                    continue
-                
-                source_articles = []
-                
-                for entry in feed.entries[:10]:  # Her feed'den en fazla 10 makale kontrol et
-                    try:
-                        title = getattr(entry, 'title', '')
-                        url = getattr(entry, 'link', '')
-                        
-                        if not title or not url:
-                            continue
-                        
-                        # URL kontrolü
-                        if url in posted_urls or url in recent_posted_urls:
-                            safe_print(f"✅ RSS makale zaten paylaşılmış: {title[:50]}...")
-                            continue
-                        
-                        # Tarih kontrolü
-                        entry_date = None
-                        date_str = ""
-                        
-                        # RSS entry'den tarih al - Gelişmiş hata yakalama
-                        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                            try:
-                                entry_date = datetime(*entry.published_parsed[:6])
-                                date_str = getattr(entry, 'published', '')
-                            except (ValueError, TypeError, OverflowError) as date_error:
-                                safe_print(f"⚠️ RSS tarih parse hatası (published_parsed): {date_error}")
-                                entry_date = None
-                                date_str = ""
-                        elif hasattr(entry, 'published'):
-                            try:
-                                entry_date = parsedate_to_datetime(entry.published)
-                                date_str = entry.published
-                            except (ValueError, TypeError) as date_error:
-                                safe_print(f"⚠️ RSS tarih parse hatası (published): {date_error}")
-                                entry_date = None
-                                date_str = ""
-                        else:
-                            entry_date = None
-                            date_str = ""
-                        
-                        # 24 saat kontrolü
-                        if entry_date:
-                            if entry_date < twenty_four_hours_ago:
-                                print(f"⏰ RSS makale 24 saatten eski: {entry_date.strftime('%Y-%m-%d %H:%M')} - {title[:50]}...")
-                                continue
-                        
-                        # İçerik al
-                        content = ""
-                        if hasattr(entry, 'summary'):
-                            content = entry.summary
-                        elif hasattr(entry, 'description'):
-                            content = entry.description
-                        elif hasattr(entry, 'content'):
-                            if isinstance(entry.content, list) and len(entry.content) > 0:
-                                content = entry.content[0].value
-                            else:
-                                content = str(entry.content)
-                        
-                        # HTML etiketlerini temizle
-                        if content:
-                            from bs4 import BeautifulSoup
-                            content = BeautifulSoup(content, 'html.parser').get_text()
-                            content = ' '.join(content.split())[:2000]
-                        
-                        # Eğer içerik yoksa başlığı kullan
-                        if not content:
-                            content = title
-                        
-                        # Hash oluştur
-                        article_hash = hashlib.md5(title.encode()).hexdigest()
-                        
-                        # Tekrar kontrolü
-                        if (article_hash not in posted_hashes and 
-                            article_hash not in recent_posted_hashes):
-                            
-                            source_articles.append({
-                            "title": title,
-                            "url": url,
-                                "content": content,
-                            "hash": article_hash,
-                            "fetch_date": datetime.now().isoformat(),
-                            "is_new": True,
-                                "already_posted": False,
-                                "source": f"RSS - {rss_source['name']}",
-                                "source_id": rss_source["id"],
-                                "article_date": entry_date.isoformat() if entry_date else datetime.now().isoformat(),
-                                "is_within_7d": True,
-                                "rss_published": date_str,
-                                "fetch_method": "RSS Feed",
-                                "method_icon": "📡",
-                                "method_color": "green"
-                            })
-                            print(f"🆕 RSS ile yeni makale (24h içinde): {title[:50]}...")
-                        else:
-                            if article_hash in recent_posted_hashes:
-                                print(f"⏰ Son 24 saatte paylaşılmış: {title[:50]}...")
-                            else:
-                                safe_print(f"✅ Makale zaten paylaşılmış: {title[:50]}...")
-                        
-                        # En fazla 5 makale al
-                        if len(source_articles) >= 5:
-                            break
-                        
-                    except Exception as entry_error:
-                        safe_print(f"⚠️ RSS entry hatası: {entry_error}")
-                        continue
-                        
-                if source_articles:
-                    all_articles.extend(source_articles)
-                    rss_source["article_count"] = len(source_articles)
-                    rss_source["success_rate"] = min(100, rss_source.get("success_rate", 0) + 10)
-                    safe_print(f"✅ {rss_source['name']}: {len(source_articles)} yeni makale bulundu")
-                else:
-                    rss_source["success_rate"] = max(0, rss_source.get("success_rate", 100) - 10)
-                    safe_print(f"⚠️ {rss_source['name']}: Yeni makale bulunamadı")
-                
-                rss_source["last_checked"] = datetime.now().isoformat()
-                
-            except Exception as source_error:
-                safe_print(f"❌ {rss_source['name']} RSS hatası: {source_error}")
-                rss_source["success_rate"] = max(0, rss_source.get("success_rate", 100) - 30)
+        if not FEEDPARSER_AVAILABLE:
+            safe_print(f"❌ feedparser kütüphanesi yüklü değil, RSS kaynakları atlanıyor")
+            for rss_source in enabled_rss_sources:
+                rss_source["success_rate"] = max(0, rss_source.get("success_rate", 100) - 20)
                 rss_source["last_checked"] = datetime.now().isoformat()
+            save_news_source_changes(before, config)
+            return []
+        
+        # Feed'ler paralel çekilir; her iş parçacığı yalnızca kendi rss_source kaydını günceller
+        from concurrent.futures import ThreadPoolExecutor
         
-        # Güncellenmiş config'i kaydet - Gelişmiş hata yakalama
+        max_workers = max(1, min(len(enabled_rss_sources), int(config.get("settings", {}).get("rss_max_workers", 8))))
+        rss_start = time.time()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='rss') as executor:
+            futures = [executor.submit(bind_context(_fetch_single_rss_source), source, twenty_four_hours_ago)
+                       for source in enabled_rss_sources]
+            results = [future.result() for future in futures]
+        
+        all_articles = []
+        scheduler = get_source_scheduler()
+        for rss_source, source_articles in zip(enabled_rss_sources, results):
+            all_articles.extend(source_articles)
+            # Feed zaten görülmüş makaleleri elediği için ek süzgeç gerekmez
+            scheduler.record_fetch(rss_source, source_articles, "error" if rss_source.get("last_error") else "ok",
+                                   per_fetch_cap=5)
+        safe_print(f"⏱️ {len(enabled_rss_sources)} RSS kaynağı {max_workers} paralel işçiyle {time.time() - rss_start:.1f}s içinde tarandı")
+        
+        # Güncellenmiş istatistikleri kaydet - sadece bu çalışmanın değiştirdiği alanlar
         try:
-            config["settings"]["last_updated"] = datetime.now().isoformat()
-            save_news_sources(config)
+            result = save_news_source_changes(before, config)
+            if not result["success"]:
+                raise RuntimeError(result["message"])
             safe_print(f"💾 RSS kaynak istatistikleri kaydedildi")
         except Exception as save_error:
             safe_print(f"❌ RSS kaynakları kaydetme hatası: {save_error}")
@@ -7367,7 +9158,7 @@ def fetch_articles_with_simple_scraping():
             try:
                 safe_print(f"🔍 Web scraping: {target['name']}")
                 
-                response = requests.get(target['url'], headers=headers, timeout=15)
+                response = http_get(target['url'], headers=headers, timeout=15)
                 response.raise_for_status()
                 
                 soup = BeautifulSoup(response.text, 'html.parser')
@@ -7430,16 +9221,15 @@ def fetch_articles_from_hackernews():
     try:
         # Hacker News API'den top stories al
         top_stories_url = "https://hacker-news.firebaseio.com/v0/topstories.json"
-        response = requests.get(top_stories_url, timeout=10)
+        response = http_get(top_stories_url, timeout=10)
         story_ids = response.json()[:50]  # İlk 50 hikaye
         
         ai_articles = []
-        ai_keywords = ['ai', 'artificial intelligence', 'machine learning', 'deep learning', 'neural', 'gpt', 'llm', 'openai', 'anthropic', 'claude', 'chatgpt']
         
         for story_id in story_ids[:20]:  # İlk 20'sini kontrol et
             try:
                 story_url = f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
-                story_response = requests.get(story_url, timeout=5)
+                story_response = http_get(story_url, timeout=5)
                 story = story_response.json()
                 
                 if not story or story.get('type') != 'story':
@@ -7448,13 +9238,10 @@ def fetch_articles_from_hackernews():
                 title = story.get('title', '')
                 url = story.get('url', '')
                 
-                # AI ile ilgili mi kontrol et - Daha sıkı filtreleme
-                title_lower = title.lower()
-                is_ai_related = any(keyword in title_lower for keyword in ai_keywords)
-                
-                # AI ile ilgili olmayan konuları filtrele
-                non_ai_keywords = ['wood', 'dried', 'kiln', 'furniture', 'cooking', 'recipe', 'travel', 'music', 'art', 'painting', 'photography']
-                has_non_ai_content = any(keyword in title_lower for keyword in non_ai_keywords)
+                # AI ile ilgili mi kontrol et - AI olmayan konular da filtrelenir (tek tarama)
+                relevance = _AI_RELEVANCE_MATCHER.categories(title)
+                is_ai_related = "ai" in relevance
+                has_non_ai_content = "non_ai" in relevance
                 
                 if not is_ai_related or not url or has_non_ai_content:
                     if has_non_ai_content:
@@ -7546,7 +9333,7 @@ def fetch_articles_from_reddit():
                 url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit=10"
                 headers = {'User-Agent': 'AI News Bot 1.0'}
                 
-                response = requests.get(url, headers=headers, timeout=10)
+                response = http_get(url, headers=headers, timeout=10)
                 data = response.json()
                 
                 posts = data.get('data', {}).get('children', [])
@@ -7715,6 +9502,177 @@ def safe_print(text):
             clean_text = re.sub(r'[^\x00-\x7F]+', '?', str(text))
             print(clean_text)
 
+# auto modu kademeleri: (ad, fonksiyon adı, yöntem etiketi, ikon, renk, varsayılan kademe süresi sn)
+AUTO_FETCH_TIERS = [
+    ('rss', 'fetch_articles_with_rss_only', 'RSS Feeds', '📡', 'blue', 20),
+    ('custom_sources', 'fetch_articles_from_custom_sources', 'Özel Kaynaklar', '📰', 'orange', 30),
+    ('pythonanywhere', 'fetch_latest_ai_articles_pythonanywhere', 'PythonAnywhere', '🐍', 'green', 35),
+    ('ai_keywords', 'fetch_ai_news_with_advanced_keywords', 'AI Keywords', '🧠', 'purple', 40),
+    ('mcp', 'fetch_latest_ai_articles_with_firecrawl', 'MCP Firecrawl', '🤖', 'blue', 45),
+]
+
+# Son paralel çekmenin kademe raporu (durum/latency) - panel ve loglar için
+_last_fetch_report = {}
+_last_fetch_report_lock = threading.Lock()
+
+
+def get_last_fetch_report():
+    """Son auto mod çekmesinin kademe bazlı süre ve sonuç raporu"""
+    with _last_fetch_report_lock:
+        return dict(_last_fetch_report)
+
+
+def _tag_fetched_articles(articles, label, icon, color):
+    """Çekilen makalelere yöntem bilgisini ekle"""
+    for article in articles:
+        article['fetch_method'] = label
+        article['method_icon'] = icon
+        article['method_color'] = color
+    return articles
+
+
+def _fetched_article_keys(article):
+    """Kademeler arası birleştirme için URL ve başlık anahtarları"""
+    keys = []
+    url = (article.get('url') or '').strip().lower().rstrip('/')
+    if url:
+        keys.append('u:' + url)
+    title = (article.get('title') or '').strip().lower()
+    if title:
+        keys.append('t:' + hashlib.md5(title.encode()).hexdigest())
+    return keys
+
+
+def fetch_auto_tiers_concurrently(max_articles, mcp_enabled, settings, start_time, max_execution_time=45):
+    """auto modu: RSS, özel kaynaklar, PythonAnywhere, AI Keywords ve MCP kademelerini paralel çalıştır.
+    
+    Sonuçlar geldikçe öncelik sırasına göre birleştirilir. Her kademenin kendi süre sınırı vardır
+    (settings['fetch_tier_timeouts'] ile değiştirilebilir); max_execution_time ise start_time'dan
+    itibaren gerçek global süre sınırıdır. max_articles benzersiz makaleye ulaşılınca bekleyen
+    kademeler iptal edilir - çalışmakta olan thread'ler durdurulamaz, sonuçları yok sayılır.
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+    
+    tier_timeouts = settings.get('fetch_tier_timeouts', {}) or {}
+    global_deadline = start_time + max_execution_time
+    tiers = [tier for tier in AUTO_FETCH_TIERS if tier[0] != 'mcp' or mcp_enabled]
+    
+    report = {
+        'started_at': datetime.fromtimestamp(start_time).isoformat(),
+        'mode': 'concurrent',
+        'max_articles': max_articles,
+        'tiers': {},
+    }
+    results = {}        # kademe adı -> makale listesi
+    seen_keys = set()
+    unique_count = 0
+    
+    executor = ThreadPoolExecutor(max_workers=len(tiers), thread_name_prefix='fetch-tier')
+    futures = {}
+    deadlines = {}
+    for priority, (name, func_name, label, icon, color, default_timeout) in enumerate(tiers):
+        fetch_func = traced(name, kind="tier")(globals()[func_name])
+        tier_started = time.time()
+        future = executor.submit(bind_context(fetch_func))
+        futures[future] = (priority, name, label, icon, color, tier_started)
+        deadlines[future] = min(tier_started + float(tier_timeouts.get(name, default_timeout)), global_deadline)
+        report['tiers'][name] = {'status': 'running', 'articles': 0, 'new_unique': 0, 'latency': None}
+    
+    safe_print(f"🚀 {len(tiers)} kademe paralel başlatıldı: {', '.join(t[0] for t in tiers)}")
+    
+    pending = set(futures)
+    try:
+        while pending:
+            now = time.time()
+            # Süresi dolan kademeleri bırak
+            for future in [f for f in pending if deadlines[f] <= now]:
+                pending.discard(future)
+                future.cancel()
+                _, name, _, _, _, tier_started = futures[future]
+                report['tiers'][name].update(status='timeout', latency=round(now - tier_started, 2))
+                safe_print(f"⏱️ {name} kademesi süre sınırını aştı ({now - tier_started:.1f}s), sonucu beklenmeyecek")
+            if not pending:
+                break
+            
+            next_deadline = min(deadlines[f] for f in pending)
+            done, _ = wait(pending, timeout=max(0.0, next_deadline - time.time()), return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                pending.discard(future)
+                priority, name, label, icon, color, tier_started = futures[future]
+                latency = round(time.time() - tier_started, 2)
+                try:
+                    tier_articles = future.result() or []
+                except Exception as e:
+                    report['tiers'][name].update(status='error', latency=latency, error=str(e)[:200])
+                    safe_print(f"⚠️ {label} hatası ({latency:.1f}s): {e}")
+                    continue
+                
+                _tag_fetched_articles(tier_articles, label, icon, color)
+                new_unique = 0
+                for article in tier_articles:
+                    keys = _fetched_article_keys(article)
+                    if keys and not any(key in seen_keys for key in keys):
+                        new_unique += 1
+                    seen_keys.update(keys)
+                unique_count += new_unique
+                results[name] = tier_articles
+                report['tiers'][name].update(status='done', latency=latency,
+                                             articles=len(tier_articles), new_unique=new_unique)
+                safe_print(f"✅ {label}: {len(tier_articles)} makale, {new_unique} yeni ({latency:.1f}s)")
+            
+            if unique_count >= max_articles and pending:
+                safe_print(f"🎯 Yeterli makale bulundu ({unique_count}), {len(pending)} kademe iptal ediliyor")
+                for future in pending:
+                    future.cancel()
+                    _, name, _, _, _, tier_started = futures[future]
+                    report['tiers'][name].update(status='cancelled', latency=round(time.time() - tier_started, 2))
+                pending = set()
+    finally:
+        # Bekleyen işleri bırak; çalışan thread'ler arka planda kendi kendine biter
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    # Öncelik sırasına göre birleştir (RSS > özel kaynaklar > ... > MCP)
+    all_articles = []
+    for name, *_ in tiers:
+        all_articles.extend(results.get(name, []))
+    
+    # Son çare fallback - kalan global süre içinde
+    if not all_articles and time.time() < global_deadline:
+        fallback_started = time.time()
+        try:
+            fallback_articles = fetch_latest_ai_articles_fallback() or []
+            all_articles.extend(_tag_fetched_articles(fallback_articles, 'Fallback', '⚠️', 'gray'))
+            report['tiers']['fallback'] = {'status': 'done', 'articles': len(fallback_articles),
+                                           'new_unique': len(fallback_articles),
+                                           'latency': round(time.time() - fallback_started, 2)}
+            safe_print(f"✅ Fallback'den {len(fallback_articles)} makale ({time.time() - fallback_started:.1f}s)")
+        except Exception as e:
+            safe_print(f"⚠️ Fallback hatası: {e}")
+    
+    unique_articles = filter_duplicate_articles(all_articles) if all_articles else []
+    total_time = time.time() - start_time
+    report.update(total_time=round(total_time, 2), unique_articles=len(unique_articles),
+                  returned=min(len(unique_articles), max_articles))
+    with _last_fetch_report_lock:
+        _last_fetch_report.clear()
+        _last_fetch_report.update(report)
+    
+    latency_summary = ", ".join(
+        f"{name}={info['status']}" + (f"/{info['latency']:.1f}s" if info.get('latency') is not None else "")
+        for name, info in report['tiers'].items()
+    )
+    safe_print(f"📊 Kademe süreleri: {latency_summary}")
+    if unique_articles:
+        print(f"📊 Toplam {len(unique_articles)} benzersiz makale bulundu ({total_time:.1f}s)")
+        print(f"🔢 Kullanıcı ayarına göre {max_articles} makale döndürülüyor")
+        return unique_articles[:max_articles]
+    
+    safe_print(f"[HATA] Hiç makale bulunamadı ({total_time:.1f}s)")
+    return []
+
+
+@traced_run("fetch_latest_ai_articles_smart", stage_name="fetch")
 def fetch_latest_ai_articles_smart():
     """Akıllı haber çekme - Ayarlara göre yöntem seçer"""
     try:
@@ -7785,7 +9743,11 @@ def fetch_latest_ai_articles_smart():
             return articles[:max_articles]
             
         else:  # method == 'auto'
-            # Otomatik seçim - Öncelik sırasına göre dene (hızlıdan yavaşa)
+            # Paralel mod: tüm kademeler aynı anda başlar, MAX_EXECUTION_TIME gerçek global süre sınırıdır
+            if settings.get('concurrent_fetch_enabled', True):
+                return fetch_auto_tiers_concurrently(max_articles, mcp_enabled, settings, start_time, MAX_EXECUTION_TIME)
+            
+            # Sıralı mod - Öncelik sırasına göre dene (hızlıdan yavaşa)
             all_articles = []
             
             # 0. RSS kaynakları (en hızlı) - İlk önce dene
@@ -7935,32 +9897,11 @@ def fetch_articles_with_mcp_only():
         print(f"📅 Bugün: {now.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"⏰ 24 saat öncesi: {twenty_four_hours_ago.strftime('%Y-%m-%d %H:%M:%S')}")
         
-        # Önce mevcut yayınlanan makaleleri yükle
-        posted_articles = load_json(HISTORY_FILE, [])
-        posted_urls = [article.get('url', '') for article in posted_articles]
-        posted_hashes = [article.get('hash', '') for article in posted_articles]
-        
-        # Son 24 saat içinde paylaşılan makaleleri de kontrol et
-        recent_posted_urls = []
-        recent_posted_hashes = []
-        
-        for article in posted_articles:
-            posted_date_str = article.get('posted_date') or article.get('fetch_date')
-            if posted_date_str:
-                try:
-                    # ISO format tarih parse et
-                    posted_date = datetime.fromisoformat(posted_date_str.replace('Z', '+00:00').replace('+00:00', ''))
-                    if posted_date >= twenty_four_hours_ago:
-                        recent_posted_urls.append(article.get('url', ''))
-                        recent_posted_hashes.append(article.get('hash', ''))
-                except Exception as date_error:
-                    safe_print(f"⚠️ Tarih parse hatası: {date_error}")
-                    continue
-        
-        print(f"📊 Son 24 saatte paylaşılan makale sayısı: {len(recent_posted_urls)}")
+        # Paylaşılan makaleler görülme indeksinden O(1) kontrol edilir
         
         # Haber kaynaklarını yükle
         config = load_news_sources()
+        before = snapshot_news_sources(config)
         enabled_sources = [s for s in config.get("sources", []) if s.get("enabled", True)]
         
         if not enabled_sources:
@@ -8033,8 +9974,7 @@ def fetch_articles_with_mcp_only():
                                     href not in article_urls):
                                     
                                     # AI ile ilgili kategorileri kontrol et
-                                    ai_keywords = ['ai', 'artificial', 'machine learning', 'robotics', 'automation', 'chatgpt', 'openai']
-                                    if any(keyword in text.lower() for keyword in ai_keywords):
+                                    if is_ai_related_text(text):
                                         article_urls.append(href)
                                         print(f"   🤖 Kategori makalesi: {text[:50]}... -> {href}")
                             
@@ -8091,9 +10031,8 @@ def fetch_articles_with_mcp_only():
                     url = url.rstrip(')')
                     
                     # Makale URL'si olup olmadığını kontrol et
-                    if (url not in posted_urls and 
-                        url not in recent_posted_urls and  # Son 24 saat kontrolü
-                        url not in clean_urls and
+                    if (url not in clean_urls and
+                        not is_article_seen(url=url, statuses=("posted",)) and
                         len(url) > 30 and  # Çok kısa URL'leri filtrele
                         not any(skip in url.lower() for skip in ['category', 'tag', 'author', 'page', 'search'])):
                         
@@ -8141,9 +10080,8 @@ def fetch_articles_with_mcp_only():
                             article_hash = hashlib.md5(title.encode()).hexdigest()
                             
                             # Tekrar kontrolü (hem genel hem de son 24 saat)
-                            if (article_hash not in posted_hashes and 
-                                article_hash not in recent_posted_hashes and
-                                is_article_recent):
+                            if (is_article_recent and
+                                not is_article_seen(hash_value=article_hash, statuses=("posted",))):
                                 
                                 source_articles.append({
                                     "title": title,
@@ -8160,7 +10098,7 @@ def fetch_articles_with_mcp_only():
                                 })
                                 print(f"🆕 MCP ile yeni makale (24h içinde): {title[:50]}...")
                             else:
-                                if article_hash in recent_posted_hashes:
+                                if is_article_seen(hash_value=article_hash, within_hours=24, statuses=("posted",)):
                                     print(f"⏰ Son 24 saatte paylaşılmış: {title[:50]}...")
                                 elif not is_article_recent:
                                     print(f"📅 24 saatten eski makale: {title[:50]}...")
@@ -8189,11 +10127,10 @@ def fetch_articles_with_mcp_only():
                 source["success_rate"] = max(0, source.get("success_rate", 100) - 30)
                 source["last_checked"] = datetime.now().isoformat()
         
-        # Güncellenmiş config'i kaydet
-        try:
-            save_json(NEWS_SOURCES_FILE, config)
-        except Exception as save_error:
-            safe_print(f"⚠️ Haber kaynakları kaydetme hatası: {save_error}")
+        # Güncellenmiş istatistikleri kaydet
+        result = save_news_source_changes(before, config)
+        if not result["success"]:
+            safe_print(f"⚠️ Haber kaynakları kaydetme hatası: {result['message']}")
         
         print(f"📊 MCP ile toplam {len(all_articles)} yeni makale bulundu (Son 24 saat filtreli)")
         
@@ -8461,7 +10398,7 @@ def fetch_trending_github_repos(language="python", time_period="daily", limit=10
         if github_token:
             headers["Authorization"] = f"token {github_token}"
         
-        response = requests.get(base_url, params=params, headers=headers, timeout=30)
+        response = http_get(base_url, params=params, headers=headers, timeout=30)
         response.raise_for_status()
         
         data = response.json()
@@ -8547,7 +10484,7 @@ def fetch_github_repo_details_fallback(repo_url):
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
         }
         
-        response = requests.get(repo_url, headers=headers, timeout=30)
+        response = http_get(repo_url, headers=headers, timeout=30)
         response.raise_for_status()
         
         soup = BeautifulSoup(response.text, 'html.parser')
@@ -8757,9 +10694,6 @@ def fetch_github_articles_for_tweets():
 def save_github_repo_history(repo_data, tweet_result):
     """GitHub repo paylaşım geçmişini kaydet"""
     try:
-        # Mevcut geçmişi yükle
-        posted_articles = load_json(HISTORY_FILE)
-        
         # Yeni kayıt oluştur
         new_record = {
             "title": f"{repo_data['name']} - GitHub Repository",
@@ -8775,11 +10709,8 @@ def save_github_repo_history(repo_data, tweet_result):
             "type": "github_repo"
         }
         
-        # Listeye ekle
-        posted_articles.append(new_record)
-        
-        # Kaydet
-        save_json(HISTORY_FILE, posted_articles)
+        # Listeye ekle (tek yazıcı kuyruğu üzerinden)
+        append_json_record(HISTORY_FILE, new_record)
         
         terminal_log(f"✅ GitHub repo geçmişi kaydedildi: {repo_data['name']}", "success")
         
@@ -8968,11 +10899,6 @@ def fetch_ai_news_with_advanced_keywords():
         
         terminal_log(f"🎯 {len(all_keywords)} anahtar kelime ile arama yapılıyor", "info")
         
-        # Mevcut makaleleri kontrol et
-        posted_articles = load_json(HISTORY_FILE)
-        posted_urls = [article.get('url', '') for article in posted_articles]
-        posted_hashes = [article.get('hash', '') for article in posted_articles]
-        
         all_found_articles = []
         
         # Prioritized search - High priority keywords first
@@ -9043,8 +10969,7 @@ def fetch_ai_news_with_advanced_keywords():
             # Posted articles ile karşılaştır
             new_articles = []
             for article in unique_articles[:max_articles]:
-                if (article.get('url') not in posted_urls and 
-                    article.get('hash') not in posted_hashes):
+                if not is_article_seen(url=article.get('url'), hash_value=article.get('hash'), statuses=("posted",)):
                     new_articles.append(article)
             
             terminal_log(f"🆕 {len(new_articles)} yeni AI makale bulundu", "success")
@@ -9072,6 +10997,9 @@ def search_ai_news_with_mcp(keywords, cutoff_date, max_results=5):
         
         found_articles = []
         
+        # ai_keywords_config.json'dan gelen liste bir kez derlenir (liste değişmedikçe önbellekten)
+        keyword_matcher = get_keyword_matcher("ai_keyword_search", {"keywords": keywords})
+        
         terminal_log(f"🎯 MCP keyword araması başlatılıyor - Hedef: {max_results} makale (timeout: {MAX_SEARCH_TIME}s)", "info")
         
         # Prioritized search sources - Sadece ilk 3 kaynak (performans için)
@@ -9190,16 +11118,10 @@ def search_ai_news_with_mcp(keywords, cutoff_date, max_results=5):
                     is_article_url = any(re.search(pattern, url) for pattern in article_patterns)
                     
                     # AI/Tech ile ilgili mi kontrol et
-                    ai_keywords_in_text = any(keyword.lower() in text.lower() for keyword in [
-                        'ai', 'artificial intelligence', 'machine learning', 'deep learning',
-                        'neural', 'chatgpt', 'gpt', 'openai', 'anthropic', 'claude', 
-                        'gemini', 'llm', 'automation', 'robot', 'algorithm'
-                    ])
+                    ai_keywords_in_text = is_ai_related_text(text)
                     
-                    ai_keywords_in_url = any(keyword in url.lower() for keyword in [
-                        'ai', 'artificial', 'machine-learning', 'deep-learning',
-                        'neural', 'chatgpt', 'openai', 'anthropic'
-                    ])
+                    # URL'de tire/alt çizgi boşluk gibi eşleşir (machine-learning)
+                    ai_keywords_in_url = is_ai_related_text(url)
                     
                     # AI sitelerinden makale URL'leri öncelikle al
                     if any(domain in url.lower() for domain in [
@@ -9241,11 +11163,8 @@ def search_ai_news_with_mcp(keywords, cutoff_date, max_results=5):
                         # URL ve başlıkta keyword kontrolü
                         text_to_check = (link_text + " " + link_url).lower()
                         
-                        # Keyword eşleşmesi var mı?
-                        matching_keywords = []
-                        for keyword in keywords:
-                            if keyword.lower() in text_to_check:
-                                matching_keywords.append(keyword)
+                        # Keyword eşleşmesi var mı? (tüm anahtarlar tek taramada)
+                        matching_keywords = list(keyword_matcher.find(text_to_check))
                         
                         if not matching_keywords:
                             terminal_log(f"❌ Keyword eşleşmesi yok: {link_text[:30]}...", "info")